@@ -86,6 +86,7 @@ from .order import *
 from .position import *
 from .resamplerfilter import *
 from .signal import *
+from .signalbatch import *
 from .sizer import *
 from .sizers import SizerFix  # old sizer for compatibility
 from .store import Store
@@ -99,8 +100,14 @@ from .writer import *
 from .profiles import LiveProfile, build_cerebro
 
 # Iteration 138: Tick-level backtesting and live trading
-from .events import TickEvent, OrderBookSnapshot, FundingEvent, BarEvent
+from .events import TickEvent, OrderBookSnapshot, OrderBookDiff, FundingEvent, BarEvent
 from .channel import Event, EventPriority, StreamingEventQueue
+from .depthbook import DepthBook
+
+# Plotting and reports (matplotlib, plotly ...) are imported on first use
+from .utils.lazyimport import lazyexports as _lazyexports
+
+__getattr__, __dir__ = _lazyexports(__name__, {"plot": (), "reports": ()})
 
 # import backtrader.studies.contrib
 
@@ -15,8 +15,6 @@ Example:
 """
 
 # import collections
-import pandas as pd
-
 from ..analyzer import Analyzer
 from ..dataseries import TimeFrame
 from ..metabase import OwnerContext
@@ -130,6 +128,8 @@ class PyFolio(Analyzer):
         The method will break if ``pandas`` is not installed
         """
         # keep import local to avoid disturbing installations with no pandas
+        import pandas as pd
+
         # Returns
         # Process returns
         cols = ["index", "return"]
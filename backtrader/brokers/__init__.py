@@ -19,8 +19,16 @@ Example:
 # The modules below should/must define __all__ with the objects wishes
 # or prepend an "_" (underscore) to private classes/variables
 
-from backtrader.brokers.bbroker import BackBroker as BackBroker
-from backtrader.brokers.bbroker import BrokerBack as BrokerBack
-from backtrader.brokers.btapibroker import BtApiBroker as BtApiBroker
-from backtrader.brokers.mixbroker import MixBroker as MixBroker
-from backtrader.brokers.tickbroker import TickBroker as TickBroker
+from ..utils.lazyimport import lazyexports as _lazyexports
+
+# The names exported by each module, imported on first use of one of them
+_EXPORTS = {
+    "bbroker": ("BackBroker", "BrokerBack"),
+    "btapibroker": ("BtApiBroker",),
+    "mixbroker": ("MixBroker",),
+    "tickbroker": ("TickBroker",),
+}
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
+
+__getattr__, __dir__ = _lazyexports(__name__, _EXPORTS)
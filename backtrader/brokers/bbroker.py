@@ -14,8 +14,12 @@ Example:
 
 import collections
 import datetime
+import heapq
+import itertools
+import operator
 
 from backtrader.broker import BrokerBase
+from backtrader.brokers.pendingbook import PendingBook
 
 # from backtrader.comminfo import CommInfoBase
 from backtrader.order import BuyOrder, Order, SellOrder
@@ -365,8 +369,13 @@ class BackBroker(BrokerBase):
         self.notifs: collections.deque = collections.deque()
         self.d_credit = collections.defaultdict(float)
         self.positions = collections.defaultdict(Position)
+        self._openpos = None  # non-flat positions (see _open_positions)
+        self._openposof = None
+        self._mtm = {}  # cached mark-to-market per data (see _get_value_net)
         self._toactivate: collections.deque = collections.deque()
         self.pending: collections.deque = collections.deque()
+        self._book = PendingBook()  # resting limit/stop orders (see _rest)
+        self._pseq = itertools.count()
         self.orders = []
         self._unrealized = 0.0
         self._leverage = 1.0
@@ -420,9 +429,14 @@ class BackBroker(BrokerBase):
         self.orders = []  # will only be appending
         # Double-ended queue
         self.pending = collections.deque()  # popleft and append(right)
+        # Resting limit/stop orders, only evaluated when the bar reaches them
+        self._book = PendingBook()
+        self._pseq = itertools.count()  # acceptance order of pending orders
         self._toactivate = collections.deque()  # to activate in next cycle
         # Position
         self.positions = collections.defaultdict(Position)
+        self._openpos = None
+        self._mtm = {}
         self.long_positions = collections.defaultdict(Position)
         self.short_positions = collections.defaultdict(Position)
         # Interest rate
@@ -561,6 +575,20 @@ class BackBroker(BrokerBase):
                 if position.size:
                     yield data_key, position_side, position
 
+    def _open_positions(self):
+        """Return the ``(data, position)`` pairs of the non-flat net positions.
+
+        ``positions`` keeps an entry for every data ever traded. The pairs
+        are collected again only after an execution (``_execute`` clears
+        them), in the order of ``positions`` so that sums over them are the
+        same as sums over ``positions``.
+        """
+        positions = self.positions
+        if self._openpos is None or self._openposof is not positions:
+            self._openpos = [(data, pos) for data, pos in positions.items() if pos]
+            self._openposof = positions
+        return self._openpos
+
     def _preview_position_key(self, order):
         if not self._is_dual_side_mode():
             return self._position_storage_key(order.data)
@@ -808,14 +836,15 @@ class BackBroker(BrokerBase):
         if order.status not in (Order.Submitted, Order.Accepted, Order.Partial):
             return False
 
-        removed = False
-        for queue in (self.pending, self.submitted):
-            try:
-                queue.remove(order)
-            except ValueError:
-                continue
-            removed = True
-            break
+        removed = self._book.remove(order)
+        if not removed:
+            for queue in (self.pending, self.submitted):
+                try:
+                    queue.remove(order)
+                except ValueError:
+                    continue
+                removed = True
+                break
 
         if not removed:
             return False
@@ -930,6 +959,39 @@ class BackBroker(BrokerBase):
         pos_value = 0.0
         pos_value_unlever = 0.0
         unrealized = 0.0
+        if not datas and positions is self.positions:
+            # Whole portfolio: only open positions count and the values of a
+            # position are reused until its size/price or the data close change
+            mtm = self._mtm
+            for data, position in self._open_positions():
+                if not position:
+                    continue
+                comminfo = getcommissioninfo(data)
+                close0 = data.close[0]
+                key = (comminfo, position.size, position.price, close0, shortcash)
+                cached = mtm.get(data)
+                if cached is None or cached[0] != key:
+                    if not shortcash:
+                        dvalue = abs(comminfo.getvalue(position, close0))
+                    else:
+                        dvalue = comminfo.getvaluesize(position.size, close0)
+                    dunrealized = comminfo.profitandloss(position.size, position.price, close0)
+                    if dvalue > 0:  # long position - unlever
+                        dunlever = (dvalue - dunrealized) / comminfo.get_leverage()
+                    else:
+                        dunlever = None
+                    cached = mtm[data] = (key, dvalue, dunrealized, dunlever)
+
+                _, dvalue, dunrealized, dunlever = cached
+                pos_value += dvalue
+                unrealized += dunrealized
+                if dunlever is not None:
+                    pos_value_unlever += dunlever
+                    pos_value_unlever += dunrealized
+                else:
+                    pos_value_unlever += dvalue
+            return None, pos_value, unrealized, pos_value_unlever
+
         # If datas is None, loop through self.positions; if datas is not None, loop through datas
         for data in datas or positions:
             # Get commission related info
@@ -1073,10 +1135,14 @@ class BackBroker(BrokerBase):
 
         If order manipulation is needed, set the parameter ``safe`` to True
         """
+        os = self.pending
+        if self._book:
+            os = heapq.merge(os, self._book.orders(), key=operator.attrgetter("pseq"))
+
         if safe:
-            os = [x.clone() for x in self.pending]
+            os = [x.clone() for x in os]
         else:
-            os = list(self.pending)
+            os = list(os)
 
         return os
 
@@ -1246,6 +1312,7 @@ class BackBroker(BrokerBase):
         # Order accept
         order.accept()
         # Add order to pending orders
+        order.pseq = next(self._pseq)
         self.pending.append(order)
         # Notify order status
         self.notify(order)
@@ -1297,6 +1364,15 @@ class BackBroker(BrokerBase):
                     o.cancel()
                     self.notify(o)
 
+            book = self._book
+            if book:
+                resting = [book.get(ref) for ref in ocol]
+                resting = [o for o in resting if o is not None]
+                for o in sorted(resting, key=operator.attrgetter("pseq"), reverse=True):
+                    book.remove(o)
+                    o.cancel()
+                    self.notify(o)
+
     def _ocoize(self, order, oco):
         """Set up OCO (One-Cancels-Other) relationship for an order.
 
@@ -1645,6 +1721,7 @@ class BackBroker(BrokerBase):
             # do a real position update if something was executed
             # Update position
             position.update(execsize, price, data.datetime.datetime())
+            self._openpos = None  # the position may have been opened/closed
             # If closed and transferring interest to pnl, closing commission includes interest charges
             if closed and self.get_param("int2pnl"):  # Assign accumulated interest data
                 closedcomm += self.d_credit.pop(data, 0.0)
@@ -2054,11 +2131,17 @@ class BackBroker(BrokerBase):
 
         return None  # no price can be returned
 
-    # Try to execute order
-    def _try_exec(self, order):
-        # Data that generated the order
-        data = order.data
-        # Get open, high, low, close prices respectively, use tick data if available
+    # Whether the matching of limit/stop orders is the one assumed by the book
+    @classmethod
+    def _restable(cls):
+        return all(
+            getattr(cls, name) is getattr(BackBroker, name)
+            for name in ("_try_exec", "_try_exec_limit", "_try_exec_stop", "_try_exec_stoplimit")
+        )
+
+    # Open, high, low, close prices of a data, use tick data if available
+    @staticmethod
+    def _bar_prices(data):
         popen = getattr(data, "tick_open", None)
         if popen is None:
             popen = data.open[0]
@@ -2071,6 +2154,12 @@ class BackBroker(BrokerBase):
         pclose = getattr(data, "tick_close", None)
         if pclose is None:
             pclose = data.close[0]
+        return popen, phigh, plow, pclose
+
+    # Try to execute order
+    def _try_exec(self, order):
+        # Get open, high, low, close prices of the data that generated the order
+        popen, phigh, plow, pclose = self._bar_prices(order.data)
 
         pcreated = order.created.price
         plimit = order.created.pricelimit
@@ -2239,7 +2328,7 @@ class BackBroker(BrokerBase):
                     credit += dcredit
                     pos.datetime = dt0
         else:
-            for data, pos in self.positions.items():
+            for data, pos in self._open_positions():
                 if pos:
                     comminfo = getcommissioninfo(data)
                     dt0 = data.datetime.datetime()
@@ -2252,6 +2341,18 @@ class BackBroker(BrokerBase):
         # Process order history
         self._process_order_history()
 
+        # Resting orders reached by this bar (or expiring) are evaluated
+        # together with the pending queue, in acceptance order
+        book = self._book
+        if book:
+            due = book.due(self._bar_prices)
+            if due:
+                merged = list(heapq.merge(pending, due, key=operator.attrgetter("pseq")))
+                pending.clear()
+                pending.extend(merged)
+
+        rest = book.add if self._restable() else None
+
         # Iterate once over all elements of the pending queue
         # Add a None to pending orders
         pending.append(None)
@@ -2272,7 +2373,9 @@ class BackBroker(BrokerBase):
             else:
                 try_exec(order)
                 if order.alive():
-                    pending.append(order)
+                    # limit/stop orders rest in the book until reached
+                    if rest is None or not rest(order):
+                        pending.append(order)
 
                 elif order.status == Order.Completed:
                     # a bracket parent order may have been executed
@@ -2294,7 +2397,7 @@ class BackBroker(BrokerBase):
             for data in set(self.long_positions) | set(self.short_positions) | set(self.positions):
                 self._sync_net_position(data)
         else:
-            for data, pos in self.positions.items():
+            for data, pos in self._open_positions():
                 # futures change cash every bar
                 if pos:
                     comminfo = getcommissioninfo(data)
@@ -22,9 +22,10 @@ from .examples import (
 )
 from .exchange import ExchangeModel, FillRole, OrderResult, QueueExchangeModel, SimpleExchangeModel
 from .latency import ConstantLatencyModel, IntpLatencyModel, LatencyEngine, LatencyModel
-from .matching_core import CancelResult, FillReport, MatchingCore, MatchResult
+from .matching_core import CancelResult, FillPool, FillReport, MatchingCore, MatchResult
 from .queue import NoQueueModel, ProbQueueModel
 from .recorder import Recorder
+from .registry import OrderSet, SymbolOrders
 from .state import StateTracker
 
 __all__ = [
@@ -40,7 +41,10 @@ __all__ = [
     "NoQueueModel",
     "ProbQueueModel",
     "Recorder",
+    "OrderSet",
+    "SymbolOrders",
     "FillReport",
+    "FillPool",
     "MatchResult",
     "CancelResult",
     "MatchingCore",
@@ -30,6 +30,8 @@ BUY_EVENT = 1 << 29
 SELL_EVENT = 1 << 28
 DEPTH_EVENT = 1
 TRADE_EVENT = 2
+DEPTH_CLEAR_EVENT = 3
+DEPTH_SNAPSHOT_EVENT = 4
 DEPTH_BBO_EVENT = 5
 
 EVENT_DTYPE = np.dtype(
@@ -204,10 +204,9 @@ class _NoPartialQueueExchangeModel(QueueExchangeModel):
 
     def on_depth_update(self, ob_event, pending_orders):
         fills: list = []
-        prev_bids = getattr(ob_event, "previous_bids", None) or []
-        prev_asks = getattr(ob_event, "previous_asks", None) or []
-        curr_bids = getattr(ob_event, "bids", None) or []
-        curr_asks = getattr(ob_event, "asks", None) or []
+        changes = self._depth_changes(ob_event)
+        if not changes:
+            return fills
 
         for order in pending_orders:
             if getattr(order, "_fill_role", None) != FillRole.MAKER:
@@ -215,8 +214,11 @@ class _NoPartialQueueExchangeModel(QueueExchangeModel):
             price = getattr(order, "price", None)
             if price is None:
                 continue
-            prev_qty = self._level_qty(prev_bids if order.isbuy() else prev_asks, float(price))
-            new_qty = self._level_qty(curr_bids if order.isbuy() else curr_asks, float(price))
+            # an unchanged level neither moves the queue nor becomes visible
+            change = changes.get((order.isbuy(), self._level_key(price)))
+            if change is None:
+                continue
+            prev_qty, new_qty = change
             if (
                 getattr(order, "_queue_wait_for_first_visible_level", False)
                 and prev_qty <= 1e-12
@@ -827,6 +829,18 @@ def _create_depth_probe(market_data_path, tick_size: float, lot_size: float):
     return HashMapMarketDepthBacktest([asset])
 
 
+def _snapshot_attrs(snapshot):
+    """Attributes of a snapshot, from its slots (events) and its __dict__."""
+    attrs = {}
+    for klass in reversed(type(snapshot).__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and hasattr(snapshot, name):
+                attrs[name] = getattr(snapshot, name)
+    attrs.update(getattr(snapshot, "__dict__", {}))
+    return attrs
+
+
 def _augment_submission_snapshot(
     base_snapshot, depth, quotes, tick_size: float, fallback_snapshot=None
 ):
@@ -881,7 +895,7 @@ def _augment_submission_snapshot(
 
     bid_levels.sort(key=lambda item: item[0], reverse=True)
     ask_levels.sort(key=lambda item: item[0])
-    payload = dict(getattr(base_snapshot, "__dict__", {}))
+    payload = _snapshot_attrs(base_snapshot)
     payload["bids"] = bid_levels
     payload["asks"] = ask_levels
     return SimpleNamespace(**payload)
@@ -949,7 +963,7 @@ def _augment_orderbook_snapshot_for_orders(base_snapshot, depth, pending_orders,
 
     bid_levels.sort(key=lambda item: item[0], reverse=True)
     ask_levels.sort(key=lambda item: item[0])
-    payload = dict(getattr(base_snapshot, "__dict__", {}))
+    payload = _snapshot_attrs(base_snapshot)
     payload["bids"] = bid_levels
     payload["asks"] = ask_levels
     return SimpleNamespace(**payload)
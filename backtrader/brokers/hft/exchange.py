@@ -9,7 +9,9 @@ matching core.
 from dataclasses import dataclass, field
 from enum import Enum
 
+from backtrader.depthbook import DepthBook
 from backtrader.order import Order
+from backtrader.utils.slots import slotted
 
 from .queue import ProbQueueModel
 
@@ -19,6 +21,7 @@ class FillRole(Enum):
     TAKER = "taker"
 
 
+@slotted()
 @dataclass
 class OrderResult:
     action: str
@@ -92,6 +95,38 @@ class QueueExchangeModel(SimpleExchangeModel):
         )
         self._tick_size = float(tick_size) if tick_size is not None else None
 
+    @property
+    def tick_size(self):
+        """Price increment used to match order and level prices (or None)."""
+        return self._tick_size
+
+    def _depth_changes(self, ob_event):
+        """Level changes brought by a depth update.
+
+        Uses the ``depth_changes`` computed by the broker from its depth
+        book when present, else diffs ``previous_bids``/``previous_asks``
+        against the current levels.
+
+        Returns:
+            dict: ``{(isbid, key): (prev_qty, new_qty)}`` as per DepthBook.
+        """
+        changes = getattr(ob_event, "depth_changes", None)
+        if changes is None:
+            changes = DepthBook.diff(
+                getattr(ob_event, "previous_bids", None),
+                getattr(ob_event, "previous_asks", None),
+                getattr(ob_event, "bids", None),
+                getattr(ob_event, "asks", None),
+                self._tick_size,
+            )
+        return changes
+
+    def _level_key(self, price):
+        """DepthBook key of the level at ``price``."""
+        if self._tick_size is not None and self._tick_size > 0:
+            return round(float(price) / self._tick_size)
+        return float(price)
+
     def on_new_order(self, order, ob_snapshot):
         if order.exectype == Order.Market:
             return self._match_against_depth(order, ob_snapshot, FillRole.TAKER)
@@ -115,53 +150,60 @@ class QueueExchangeModel(SimpleExchangeModel):
         return OrderResult(action="PENDING")
 
     def on_trade(self, trade_event, pending_orders):
-        fills = []
+        trade_price = getattr(trade_event, "price", None)
+        if trade_price is None:
+            return []
+        key = self._level_key(trade_price)
+        level = []
         for order in pending_orders:
             if getattr(order, "_fill_role", None) != FillRole.MAKER:
                 continue
-            trade_price = getattr(trade_event, "price", None)
             order_price = getattr(order, "price", None)
-            if trade_price is None or order_price is None:
-                continue
-            if self._tick_size is not None and self._tick_size > 0:
-                if round(float(trade_price) / self._tick_size) != round(
-                    float(order_price) / self._tick_size
-                ):
-                    continue
-            elif float(trade_price) != float(order_price):
+            if order_price is None or self._level_key(order_price) != key:
                 continue
-            fillable = self._queue_model.update_on_trade(order, trade_event)
-            if fillable > 0:
-                fills.append((order, trade_price, fillable, FillRole.MAKER))
-        return fills
+            level.append(order)
+        if not level:
+            return []
+
+        update_level = getattr(self._queue_model, "update_level_on_trade", None)
+        if update_level is not None:
+            fillables = update_level(level, trade_event)
+        else:
+            fillables = [self._queue_model.update_on_trade(order, trade_event) for order in level]
+        return [
+            (order, trade_price, fillable, FillRole.MAKER)
+            for order, fillable in zip(level, fillables)
+            if fillable > 0
+        ]
 
     def on_depth_update(self, ob_event, pending_orders):
         fills: list = []
-        prev_bids = getattr(ob_event, "previous_bids", None) or []
-        prev_asks = getattr(ob_event, "previous_asks", None) or []
-        curr_bids = getattr(ob_event, "bids", None) or []
-        curr_asks = getattr(ob_event, "asks", None) or []
-
-        def level_qty(levels, price):
-            for level_price, level_qty_value in levels:
-                if self._tick_size is not None and self._tick_size > 0:
-                    if round(float(level_price) / self._tick_size) == round(
-                        float(price) / self._tick_size
-                    ):
-                        return float(level_qty_value)
-                elif float(level_price) == float(price):
-                    return float(level_qty_value)
-            return 0.0
+        changes = self._depth_changes(ob_event)
+        if not changes:
+            return fills
 
+        levels = {}
         for order in pending_orders:
             if getattr(order, "_fill_role", None) != FillRole.MAKER:
                 continue
             price = getattr(order, "price", None)
             if price is None:
                 continue
-            prev_qty = level_qty(prev_bids if order.isbuy() else prev_asks, price)
-            new_qty = level_qty(curr_bids if order.isbuy() else curr_asks, price)
+            change_key = (order.isbuy(), self._level_key(price))
+            change = changes.get(change_key)
+            if change is None:
+                continue
+            prev_qty, new_qty = change
             if abs(prev_qty - new_qty) <= 1e-12:
                 continue
-            self._queue_model.update_on_depth(order, prev_qty, new_qty)
+            levels.setdefault(change_key, []).append(order)
+
+        update_level = getattr(self._queue_model, "update_level_on_depth", None)
+        for change_key, orders in levels.items():
+            prev_qty, new_qty = changes[change_key]
+            if update_level is not None:
+                update_level(orders, prev_qty, new_qty)
+            else:
+                for order in orders:
+                    self._queue_model.update_on_depth(order, prev_qty, new_qty)
         return fills
@@ -3,11 +3,18 @@
 Defines :class:`LatencyModel` and implementations (e.g.
 :class:`ConstantLatencyModel`) that model feed, order-entry and order-response
 delays so the tick matching engine can simulate realistic exchange round-trips.
+
+Besides the per-event lookups, models answer batches of timestamps at once
+(``feed_latencies`` and friends) as NumPy arrays.
 """
 
 import bisect
 import heapq
 
+import numpy as np
+
+_FEED, _ENTRY, _RESPONSE = range(3)
+
 
 class LatencyModel:
     def feed_latency(self, exch_ts, symbol):
@@ -19,6 +26,20 @@ class LatencyModel:
     def order_response_latency(self, exch_ts, symbol):
         raise NotImplementedError
 
+    def feed_latencies(self, exch_ts, symbol):
+        """Feed latencies of an array of exchange timestamps."""
+        return np.array([self.feed_latency(ts, symbol) for ts in exch_ts], dtype=np.float64)
+
+    def order_entry_latencies(self, local_ts, symbol):
+        """Order-entry latencies of an array of local timestamps."""
+        return np.array([self.order_entry_latency(ts, symbol) for ts in local_ts], dtype=np.float64)
+
+    def order_response_latencies(self, exch_ts, symbol):
+        """Order-response latencies of an array of exchange timestamps."""
+        return np.array(
+            [self.order_response_latency(ts, symbol) for ts in exch_ts], dtype=np.float64
+        )
+
 
 class ConstantLatencyModel(LatencyModel):
     def __init__(self, feed_latency_ms=0, order_entry_latency_ms=0, order_response_latency_ms=0):
@@ -38,23 +59,66 @@ class ConstantLatencyModel(LatencyModel):
         _ = (exch_ts, symbol)
         return self._resp_lat
 
+    def feed_latencies(self, exch_ts, symbol):
+        _ = symbol
+        return np.full(len(exch_ts), self._feed_lat, dtype=np.float64)
+
+    def order_entry_latencies(self, local_ts, symbol):
+        _ = symbol
+        return np.full(len(local_ts), self._entry_lat, dtype=np.float64)
+
+    def order_response_latencies(self, exch_ts, symbol):
+        _ = symbol
+        return np.full(len(exch_ts), self._resp_lat, dtype=np.float64)
+
 
 class IntpLatencyModel(LatencyModel):
+    """Latencies interpolated linearly between measured points.
+
+    ``latency_data`` holds ``(timestamp, feed, entry, response)`` rows. The
+    points are kept in NumPy arrays for the batch lookups, and in lists for
+    the per-event ones: each series keeps the position of its last lookup
+    and, as replays query increasing timestamps, moves it by a few points
+    instead of searching the whole table.
+    """
+
+    #: Points a cursor steps over before falling back to a binary search
+    CURSOR_STEPS = 8
+
     def __init__(self, latency_data, latency_offset=0.0):
         self._offset = float(latency_offset)
         rows = sorted(
             (float(row[0]), float(row[1]), float(row[2]), float(row[3])) for row in latency_data
         )
-        self._ts = [row[0] for row in rows]
-        self._feed = [row[1] for row in rows]
-        self._entry = [row[2] for row in rows]
-        self._resp = [row[3] for row in rows]
-
-    def _interp(self, ts, values):
+        table = np.array(rows, dtype=np.float64).reshape(-1, 4)
+        self._ts_array = np.ascontiguousarray(table[:, 0])
+        self._arrays = tuple(np.ascontiguousarray(table[:, col]) for col in (1, 2, 3))
+        self._ts = self._ts_array.tolist()
+        self._values = tuple(array.tolist() for array in self._arrays)
+        self._cursors = [0, 0, 0]
+
+    def _locate(self, lookup_ts, series):
+        # bisect_left of lookup_ts, starting from the cursor of the series
+        ts = self._ts
+        idx = self._cursors[series]
+        if idx < len(ts) and ts[idx] < lookup_ts:
+            for _ in range(self.CURSOR_STEPS):
+                idx += 1
+                if idx == len(ts) or ts[idx] >= lookup_ts:
+                    break
+            else:
+                idx = bisect.bisect_left(ts, lookup_ts, idx)
+        elif idx > 0 and ts[idx - 1] >= lookup_ts:
+            idx = bisect.bisect_left(ts, lookup_ts, 0, idx)
+        self._cursors[series] = idx
+        return idx
+
+    def _interp(self, ts, series):
         if not self._ts:
             return 0.0
+        values = self._values[series]
         lookup_ts = float(ts) + self._offset
-        idx = bisect.bisect_left(self._ts, lookup_ts)
+        idx = self._locate(lookup_ts, series)
         if idx <= 0:
             return values[0]
         if idx >= len(self._ts):
@@ -68,17 +132,51 @@ class IntpLatencyModel(LatencyModel):
         ratio = (lookup_ts - left_ts) / (right_ts - left_ts)
         return left_val + (right_val - left_val) * ratio
 
+    def _interp_array(self, ts, series):
+        lookup_ts = np.asarray(ts, dtype=np.float64) + self._offset
+        count = len(self._ts)
+        if count == 0:
+            return np.zeros(lookup_ts.shape, dtype=np.float64)
+        values = self._arrays[series]
+        if count == 1:
+            return np.full(lookup_ts.shape, values[0], dtype=np.float64)
+
+        idx = np.searchsorted(self._ts_array, lookup_ts, side="left")
+        right = np.clip(idx, 1, count - 1)
+        left = right - 1
+        left_ts = self._ts_array[left]
+        span = self._ts_array[right] - left_ts
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = (lookup_ts - left_ts) / span
+        result = values[left] + (values[right] - values[left]) * ratio
+        result = np.where(span == 0.0, values[right], result)
+        result[idx <= 0] = values[0]
+        result[idx >= count] = values[-1]
+        return result
+
     def feed_latency(self, exch_ts, symbol):
         _ = symbol
-        return self._interp(exch_ts, self._feed)
+        return self._interp(exch_ts, _FEED)
 
     def order_entry_latency(self, local_ts, symbol):
         _ = symbol
-        return self._interp(local_ts, self._entry)
+        return self._interp(local_ts, _ENTRY)
 
     def order_response_latency(self, exch_ts, symbol):
         _ = symbol
-        return self._interp(exch_ts, self._resp)
+        return self._interp(exch_ts, _RESPONSE)
+
+    def feed_latencies(self, exch_ts, symbol):
+        _ = symbol
+        return self._interp_array(exch_ts, _FEED)
+
+    def order_entry_latencies(self, local_ts, symbol):
+        _ = symbol
+        return self._interp_array(local_ts, _ENTRY)
+
+    def order_response_latencies(self, exch_ts, symbol):
+        _ = symbol
+        return self._interp_array(exch_ts, _RESPONSE)
 
 
 class LatencyEngine:
@@ -1,17 +1,21 @@
 """Order-matching core for the tick-level broker.
 
-Defines the fill/match data structures (:class:`FillReport`, :class:`MatchResult`)
-and the matching engine that turns tick/depth events plus pending orders into
-fills, applying the configured exchange and queue models.
+Defines the fill/match data structures (:class:`FillReport`, :class:`MatchResult`),
+the :class:`FillPool` recycling fill records and the matching engine that turns
+tick/depth events plus pending orders into fills, applying the configured
+exchange and queue models.
 """
 
 from dataclasses import dataclass, field
 
 from backtrader.order import Order
+from backtrader.utils.slots import slotted
 
 from .exchange import FillRole
+from .registry import OrderSet
 
 
+@slotted()
 @dataclass
 class FillReport:
     order: object
@@ -22,6 +26,7 @@ class FillReport:
     source: str = "tick"
 
 
+@slotted()
 @dataclass
 class MatchResult:
     action: str
@@ -29,16 +34,68 @@ class MatchResult:
     reject_reason: str = ""
 
 
+@slotted()
 @dataclass
 class CancelResult:
     success: bool
     reason: str = ""
 
 
+class FillPool:
+    """Free list of :class:`FillReport` records.
+
+    Fills given back with :meth:`release` are reused by :meth:`acquire`
+    instead of allocating new records. A released fill must not be
+    referenced anymore: it is overwritten when handed out again.
+
+    Args:
+        maxsize: Maximum number of free fills kept.
+    """
+
+    __slots__ = ("_free", "maxsize")
+
+    def __init__(self, maxsize=4096):
+        self._free = []
+        self.maxsize = maxsize
+
+    def __len__(self):
+        return len(self._free)
+
+    def acquire(self, order, fill_price, fill_size, role="taker", timestamp=0.0, source="tick"):
+        if not self._free:
+            return FillReport(order, fill_price, fill_size, role, timestamp, source)
+        fill = self._free.pop()
+        fill.order = order
+        fill.fill_price = fill_price
+        fill.fill_size = fill_size
+        fill.role = role
+        fill.timestamp = timestamp
+        fill.source = source
+        return fill
+
+    def release(self, fills):
+        free = self._free
+        for fill in fills:
+            if len(free) >= self.maxsize:
+                break
+            fill.order = None  # do not keep the order alive
+            free.append(fill)
+
+
 class MatchingCore:
-    def __init__(self, latency_engine=None, exchange_model=None):
+    """Matches pending orders against tick and depth events.
+
+    Args:
+        latency_engine: Delays the visibility of submitted orders (optional).
+        exchange_model: Exchange/queue model deciding maker fills (optional).
+        fill_pool: :class:`FillPool` the fills are taken from (optional).
+            Fills of a processed result go back to it with :meth:`release`.
+    """
+
+    def __init__(self, latency_engine=None, exchange_model=None, fill_pool=None):
         self._latency = latency_engine
         self._exchange_model = exchange_model
+        self._fill_pool = fill_pool
         self._pending_by_symbol = {}
         self._order_to_symbol = {}
 
@@ -50,14 +107,12 @@ class MatchingCore:
 
     def _bucket(self, symbol):
         if symbol not in self._pending_by_symbol:
-            self._pending_by_symbol[symbol] = []
+            self._pending_by_symbol[symbol] = OrderSet()
         return self._pending_by_symbol[symbol]
 
     def _add_pending(self, order, symbol=None):
         symbol = symbol or self._get_symbol(order)
-        bucket = self._bucket(symbol)
-        if order not in bucket:
-            bucket.append(order)
+        self._bucket(symbol).add(order)
         self._order_to_symbol[id(order)] = symbol
 
     def submit_order(self, order, current_ts=0.0):
@@ -117,6 +172,10 @@ class MatchingCore:
     def pending_for_symbol(self, symbol):
         return list(self._pending_by_symbol.get(symbol, []))
 
+    def is_pending(self, order):
+        symbol = self._order_to_symbol.get(id(order))
+        return order in self._pending_by_symbol.get(symbol, ())
+
     def pending_orders(self):
         result = []
         for bucket in self._pending_by_symbol.values():
@@ -179,7 +238,15 @@ class MatchingCore:
 
         return MatchResult(action="FILL" if fills else "PENDING", fills=fills)
 
+    def release(self, result):
+        """Returns the fills of a processed ``result`` to the fill pool."""
+        if self._fill_pool is not None:
+            self._fill_pool.release(result.fills)
+            result.fills = []
+
     def _build_fill(self, order, price, size, timestamp, source="tick", role="taker"):
+        if self._fill_pool is not None:
+            return self._fill_pool.acquire(order, price, size, role, timestamp, source)
         return FillReport(
             order=order,
             fill_price=price,
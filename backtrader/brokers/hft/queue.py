@@ -4,6 +4,11 @@ Defines :class:`NoQueueModel` (and probabilistic variants like
 ``ProbQueueModel``) that estimate how much volume sits ahead of a resting limit
 order and how it gets consumed by trades/depth updates, driving realistic maker
 fill timing in the tick matching engine.
+
+Each model updates all the resting orders of a price level at once
+(``update_level_on_trade``/``update_level_on_depth``). The per-order
+``update_on_trade``/``update_on_depth`` update a level of one order, so
+subclasses change the queue math by overriding the level methods.
 """
 
 
@@ -19,20 +24,34 @@ class NoQueueModel:
         order._queue_fillable = 0.0
 
     def update_on_trade(self, order, trade_event):
-        remaining = getattr(getattr(order, "executed", None), "remsize", None)
-        if remaining is None:
-            remaining = getattr(order, "size", 0.0)
+        return self.update_level_on_trade((order,), trade_event)[0]
+
+    def update_level_on_trade(self, orders, trade_event):
+        """Update the orders of the traded level.
+
+        Returns:
+            list: The fillable size of each order.
+        """
         trade_volume = abs(getattr(trade_event, "volume", 0.0))
-        fillable = min(abs(remaining), trade_volume)
-        order._queue_fillable = fillable
-        return fillable
+        fillables = []
+        for order in orders:
+            remaining = getattr(getattr(order, "executed", None), "remsize", None)
+            if remaining is None:
+                remaining = getattr(order, "size", 0.0)
+            fillable = min(abs(remaining), trade_volume)
+            order._queue_fillable = fillable
+            fillables.append(fillable)
+        return fillables
 
     def update_on_depth(self, order, prev_qty, new_qty):
-        _ = prev_qty
-        order._queue_ahead = min(
-            max(0.0, float(getattr(order, "_queue_ahead", 0.0))), float(new_qty)
-        )
-        order._queue_trade_qty = 0.0
+        self.update_level_on_depth((order,), prev_qty, new_qty)
+
+    def update_level_on_depth(self, orders, prev_qty, new_qty):
+        """Update the orders of a level whose quantity changed."""
+        new_qty = float(new_qty)
+        for order in orders:
+            order._queue_ahead = min(max(0.0, float(getattr(order, "_queue_ahead", 0.0))), new_qty)
+            order._queue_trade_qty = 0.0
 
     def is_filled(self, order):
         return float(getattr(order, "_queue_fillable", 0.0)) > 0.0
@@ -67,32 +86,50 @@ class ProbQueueModel:
         return back**self.power / denominator
 
     def update_on_trade(self, order, trade_event):
-        queue_ahead = float(getattr(order, "_queue_ahead", 0.0))
+        return self.update_level_on_trade((order,), trade_event)[0]
+
+    def update_level_on_trade(self, orders, trade_event):
+        """Update the orders of the traded level.
+
+        Returns:
+            list: The fillable size of each order.
+        """
         trade_qty = abs(float(getattr(trade_event, "volume", 0.0)))
         if trade_qty <= 0.0:
-            order._queue_fillable = 0.0
-            return 0.0
-        queue_ahead -= trade_qty
-        order._queue_ahead = queue_ahead
-        order._queue_trade_qty = float(getattr(order, "_queue_trade_qty", 0.0)) + trade_qty
-        fillable = self.is_filled(order)
-        order._queue_fillable = fillable
-        return fillable
+            for order in orders:
+                order._queue_fillable = 0.0
+            return [0.0] * len(orders)
+
+        fillables = []
+        for order in orders:
+            order._queue_ahead = float(getattr(order, "_queue_ahead", 0.0)) - trade_qty
+            order._queue_trade_qty = float(getattr(order, "_queue_trade_qty", 0.0)) + trade_qty
+            fillable = self.is_filled(order)
+            order._queue_fillable = fillable
+            fillables.append(fillable)
+        return fillables
 
     def update_on_depth(self, order, prev_qty, new_qty):
-        change = float(prev_qty) - float(new_qty)
-        queue_ahead = float(getattr(order, "_queue_ahead", 0.0))
-        trade_qty = float(getattr(order, "_queue_trade_qty", 0.0))
-        change -= trade_qty
-        order._queue_trade_qty = 0.0
-        if change < 0.0:
-            order._queue_ahead = min(queue_ahead, float(new_qty))
-            return
-        front = queue_ahead
-        back = float(prev_qty) - front
-        probability = self._probability(front, back)
-        estimate = front - (1.0 - probability) * change + min(back - probability * change, 0.0)
-        order._queue_ahead = min(estimate, float(new_qty))
+        self.update_level_on_depth((order,), prev_qty, new_qty)
+
+    def update_level_on_depth(self, orders, prev_qty, new_qty):
+        """Update the orders of a level whose quantity changed."""
+        prev_qty = float(prev_qty)
+        new_qty = float(new_qty)
+        level_change = prev_qty - new_qty
+        for order in orders:
+            queue_ahead = float(getattr(order, "_queue_ahead", 0.0))
+            change = level_change - float(getattr(order, "_queue_trade_qty", 0.0))
+            order._queue_trade_qty = 0.0
+            if change < 0.0:
+                order._queue_ahead = min(queue_ahead, new_qty)
+                continue
+            back = prev_qty - queue_ahead
+            probability = self._probability(queue_ahead, back)
+            estimate = (
+                queue_ahead - (1.0 - probability) * change + min(back - probability * change, 0.0)
+            )
+            order._queue_ahead = min(estimate, new_qty)
 
     def is_filled(self, order):
         queue_ahead = float(getattr(order, "_queue_ahead", 0.0))
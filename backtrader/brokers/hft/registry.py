@@ -0,0 +1,184 @@
+"""Pending-order registry for the tick-level broker.
+
+Defines :class:`OrderSet`, an insertion-ordered set of orders with O(1)
+membership tests and removals, and :class:`SymbolOrders`, the pending orders
+of one symbol indexed by the price at which they can match, so that a trade
+or depth event only visits the orders it can reach.
+"""
+
+import bisect
+import itertools
+import math
+
+from backtrader.order import Order
+
+
+class OrderSet:
+    """Insertion-ordered set of orders keyed by ``id(order)``.
+
+    Offers the list operations used on pending-order buckets (``append``,
+    ``remove``, ``in``, iteration and ``len``) without their linear scans.
+    """
+
+    __slots__ = ("_orders",)
+
+    def __init__(self, orders=()):
+        self._orders = {}
+        for order in orders:
+            self.add(order)
+
+    def __contains__(self, order):
+        return id(order) in self._orders
+
+    def __iter__(self):
+        return iter(list(self._orders.values()))
+
+    def __len__(self):
+        return len(self._orders)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self._orders.values())!r})"
+
+    def add(self, order):
+        """Adds ``order``. Returns ``False`` if it was already present."""
+        key = id(order)
+        if key in self._orders:
+            return False
+        self._orders[key] = order
+        return True
+
+    append = add
+
+    def discard(self, order):
+        """Removes ``order``. Returns ``False`` if it was not present."""
+        return self._orders.pop(id(order), None) is not None
+
+    def remove(self, order):
+        if not self.discard(order):
+            raise ValueError("order not in set")
+
+
+class SymbolOrders(OrderSet):
+    """Pending orders of a symbol indexed by their matching price.
+
+    Limit, stop and stop-limit orders are kept in four ladders of
+    ``(level, seq)`` sorted by price, keyed by ``(isbuy, isdown)``: orders in
+    a ``down`` ladder can match when the reference price is at or below
+    their level (buy limit, sell stop), orders in an ``up`` ladder when it is
+    at or above it (sell limit, buy stop). A triggered stop-limit order is
+    indexed on its limit price. Any other order is always a candidate.
+
+    Candidates are returned in insertion order, as a list bucket would
+    iterate them.
+    """
+
+    __slots__ = ("_seqs", "_counter", "_byseq", "_where", "_ladders", "_always")
+
+    def __init__(self, orders=()):
+        self._seqs = {}  # id(order) -> seq
+        self._counter = itertools.count()
+        self._byseq = {}  # seq -> order
+        self._where = {}  # seq -> (ladder key, level)
+        self._ladders = {key: [] for key in itertools.product((True, False), repeat=2)}
+        self._always = {}  # seq -> order
+        super().__init__(orders)
+
+    @staticmethod
+    def placement(order):
+        """Returns ``((isbuy, isdown), level)`` or ``None`` if not indexable."""
+        exectype = order.exectype
+        isbuy = order.isbuy()
+        if exectype == Order.Limit:
+            level, isdown = order.price, isbuy
+        elif exectype == Order.Stop:
+            level, isdown = order.price, not isbuy
+        elif exectype == Order.StopLimit:
+            if getattr(order, "_stop_triggered", False):
+                level, isdown = order.pricelimit, isbuy
+            else:
+                level, isdown = order.price, not isbuy
+        else:
+            return None
+
+        if level is None or math.isnan(level):
+            return None
+        return (isbuy, isdown), level
+
+    def add(self, order):
+        if not super().add(order):
+            return False
+        seq = self._seqs[id(order)] = next(self._counter)
+        self._byseq[seq] = order
+        self._place(seq, order)
+        return True
+
+    append = add
+
+    def discard(self, order):
+        if not super().discard(order):
+            return False
+        seq = self._seqs.pop(id(order))
+        del self._byseq[seq]
+        self._unplace(seq)
+        return True
+
+    def reindex(self, order):
+        """Files ``order`` again after a change of its matching price."""
+        seq = self._seqs.get(id(order))
+        if seq is not None:
+            self._unplace(seq)
+            self._place(seq, order)
+
+    def _place(self, seq, order):
+        placement = self.placement(order)
+        if placement is None:
+            self._always[seq] = order
+            return
+        key, level = placement
+        bisect.insort(self._ladders[key], (level, seq))
+        self._where[seq] = placement
+
+    def _unplace(self, seq):
+        if self._always.pop(seq, None) is not None:
+            return
+        key, level = self._where.pop(seq)
+        ladder = self._ladders[key]
+        del ladder[bisect.bisect_left(ladder, (level, seq))]
+
+    def _reached(self, isbuy, price, seqs):
+        # down: level >= price, up: level <= price
+        down = self._ladders[isbuy, True]
+        seqs.extend(seq for _, seq in down[bisect.bisect_left(down, (price,)) :])
+        up = self._ladders[isbuy, False]
+        seqs.extend(seq for _, seq in up[: bisect.bisect_left(up, (price, math.inf))])
+
+    def _candidates(self, seqs):
+        seqs.extend(self._always)
+        seqs.sort()
+        return [self._byseq[seq] for seq in seqs]
+
+    def trade_candidates(self, price):
+        """Orders which a trade at ``price`` can trigger or fill."""
+        if price is None or math.isnan(price):
+            return list(self)
+        seqs = []
+        self._reached(True, price, seqs)
+        self._reached(False, price, seqs)
+        return self._candidates(seqs)
+
+    def depth_candidates(self, best_bid, best_ask):
+        """Orders which a book with ``best_bid``/``best_ask`` can fill.
+
+        Buy orders are matched against the best ask and sell orders against
+        the best bid; a missing side cannot fill resting orders.
+        """
+        if (best_bid is not None and math.isnan(best_bid)) or (
+            best_ask is not None and math.isnan(best_ask)
+        ):
+            return list(self)
+        seqs = []
+        if best_ask is not None:
+            self._reached(True, best_ask, seqs)
+        if best_bid is not None:
+            self._reached(False, best_bid, seqs)
+        return self._candidates(seqs)
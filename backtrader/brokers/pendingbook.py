@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+"""Pending Book Module - Resting limit and stop orders indexed by price.
+
+``BackBroker`` evaluates its pending orders on every bar, but a limit or
+stop order can only execute (or trigger) when the bar reaches its price.
+The broker files the orders which are left resting after an evaluation in
+a ``PendingBook``: per data feed, two ladders sorted by trigger price and a
+heap of expiration dates. On each bar only the orders whose price lies
+inside the range traded by the bar, and the ones which expire, are handed
+back to the broker for evaluation.
+
+Classes:
+    PendingBook: Resting orders indexed by data feed, price and validity.
+"""
+
+import bisect
+import heapq
+import math
+
+from ..order import Order
+
+__all__ = ["PendingBook"]
+
+
+class _DataBook:
+    """Resting orders of a single data feed.
+
+    Ladders hold ``(level, seq)`` tuples sorted by price. Orders in ``down``
+    can execute when the bar trades at or below their level (buy limit,
+    sell stop), orders in ``up`` when it trades at or above it (sell limit,
+    buy stop). ``expiry`` is a heap of ``(valid, seq)`` whose entries are
+    discarded lazily.
+    """
+
+    __slots__ = ("down", "up", "expiry", "inheap")
+
+    def __init__(self):
+        self.down = []
+        self.up = []
+        self.expiry = []
+        self.inheap = set()
+
+
+class PendingBook:
+    """Resting orders of a broker indexed by data feed, price and validity.
+
+    Orders are identified by ``order.pseq``, the acceptance sequence number
+    given by the broker, and ``due`` returns them in that order so that the
+    broker evaluates them as if they had stayed in its pending queue.
+    """
+
+    def __init__(self):
+        self._books = {}  # data -> _DataBook
+        self._where = {}  # seq -> (order, ladder, level)
+        self._refs = {}  # order.ref -> seq
+
+    def __len__(self):
+        return len(self._where)
+
+    @staticmethod
+    def placement(order):
+        """Returns ``(isdown, level)`` for an order which can rest in the book.
+
+        Only orders whose execution depends on the bar reaching a fixed
+        price qualify. Trailing orders adjust their price on every bar and
+        are left out, as are market, close and historical orders and orders
+        which override ``expire``.
+
+        Returns:
+            tuple or None: The ladder (``True`` for ``down``) and the price,
+            or ``None`` if the order has to be evaluated on every bar.
+        """
+        exectype = order.exectype
+        if exectype == Order.Limit:
+            level, isdown = order.created.price, order.isbuy()
+        elif exectype == Order.Stop:
+            level, isdown = order.created.price, not order.isbuy()
+        elif exectype == Order.StopLimit:
+            if order.triggered:  # a limit order on pricelimit
+                level, isdown = order.created.pricelimit, order.isbuy()
+            else:
+                level, isdown = order.created.price, not order.isbuy()
+        else:
+            return None
+
+        if level is None or math.isnan(level) or type(order).expire is not Order.expire:
+            return None
+
+        return isdown, level
+
+    def add(self, order):
+        """Files a resting ``order``. Returns ``False`` if it does not qualify."""
+        placement = self.placement(order)
+        if placement is None:
+            return False
+
+        isdown, level = placement
+        book = self._books.get(order.data)
+        if book is None:
+            book = self._books[order.data] = _DataBook()
+
+        seq = order.pseq
+        ladder = book.down if isdown else book.up
+        bisect.insort(ladder, (level, seq))
+        self._where[seq] = (order, ladder, level)
+        self._refs[order.ref] = seq
+        if order.valid and seq not in book.inheap:
+            heapq.heappush(book.expiry, (order.valid, seq))
+            book.inheap.add(seq)
+
+        return True
+
+    def get(self, ref):
+        """Returns the resting order with reference ``ref`` or ``None``."""
+        seq = self._refs.get(ref)
+        return None if seq is None else self._where[seq][0]
+
+    def remove(self, order):
+        """Removes ``order`` from the book. Returns ``False`` if not resting."""
+        seq = self._refs.pop(order.ref, None)
+        if seq is None:
+            return False
+
+        _, ladder, level = self._where.pop(seq)
+        del ladder[bisect.bisect_left(ladder, (level, seq))]
+        return True
+
+    def orders(self):
+        """Returns the resting orders in acceptance order."""
+        return [self._where[seq][0] for seq in sorted(self._where)]
+
+    def due(self, prices):
+        """Removes and returns the orders to be evaluated on this bar.
+
+        Args:
+            prices: Callable returning ``(open, high, low, close)`` for a
+                data feed.
+
+        Returns:
+            list: Orders reached by the bar range or expiring, sorted by
+            acceptance sequence.
+        """
+        where = self._where
+        refs = self._refs
+        due = []
+        for data, book in self._books.items():
+            down, up = book.down, book.up
+            if not down and not up:
+                book.expiry.clear()  # only stale entries are left
+                book.inheap.clear()
+                continue
+
+            popen, phigh, plow, _ = prices(data)
+            if math.isnan(popen) or math.isnan(phigh) or math.isnan(plow):
+                crossed = down + up  # comparisons cannot be trusted
+                down.clear()
+                up.clear()
+            else:
+                i = bisect.bisect_left(down, (min(popen, plow),))
+                j = bisect.bisect_left(up, (max(popen, phigh), math.inf))
+                crossed = down[i:] + up[:j]
+                del down[i:]
+                del up[:j]
+
+            for _, seq in crossed:
+                order = where.pop(seq)[0]
+                del refs[order.ref]
+                due.append((seq, order))
+
+            expiry = book.expiry
+            if expiry:
+                dt0 = data.datetime[0]
+                while expiry and expiry[0][0] < dt0:
+                    _, seq = heapq.heappop(expiry)
+                    book.inheap.discard(seq)
+                    if seq in where:
+                        order = where[seq][0]
+                        self.remove(order)
+                        due.append((seq, order))
+
+        due.sort(key=lambda item: item[0])
+        return [order for _, order in due]
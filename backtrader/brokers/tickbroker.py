@@ -16,7 +16,17 @@ Example:
 import collections
 
 from backtrader.broker import BrokerBase
-from backtrader.brokers.hft import FillRole, LatencyEngine, MatchingCore, Recorder, StateTracker
+from backtrader.depthbook import DepthBook
+from backtrader.brokers.hft import (
+    FillRole,
+    LatencyEngine,
+    MatchingCore,
+    OrderSet,
+    Recorder,
+    StateTracker,
+    SymbolOrders,
+)
+from backtrader.events import OrderBookDiff, OrderBookSnapshot
 from backtrader.order import BuyOrder, Order, SellOrder
 from backtrader.parameters import ParameterDescriptor
 from backtrader.position import Position
@@ -99,7 +109,7 @@ class TickBroker(BrokerBase):
         self._cash = self.get_param("cash")
         self._value = self._cash
         self._orders = []
-        self._pending_orders = []
+        self._pending_orders = OrderSet()
         self._order_history = []
         self._positions: dict = collections.defaultdict(Position)
         self.positions = self._positions
@@ -111,6 +121,7 @@ class TickBroker(BrokerBase):
         self._fundmode = False
         self._last_tick = {}
         self._last_orderbook = {}
+        self._depth_books = {}
         self._impact_model = impact_model
         self._latency_model = latency_model
         self._exchange_model = exchange_model
@@ -123,7 +134,7 @@ class TickBroker(BrokerBase):
         )
         self._state_tracker = state_tracker or StateTracker()
         self._recorder = recorder or Recorder()
-        self._orders_by_symbol = collections.defaultdict(list)
+        self._orders_by_symbol = collections.defaultdict(SymbolOrders)
         self._last_event_ts = 0.0
         self._tick_count = 0
         self._position_mode_frozen = False
@@ -141,7 +152,7 @@ class TickBroker(BrokerBase):
         super().start()
         self._cash = self.get_param("cash")
         self._value = self._cash
-        self._pending_orders = []
+        self._pending_orders = OrderSet()
         self._order_history = []
         self._positions = collections.defaultdict(Position)
         self.positions = self._positions
@@ -150,7 +161,8 @@ class TickBroker(BrokerBase):
         self._notifs = collections.deque()
         self._last_tick = {}
         self._last_orderbook = {}
-        self._orders_by_symbol = collections.defaultdict(list)
+        self._depth_books = {}
+        self._orders_by_symbol = collections.defaultdict(SymbolOrders)
         self._latency_engine = LatencyEngine(latency_model=self._latency_model)
         self._matching_core = MatchingCore(
             latency_engine=self._latency_engine,
@@ -306,7 +318,7 @@ class TickBroker(BrokerBase):
         order.broker = self
         order.plen = 0
         self._matching_core.submit_order(order, current_ts=self._last_event_ts)
-        if order in self._matching_core.pending_for_symbol(self._get_data_name(order.data)):
+        if self._matching_core.is_pending(order):
             self._queue_pending_order(order)
         self.notify(order)
         return order
@@ -548,13 +560,18 @@ class TickBroker(BrokerBase):
         self._tick_count += 1
         self._activate_visible_orders(current_ts)
 
+        bucket = self._orders_by_symbol.get(data_name)
+        if bucket is None:
+            candidates = []
+        elif self._exchange_model is not None:
+            candidates = list(bucket)  # queue positions follow every trade
+        else:
+            candidates = bucket.trade_candidates(getattr(tick_event, "price", None))
         active_orders = [
-            order
-            for order in list(self._orders_by_symbol.get(data_name, []))
-            if self._order_is_active_for_event(order, tick_event)
+            order for order in candidates if self._order_is_active_for_event(order, tick_event)
         ]
 
-        matched = []
+        matched = OrderSet()
         if self._exchange_model is not None:
             for fill_order, fill_price, fill_size, fill_role in self._exchange_model.on_trade(
                 tick_event, active_orders
@@ -590,6 +607,8 @@ class TickBroker(BrokerBase):
                 self._execute(order, fill_price, fill_size, tick_event)
                 if not order.alive() or not self.get_param("allow_partial"):
                     matched.append(order)
+            if order.exectype == Order.StopLimit:
+                bucket.reindex(order)  # once triggered it rests on its limit price
 
         for order in matched:
             self._remove_pending_order(order)
@@ -597,8 +616,12 @@ class TickBroker(BrokerBase):
     def process_orderbook(self, ob_event, data=None):
         """Process an order book snapshot and match pending orders.
 
+        An OrderBookDiff is applied to the depth book of its symbol and the
+        resulting snapshot is processed in its place. With an exchange model
+        the event carries the level changes in ``depth_changes``.
+
         Args:
-            ob_event: OrderBookSnapshot with current depth.
+            ob_event: OrderBookSnapshot with current depth, or OrderBookDiff.
             data: The data feed associated with this snapshot (optional).
         """
         ob_event = self._latency_engine.apply_feed_latency(ob_event)
@@ -606,22 +629,38 @@ class TickBroker(BrokerBase):
         current_ts = getattr(ob_event, "local_time", ob_event.timestamp)
         self._last_event_ts = current_ts
         previous_orderbook = self._last_orderbook.get(data_name)
-        ob_event.previous_bids = list(getattr(previous_orderbook, "bids", []) or [])
-        ob_event.previous_asks = list(getattr(previous_orderbook, "asks", []) or [])
+        if (
+            self._exchange_model is not None
+            or data_name in self._depth_books
+            or isinstance(ob_event, OrderBookDiff)
+        ):
+            ob_event, changes = self._update_depth_book(ob_event, previous_orderbook)
+            ob_event.depth_changes = changes
+        # Snapshots are not modified once processed: no need to copy the levels
+        ob_event.previous_bids = getattr(previous_orderbook, "bids", None) or []
+        ob_event.previous_asks = getattr(previous_orderbook, "asks", None) or []
         self._last_orderbook[data_name] = ob_event
         self._activate_visible_orders(current_ts)
 
+        bucket = self._orders_by_symbol.get(data_name)
+        if bucket is None:
+            candidates = []
+        elif self._exchange_model is not None:
+            candidates = list(bucket)  # every order sees the new book
+        else:
+            candidates = bucket.depth_candidates(
+                ob_event.bids[0][0] if ob_event.bids else None,
+                ob_event.asks[0][0] if ob_event.asks else None,
+            )
         active_orders = [
-            order
-            for order in list(self._orders_by_symbol.get(data_name, []))
-            if self._order_is_active_for_event(order, ob_event)
+            order for order in candidates if self._order_is_active_for_event(order, ob_event)
         ]
         for order in active_orders:
             order._queue_trade_qty_before_depth_update = float(
                 getattr(order, "_queue_trade_qty", 0.0)
             )
 
-        matched = []
+        matched = OrderSet()
         if self._exchange_model is not None:
             for (
                 fill_order,
@@ -1157,6 +1196,40 @@ class TickBroker(BrokerBase):
         for order in matched:
             self._remove_pending_order(order)
 
+    def _update_depth_book(self, ob_event, previous_orderbook):
+        """Apply an order book event to the depth book of its symbol.
+
+        The book is keyed with the tick size of the exchange model, if any,
+        and is seeded from the previous snapshot when first needed.
+
+        Returns:
+            tuple: The snapshot to process (built from the book for an
+            OrderBookDiff) and the level changes as returned by DepthBook.
+        """
+        symbol = ob_event.symbol
+        tick_size = getattr(self._exchange_model, "tick_size", None)
+        tick_size = float(tick_size) if tick_size and tick_size > 0 else None
+        book = self._depth_books.get(symbol)
+        if book is None or book.tick_size != tick_size:
+            book = self._depth_books[symbol] = DepthBook(tick_size)
+            if previous_orderbook is not None:
+                book.apply_snapshot(previous_orderbook.bids, previous_orderbook.asks)
+
+        if not isinstance(ob_event, OrderBookDiff):
+            return ob_event, book.apply_snapshot(ob_event.bids, ob_event.asks)
+
+        changes = book.apply_diff(ob_event.bids, ob_event.asks)
+        snapshot = OrderBookSnapshot(
+            timestamp=ob_event.timestamp,
+            symbol=symbol,
+            exchange=ob_event.exchange,
+            asset_type=ob_event.asset_type,
+            local_time=ob_event.local_time,
+            bids=book.bids,
+            asks=book.asks,
+        )
+        return snapshot, changes
+
     def _try_match(self, order, tick):
         """Try to match an order against a tick.
 
@@ -1733,27 +1806,17 @@ class TickBroker(BrokerBase):
         return self._event_timestamp_ns(event) > int(active_after_ts)
 
     def _queue_pending_order(self, order):
-        if order not in self._pending_orders:
-            self._pending_orders.append(order)
-        data_name = self._get_data_name(order.data)
-        if order not in self._orders_by_symbol[data_name]:
-            self._orders_by_symbol[data_name].append(order)
+        self._pending_orders.add(order)
+        self._orders_by_symbol[self._get_data_name(order.data)].add(order)
 
     def _remove_pending_order(self, order):
-        try:
-            self._pending_orders.remove(order)
-        except ValueError:
-            # Order already removed from the pending list; idempotent removal.
-            pass
+        # Idempotent: the order may already be gone from either registry
+        self._pending_orders.discard(order)
 
         data_name = self._get_data_name(order.data)
         bucket = self._orders_by_symbol.get(data_name)
         if bucket is not None:
-            try:
-                bucket.remove(order)
-            except ValueError:
-                # Order not in this symbol bucket; idempotent removal.
-                pass
+            bucket.discard(order)
             if not bucket:
                 del self._orders_by_symbol[data_name]
 
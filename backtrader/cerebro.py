@@ -35,19 +35,24 @@ import collections
 import datetime
 import itertools
 import multiprocessing
+import pickle
 from datetime import timezone
 
 from . import errors, feeds, indicator, linebuffer, observers
 from .brokers import BackBroker
+from .channelshards import ShardedRun, allocate_cash, partition_sources, run_shards
 from .dataseries import TimeFrame
 from .metabase import OwnerContext
+from .optscheduler import OptResultsFile, OptScheduler, sweep_fingerprint
 from .parameters import ParameterDescriptor, ParameterizedBase
+from .signalbatch import SignalBatchStrategy
 from .strategy import SignalStrategy, Strategy
 from .timer import Timer
 from .tradingcal import PandasMarketCalendar, TradingCalendarBase
-from .utils import OrderedDict, date2num, num2date, tzparse
+from .utils import OrderedDict, date2num, num2date, tzparse, vectorops
 from .utils.log_message import get_logger
 from .utils.py3 import integer_types, map, range, string_types, zip
+from .utils.sharedmem import SharedLinesStore
 from .writer import WriterFile
 
 logger = get_logger(__name__)
@@ -106,6 +111,26 @@ class Cerebro(ParameterizedBase):
       Note: When True, indicators are calculated using vectorized operations
       for better performance. Strategies and observers still run event-by-event.
 
+    - ``preloadresample`` (default: ``False``)
+
+      Data feeds added with ``resampledata`` turn ``preload`` (and with it
+      ``runonce``) off. If ``True`` and both are on, they are preloaded like
+      any other feed: the source bars are then resampled all at once (see
+      the ``bulk`` parameter of the ``Resampler``), which delivers the same
+      bars much faster than resampling them one by one
+
+      Note: The datas are then synchronized as preloaded datas are, like
+      those resampled with ``data.resample``. Has no effect with
+      ``replaydata`` or live feeds, which always run without preload.
+
+    - ``feedcache`` (default: ``None``)
+
+      Directory (or ``FeedCache``) keeping the lines of the preloaded data
+      feeds, as parsed and resampled, on disk. Later runs memory-map the
+      stored lines instead of loading the feeds again, until the source,
+      the parameters or the filters of a feed change. Feeds with a
+      ``cache`` parameter of their own use that one instead
+
     - ``live`` (default: ``False``)
 
       If no data has reported itself as *live* (via the data's ``islive``
@@ -231,6 +256,73 @@ class Cerebro(ParameterizedBase):
       Note: When True, identical indicator calculations are cached and reused
       to reduce computation. Disabled by default due to edge cases.
 
+    - ``vectorize`` (default: ``False``)
+
+      When running in ``runonce`` mode, compute the core indicators (moving
+      averages, ``Highest``/``Lowest``/``SumN``, ``StdDev``, Bollinger Bands,
+      ``RSI``, ``ATR``, ``MACD`` and everything built on top of them, like
+      ``Stochastic``) with whole-array NumPy kernels which write straight into
+      the line storage.
+
+      The results are bit-for-bit those of the regular ``once()`` code:
+      window sums are rounded exactly like ``math.fsum`` (or like the plain
+      loops of Bollinger Bands).
+
+    - ``numpystorage`` (default: ``False``)
+
+      Keep the values of unbounded lines in contiguous NumPy storage (a
+      preallocated float64 array with amortized O(1) appends) instead of
+      ``array.array``. Whole-line reads like ``get``/``getzero`` and the
+      ``vectorize`` kernels then work on the values without copying them
+      value by value.
+
+      Note: Per-bar scalar access goes through Python instead of C, so this
+      pays off with ``runonce``/``vectorize`` and whole-line reads. It has no
+      effect on lines using ``exactbars`` (``deque``) storage.
+
+    - ``fuse`` (default: ``False``)
+
+      Compile each tree of line operations held by a strategy (for example
+      ``self.signal = (self.data.close - sma) / atr > 1.5``) into a single
+      fused evaluator. In ``runonce`` mode the whole expression is computed
+      with NumPy without intermediate buffers and in ``next`` mode a
+      generated function evaluates it with a single call per bar. The
+      intermediate nodes are not evaluated.
+
+      Note: Trees holding other ``LineActions`` (delayed lines, ``bt.If``,
+      ``bt.And``, ...) or lines following another feed keep their regular
+      evaluation.
+
+    - ``indcache`` (default: ``False``)
+
+      In ``runonce`` mode keep the values computed by each indicator, keyed
+      by its class, its parameters and its inputs (data feeds or other
+      indicators), and reuse them when an identical indicator is found in a
+      later run of the same process. When optimizing
+      ``fast=range(5, 50), slow=range(20, 200)`` each distinct moving
+      average is then computed once per worker process instead of once per
+      combination. The cache is emptied at the start of each ``run``.
+
+      Note: Indicators fed by line operations (``self.data.close -
+      self.data.open``, ``bt.If``, ...) are always computed. Only the lines
+      of an indicator are restored: indicators keeping other state computed
+      in ``next``/``once`` and read by the strategy must not use it.
+
+    - ``incremental`` (default: ``False``)
+
+      When running in ``next`` mode (including live trading), update the
+      window indicators (``SMA``, ``Average``, ``SumN``, ``Highest``/
+      ``Lowest``, ``StdDev`` and Bollinger Bands) from rolling state kept
+      between bars instead of recalculating the whole window: each bar costs
+      O(1) instead of O(period). Running sums and variances are recalculated
+      exactly from the window every ``period`` bars to bound the rounding
+      drift. It can also be enabled per indicator class with
+      ``Indicator.useincremental``.
+
+      Note: Results may differ from the regular ``next`` in the last bits
+      of precision. Windows holding NaN or infinite values are recalculated
+      as usual.
+
     - ``writer`` (default: ``False``)
 
       If set to ``True`` a default WriterFile will be created which will
@@ -261,6 +353,42 @@ class Cerebro(ParameterizedBase):
       Note: When True with preload/runonce, data is preloaded once in the
       main process and shared across optimization workers (~20% speedup).
 
+    - ``optsharedmem`` (default: ``False``)
+
+      If ``True`` and ``optdatas`` is in effect, the values of the lines of
+      the data feeds preloaded in the main process are moved to a single
+      ``multiprocessing.shared_memory`` block. The optimization workers then
+      receive only the name of the block and attach to it read-only instead
+      of getting (and keeping) a pickled copy of every feed.
+
+      Note: The shared values are copy-on-write: a worker modifying a data
+      line gets a private copy of that line. The block is destroyed when the
+      optimization finishes.
+
+    - ``optchunksize`` (default: ``0``)
+
+      Number of parameter combinations sent to a worker process per task
+      during optimization. With ``0`` the size adapts to the measured run
+      time of a combination, aiming at about one second of work per task.
+      Workers keep the ``Cerebro`` (and the feeds preloaded with
+      ``optdatas``) from one task to the next.
+
+    - ``optresults`` (default: ``None``)
+
+      Path of a file where each optimization result is stored as soon as
+      its combination finishes. If the file already holds results of the
+      same sweep, those combinations are not run again: an interrupted
+      optimization is resumed by running it again with the same file.
+
+      The sweep is identified by the combinations and by the datas (files
+      by path, size and modification time), the broker and its commission
+      schemes, the analyzers, observers, sizers and the parameters of
+      ``Cerebro``: a file holding the results of another sweep raises
+      ``ConfigError``, as does a value without a stable description (an
+      object whose ``repr`` is its address).
+
+      Note: Results must be picklable (the default with ``optreturn``). The
+      ``optcallback`` callbacks are not called for the loaded results.
 
     - ``optreturn`` (default: ``True``)
 
@@ -352,6 +480,32 @@ class Cerebro(ParameterizedBase):
       Note: False delays notifications until next bar. True sends immediately.
       Mainly relevant for live trading.
 
+    - ``channelshards`` (default: ``False``)
+
+      If ``True``, a channel run (``run(channel=...)``) partitions the events
+      by symbol and replays each symbol in a worker process (``maxcpus``
+      processes) with its own copy of the broker and strategies. Strategies
+      must not share state across symbols.
+
+      ``run`` then returns a ``ShardedRun``: for each symbol, the
+      ``OptReturn`` of its strategies, with the fills (``order_history``),
+      recorder entries (``records``) and portfolio ``equity`` of all the
+      symbols merged by timestamp.
+
+      The cash of the broker is split among the shards (see ``shardcash``)
+      and each shard can only spend its part: results differ from those of
+      a serial run if a symbol needs more cash than it was given.
+
+      Note: The channels of a ``StreamingEventQueue`` are split by symbol
+      and each worker loads the events of its own channels. The events of
+      other streams are buffered per symbol before the workers start.
+
+    - ``shardcash`` (default: ``None``)
+
+      Cash of the shard brokers with ``channelshards``, as a dict
+      ``{symbol: cash}``. The symbols left out share the rest of the cash of
+      the broker evenly (all of them if ``None``).
+
     """
 
     # Parameter descriptors using new system
@@ -359,6 +513,10 @@ class Cerebro(ParameterizedBase):
         default=True, type_=bool, doc="Whether to preload the different data feeds"
     )
     runonce = ParameterDescriptor(default=True, type_=bool, doc="Run Indicators in vectorized mode")
+    preloadresample = ParameterDescriptor(
+        default=False, type_=bool, doc="Preload (and bulk resample) resampledata feeds"
+    )
+    feedcache = ParameterDescriptor(default=None, doc="On-disk cache of the preloaded datas")
     maxcpus = ParameterDescriptor(default=None, doc="How many cores to use for optimization")
     stdstats = ParameterDescriptor(default=True, type_=bool, doc="Add default Observers")
     oldbuysell = ParameterDescriptor(
@@ -372,12 +530,34 @@ class Cerebro(ParameterizedBase):
     optdatas = ParameterDescriptor(
         default=True, type_=bool, doc="Optimize data preloading during optimization"
     )
+    optsharedmem = ParameterDescriptor(
+        default=False, type_=bool, doc="Share preloaded data with optimization workers"
+    )
+    optchunksize = ParameterDescriptor(
+        default=0, type_=int, doc="Combinations per optimization task (0: adaptive)"
+    )
+    optresults = ParameterDescriptor(default=None, doc="File streaming optimization results")
     optreturn = ParameterDescriptor(
         default=True, type_=bool, doc="Return simplified objects during optimization"
     )
     objcache = ParameterDescriptor(
         default=False, type_=bool, doc="Cache lines objects to reduce memory"
     )
+    vectorize = ParameterDescriptor(
+        default=False, type_=bool, doc="Compute runonce indicators with NumPy kernels"
+    )
+    numpystorage = ParameterDescriptor(
+        default=False, type_=bool, doc="Store line values in contiguous NumPy arrays"
+    )
+    fuse = ParameterDescriptor(
+        default=False, type_=bool, doc="Compile strategy line operation trees"
+    )
+    indcache = ParameterDescriptor(
+        default=False, type_=bool, doc="Reuse runonce indicator results across runs"
+    )
+    incremental = ParameterDescriptor(
+        default=False, type_=bool, doc="Update window indicators with rolling state in next"
+    )
     live = ParameterDescriptor(default=False, type_=bool, doc="Run in live mode")
     writer = ParameterDescriptor(default=False, type_=bool, doc="Add a default WriterFile")
     tradehistory = ParameterDescriptor(
@@ -394,6 +574,10 @@ class Cerebro(ParameterizedBase):
     quicknotify = ParameterDescriptor(
         default=False, type_=bool, doc="Deliver broker notifications quickly"
     )
+    channelshards = ParameterDescriptor(
+        default=False, type_=bool, doc="Replay channel events per symbol in worker processes"
+    )
+    shardcash = ParameterDescriptor(default=None, doc="Cash of each channel shard by symbol")
 
     def __init__(self, **kwargs):
         """Initialize Cerebro with optional parameter overrides.
@@ -416,6 +600,7 @@ class Cerebro(ParameterizedBase):
         self._event_stop = None
         self._dolive = False  # Live trading mode flag
         self._doreplay = False  # Data replay mode flag
+        self._doresample = False  # Data resample mode flag
         self._dooptimize = False  # Optimization mode flag
 
         # Component containers
@@ -433,6 +618,7 @@ class Cerebro(ParameterizedBase):
         self.storecbs = []  # Store callbacks
         self.datacbs = []  # Data callbacks
         self.signals = []  # Signal definitions
+        self.optsignals = []  # Signal grids evaluated as a batch
 
         # Signal strategy configuration
         self._signal_strat = (None, None, None)
@@ -762,6 +948,31 @@ class Cerebro(ParameterizedBase):
         """Add a signal to be used with SignalStrategy."""
         self.signals.append((sigtype, sigcls, sigargs, sigkwargs))
 
+    def optsignal(self, sigtype, sigcls, *sigargs, **sigkwargs):
+        """Add a signal whose parameters are evaluated as a grid in one run.
+
+        As with ``optstrategy``, ``sigargs`` and ``sigkwargs`` hold iterables
+        with the values to check. Instead of running the combinations one by
+        one, ``run`` uses a single ``SignalBatchStrategy`` which computes all
+        the signals of the grid and simulates every combination with a
+        simplified vectorized broker. Signals added with ``add_signal`` are
+        part of every combination.
+
+        The results are in the ``batch`` attribute (``SignalBatchResults``)
+        of the strategy returned by ``run``::
+
+          cerebro.optsignal(bt.SIGNAL_LONGSHORT, SmaCross, fast=range(5, 50),
+                            slow=range(20, 200))
+          batch = cerebro.run()[0].batch
+          for idx in batch.ranking(by='value', n=10):
+              print(batch.get(idx))
+        """
+        args = itertools.product(*self.iterize(sigargs))
+        vals = itertools.product(*self.iterize(sigkwargs.values()))
+        kwargs = [dict(zip(sigkwargs, v)) for v in vals]
+        combos = list(itertools.product(args, kwargs))
+        self.optsignals.append((sigtype, sigcls, combos))
+
     def signal_strategy(self, stratcls, *args, **kwargs):
         """Set a SignalStrategy subclass to receive signals."""
         self._signal_strat = (stratcls, args, kwargs)
@@ -1064,6 +1275,9 @@ class Cerebro(ParameterizedBase):
         # quick-notify path so strategy/observer callbacks receive them.
         self.p.quicknotify = True
 
+        if self.p.channelshards and channel is not True:
+            return self._run_channel_sharded(channel)
+
         # --- strategy instantiation (simplified, no bar-data required) ---
         self._init_stcount()
         runstrats: list = []
@@ -1126,6 +1340,27 @@ class Cerebro(ParameterizedBase):
         self.runstrats = [runstrats]
         return runstrats
 
+    def _run_channel_sharded(self, channel):
+        """Replay the events of ``channel`` per symbol in worker processes.
+
+        Each shard runs in a copy of this Cerebro unpickled for it, in the
+        pool or, with ``maxcpus=1``, in this process, with its part of the
+        cash of the broker. Channels of a queue are loaded by the shards.
+        """
+        shards = partition_sources(channel)
+        cash = allocate_cash(self._broker.get_param("cash"), list(shards), self.p.shardcash)
+        tasks = [(symbol, cash[symbol], events) for symbol, events in shards.items()]
+        logger.info("Replaying %d channel shards", len(tasks))
+
+        processes = 1
+        if self.p.maxcpus != 1 and len(tasks) > 1:
+            processes = min(self.p.maxcpus or multiprocessing.cpu_count(), len(tasks))
+        results = run_shards(pickle.dumps(self), tasks, processes)
+
+        sharded = ShardedRun(results)
+        self.runstrats = list(sharded)
+        return sharded
+
     def _instantiate_channel_strategies(self, runstrats):
         """Instantiate strategy classes for channel mode and append to
         ``runstrats``.
@@ -1280,7 +1515,7 @@ class Cerebro(ParameterizedBase):
 
         dataname.resample(**kwargs)
         self.adddata(dataname, name=name)
-        self._doreplay = True
+        self._doresample = True
 
         return dataname
 
@@ -1522,6 +1757,10 @@ class Cerebro(ParameterizedBase):
             self._dopreload = self._dopreload and self._exactbars < 1
         # If _doreplay is True or any data has replaying attribute True, set _doreplay to True
         self._doreplay = self._doreplay or any(x.replaying for x in self.datas)
+        # Resampled datas are also constructed in realtime unless preloaded
+        preloadresample = self.p.preloadresample and self._dopreload and self._dorunonce
+        if self._doresample and not (preloadresample and not (self._dolive or self.p.live)):
+            self._doreplay = True
         # If _doreplay, need to set _dopreload to False
         if self._doreplay:
             # preloading is not supported with replay. full timeframe bars
@@ -1606,14 +1845,27 @@ class Cerebro(ParameterizedBase):
 
         linebuffer.LineActions.usecache(self.p.objcache)
         indicator.Indicator.usecache(self.p.objcache)
+        indicator.Indicator.usevectorize(self.p.vectorize)
+        indicator.Indicator.useresultcache(self.p.indcache)
+        indicator.Indicator.useincremental(self.p.incremental)
+        linebuffer.LineBuffer.usenumpy(self.p.numpystorage)
+        linebuffer.LinesOperation.usefusion(self.p.fuse)
 
         # Resolve runonce/preload/exactbars/replay/live execution flags + writers
         self._resolve_run_flags()
 
         # Running strategy list
         self.runstrats = []
+        # Signal grids are evaluated by a single batch strategy
+        if self.optsignals:
+            self.addstrategy(
+                SignalBatchStrategy,
+                _accumulate=self._signal_accumulate,
+                signals=self.signals,
+                optsignals=self.optsignals,
+            )
         # If signals is not None, handle signalstrategy related issues
-        if self.signals:  # allow processing of signals
+        elif self.signals:  # allow processing of signals
             signalst, sargs, skwargs = self._signal_strat
             if signalst is None:
                 # Try to see if the 1st regular strategy is a signal strategy
@@ -1650,46 +1902,17 @@ class Cerebro(ParameterizedBase):
             self.addstrategy(Strategy)
         # Iterate strategies
         iterstrats = itertools.product(*self.strats)
-        # If not optimization parameters, or using 1 cpu core
-        if not self._dooptimize or self.p.maxcpus == 1:
-            # If no optimmization is wished ... or 1 core is to be used
-            # let's skip process "spawning"
+        # If not optimization parameters
+        if not self._dooptimize:
             # Iterate through strategies
             for iterstrat in iterstrats:
                 # Run strategy
                 runstrat = self.runstrategies(iterstrat)
                 # Add running strategy to running strategy list
                 self.runstrats.append(runstrat)
-                # If optimization parameters
-                if self._dooptimize:
-                    # Iterate all optcbs to return stopped strategy results
-                    for cb in self.optcbs:
-                        cb(runstrat)  # callback receives finished strategy
         # If optimization parameters
         else:
-            # If optdatas is True, and _dopreload, and _dorunonce
-            if self.p.optdatas and self._dopreload and self._dorunonce:
-                # Iterate each data, reset, if _exactbars < 1, extend data
-                # Start data
-                # If data _dopreload, call preload on data
-                for data in self.datas:
-                    data.reset()
-                    if self._exactbars < 1:  # datas can be a full length
-                        data.extend(size=self.params.lookahead)
-                    data._start()
-                    data.preload()
-            # Start process pool
-            pool = multiprocessing.Pool(self.p.maxcpus or None)
-            for r in pool.imap(self, iterstrats):
-                self.runstrats.append(r)
-                for cb in self.optcbs:
-                    cb(r)  # callback receives finished strategy
-            # Close process pool
-            pool.close()
-            # If optdatas is True, and _dopreload, and _dorunonce, iterate data and stop data
-            if self.p.optdatas and self._dopreload and self._dorunonce:
-                for data in self.datas:
-                    data.stop()
+            self.runstrats = self._runoptimize(list(iterstrats))
         # If not optimization parameters
         if not self._dooptimize:
             # avoid a list of list for regular cases
@@ -1697,6 +1920,81 @@ class Cerebro(ParameterizedBase):
 
         return self.runstrats
 
+    def _runoptimize(self, combos):
+        """Run the combinations of an optimization and return their results.
+
+        Results already stored in the ``optresults`` file are loaded instead
+        of being run again, and every new result is stored (and passed to the
+        ``optcallback`` callbacks) as soon as its combination finishes.
+
+        Args:
+            combos: List of combinations (one ``(strategy class, args,
+                kwargs)`` per added strategy).
+
+        Returns:
+            list: The results of the combinations, in order.
+        """
+        results = [None] * len(combos)
+        resultsfile = None
+        if self.p.optresults:
+            resultsfile = OptResultsFile(
+                self.p.optresults, sweep_fingerprint(combos, self), len(combos)
+            )
+            for idx, result in resultsfile.open().items():
+                results[idx] = result
+
+        def onresult(idx, result):
+            results[idx] = result
+            if resultsfile is not None:
+                resultsfile.append(idx, result)
+            for cb in self.optcbs:
+                cb(result)  # callback receives finished strategy
+
+        todo = [(idx, iterstrat) for idx, iterstrat in enumerate(combos) if results[idx] is None]
+        try:
+            if self.p.maxcpus == 1:
+                # If 1 core is to be used let's skip process "spawning"
+                for idx, iterstrat in todo:
+                    onresult(idx, self.runstrategies(iterstrat))
+            elif todo:
+                self._runoptimize_pool(todo, onresult)
+        finally:
+            if resultsfile is not None:
+                resultsfile.close()
+
+        return results
+
+    def _runoptimize_pool(self, todo, onresult):
+        """Run optimization combinations in a pool of worker processes."""
+        predata = self.p.optdatas and self._dopreload and self._dorunonce
+        sharedlines = None
+        # If optdatas is True, and _dopreload, and _dorunonce
+        if predata:
+            # Iterate each data, reset, if _exactbars < 1, extend data
+            # Start data
+            # If data _dopreload, call preload on data
+            for data in self.datas:
+                data.reset()
+                if self._exactbars < 1:  # datas can be a full length
+                    data.extend(size=self.params.lookahead)
+                data._start()
+                data.preload()
+            # Workers attach to the preloaded values instead of copying them
+            if self.p.optsharedmem:
+                sharedlines = SharedLinesStore()
+                sharedlines.share(self.datas)
+
+        try:
+            scheduler = OptScheduler(self, self.p.maxcpus or None, self.p.optchunksize)
+            scheduler.run(todo, onresult)
+        finally:
+            if sharedlines is not None:
+                sharedlines.release()
+            # If optdatas is True, and _dopreload, and _dorunonce, iterate data and stop data
+            if predata:
+                for data in self.datas:
+                    data.stop()
+
     # Initialize count
     def _init_stcount(self):
         self.stcount = itertools.count(0)
@@ -1920,6 +2218,7 @@ class Cerebro(ParameterizedBase):
             for a in strat.analyzers:
                 a.strategy = None
                 a._parent = None
+                a._owner = None  # the strategy cannot be unpickled in the parent
                 # OPTIMIZED: Use __dict__ instead of dir() for better performance
                 for attrname in list(a.__dict__.keys()):
                     if attrname.startswith("data"):
@@ -2138,6 +2437,12 @@ class Cerebro(ParameterizedBase):
            receive ``_next()`` / ``_next_open()``.
         """
         try:
+            # One historical feed without stores: nothing to align
+            if len(self.datas) == 1 and not self.stores:
+                data = self.datas[0]
+                if not data.islive() and not data.replaying:
+                    return self._runnext_single(runstrats, data)
+
             # Sort data by time period
             datas = sorted(self.datas, key=lambda x: (x._timeframe, x._compression))
             # Other data
@@ -2320,6 +2625,82 @@ class Cerebro(ParameterizedBase):
             logger.exception("Unhandled exception in _runnext")
             raise
 
+    def _runnext_single(self, runstrats, data):
+        """Run loop of ``_runnext`` for a single historical data feed.
+
+        With one feed there is nothing to align: the feed is the master of
+        every bar, so the loop only moves it and dispatches the bar, skipping
+        the per-bar bookkeeping of the general loop (live checks, the lists of
+        returns and datetimes, the master search). Notifications, timers,
+        ``_last`` filters, ``cheat_on_open`` and writers behave as in
+        ``_runnext``.
+        """
+        dt0 = date2num(datetime.datetime.max) - 2  # default at max
+        data.do_qcheck(bool(data.p.qcheck), 0.0)  # no live data: never changes
+        notifs = data.notifs
+        timers, timerscheat = self._timers, self._timerscheat
+        cheat_on_open = self.p.cheat_on_open
+
+        while True:
+            if notifs:
+                self._datanotify()
+                if self._event_stop:  # stop if requested
+                    return
+
+            lastret = False
+            ret = data.next(ticks=False)
+            if ret:
+                dt0 = data.lines.datetime[0]
+                if dt0 < 1:
+                    logger.warning(
+                        "Invalid datetime value dt0=%s detected in _runnext, aborting run loop",
+                        dt0,
+                    )
+                    return
+                self._dtmaster = data.num2date(dt0)
+                self._udtmaster = num2date(dt0)
+                data._tick_fill(force=True)
+            elif ret is None:
+                data._check()
+            else:
+                lastret = data._last()
+                if not lastret:
+                    break  # only go an extra round if "lasts" delivered
+
+            if notifs:
+                self._datanotify()
+                if self._event_stop:  # stop if requested
+                    return
+
+            if not (ret or lastret):
+                continue
+
+            if timerscheat:
+                self._check_timers(runstrats, dt0, cheat=True)
+            if cheat_on_open:
+                for strat in runstrats:
+                    strat._next_open()
+                    if self._event_stop:  # stop if requested
+                        return
+
+            self._brokernotify()
+            if self._event_stop:  # stop if requested
+                return
+
+            if timers:
+                self._check_timers(runstrats, dt0, cheat=False)
+            for strat in runstrats:
+                strat._next()
+                if self._event_stop:  # stop if requested
+                    return
+
+                self._next_writers(runstrats)
+
+        self._datanotify()
+        if self._event_stop:  # stop if requested
+            return
+        self._storenotify()
+
     # runonce
     def _runonce(self, runstrats):
         """
@@ -2339,6 +2720,9 @@ class Cerebro(ParameterizedBase):
         # here again, because pointers are at 0
         # Sort data from small period to large period
         datas = sorted(self.datas, key=lambda x: (x._timeframe, x._compression))
+        # The datas are preloaded: which datas move at each step can be known
+        # in advance instead of peeking into every data at every step
+        steps = self._oncetimeline(datas)
 
         while True:
             self._storenotify()
@@ -2348,23 +2732,26 @@ class Cerebro(ParameterizedBase):
             if self._event_stop:  # stop if requested
                 return
 
-            # Check the next incoming date in the datas
-            # For each data call advance_peek(), get minimum time as the first one
-            dts = [d.advance_peek() for d in datas]
-            dt0 = min(dts)
-            if dt0 == float("inf"):
-                break  # no data delivers anything
-
-            # Timemaster if needed be
-            # dmaster = datas[dts.index(dt0)]  # and timemaster
-            # For each data time, if time <= minimum time, advance data, otherwise ignore
-            for i, dti in enumerate(dts):
-                if dti <= dt0:
-                    datas[i].advance()
-                    # self._plotfillers2[i].append(slen)  # mark as fill
-                else:
-                    # self._plotfillers[i].append(slen)
-                    pass
+            if steps is not None:
+                try:
+                    dt0, ticking = next(steps)
+                except StopIteration:
+                    break  # no data delivers anything
+
+                for d in ticking:
+                    d.advance()
+            else:
+                # Check the next incoming date in the datas
+                # For each data call advance_peek(), get minimum time as the first one
+                dts = [d.advance_peek() for d in datas]
+                dt0 = min(dts)
+                if dt0 == float("inf"):
+                    break  # no data delivers anything
+
+                # For each data time, if time <= minimum time, advance data, otherwise ignore
+                for i, dti in enumerate(dts):
+                    if dti <= dt0:
+                        datas[i].advance()
             # Check timer
             self._check_timers(runstrats, dt0, cheat=True)
             # If cheat_on_open, call _oncepost_open() for each strategy
@@ -2388,6 +2775,34 @@ class Cerebro(ParameterizedBase):
                     return
                 self._next_writers(runstrats)
 
+    def _oncetimeline(self, datas):
+        """Precompute the steps of the ``_runonce`` loop.
+
+        Merges the pending datetimes of the (preloaded) ``datas`` into one
+        timeline. Returns an iterator of ``(dt0, ticking)`` tuples, where
+        ``ticking`` holds the datas which deliver a bar at ``dt0``, or
+        ``None`` if a data has datetimes which ``advance_peek`` does not
+        deliver in order (not increasing or not positive).
+        """
+        timelines = []
+        for d in datas:
+            line = d.lines.datetime
+            dts = vectorops.as_ndarray(line.array, line.buflen())[line.idx + 1 :].copy()
+            if len(dts) and not dts[0] > 0:
+                return None
+            timelines.append(dts)
+
+        merged = vectorops.merge_timelines(timelines)
+        if merged is None:
+            return None
+
+        steps, members = merged
+        ndatas = len(datas)
+        return (
+            (dt0, datas if len(m) == ndatas else [datas[i] for i in m])
+            for dt0, m in zip(steps.tolist(), members)
+        )
+
     # Check timer
     def _check_timers(self, runstrats, dt0, cheat=False):
         # If cheat is False, timers equals self._timers, otherwise equals self._timerscheat
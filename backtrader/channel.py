@@ -5,6 +5,7 @@ This module provides the core channel system:
 - DataChannel: Base class for all data channels (Tick, OrderBook, Funding)
 - DataValidationResult: Result container for data validation
 - StreamingEventQueue: Memory-efficient event queue with adaptive preloading
+  or batch merging of time-sorted sources
 - ChannelSharingMode: Enum for channel sharing between strategies
 
 The channel system is independent of LineSeries and uses deque for buffering,
@@ -21,12 +22,17 @@ Example:
 """
 
 import heapq
+import itertools
+import math
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
+
 from .utils.log_message import get_logger
+from .utils.slots import slotted
 
 logger = get_logger(__name__)
 
@@ -44,6 +50,7 @@ class EventPriority(IntEnum):
     BAR = 40
 
 
+@slotted()
 @dataclass(order=True)
 class Event:
     """Event wrapper for queue ordering.
@@ -265,6 +272,22 @@ class DataChannel:
         """
         raise NotImplementedError(f"{self.__class__.__name__} must implement load()")
 
+    def load_batches(self, batch_size=10000) -> Iterator[Tuple[np.ndarray, list]]:
+        """Load events in batches for the batch merge of StreamingEventQueue.
+
+        The default implementation groups the events of ``load()``.
+        Subclasses reading columnar sources can override it to provide
+        the timestamps without going through the events.
+
+        Args:
+            batch_size: Number of events per batch.
+
+        Yields:
+            tuple: ``(timestamps, events)``, a float64 array and the list
+            of events it belongs to, in time order.
+        """
+        return _iter_batches(self.load(), batch_size)
+
     def get_validation_errors(self) -> List[DataValidationResult]:
         """Get all validation errors encountered."""
         return list(self._validation_errors)
@@ -303,6 +326,176 @@ class DataChannel:
         )
 
 
+def _iter_batches(events, batch_size) -> Iterator[Tuple[np.ndarray, list]]:
+    """Group an event iterable into ``(timestamps, events)`` batches."""
+    events = iter(events)
+    while True:
+        chunk = list(itertools.islice(events, batch_size))
+        if not chunk:
+            return
+        batch = [event for event in chunk if hasattr(event, "timestamp")]
+        if batch:
+            timestamps = np.fromiter(
+                (event.timestamp for event in batch), dtype=np.float64, count=len(batch)
+            )
+            yield timestamps, batch
+
+
+class _MergeSource:
+    """A channel or bar source of the batch merge, with its pending events."""
+
+    __slots__ = ("batches", "channel_type", "channel_name", "priority", "timestamps", "events")
+
+    def __init__(self, batches, channel_type, channel_name, priority):
+        self.batches = batches  # None once exhausted
+        self.channel_type = channel_type
+        self.channel_name = channel_name  # None: symbol of each event (bars)
+        self.priority = priority
+        self.timestamps = np.empty(0, dtype=np.float64)
+        self.events = []
+
+    def pull(self):
+        """Append the next batch to the pending events."""
+        try:
+            timestamps, events = next(self.batches)
+        except StopIteration:
+            self.batches = None
+            return
+
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        if len(timestamps) > 1 and np.any(timestamps[1:] < timestamps[:-1]):
+            order = np.argsort(timestamps, kind="stable")
+            timestamps = timestamps[order]
+            events = [events[i] for i in order.tolist()]
+
+        if len(self.timestamps):
+            self.timestamps = np.concatenate((self.timestamps, timestamps))
+            self.events.extend(events)
+        else:
+            self.timestamps = timestamps
+            self.events = list(events)
+
+
+class _BatchMerger:
+    """Merges time-sorted batches of several sources with array sorts.
+
+    Each round takes from every source the pending events older than the
+    horizon, the smallest last pending timestamp among the sources which
+    are not exhausted, so that no event still to be loaded can precede
+    them. The round is ordered with a single stable sort on (timestamp,
+    priority, sequence), sequences being numbered source after source,
+    and handed out through a cursor.
+    """
+
+    def __init__(self, sources):
+        self._sources = sources
+        self._sequence = 0
+        self._timestamps = []
+        self._priorities = []
+        self._sequences = []
+        self._owners = []
+        self._events = []
+        self._cursor = 0
+
+    def __len__(self):
+        return len(self._events) - self._cursor
+
+    def _refill(self):
+        """Merge the next round. Returns False once every source is drained."""
+        sources = self._sources
+        for source in sources:
+            if source.batches is not None and not len(source.timestamps):
+                source.pull()
+
+        while True:
+            live = [source for source in sources if source.batches is not None]
+            while any(not len(source.timestamps) for source in live):
+                for source in live:
+                    if not len(source.timestamps):
+                        source.pull()
+                live = [source for source in sources if source.batches is not None]
+
+            horizon = min((source.timestamps[-1] for source in live), default=math.inf)
+            takes = []
+            for index, source in enumerate(sources):
+                if horizon == math.inf:
+                    count = len(source.timestamps)
+                else:
+                    count = int(np.searchsorted(source.timestamps, horizon, side="left"))
+                if count:
+                    takes.append((index, source, count))
+
+            if takes:
+                break
+            if not live:
+                return False
+            for source in live:  # everything pending sits at the horizon
+                if source.timestamps[-1] == horizon:
+                    source.pull()
+
+        timestamps = []
+        priorities = []
+        owners = []
+        events = []
+        for index, source, count in takes:
+            timestamps.append(source.timestamps[:count])
+            priorities.append(np.full(count, source.priority, dtype=np.int64))
+            owners.append(np.full(count, index, dtype=np.int64))
+            events.extend(source.events[:count])
+            source.timestamps = source.timestamps[count:]
+            del source.events[:count]
+
+        timestamps = np.concatenate(timestamps)
+        priorities = np.concatenate(priorities)
+        owners = np.concatenate(owners)
+        sequences = np.arange(self._sequence, self._sequence + len(events), dtype=np.int64)
+        self._sequence += len(events)
+        if len(takes) > 1:
+            order = np.lexsort((sequences, priorities, timestamps))
+            timestamps = timestamps[order]
+            priorities = priorities[order]
+            sequences = sequences[order]
+            owners = owners[order]
+            events = [events[i] for i in order.tolist()]
+
+        self._timestamps = timestamps.tolist()
+        self._priorities = priorities.tolist()
+        self._sequences = sequences.tolist()
+        self._owners = owners.tolist()
+        self._events = events
+        self._cursor = 0
+        return True
+
+    def has_next(self) -> bool:
+        return self._cursor < len(self._events) or self._refill()
+
+    def _event(self, i) -> Event:
+        source = self._sources[self._owners[i]]
+        data = self._events[i]
+        channel_name = source.channel_name
+        if channel_name is None:
+            channel_name = getattr(data, "symbol", "")
+        return Event(
+            timestamp=self._timestamps[i],
+            priority=self._priorities[i],
+            sequence=self._sequences[i],
+            channel_type=source.channel_type,
+            channel_name=channel_name,
+            data=data,
+        )
+
+    def peek(self) -> Optional[Event]:
+        return self._event(self._cursor) if self.has_next() else None
+
+    def pop(self) -> Optional[Event]:
+        if not self.has_next():
+            return None
+        event = self._event(self._cursor)
+        self._events[self._cursor] = None  # release the data once handed out
+        self._cursor += 1
+        return event
+
+
 class StreamingEventQueue:
     """Memory-efficient event queue with adaptive preloading.
 
@@ -313,6 +506,14 @@ class StreamingEventQueue:
     The queue loads data in chunks rather than all at once, keeping
     memory usage bounded regardless of total data size.
 
+    With ``batch_merge=True`` the sources, which must then be time-sorted,
+    are read in batches (``DataChannel.load_batches``) and merged with
+    array sorts instead of the heap; ``Event`` wrappers are only created
+    as events are popped. Events are then strictly ordered by (timestamp,
+    priority, source, position), sources being the channels followed by
+    the bar data in the order given. Memory is bounded by ``batch_size``
+    events per source and the preload window is not used.
+
     Args:
         channels: List of DataChannel instances.
         bars: List of bar data iterators.
@@ -320,6 +521,11 @@ class StreamingEventQueue:
         max_memory_mb: Maximum memory target in MB.
         adaptive: Whether to adapt the preload window based on memory.
         batch_size: Number of events to load per batch from each channel.
+        batch_merge: Whether to merge time-sorted batches instead of
+            pushing events on a heap.
+
+    Attributes:
+        options: The keyword arguments above, to build queues alike.
 
     Example::
 
@@ -343,6 +549,7 @@ class StreamingEventQueue:
         max_memory_mb=200,
         adaptive=True,
         batch_size=10000,
+        batch_merge=False,
     ):
         """Initialize a StreamingEventQueue.
 
@@ -353,9 +560,18 @@ class StreamingEventQueue:
             max_memory_mb: Maximum memory target in MB.
             adaptive: Whether to adapt the preload window based on memory.
             batch_size: Number of events to load per batch from each channel.
+            batch_merge: Whether to merge time-sorted batches instead of
+                pushing events on a heap.
         """
         self._channels = channels or []
         self._bars = bars or []
+        self.options = {
+            "preload_window": preload_window,
+            "max_memory_mb": max_memory_mb,
+            "adaptive": adaptive,
+            "batch_size": batch_size,
+            "batch_merge": batch_merge,
+        }
         self._window = preload_window
         self._max_memory = max_memory_mb * 1024 * 1024
         self._adaptive = adaptive
@@ -383,11 +599,60 @@ class StreamingEventQueue:
         # Statistics
         self._total_events_popped = 0
 
+        self._merger = None
+        if batch_merge:
+            self._merger = _BatchMerger(self._init_merge_sources())
+            return
+
         # Initialize iterators
         self._init_iterators()
         # Initial preload
         self._ensure_preload()
 
+    def partition(self) -> Optional[Dict[str, list]]:
+        """Group the channels of the queue by symbol.
+
+        A queue built with ``options`` over the channels of one symbol
+        yields the events of that symbol in (timestamp, priority) order,
+        as this queue does.
+
+        Returns:
+            dict: ``{symbol: [channel, ...]}`` in channel order, or ``None``
+            if the queue also merges bar data (each bar carries its own
+            symbol) or a channel has no symbol.
+        """
+        if self._bars or any(not channel.symbol for channel in self._channels):
+            return None
+        groups = {}
+        for channel in self._channels:
+            groups.setdefault(channel.symbol, []).append(channel)
+        return groups
+
+    def _init_merge_sources(self) -> List[_MergeSource]:
+        """Create the batch merge sources of all channels and bar data."""
+        sources = []
+        for channel in self._channels:
+            try:
+                if hasattr(channel, "load_batches"):
+                    batches = iter(channel.load_batches(self._batch_size))
+                else:
+                    batches = _iter_batches(channel.load(), self._batch_size)
+            except Exception as e:
+                logger.warning("Failed to init iterator for channel %s: %s", channel, e)
+                continue
+            priority = int(self._get_channel_priority(channel))
+            sources.append(_MergeSource(batches, channel.channel_type, channel.symbol, priority))
+
+        for i, bar_data in enumerate(self._bars):
+            try:
+                batches = _iter_batches(iter(bar_data), self._batch_size)
+            except Exception as e:
+                logger.warning("Failed to init iterator for bar data %d: %s", i, e)
+                continue
+            sources.append(_MergeSource(batches, "bar", None, int(EventPriority.BAR)))
+
+        return sources
+
     def _init_iterators(self):
         """Initialize iterators for all channels and bar data."""
         for i, channel in enumerate(self._channels):
@@ -516,6 +781,8 @@ class StreamingEventQueue:
     @property
     def empty(self) -> bool:
         """Whether the queue is empty and all sources exhausted."""
+        if self._merger is not None:
+            return not self._merger.has_next()
         if self._heap:
             return False
         # Try loading more
@@ -538,6 +805,13 @@ class StreamingEventQueue:
         Returns:
             The next Event, or None if the queue is empty.
         """
+        if self._merger is not None:
+            event = self._merger.pop()
+            if event is not None:
+                self._current_ts = event.timestamp
+                self._total_events_popped += 1
+            return event
+
         if not self._heap:
             if self.empty:
                 return None
@@ -565,6 +839,8 @@ class StreamingEventQueue:
         Returns:
             The next Event, or None if the queue is empty.
         """
+        if self._merger is not None:
+            return self._merger.peek()
         if not self._heap:
             if self.empty:
                 return None
@@ -610,8 +886,8 @@ class StreamingEventQueue:
 
     @property
     def heap_size(self) -> int:
-        """Current number of events in the heap."""
-        return len(self._heap)
+        """Current number of events in the heap (or merged batch)."""
+        return len(self)
 
     @property
     def total_events_popped(self) -> int:
@@ -629,6 +905,8 @@ class StreamingEventQueue:
         Returns:
             int: Number of events currently in the heap.
         """
+        if self._merger is not None:
+            return len(self._merger)
         return len(self._heap)
 
     def __iter__(self):
@@ -657,7 +935,7 @@ class StreamingEventQueue:
             str: Representation showing heap size, popped count, and window.
         """
         return (
-            f"StreamingEventQueue(heap={len(self._heap)}, "
+            f"StreamingEventQueue(heap={len(self)}, "
             f"popped={self._total_events_popped}, "
             f"window={self._window:.0f}s)"
         )
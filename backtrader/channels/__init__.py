@@ -4,9 +4,14 @@ Provides specialized data channels for different market data types:
 - TickChannel: Trade/tick data
 - OrderBookChannel: Order book depth snapshots
 - FundingRateChannel: Funding rate data for perpetual contracts
+
+Tick and order book channels also replay binary event stores (see
+``eventstore``), written with ``write_event_store`` or
+``convert_to_event_store``.
 """
 
 from .bridge import ChannelBridge
+from .eventstore import convert_to_event_store, iter_event_store, write_event_store
 from .funding import FundingRateChannel
 from .live_queue import LiveEventQueue
 from .live_validator import LiveDataValidator
@@ -20,4 +25,7 @@ __all__ = [
     "ChannelBridge",
     "LiveEventQueue",
     "LiveDataValidator",
+    "write_event_store",
+    "iter_event_store",
+    "convert_to_event_store",
 ]
@@ -0,0 +1,406 @@
+"""Binary event store for tick and order book replay.
+
+Stores the trades and depth updates of one instrument as a ``.npy`` file of
+``EVENT_DTYPE`` rows (the hftbacktest event layout defined in
+``brokers/hft/binance_bbo.py``), which is memory-mapped and decoded in
+chunks on replay: no text parsing and no per-row allocation until the
+events are handed out.
+
+Row layout:
+    - ``ev``: event kind in the low byte (``TRADE_EVENT``, ``DEPTH_EVENT``,
+      ``DEPTH_SNAPSHOT_EVENT``, ``DEPTH_CLEAR_EVENT``, ``DEPTH_BBO_EVENT``)
+      plus the ``EXCH_EVENT``/``LOCAL_EVENT`` and ``BUY_EVENT``/``SELL_EVENT``
+      flags (bid/ask side for depth rows, taker side for trades).
+    - ``exch_ts``/``local_ts``: exchange and local timestamps in ns.
+    - ``px``/``qty``: trade price and volume, or level price and quantity.
+    - ``order_id``: numeric trade id (0 if none).
+    - ``ival``: event sequence; the contiguous rows sharing it form one
+      event (a trade, a depth diff or a book snapshot).
+    - ``fval``: event timestamp in seconds as given to the writer, which
+      ``exch_ts`` only approximates (0 for rows from other sources, whose
+      timestamp is ``exch_ts``).
+
+Order book snapshots are stored as diffs against the previous one (only
+the first is stored in full), so that an update which touches a couple of
+levels takes a couple of rows.
+
+Example:
+    Converting and replaying::
+
+        write_event_store(channel.load(), 'btc_depth.npy')
+        for event in iter_event_store('btc_depth.npy', 'BTC/USDT'):
+            ...
+"""
+
+import gzip
+import heapq
+import math
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+from ..brokers.hft.binance_bbo import (
+    BUY_EVENT,
+    DEPTH_CLEAR_EVENT,
+    DEPTH_EVENT,
+    DEPTH_SNAPSHOT_EVENT,
+    EVENT_DTYPE,
+    EXCH_EVENT,
+    LOCAL_EVENT,
+    SELL_EVENT,
+    TRADE_EVENT,
+)
+from ..depthbook import DepthBook
+from ..events import OrderBookDiff, OrderBookSnapshot, TickEvent
+
+__all__ = [
+    "STORE_SUFFIX",
+    "write_event_store",
+    "load_event_store",
+    "iter_event_chunks",
+    "iter_event_store",
+    "convert_hft_events",
+    "convert_to_event_store",
+]
+
+STORE_SUFFIX = ".npy"
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_KIND_MASK = 0xFF
+_FEED_FLAGS = EXCH_EVENT | LOCAL_EVENT
+_SNAPSHOT_KINDS = (DEPTH_SNAPSHOT_EVENT, DEPTH_CLEAR_EVENT)
+
+
+def write_event_store(events: Iterable, path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Write tick and order book events to a store file.
+
+    Events are encoded in chunks to a temporary file next to ``path`` and
+    copied into the final ``.npy`` file, so that memory use does not grow
+    with the number of events. ``bid_*``/``ask_*`` quote fields of ticks
+    are not stored.
+
+    Args:
+        events: TickEvent, OrderBookSnapshot and OrderBookDiff instances of
+            a single instrument, in replay order.
+        path: Output file path.
+        chunk_size: Number of rows encoded at a time.
+
+    Returns:
+        int: Number of rows written.
+
+    Raises:
+        ValueError: For events of another type.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    book = DepthBook()
+    count = 0
+    try:
+        with open(tmp_path, "wb") as raw:
+            rows = []
+            for seq, event in enumerate(events):
+                _encode_event(event, seq, book, rows)
+                if len(rows) >= chunk_size:
+                    np.array(rows, dtype=EVENT_DTYPE).tofile(raw)
+                    count += len(rows)
+                    rows = []
+            if rows:
+                np.array(rows, dtype=EVENT_DTYPE).tofile(raw)
+                count += len(rows)
+
+        output = np.lib.format.open_memmap(path, mode="w+", dtype=EVENT_DTYPE, shape=(count,))
+        if count:
+            source = np.memmap(tmp_path, dtype=EVENT_DTYPE, mode="r", shape=(count,))
+            for start in range(0, count, chunk_size):
+                output[start : start + chunk_size] = source[start : start + chunk_size]
+            del source
+        output.flush()
+        del output
+    finally:
+        if tmp_path.exists():
+            os.remove(tmp_path)
+
+    return count
+
+
+def _encode_event(event, seq, book, rows):
+    """Append the rows of ``event`` to ``rows``."""
+    timestamp = float(event.timestamp)
+    exch_ts = round(timestamp * 1e9)
+    local_ts = exch_ts if event.local_time is None else round(event.local_time * 1e9)
+
+    if isinstance(event, TickEvent):
+        side = {"buy": BUY_EVENT, "sell": SELL_EVENT}.get(event.direction, 0)
+        trade_id = str(event.trade_id)
+        rows.append(
+            (
+                TRADE_EVENT | _FEED_FLAGS | side,
+                exch_ts,
+                local_ts,
+                event.price,
+                event.volume,
+                int(trade_id) if trade_id.isdigit() else 0,
+                seq,
+                timestamp,
+            )
+        )
+        return
+
+    if isinstance(event, OrderBookSnapshot):
+        first = not len(book)
+        changes = book.apply_snapshot(event.bids, event.asks)
+        if first or not len(book):
+            kind = DEPTH_SNAPSHOT_EVENT if len(book) else DEPTH_CLEAR_EVENT
+            levels = [(True, level) for level in book.bids]
+            levels += [(False, level) for level in book.asks]
+        else:
+            levels = [(isbid, (key, qty)) for (isbid, key), (_, qty) in changes.items()]
+            kind = DEPTH_EVENT
+    elif isinstance(event, OrderBookDiff):
+        book.apply_diff(event.bids, event.asks)
+        levels = [(True, level) for level in event.bids]
+        levels += [(False, level) for level in event.asks]
+        kind = DEPTH_EVENT
+    else:
+        raise ValueError(f"Cannot store {type(event).__name__} events")
+
+    if not levels:
+        if not len(book):
+            row = (DEPTH_CLEAR_EVENT | _FEED_FLAGS, exch_ts, local_ts, math.nan, 0.0, 0, seq)
+            rows.append(row + (timestamp,))
+            return
+        # Nothing changed: restate a level so that the event is kept
+        isbid = book.best_bid is not None
+        levels = [(isbid, book.levels(isbid, 1)[0])]
+
+    for isbid, (price, qty) in levels:
+        side = BUY_EVENT if isbid else SELL_EVENT
+        rows.append((kind | _FEED_FLAGS | side, exch_ts, local_ts, price, qty, 0, seq, timestamp))
+
+
+def load_event_store(path) -> np.ndarray:
+    """Memory-map a store file.
+
+    Raises:
+        ValueError: If the file does not hold ``EVENT_DTYPE`` rows.
+    """
+    data = np.load(path, mmap_mode="r", allow_pickle=False)
+    if data.dtype != EVENT_DTYPE or data.ndim != 1:
+        raise ValueError(f"{path} is not an event store (dtype {data.dtype})")
+    return data
+
+
+def iter_event_chunks(
+    path, chunk_size: int = DEFAULT_CHUNK_SIZE, kind: Optional[str] = None
+) -> Iterator[np.ndarray]:
+    """Yield the rows of a store in chunks which do not split events.
+
+    Args:
+        path: Store file path (or an already loaded array).
+        chunk_size: Approximate number of rows per chunk.
+        kind: ``'tick'`` or ``'orderbook'`` to keep only trade or depth
+            rows, ``None`` for both.
+
+    Yields:
+        numpy.ndarray: ``EVENT_DTYPE`` rows.
+    """
+    data = path if isinstance(path, np.ndarray) else load_event_store(path)
+    ival = data["ival"]
+    total = len(data)
+    start = 0
+    while start < total:
+        end = min(start + chunk_size, total)
+        if end < total:
+            # Move the end back to the start of the event it falls into
+            boundary = int(np.searchsorted(ival, ival[end], side="left"))
+            end = boundary if boundary > start else int(np.searchsorted(ival, ival[end], "right"))
+
+        chunk = data[start:end]
+        if kind is not None:
+            istrade = (chunk["ev"] & _KIND_MASK) == TRADE_EVENT
+            chunk = chunk[istrade if kind == "tick" else ~istrade]
+        else:
+            chunk = np.asarray(chunk)
+        if len(chunk):
+            yield chunk
+        start = end
+
+
+def iter_event_store(
+    path,
+    symbol: str,
+    kind: Optional[str] = None,
+    exchange: str = "",
+    asset_type: str = "spot",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator:
+    """Replay a store as events.
+
+    Trades are yielded as TickEvent, depth rows as OrderBookDiff, and full
+    books (the first snapshot, a cleared book) as OrderBookSnapshot.
+    ``local_time`` is only set when it differs from the exchange time.
+
+    Args:
+        path: Store file path (or an already loaded array).
+        symbol: Symbol of the events.
+        kind: ``'tick'`` or ``'orderbook'`` to replay only trades or depth.
+        exchange: Exchange name of the events.
+        asset_type: Asset type of the events.
+        chunk_size: Approximate number of rows decoded at a time.
+
+    Yields:
+        TickEvent, OrderBookDiff or OrderBookSnapshot instances.
+    """
+    for chunk in iter_event_chunks(path, chunk_size=chunk_size, kind=kind):
+        evs = chunk["ev"].tolist()
+        exch_ts = chunk["exch_ts"]
+        local_ts = chunk["local_ts"]
+        fval = chunk["fval"]
+        timestamps = np.where(fval != 0.0, fval, exch_ts / 1e9).tolist()
+        local_times = np.where(local_ts != exch_ts, local_ts / 1e9, np.nan).tolist()
+        prices = chunk["px"].tolist()
+        qtys = chunk["qty"].tolist()
+        trade_ids = chunk["order_id"].tolist()
+        seqs = chunk["ival"].tolist()
+
+        n = len(evs)
+        i = 0
+        while i < n:
+            ev = evs[i]
+            local_time = local_times[i]
+            if local_time != local_time:  # NaN
+                local_time = None
+
+            if ev & _KIND_MASK == TRADE_EVENT:
+                yield TickEvent(
+                    timestamp=timestamps[i],
+                    symbol=symbol,
+                    exchange=exchange,
+                    asset_type=asset_type,
+                    local_time=local_time,
+                    price=prices[i],
+                    volume=qtys[i],
+                    direction="buy" if ev & BUY_EVENT else "sell" if ev & SELL_EVENT else "",
+                    trade_id=str(trade_ids[i]) if trade_ids[i] else "",
+                )
+                i += 1
+                continue
+
+            seq = seqs[i]
+            issnapshot = False
+            bids = []
+            asks = []
+            j = i
+            while j < n and seqs[j] == seq:
+                rowev = evs[j]
+                if rowev & _KIND_MASK in _SNAPSHOT_KINDS:
+                    issnapshot = True
+                if rowev & BUY_EVENT:
+                    bids.append((prices[j], qtys[j]))
+                elif rowev & SELL_EVENT:
+                    asks.append((prices[j], qtys[j]))
+                j += 1
+
+            eventcls = OrderBookSnapshot if issnapshot else OrderBookDiff
+            yield eventcls(
+                timestamp=timestamps[i],
+                symbol=symbol,
+                exchange=exchange,
+                asset_type=asset_type,
+                local_time=local_time,
+                bids=bids,
+                asks=asks,
+            )
+            i = j
+
+
+def convert_hft_events(data: np.ndarray) -> np.ndarray:
+    """Turn an hftbacktest event array (e.g. a converted npz) into store rows.
+
+    Keeps the rows seen by the exchange side (``EXCH_EVENT``) and numbers
+    the events: each trade is an event, and consecutive depth rows with the
+    same exchange timestamp and kind form one.
+
+    Args:
+        data: ``EVENT_DTYPE`` array.
+
+    Returns:
+        numpy.ndarray: Store rows.
+    """
+    rows = np.array(data[(data["ev"] & np.uint64(EXCH_EVENT)) != 0], dtype=EVENT_DTYPE)
+    if not len(rows):
+        return rows
+    kinds = rows["ev"] & np.uint64(_KIND_MASK)
+    exch_ts = rows["exch_ts"]
+    starts = np.ones(len(rows), dtype=bool)
+    starts[1:] = (exch_ts[1:] != exch_ts[:-1]) | (kinds[1:] != kinds[:-1])
+    starts |= kinds == TRADE_EVENT
+    rows["ival"] = np.cumsum(starts) - 1
+    return rows
+
+
+def convert_to_event_store(
+    inputs, output, symbol: str = "", depth: Optional[int] = None, chunk_size=DEFAULT_CHUNK_SIZE
+) -> int:
+    """Convert replay inputs of one instrument into a store file.
+
+    Tick CSV files and order book CSV/JSONL files (plain or gzip) are read
+    with TickChannel and OrderBookChannel and merged by timestamp;
+    hftbacktest ``.npz``/``.npy`` event arrays are converted as arrays and
+    cannot be mixed with text inputs.
+
+    Args:
+        inputs: Input file paths.
+        output: Store file path.
+        symbol: Symbol given to the channels reading text inputs.
+        depth: Order book depth to keep (all levels by default).
+        chunk_size: Number of rows encoded at a time.
+
+    Returns:
+        int: Number of rows written.
+    """
+    from .orderbook import OrderBookChannel
+    from .tick import TickChannel
+
+    inputs = [str(path) for path in inputs]
+    arrays = [path for path in inputs if path.endswith((".npz", ".npy"))]
+    if arrays:
+        if len(arrays) != len(inputs):
+            raise ValueError("hftbacktest event arrays cannot be mixed with text inputs")
+        parts = []
+        for path in arrays:
+            if path.endswith(".npy"):
+                parts.append(np.load(path, allow_pickle=False))
+                continue
+            with np.load(path, allow_pickle=False) as payload:
+                parts.append(payload["data"])
+        data = np.concatenate(parts) if len(parts) > 1 else parts[0]
+        data = data[np.argsort(data["exch_ts"], kind="mergesort")]
+        rows = convert_hft_events(np.asarray(data, dtype=EVENT_DTYPE))
+        np.save(output, rows)
+        return len(rows)
+
+    sources = []
+    for path in inputs:
+        if _is_tick_file(path):
+            channel = TickChannel(symbol, dataname=path, validate=False)
+        else:
+            channel = OrderBookChannel(
+                symbol, dataname=path, depth=depth or 1 << 31, validate=False
+            )
+        sources.append(channel.load())
+
+    events = heapq.merge(*sources, key=lambda event: event.timestamp)
+    return write_event_store(events, output, chunk_size=chunk_size)
+
+
+def _is_tick_file(path: str) -> bool:
+    """Whether a CSV file holds ticks (a ``price`` column) rather than books."""
+    if ".jsonl" in path:
+        return False
+    open_func = gzip.open if path.endswith(".gz") else open
+    with open_func(path, "rt", encoding="utf-8") as f:
+        header = f.readline()
+    return "price" in [column.strip() for column in header.split(",")]
@@ -1,7 +1,9 @@
 """OrderBook data channel for order book depth snapshots.
 
 Provides OrderBookChannel for loading, validating, and buffering order book
-data from CSV/JSONL files or other sources.
+data from CSV/JSONL files or other sources. Depth-diff streams (Binance
+``depthUpdate`` style) are applied to an incremental book and turned into
+snapshots.
 
 Example:
     Loading order book data from CSV::
@@ -19,11 +21,13 @@ import csv
 import gzip
 import json
 import math
-from typing import Iterator, List, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 from ..channel import DataChannel, DataValidationResult
-from ..events import OrderBookSnapshot
+from ..depthbook import DepthBook
+from ..events import OrderBookDiff, OrderBookSnapshot
 from ..utils.log_message import get_logger
+from .eventstore import STORE_SUFFIX, iter_event_store
 
 logger = get_logger(__name__)
 
@@ -38,7 +42,10 @@ class OrderBookChannel(DataChannel):
     where bids/asks are JSON-encoded lists of [price, qty] pairs.
 
     JSONL format expects one JSON object per line with fields:
-    timestamp, symbol, bids, asks.
+    timestamp, symbol, bids, asks. Lines in the Binance ``depthUpdate``
+    format (``e``, ``E``, ``U``, ``u``, ``b``, ``a``) are depth diffs: they
+    are applied to the book seeded by the last snapshot (whose
+    ``lastUpdateId`` is honoured) and yielded as snapshots.
 
     Args:
         symbol: Trading pair symbol (e.g., 'BTC/USDT').
@@ -78,12 +85,88 @@ class OrderBookChannel(DataChannel):
         self._depth = depth
         self._last_best_bid = None
         self._last_best_ask = None
+        # Incremental book for depth diffs, built from the last snapshot
+        # levels on the first diff which follows it
+        self._book = None
+        self._seed = ([], [])
+        self._last_update_id = None
 
     @property
     def depth(self):
         """Configured maximum order book depth."""
         return self._depth
 
+    def push(self, event) -> bool:
+        """Push a snapshot, or a depth diff applied to the book, to the buffer.
+
+        Args:
+            event: An OrderBookSnapshot or OrderBookDiff instance.
+
+        Returns:
+            True if the event was accepted, False if rejected.
+        """
+        if isinstance(event, OrderBookDiff):
+            event = self.apply_diff(event)
+            if event is None:
+                return False
+            return super().push(event)
+
+        levels = (event.bids, event.asks)  # validation truncates the event
+        if not super().push(event):
+            return False
+        self._seed_book(*levels)
+        return True
+
+    def apply_diff(self, diff) -> Optional[OrderBookSnapshot]:
+        """Apply a depth diff to the book and return the resulting snapshot.
+
+        Diffs already covered by the last snapshot (``final_update_id`` not
+        above its ``lastUpdateId``) or by a previous diff are dropped. A gap
+        in the update ids is logged and the diff applied anyway, as there
+        is no snapshot to resynchronize from when replaying.
+
+        Args:
+            diff: OrderBookDiff instance.
+
+        Returns:
+            OrderBookSnapshot truncated to the configured depth, or None if
+            the diff was dropped.
+        """
+        last = self._last_update_id
+        if diff.final_update_id and last is not None:
+            if diff.final_update_id <= last:
+                return None
+            if diff.first_update_id > last + 1 and diff.prev_update_id != last:
+                logger.warning(
+                    "Gap in depth updates for %s: %d -> %d",
+                    self.symbol,
+                    last,
+                    diff.first_update_id,
+                )
+
+        if self._book is None:
+            self._book = DepthBook()
+            self._book.apply_snapshot(*self._seed)
+        self._book.apply_diff(diff.bids, diff.asks)
+        if diff.final_update_id:
+            self._last_update_id = diff.final_update_id
+
+        return OrderBookSnapshot(
+            timestamp=diff.timestamp,
+            symbol=diff.symbol,
+            exchange=diff.exchange,
+            asset_type=diff.asset_type,
+            local_time=diff.local_time,
+            bids=self._book.levels(True, self._depth),
+            asks=self._book.levels(False, self._depth),
+        )
+
+    def _seed_book(self, bids, asks, last_update_id=None):
+        """Make the (untruncated) levels of a snapshot the base for diffs."""
+        self._book = None
+        self._seed = (bids, asks)
+        self._last_update_id = last_update_id
+
     def _validate_event(self, event) -> DataValidationResult:
         """Validate order book specific fields beyond base validation.
 
@@ -111,8 +194,8 @@ class OrderBookChannel(DataChannel):
     def load(self) -> Iterator[OrderBookSnapshot]:
         """Load order book events from file.
 
-        Supports CSV and JSONL formats. File format is auto-detected
-        by extension (.jsonl or .csv/.csv.gz).
+        Supports CSV, JSONL and binary event store formats. File format is
+        auto-detected by extension (.jsonl, .npy or .csv/.csv.gz).
 
         Yields:
             OrderBookSnapshot instances.
@@ -122,6 +205,8 @@ class OrderBookChannel(DataChannel):
 
         if self._dataname.endswith(".jsonl") or self._dataname.endswith(".jsonl.gz"):
             yield from self._load_jsonl()
+        elif self._dataname.endswith(STORE_SUFFIX):
+            yield from self._load_store()
         else:
             yield from self._load_csv()
 
@@ -176,7 +261,7 @@ class OrderBookChannel(DataChannel):
 
         Supports both plain JSONL and gzip-compressed JSONL (.jsonl.gz).
         Each line should contain a JSON object with timestamp, symbol,
-        bids, and asks fields.
+        bids, and asks fields, or a Binance ``depthUpdate`` diff.
 
         Yields:
             OrderBookSnapshot instances.
@@ -191,8 +276,15 @@ class OrderBookChannel(DataChannel):
                     continue
                 try:
                     data = json.loads(line)
+                    if data.get("e") == "depthUpdate" or "b" in data or "a" in data:
+                        ob = self.apply_diff(self._parse_diff(data))
+                        if ob is not None:
+                            yield ob
+                        continue
+
                     bids = _parse_level_pairs(data.get("bids", []))
                     asks = _parse_level_pairs(data.get("asks", []))
+                    self._seed_book(bids, asks, data.get("lastUpdateId"))
 
                     ob = OrderBookSnapshot(
                         timestamp=_parse_required_float(data["timestamp"]),
@@ -207,6 +299,52 @@ class OrderBookChannel(DataChannel):
                     logger.warning("Skipping invalid OB JSONL line %d: %s", line_num, e)
                     continue
 
+    def _load_store(self) -> Iterator[OrderBookSnapshot]:
+        """Load order book events from a binary event store (.npy).
+
+        Depth rows are replayed as diffs applied to the book, like the
+        ``depthUpdate`` lines of JSONL files.
+
+        Yields:
+            OrderBookSnapshot instances.
+        """
+        events = iter_event_store(
+            self._dataname,
+            self.symbol,
+            kind="orderbook",
+            exchange=self.params.get("exchange", ""),
+            asset_type=self.params.get("asset_type", "spot"),
+        )
+        for event in events:
+            if isinstance(event, OrderBookDiff):
+                ob = self.apply_diff(event)
+                if ob is not None:
+                    yield ob
+                continue
+
+            self._seed_book(event.bids, event.asks)
+            event.bids = event.bids[: self._depth]
+            event.asks = event.asks[: self._depth]
+            yield event
+
+    def _parse_diff(self, data) -> OrderBookDiff:
+        """Build an OrderBookDiff from a Binance ``depthUpdate`` object."""
+        if "timestamp" in data:
+            timestamp = _parse_required_float(data["timestamp"])
+        else:
+            timestamp = _parse_required_float(data["E"]) / 1000.0
+        return OrderBookDiff(
+            timestamp=timestamp,
+            symbol=data.get("symbol", self.symbol),
+            exchange=data.get("exchange", ""),
+            asset_type=data.get("asset_type", "spot"),
+            bids=_parse_level_pairs(data.get("b", [])),
+            asks=_parse_level_pairs(data.get("a", [])),
+            first_update_id=int(data.get("U", 0)),
+            final_update_id=int(data.get("u", 0)),
+            prev_update_id=data.get("pu"),
+        )
+
     def __repr__(self):
         """Return a string representation of the channel.
 
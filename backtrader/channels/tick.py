@@ -22,6 +22,7 @@ from typing import Iterator
 from ..channel import DataChannel, DataValidationResult
 from ..events import TickEvent
 from ..utils.log_message import get_logger
+from .eventstore import STORE_SUFFIX, iter_event_store
 
 logger = get_logger(__name__)
 
@@ -109,6 +110,8 @@ class TickChannel(DataChannel):
 
         Supports both plain CSV and gzip-compressed CSV (.csv.gz).
         The file must have at minimum: timestamp, price, volume, direction.
+        Binary event stores (.npy, see ``eventstore``) are replayed from
+        their trade rows.
 
         Yields:
             TickEvent instances.
@@ -120,6 +123,16 @@ class TickChannel(DataChannel):
         if self._dataname is None:
             raise ValueError("dataname (file path) is required for loading")
 
+        if self._dataname.endswith(STORE_SUFFIX):
+            yield from iter_event_store(
+                self._dataname,
+                self.symbol,
+                kind="tick",
+                exchange=self.params.get("exchange", ""),
+                asset_type=self.params.get("asset_type", "spot"),
+            )
+            return
+
         open_func = gzip.open if self._dataname.endswith(".gz") else open
         open_kwargs = (
             {"mode": "rt", "encoding": "utf-8"}
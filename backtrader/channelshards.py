@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+"""Channel Shards Module - Replay independent symbols in parallel.
+
+A portfolio of per-symbol strategies without cross-symbol state can replay
+each symbol on its own. With ``Cerebro(channelshards=True)`` the events of
+a channel run are partitioned by symbol (``Event.channel_name``, else the
+``symbol`` of the event data) and each shard is replayed in a worker process
+by its own copy of the ``Cerebro``: its own broker and strategy instances.
+
+A ``StreamingEventQueue`` of channels is partitioned at the source: each
+worker gets the channels of its symbol and loads their events itself. Other
+event streams are read by the main process and their events sent to the
+workers. The pickled ``Cerebro`` is sent once to each worker process.
+
+The cash of the broker is split among the shards (evenly, or as given by
+``Cerebro(shardcash=...)``), so that the shards together start with the
+capital of the broker. A shard can only spend its own allocation: the
+results only match those of a serial run if no shard needs more cash than
+it was given, which a single broker shared by all the symbols would have
+lent it.
+
+The shard results are merged deterministically: fills, recorder entries and
+the portfolio equity are ordered by timestamp, ties going to the shard of
+the symbol seen first in the channel (of the first channel of a queue).
+
+Classes:
+    QueueSource: Events of the channels of one symbol, loaded when iterated.
+    ShardResult: Outcome of the replay of one shard.
+    ShardedRun: Results of all the shards and their merged outputs.
+
+Functions:
+    partition_sources: Split a channel run into per-symbol shards.
+    partition_events: Split an event stream into per-symbol shards.
+    allocate_cash: Split the cash of the broker among the shards.
+    run_shards: Replay the shards in worker processes.
+"""
+
+import itertools
+import multiprocessing
+import pickle
+
+from .channel import StreamingEventQueue
+from .errors import ConfigError
+
+__all__ = [
+    "QueueSource",
+    "ShardResult",
+    "ShardedRun",
+    "allocate_cash",
+    "partition_events",
+    "partition_sources",
+    "run_shards",
+]
+
+# Pickled Cerebro of a worker process, set once by the pool initializer
+_worker_setup = None
+
+
+def _worker_init(setup):
+    global _worker_setup
+    _worker_setup = setup
+
+
+def shard_key(event):
+    """Symbol of the shard ``event`` belongs to."""
+    return event.channel_name or getattr(event.data, "symbol", "") or ""
+
+
+def partition_events(events):
+    """Split ``events`` into ``{symbol: [event, ...]}``.
+
+    Symbols are ordered by their first event and each shard keeps the order
+    of the stream.
+    """
+    shards = {}
+    for event in events:
+        key = shard_key(event)
+        shard = shards.get(key)
+        if shard is None:
+            shard = shards[key] = []
+        shard.append(event)
+    return shards
+
+
+class QueueSource:
+    """Events of the channels of one symbol, loaded when iterated.
+
+    Iterating builds a ``StreamingEventQueue`` over the channels, so the
+    events are loaded (in batches) by the process replaying them.
+
+    Args:
+        channels: Channels of the symbol.
+        options: Keyword arguments of the queue (``StreamingEventQueue.options``).
+    """
+
+    def __init__(self, channels, options):
+        self.channels = channels
+        self.options = options
+
+    def __iter__(self):
+        return iter(StreamingEventQueue(self.channels, **self.options))
+
+
+def partition_sources(channel):
+    """Split the events of a channel run into ``{symbol: events}``.
+
+    A ``StreamingEventQueue`` which can be partitioned by channel (see
+    ``StreamingEventQueue.partition``) gives a ``QueueSource`` per symbol,
+    in the order of the channels. Other streams are read and split by
+    ``partition_events``.
+    """
+    groups = channel.partition() if isinstance(channel, StreamingEventQueue) else None
+    if groups is None:
+        return partition_events(channel)
+    return {symbol: QueueSource(channels, channel.options) for symbol, channels in groups.items()}
+
+
+def allocate_cash(cash, symbols, allocations=None):
+    """Split ``cash`` among the shards of ``symbols``.
+
+    Args:
+        cash: Cash of the broker.
+        symbols: Symbols of the shards.
+        allocations: Optional ``{symbol: cash}``. The symbols left out share
+            the rest of ``cash`` evenly.
+
+    Returns:
+        dict: ``{symbol: cash}`` for every symbol of ``symbols``.
+
+    Raises:
+        ConfigError: The broker has no cash to split, or the allocations are
+            negative, name unknown symbols or add up to more than ``cash``.
+    """
+    if cash is None:
+        raise ConfigError("Sharded channel runs need a broker with a cash parameter")
+    allocations = dict(allocations or {})
+    unknown = set(allocations) - set(symbols)
+    if unknown:
+        raise ConfigError(f"Cash allocated to symbols without events: {sorted(unknown)}")
+    if any(amount < 0 for amount in allocations.values()):
+        raise ConfigError("Cash allocations cannot be negative")
+
+    rest = cash - sum(allocations.values())
+    if rest < -1e-9 * abs(cash):
+        raise ConfigError(f"Cash allocations exceed the cash of the broker ({cash})")
+
+    others = [symbol for symbol in symbols if symbol not in allocations]
+    share = max(rest, 0.0) / len(others) if others else 0.0
+    return {symbol: allocations.get(symbol, share) for symbol in symbols}
+
+
+class ShardResult:
+    """Outcome of the replay of one shard.
+
+    Attributes:
+        symbol: Symbol of the shard.
+        strategies: ``OptReturn`` of each strategy (params and analyzers).
+        order_history: Fills of the shard broker (``order_history``).
+        records: Recorder entries of the shard broker.
+        equity: ``(timestamp, value)`` of the broker, at each event where
+            the value changed.
+        startvalue: Value of the broker before the first event: the cash
+            allocated to the shard.
+        value: Value of the broker after the last event.
+        cash: Cash of the broker after the last event.
+    """
+
+    def __init__(self, symbol, strategies, order_history, records, equity, startvalue, value, cash):
+        self.symbol = symbol
+        self.strategies = strategies
+        self.order_history = order_history
+        self.records = records
+        self.equity = equity
+        self.startvalue = startvalue
+        self.value = value
+        self.cash = cash
+
+    @property
+    def pnl(self):
+        """Profit and loss of the shard."""
+        return self.value - self.startvalue
+
+    def __repr__(self):
+        return (
+            f"ShardResult(symbol={self.symbol!r}, fills={len(self.order_history)}, "
+            f"value={self.value!r})"
+        )
+
+
+def _track_equity(events, broker, equity, start):
+    """Yield ``events``, noting the broker value once each is processed."""
+    start.append(broker.getvalue())
+    last = start[0]
+    for event in events:
+        yield event
+        value = broker.getvalue()
+        if value != last:
+            equity.append((event.timestamp, value))
+            last = value
+
+
+def run_shard(task):
+    """Replay a shard in a fresh copy of the Cerebro of the worker.
+
+    Args:
+        task: ``(symbol, cash, events)``, the events being a list or a
+            ``QueueSource``.
+    """
+    symbol, cash, events = task
+    cerebro = pickle.loads(_worker_setup)
+    cerebro.p.channelshards = False
+    cerebro._broker.set_param("cash", cash)  # taken by the broker on start
+
+    equity, start = [], []
+    runstrats = cerebro._run_channel(_track_equity(events, cerebro._broker, equity, start))
+    broker = cerebro._broker
+    recorder = getattr(broker, "recorder", None)
+    return ShardResult(
+        symbol,
+        cerebro._build_optreturn_results(runstrats),
+        list(getattr(broker, "order_history", ())),
+        recorder.snapshot() if recorder is not None else [],
+        equity,
+        start[0] if start else broker.getvalue(),
+        broker.getvalue(),
+        broker.getcash(),
+    )
+
+
+def run_shards(setup, tasks, processes=1):
+    """Replay the shards of ``tasks`` (see ``run_shard``).
+
+    Args:
+        setup: The pickled Cerebro, sent once to each worker process.
+        tasks: ``(symbol, cash, events)`` of each shard.
+        processes: Number of worker processes; 1 replays in this process.
+
+    Returns:
+        list: ``ShardResult`` of each task, in order.
+    """
+    if processes <= 1:
+        _worker_init(setup)
+        try:
+            return [run_shard(task) for task in tasks]
+        finally:
+            _worker_init(None)
+
+    with multiprocessing.Pool(processes, initializer=_worker_init, initargs=(setup,)) as pool:
+        return pool.map(run_shard, tasks, chunksize=1)
+
+
+def _merge_by_timestamp(sequences):
+    # sorted is stable: equal timestamps keep the order of the shards
+    return sorted(itertools.chain.from_iterable(sequences), key=lambda item: item["timestamp"])
+
+
+class ShardedRun(list):
+    """Results of a sharded channel run.
+
+    As a list it holds, for each shard, the ``OptReturn`` of its strategies
+    (like the results of an optimization). The merged outputs are available
+    as attributes.
+
+    Attributes:
+        shards: ``ShardResult`` of each shard, in symbol order.
+        order_history: Fills of all the shards by timestamp.
+        records: Recorder entries of all the shards by timestamp.
+        equity: ``(timestamp, value)`` of the portfolio, the sum of the
+            values of the shard brokers, at each change.
+        startvalue: Value of the portfolio before the first event: the cash
+            of the broker, split among the shards.
+        value: Final value of the portfolio.
+        cash: Final cash of the portfolio.
+        pnl: ``{symbol: profit and loss}`` of each shard.
+    """
+
+    def __init__(self, shards):
+        super().__init__(shard.strategies for shard in shards)
+        self.shards = list(shards)
+        self.order_history = _merge_by_timestamp(shard.order_history for shard in shards)
+        self.records = _merge_by_timestamp(shard.records for shard in shards)
+        self.startvalue = sum(shard.startvalue for shard in shards)
+        self.value = sum(shard.value for shard in shards)
+        self.cash = sum(shard.cash for shard in shards)
+        self.equity = self._merge_equity(shards)
+        self.pnl = {shard.symbol: shard.pnl for shard in shards}
+
+    @staticmethod
+    def _merge_equity(shards):
+        values = [shard.startvalue for shard in shards]
+        points = sorted(
+            (
+                (timestamp, index, value)
+                for index, shard in enumerate(shards)
+                for timestamp, value in shard.equity
+            ),
+            key=lambda point: (point[0], point[1]),
+        )
+        equity = []
+        for timestamp, group in itertools.groupby(points, key=lambda point: point[0]):
+            for _, index, value in group:
+                values[index] = value
+            equity.append((timestamp, sum(values)))
+        return equity
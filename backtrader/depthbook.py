@@ -0,0 +1,159 @@
+"""Incremental L2 depth book for tick-level backtesting.
+
+Provides DepthBook, which keeps both sides of an order book as price levels
+sorted by integer tick (or by raw price when no tick size is given). It can
+be refreshed from a full snapshot or updated in place from depth diffs
+(Binance ``depthUpdate`` style, a quantity of 0 removes the level). Each
+update returns the level changes, so that consumers like the queue-position
+models do not have to compare whole snapshots.
+
+Example:
+    Applying a diff::
+
+        book = DepthBook(tick_size=0.1)
+        book.apply_snapshot(bids=[(100.0, 2.0)], asks=[(100.1, 1.0)])
+        changes = book.apply_diff(bids=[(100.0, 0.0), (99.9, 3.0)], asks=[])
+        # {(True, 1000): (2.0, 0.0), (True, 999): (0.0, 3.0)}
+"""
+
+import bisect
+from typing import Dict, List, Optional, Tuple
+
+__all__ = ["DepthBook"]
+
+
+class _DepthSide:
+    """Price levels of one side: ``keys`` sorted ascending, ``levels`` by key."""
+
+    __slots__ = ("keys", "levels")
+
+    def __init__(self):
+        self.keys = []
+        self.levels = {}  # key -> (price, qty)
+
+
+class DepthBook:
+    """Both sides of an L2 order book, updated from snapshots or diffs.
+
+    Levels are keyed by ``round(price / tick_size)`` when ``tick_size`` is
+    given, else by the price itself. When several levels of an update share
+    a key the first one is kept, as a scan of the level list would find it.
+
+    Changes are returned as a dict ``{(isbid, key): (prev_qty, new_qty)}``
+    holding only the levels whose quantity changed, a missing level having
+    a quantity of 0.
+
+    Args:
+        tick_size: Price increment used to key the levels (optional).
+    """
+
+    def __init__(self, tick_size: Optional[float] = None):
+        self.tick_size = float(tick_size) if tick_size and tick_size > 0 else None
+        self._sides = {True: _DepthSide(), False: _DepthSide()}
+
+    def key(self, price):
+        """Key of the level at ``price``."""
+        if self.tick_size is not None:
+            return round(float(price) / self.tick_size)
+        return float(price)
+
+    def apply_snapshot(self, bids, asks) -> Dict[tuple, Tuple[float, float]]:
+        """Replaces the book with the ``bids``/``asks`` lists of (price, qty)."""
+        changes = {}
+        for isbid, new in ((True, bids), (False, asks)):
+            side = self._sides[isbid]
+            old = side.levels
+            levels = {}
+            for price, qty in new or ():
+                levels.setdefault(self.key(price), (float(price), float(qty)))
+
+            for key, (_, qty) in levels.items():
+                prev = old[key][1] if key in old else 0.0
+                if prev != qty:
+                    changes[isbid, key] = (prev, qty)
+            for key, (_, qty) in old.items():
+                if key not in levels and qty != 0.0:
+                    changes[isbid, key] = (qty, 0.0)
+
+            side.levels = levels
+            side.keys = sorted(levels)
+
+        return changes
+
+    def apply_diff(self, bids, asks) -> Dict[tuple, Tuple[float, float]]:
+        """Updates the levels of ``bids``/``asks``; a quantity of 0 removes it."""
+        changes = {}
+        for isbid, updates in ((True, bids), (False, asks)):
+            side = self._sides[isbid]
+            keys, levels = side.keys, side.levels
+            for price, qty in updates or ():
+                key = self.key(price)
+                qty = float(qty)
+                level = levels.get(key)
+                prev = 0.0 if level is None else level[1]
+                if qty:
+                    if level is None:
+                        bisect.insort(keys, key)
+                    levels[key] = (float(price), qty)
+                elif level is not None:
+                    del keys[bisect.bisect_left(keys, key)]
+                    del levels[key]
+
+                first = changes.get((isbid, key))
+                if first is not None:
+                    prev = first[0]
+                if prev != qty:
+                    changes[isbid, key] = (prev, qty)
+                elif first is not None:
+                    del changes[isbid, key]  # back to where it was
+
+        return changes
+
+    @staticmethod
+    def diff(prev_bids, prev_asks, bids, asks, tick_size=None):
+        """Level changes between two snapshots given as (price, qty) lists."""
+        book = DepthBook(tick_size)
+        book.apply_snapshot(prev_bids, prev_asks)
+        return book.apply_snapshot(bids, asks)
+
+    def levels(self, isbid: bool, depth: Optional[int] = None) -> List[Tuple[float, float]]:
+        """(price, qty) levels of a side, best first, up to ``depth``."""
+        side = self._sides[isbid]
+        keys = side.keys
+        if isbid:
+            keys = keys[::-1] if depth is None else keys[: -depth - 1 : -1]
+        elif depth is not None:
+            keys = keys[:depth]
+        return [side.levels[key] for key in keys]
+
+    @property
+    def bids(self) -> List[Tuple[float, float]]:
+        return self.levels(True)
+
+    @property
+    def asks(self) -> List[Tuple[float, float]]:
+        return self.levels(False)
+
+    def qty(self, isbid: bool, price) -> float:
+        """Quantity at ``price`` on a side (0.0 if there is no such level)."""
+        level = self._sides[isbid].levels.get(self.key(price))
+        return 0.0 if level is None else level[1]
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        side = self._sides[True]
+        return side.levels[side.keys[-1]][0] if side.keys else None
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        side = self._sides[False]
+        return side.levels[side.keys[0]][0] if side.keys else None
+
+    def __len__(self):
+        return len(self._sides[True].keys) + len(self._sides[False].keys)
+
+    def __repr__(self):
+        return (
+            f"DepthBook(tick_size={self.tick_size!r}, bids={len(self._sides[True].keys)}, "
+            f"asks={len(self._sides[False].keys)})"
+        )
@@ -2,11 +2,12 @@
 
 This module defines the base EventData class and concrete event types used
 across all data channels. Events use Python dataclasses for performance
-and type safety.
+and type safety, with ``__slots__`` to keep their memory footprint small.
 
 Event Types:
     - TickEvent: Individual trade/tick data
     - OrderBookSnapshot: Order book depth snapshot
+    - OrderBookDiff: Incremental order book depth update
     - FundingEvent: Funding rate data for perpetual contracts
     - BarEvent: OHLCV bar data
 
@@ -28,7 +29,10 @@ from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass, field
 from typing import List, Optional, Tuple
 
+from .utils.slots import slotted
 
+
+@slotted(dynamic=True)
 @dataclass
 class EventData(ABC):
     """Base class for all event data.
@@ -37,6 +41,10 @@ class EventData(ABC):
     asset_type, and local_time. Subclasses must implement event_type
     property and can override validate() for type-specific checks.
 
+    Fields are stored in ``__slots__``. Adapters of live feeds may still
+    attach extra attributes (e.g. ``datetime``), the instance dictionary
+    holding them is only allocated when they do.
+
     Attributes:
         timestamp: Unix timestamp in seconds (supports millisecond precision).
         symbol: Trading pair symbol (e.g., 'BTC/USDT').
@@ -80,6 +88,7 @@ class EventData(ABC):
         return True
 
 
+@slotted()
 @dataclass
 class TickEvent(EventData):
     """Tick/trade event data.
@@ -145,6 +154,7 @@ class TickEvent(EventData):
         return True
 
 
+@slotted("previous_bids", "previous_asks", "depth_changes")
 @dataclass
 class OrderBookSnapshot(EventData):
     """Order book depth snapshot.
@@ -155,6 +165,11 @@ class OrderBookSnapshot(EventData):
     Attributes:
         bids: List of (price, quantity) tuples, descending by price.
         asks: List of (price, quantity) tuples, ascending by price.
+
+    The tick broker sets ``previous_bids``/``previous_asks`` (levels of the
+    previous snapshot of the symbol) and ``depth_changes`` (level changes
+    from its depth book) on the snapshots it processes; they are unset
+    before.
     """
 
     bids: List[Tuple[float, float]] = field(default_factory=list)
@@ -226,6 +241,55 @@ class OrderBookSnapshot(EventData):
         return True
 
 
+@slotted()
+@dataclass
+class OrderBookDiff(EventData):
+    """Incremental order book depth update.
+
+    Carries only the levels which changed since the previous update, as in
+    the Binance ``depthUpdate`` stream. The quantities are absolute; a
+    quantity of 0 removes the level.
+
+    Attributes:
+        bids: List of (price, quantity) bid level updates.
+        asks: List of (price, quantity) ask level updates.
+        first_update_id: First update id of the event (Binance ``U``).
+        final_update_id: Final update id of the event (Binance ``u``).
+        prev_update_id: Final update id of the previous event (Binance
+            futures ``pu``), if the stream provides it.
+    """
+
+    bids: List[Tuple[float, float]] = field(default_factory=list)
+    asks: List[Tuple[float, float]] = field(default_factory=list)
+    first_update_id: int = 0
+    final_update_id: int = 0
+    prev_update_id: Optional[int] = None
+
+    @property
+    def event_type(self) -> str:
+        """Return the event type identifier.
+
+        Returns:
+            str: The string 'orderbook_diff' for order book diff events.
+        """
+        return "orderbook_diff"
+
+    def validate(self) -> bool:
+        """Validate order book diff fields.
+
+        Checks:
+            - Common fields valid (via super)
+            - All prices > 0 and quantities >= 0
+        """
+        if not super().validate():
+            return False
+        for price, qty in self.bids + self.asks:
+            if price <= 0 or qty < 0:
+                return False
+        return True
+
+
+@slotted()
 @dataclass
 class FundingEvent(EventData):
     """Funding rate event for perpetual contracts.
@@ -273,6 +337,7 @@ class FundingEvent(EventData):
         return True
 
 
+@slotted()
 @dataclass
 class BarEvent(EventData):
     """OHLCV bar event data.
@@ -26,14 +26,20 @@ Example:
 import collections
 import datetime
 import inspect
+import io
+import itertools
+import mmap
 import os.path
 
+import numpy as np
+
 from . import dataseries, metabase
 from .dataseries import SimpleFilterWrapper, TimeFrame
 from .resamplerfilter import Replayer, Resampler
 from .tradingcal import PandasMarketCalendar
 from .utils import date2num, num2date, time2num, tzparse
 from .utils.date import Localizer
+from .utils.feedcache import FeedCache
 from .utils.log_message import get_logger
 from .utils.py3 import range, string_types, zip
 
@@ -69,6 +75,9 @@ class AbstractDataBase(dataseries.OHLCDateTime):
         tzinput: Input timezone.
         qcheck: Timeout in seconds for live event checking.
         calendar: Trading calendar to use.
+        cache: ``FeedCache`` (or its directory) keeping the preloaded lines
+            on disk for later runs. Defaults to the ``feedcache`` parameter
+            of ``Cerebro``.
 
     Example:
         >>> data = AbstractDataBase(dataname='data.csv')
@@ -93,6 +102,7 @@ class AbstractDataBase(dataseries.OHLCDateTime):
         ("tzinput", None),
         ("qcheck", 0.0),  # timeout in seconds (float) to check for events
         ("calendar", None),
+        ("cache", None),
     )
 
     # Keep original params definition for compatibility with metaclass system
@@ -262,6 +272,9 @@ class AbstractDataBase(dataseries.OHLCDateTime):
     _store = None
 
     _clone = False
+    # Whether the lines can come from the feed cache (see ``_endsource``)
+    _cacheable = False
+    _caching = False  # preloading to fill the feed cache
     _qcheck = 0.0
 
     # Time offset
@@ -728,6 +741,9 @@ class AbstractDataBase(dataseries.OHLCDateTime):
 
         Loads all bars and resets position to the beginning.
         """
+        if self._fastpreload():
+            return
+
         # Load data
         while self.load():
             pass
@@ -735,6 +751,182 @@ class AbstractDataBase(dataseries.OHLCDateTime):
         self._last()
         self.home()
 
+    def _fastpreload(self):
+        """Fills the lines from the feed cache or by bulk resampling.
+
+        Returns:
+            bool: ``False`` if ``preload`` has to load the bars itself.
+        """
+        return self._cachedpreload() or self._bulkresample()
+
+    def _getfeedcache(self):
+        cache = self.p.cache
+        if cache is None:
+            cache = getattr(getattr(self._env, "p", None), "feedcache", None)
+        if cache is None or isinstance(cache, FeedCache):
+            return cache
+        return FeedCache(cache)
+
+    def _cachedpreload(self):
+        """Fills the lines from the feed cache, else preloads and caches them.
+
+        Returns:
+            bool: ``False`` if the feed is not cached and ``preload`` has to
+            load the bars itself.
+        """
+        if self._caching or not self._cacheable:
+            return False
+        cache = self._getfeedcache()
+        if cache is None or self.islive() or self._barstack or self._barstash:
+            return False
+        # The lines get the values of the entry and nothing else
+        for line in self.lines:
+            if line.mode != line.UnBounded or line.bindings or line._clock is not None:
+                return False
+            if line.extension or len(line.array):
+                return False
+
+        key = cache.key(self)
+        if key is None:
+            return False
+        if cache.load(self, key):
+            self._endsource()
+            self.home()
+            return True
+
+        self._caching = True
+        try:
+            self.preload()
+        finally:
+            self._caching = False
+        cache.save(self, key)
+        return True
+
+    def _endsource(self):
+        """Leaves the source as ``preload`` does once it has read all of it.
+
+        Called instead of ``preload`` when the lines come from the feed
+        cache. Feeds setting ``_cacheable`` override it unless there is
+        nothing to leave.
+        """
+
+    def _canbulkfill(self):
+        """Whether ``_bulkfill`` gives the lines ``preload`` would give.
+
+        Nothing ``load`` does beyond the date checks may be in use: filters,
+        an input timezone, stacked bars or lines bound to others.
+        """
+        if self._filters or self._ffilters:
+            return False
+        return self._canfilllines()
+
+    def _canfilllines(self):
+        # load is not customized and the lines only take the values of the bars
+        if type(self).load is not AbstractDataBase.load or self._tzinput:
+            return False
+        if self._barstack or self._barstash:
+            return False
+        return all(
+            line.mode == line.UnBounded and not line.bindings and line._clock is None
+            for line in self.lines
+        )
+
+    def _canbulkresample(self):
+        """Whether ``Resampler.bulk`` can stand in for the only filter."""
+        if len(self._filters) != 1:
+            return False
+        resampler, fargs, fkwargs = self._filters[0]
+        if not isinstance(resampler, Resampler) or fargs or fkwargs:
+            return False
+        rtype = type(resampler)
+        if rtype.__call__ is not Resampler.__call__ or rtype.last is not Resampler.last:
+            return False
+        if [ff for ff, _, _ in self._ffilters] != [resampler] or not resampler.p.bulk:
+            return False
+        # Not yet used: a new resampler over data seen for the 1st time
+        if resampler.bar.isopen() or resampler.compcount or resampler._nexteos is not None:
+            return False
+        if self.islive() or self._tz is not None or self._calendar is not None:
+            return False
+        if any(line.extension or len(line.array) for line in self.lines):
+            return False
+        return self._canfilllines()
+
+    def _bulkresample(self):
+        """Preloads the source bars and resamples them all at once.
+
+        The source bars are preloaded with the resampler detached and the
+        resampled bars from ``Resampler.bulk`` fill the lines. Should it
+        not take them, they go through the resampler one by one from the
+        bar stash, as if loaded again.
+
+        Returns:
+            bool: ``False`` if ``preload`` has to load and resample the bars.
+        """
+        if not self._canbulkresample():
+            return False
+
+        resampler = self._filters[0][0]
+        filters, ffilters = self._filters, self._ffilters
+        self._filters, self._ffilters = [], []
+        try:
+            self.preload()
+        finally:
+            self._filters, self._ffilters = filters, ffilters
+
+        columns = [np.array(line.array, dtype=np.float64) for line in self.lines]
+        bars = resampler.bulk(self, dict(zip(self.getlinealiases(), columns)))
+        for line in self.lines:
+            line.reset()
+
+        if bars is None:
+            self._barstash.extend(zip(*[column.tolist() for column in columns]))
+            while self.load():
+                pass
+            self._last()
+        else:
+            # Bar values go to the lines in order, as _updatebar puts them
+            size = len(bars[0])
+            for i, line in enumerate(self.lines):
+                if i < len(bars):
+                    line.forwardvalues(bars[i])
+                else:
+                    line.forward(size=size)
+
+        self.home()
+        return True
+
+    def _bulkfill(self, values, size, nsaxis=None):
+        """Adds ``size`` bars at once, applying the date checks of ``load``.
+
+        Args:
+            values: ``{line alias: float values}``. Lines left out get their
+              default value and a missing datetime is stored as ``1.0``.
+            size: Number of bars in the arrays.
+            nsaxis: Optional int64 epoch nanoseconds of the bars, kept as
+              the ``nsaxis`` of the datetime line.
+        """
+        dtline = self.lines.datetime
+        start = len(dtline.array)
+        dts = dtline.asstored(values.get("datetime", np.ones(size)))
+
+        keep = dts >= self.fromdate
+        past = np.flatnonzero(keep & (dts > self.todate))
+        if len(past):
+            keep[past[0] :] = False
+        kept = int(keep.sum())
+
+        for i, alias in enumerate(self.getlinealiases()):
+            line = self.lines[i]
+            array = dts if line is dtline else values.get(alias)
+            if array is None:
+                line.forward(size=kept)  # fields left out: default value
+            else:
+                line.forwardvalues(array if kept == size else np.asarray(array)[keep])
+
+        if nsaxis is not None and not start:
+            dtline._nsaxis = np.asarray(nsaxis, dtype=np.int64)[keep]
+
     # Last chance to use filters
     def _last(self, datamaster=None):
         # A last chance for filters to deliver something
@@ -1081,14 +1273,25 @@ class CSVDataBase(DataBase):
 
     The return value of ``_loadline`` (True/False) will be the return value
     of ``_load`` which has been overriden by this base class
+
+    Subclasses can also override ``_loadcolumns(columns)`` to parse all the
+    rows at once. ``preload`` then reads the (memory-mapped) file in a
+    single step and fills the lines with whole arrays, unless filters or an
+    input timezone are set. The values are the same as those of the
+    ``_loadline`` path, which is used whenever ``_loadcolumns`` declines.
+
+    Params:
+      - ``bulkload`` (default: ``True``): use ``_loadcolumns`` in ``preload``
     """
 
     # Data defaults to None
     f = None
+    _cacheable = True
     # Set specific parameters, merge parent class parameters - use _params_tuple to save original definition
     _params_tuple = (
         ("headers", True),
         ("separator", ","),
+        ("bulkload", True),
     )
 
     # Keep original params definition for compatibility with metaclass system
@@ -1164,9 +1367,13 @@ class CSVDataBase(DataBase):
 
         Loads all available data and closes the file handle.
         """
-        # Load data
-        while self.load():
-            pass
+        if self._fastpreload():
+            return
+
+        # Load data, all at once if possible
+        if not (self.p.bulkload and self._bulkload()):
+            while self.load():
+                pass
         # Settings after load is finished
         self._last()
         self.home()
@@ -1177,6 +1384,95 @@ class CSVDataBase(DataBase):
             self.f.close()
             self.f = None
 
+    def _endsource(self):
+        if self.f is not None:
+            self.f.close()
+            self.f = None
+
+    def _loadcolumns(self, columns):
+        """Parses all the rows of the file at once.
+
+        Args:
+            columns: One tuple of string fields per CSV column.
+
+        Returns:
+            dict: ``{line alias: float values}`` (lines left out get their
+            default value) or ``None`` to load the file line by line.
+        """
+        return None
+
+    def _canbulkload(self):
+        # The bulk path replaces load(): nothing it does may be customized
+        if type(self)._loadcolumns is CSVDataBase._loadcolumns:
+            return False
+        if type(self)._load is not CSVDataBase._load or self.f is None:
+            return False
+        return self._canbulkfill()
+
+    def _readrest(self):
+        """Text left in the file, read from a memory map when possible."""
+        f = self.f
+        if isinstance(f, io.TextIOWrapper) and not hasattr(self.p.dataname, "readline"):
+            size = os.fstat(f.fileno()).st_size
+            if not size:
+                return "", False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, f.encoding, f.errors)
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            if self.p.headers:
+                text = text.partition("\n")[2]
+            return text, False  # the file itself was not read
+
+        return f.read(), True
+
+    def _splitcolumns(self, text):
+        """Fields of the rows in ``text``, by column.
+
+        Returns:
+            list: One list of strings per column (empty without rows) or
+            ``None`` if the rows do not all have the same number of fields.
+        """
+        separator = self.separator
+        if not isinstance(separator, str) or not separator or "\n" in separator:
+            return None
+        if not text:
+            return []
+        if text.endswith("\n"):
+            text = text[:-1]  # readline stops at the newline ending the file
+        rows = text.split("\n")
+        if len(set(map(str.count, rows, itertools.repeat(separator)))) != 1:
+            return None
+        # A single list of fields: no per row lists for the GC to go through
+        fields = text.replace("\n", separator).split(separator)
+        ncols = len(fields) // len(rows)
+        return [fields[col::ncols] for col in range(ncols)]
+
+    def _bulkload(self):
+        """Loads all the rows with ``_loadcolumns``.
+
+        Returns:
+            bool: ``False`` if the rows have to be loaded one by one.
+        """
+        if not self._canbulkload():
+            return False
+
+        text, consumed = self._readrest()
+        columns = self._splitcolumns(text)
+        values = None
+        if columns is not None:
+            try:
+                values = self._loadcolumns(columns) if columns else {}
+            except (ArithmeticError, IndexError, TypeError, ValueError):
+                pass  # the line by line path raises it where due
+        if values is None:
+            if consumed:
+                self.f = io.StringIO(text)
+            return False
+
+        self._bulkfill(values, len(columns[0]) if columns else 0)
+        return True
+
     # Load a line of data
     def _load(self):
         # If data file is None, return False; if line cannot be read, return False; process line, call _loadline to load
@@ -1262,6 +1558,7 @@ class DataClone(AbstractDataBase):
 
     # Set _clone attribute to True
     _clone = True
+    _cacheable = True  # the source is preloaded on its own
 
     # Initialize, data equals dataname parameter value, _datename equals data's _dataname attribute value
     # Then copy date, time, trading interval, compression parameters
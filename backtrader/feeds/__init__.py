@@ -8,6 +8,7 @@ and the unified bt_api_py live interface.
 Data Feed Types:
     - CSV Feeds: GenericCSVData, BTCSV, MT4CSV, SierraChart, VChartCSV
     - Pandas: PandasData for pandas DataFrame integration
+    - NumPy: NumpyData for column arrays
     - Online: Yahoo Finance, Quandl, BtApiFeed
     - Utilities: Chainer, RollOver for data manipulation
 
@@ -25,19 +26,57 @@ Example:
     >>> cerebro.adddata(data)
 """
 
-from .btapifeed import BtApiFeed as BtApiFeed
-from .btcsv import *
-from .chainer import Chainer as Chainer
-from .csvgeneric import *
-from .influxfeed import *
-from .mixed_channel import MixedChannel as MixedChannel
-from .mixed_channel import build_mixed_channel as build_mixed_channel
-from .mt4csv import *
-from .pandafeed import *
-from .quandl import *
-from .rollover import RollOver as RollOver
-from .sierrachart import *
-from .vchart import *
-from .vchartcsv import *
-from .vchartfile import VChartFile as VChartFile
-from .yahoo import *
+from ..feed import DataBase as DataBase
+from ..utils.lazyimport import lazyexports as _lazyexports
+
+# The names exported by each module, imported on first use of one of them
+_EXPORTS = {
+    "btapifeed": ("BtApiFeed",),
+    "btcsv": ("BacktraderCSVData", "BacktraderCSV"),
+    "chainer": ("Chainer",),
+    "csvgeneric": ("GenericCSVData", "GenericCSV"),
+    "influxfeed": ("InfluxDBClientError", "InfluxDB"),
+    "mixed_channel": ("MixedChannel", "build_mixed_channel"),
+    "mt4csv": ("MT4CSVData",),
+    "numpyfeed": ("NumpyData",),
+    "pandafeed": ("PandasDirectData", "PandasData"),
+    "quandl": ("QuandlCSV", "Quandl"),
+    "rollover": ("RollOver",),
+    "sierrachart": ("SierraChartCSVData",),
+    "vchart": ("VChartData", "VChartFeed"),
+    "vchartcsv": ("VChartCSVData", "VChartCSV"),
+    "vchartfile": ("VChartFile",),
+    "yahoo": (
+        "YahooFinanceCSVData",
+        "YahooLegacyCSV",
+        "YahooFinanceCSV",
+        "YahooFinanceData",
+        "YahooFinance",
+    ),
+}
+
+# Names the star imports of the submodules used to leak into the package,
+# still resolved (with a DeprecationWarning) from the last module leaking them
+_DEPRECATED = {
+    "btcsv": ("time",),
+    "csvgeneric": ("UTC", "timezone"),
+    "influxfeed": ("Any", "Iterator", "Optional", "TIMEFRAMES", "dt", "idbclient"),
+    "pandafeed": ("filter", "integer_types", "string_types"),
+    "vchart": ("os", "struct"),
+    "yahoo": (
+        "TimeFrame",
+        "collections",
+        "date",
+        "date2num",
+        "datetime",
+        "feed",
+        "get_logger",
+        "io",
+        "itertools",
+        "logger",
+    ),
+}
+
+__all__ = ["DataBase"] + [name for names in _EXPORTS.values() for name in names]
+
+__getattr__, __dir__ = _lazyexports(__name__, _EXPORTS, _DEPRECATED)
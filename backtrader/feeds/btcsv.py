@@ -14,8 +14,11 @@ Example:
 
 from datetime import date, datetime, time
 
+import numpy as np
+
 from .. import feed
 from ..utils import date2num
+from ..utils.dateintern import ordinal2num
 
 
 class BacktraderCSVData(feed.CSVDataBase):
@@ -57,6 +60,34 @@ class BacktraderCSVData(feed.CSVDataBase):
 
         return True
 
+    def _loadcolumns(self, columns):
+        if type(self)._loadline is not BacktraderCSVData._loadline:
+            return None
+        if len(columns) not in (7, 8) or self.p.sessionend.tzinfo is not None:
+            return None
+
+        ordinals = {
+            dttxt: date(int(dttxt[0:4]), int(dttxt[5:7]), int(dttxt[8:10])).toordinal()
+            for dttxt in set(columns[0])
+        }
+        if len(columns) == 8:
+            usecs = {}
+            for tmtxt in set(columns[1]):
+                tm = time(int(tmtxt[0:2]), int(tmtxt[3:5]), int(tmtxt[6:8]))
+                usecs[tmtxt] = (tm.hour * 60 + tm.minute) * 60 + tm.second
+            usecs = [usecs[tmtxt] * 1000000 for tmtxt in columns[1]]
+        else:
+            tm = self.p.sessionend  # end of the session parameter
+            usecs = [((tm.hour * 60 + tm.minute) * 60 + tm.second) * 1000000 + tm.microsecond]
+            usecs *= len(columns[0])
+
+        count = len(columns[0])
+        values = {"datetime": ordinal2num([ordinals[dttxt] for dttxt in columns[0]], usecs)}
+        fields = columns[len(columns) - 6 :]
+        for name, column in zip(("open", "high", "low", "close", "volume", "openinterest"), fields):
+            values[name] = np.fromiter(map(float, column), dtype=np.float64, count=count)
+        return values
+
 
 class BacktraderCSV(feed.CSVFeedBase):
     """Backtrader CSV feed class.
@@ -20,16 +20,101 @@ Example:
     >>> cerebro.adddata(data)
 """
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+
+import numpy as np
 
 from .. import feed
 from ..dataseries import TimeFrame
 from ..utils import date2num
+from ..utils.dateintern import ordinal2num
 from ..utils.py3 import integer_types, string_types
 
 # Python 3.11+ has datetime.UTC, earlier versions use timezone.utc
 UTC = timezone.utc
 
+# strptime directives parsed by _strptime_parts: (field, width, default)
+_DIRECTIVES = {
+    "Y": ("year", 4, 1900),
+    "m": ("month", 2, 1),
+    "d": ("day", 2, 1),
+    "H": ("hour", 2, 0),
+    "M": ("minute", 2, 0),
+    "S": ("second", 2, 0),
+}
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _strptime_parts(specs):
+    """Vectorized ``strptime`` of zero-padded, fixed-width fields.
+
+    Args:
+        specs: ``[(strings, format), ...]`` whose parts make up a datetime.
+            Formats may only hold ``%Y %m %d %H %M %S`` and literal
+            characters.
+
+    Returns:
+        tuple: ``(ordinals, microseconds)`` arrays, or ``None`` if a format
+        or a string does not fit (``strptime`` has then to be used).
+    """
+    fields = {}
+    for strings, fmt in specs:
+        layout, literals, width = [], [], 0
+        chars = iter(fmt)
+        for char in chars:
+            if char != "%":
+                literals.append((width, ord(char)))
+                width += 1
+                continue
+            name, size, _ = _DIRECTIVES.get(next(chars, ""), (None, 0, 0))
+            if name is None or name in fields:
+                return None
+            layout.append((name, width, size))
+            fields[name] = None
+            width += size
+
+        if set(map(len, strings)) != {width}:
+            return None
+        joined = "".join(strings)
+        if not joined.isascii():
+            return None
+        codes = np.frombuffer(joined.encode("ascii"), dtype=np.uint8).reshape(-1, width)
+        for pos, code in literals:
+            if (codes[:, pos] != code).any():
+                return None
+        for name, pos, size in layout:
+            digits = codes[:, pos : pos + size].astype(np.int64) - 48
+            if ((digits < 0) | (digits > 9)).any():
+                return None
+            fields[name] = digits @ (10 ** np.arange(size - 1, -1, -1, dtype=np.int64))
+
+    count = len(specs[0][0])
+    year, month, day, hour, minute, second = (
+        np.full(count, default, dtype=np.int64) if fields.get(name) is None else fields[name]
+        for name, _, default in _DIRECTIVES.values()
+    )
+    if ((year < 1) | (month < 1) | (month > 12) | (day < 1)).any():
+        return None
+    if ((hour > 23) | (minute > 59) | (second > 59)).any():
+        return None
+    months = ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+    first = months.astype("datetime64[D]").astype(np.int64)
+    monthdays = (months + 1).astype("datetime64[D]").astype(np.int64) - first
+    if (day > monthdays).any():
+        return None
+    ordinals = first + (day - 1) + _EPOCH_ORDINAL
+    return ordinals, ((hour * 60 + minute) * 60 + second) * 1000000
+
+
+def _timestamp_parts(strings):
+    """``datetime.fromtimestamp(int(x), UTC)`` of all the ``strings``."""
+    seconds = np.array([int(string) for string in strings], dtype=object)
+    if len(seconds) and not (-62135596800 <= seconds.min() and seconds.max() <= 253402300799):
+        return None  # out of the datetime range: let fromtimestamp raise
+    seconds = seconds.astype(np.int64)
+    return seconds // 86400 + _EPOCH_ORDINAL, seconds % 86400 * 1000000
+
 
 class GenericCSVData(feed.CSVDataBase):
     """Parses a CSV file according to the order and field presence defined by the
@@ -139,29 +224,7 @@ class GenericCSVData(feed.CSVDataBase):
         # If not string, call time conversion function _dtconvert set in start
         else:
             dt = self._dtconvert(dtfield)
-        # If trading interval is greater than or equal to day
-        if self.p.timeframe >= TimeFrame.Days:
-            # check if the expected end of session is larger than parsed
-            # If _tzinput is True, need to localize date, otherwise date remains original
-            if self._tzinput:
-                dtin = self._tzinput.localize(dt)  # pytz compatible-ized
-            else:
-                dtin = dt
-            # Use date2num to convert date to number
-            dtnum = date2num(dtin)  # utc'ize
-            # Combine date and sessionend, convert to number
-            dteos = datetime.combine(dt.date(), self.p.sessionend)
-            dteosnum = self.date2num(dteos)  # utc'ize
-            # If number converted from combined sessionend date is greater than converted date number, use former number as time
-            if dteosnum > dtnum:
-                self.lines.datetime[0] = dteosnum
-            # If not greater, if self._tzinput is True, directly convert dt to time, if not True, use original dtnum
-            else:
-                # Avoid reconversion if already converted dtin == dt
-                self.l.datetime[0] = date2num(dt) if self._tzinput else dtnum
-        # If trading cycle is less than day, convert time directly
-        else:
-            self.lines.datetime[0] = date2num(dt)
+        self.lines.datetime[0] = self._dt2num(dt)
 
         # PERFORMANCE OPTIMIZATION: Cache field mappings on first call
         # Avoids repeated getattr calls (619K+ calls to _loadline)
@@ -192,6 +255,86 @@ class GenericCSVData(feed.CSVDataBase):
 
         return True
 
+    def _dt2num(self, dt):
+        """Numeric value of the parsed datetime ``dt``."""
+        # If trading interval is greater than or equal to day
+        if self.p.timeframe >= TimeFrame.Days:
+            # check if the expected end of session is larger than parsed
+            # If _tzinput is True, need to localize date, otherwise date remains original
+            if self._tzinput:
+                dtin = self._tzinput.localize(dt)  # pytz compatible-ized
+            else:
+                dtin = dt
+            # Use date2num to convert date to number
+            dtnum = date2num(dtin)  # utc'ize
+            # Combine date and sessionend, convert to number
+            dteos = datetime.combine(dt.date(), self.p.sessionend)
+            dteosnum = self.date2num(dteos)  # utc'ize
+            # If number converted from combined sessionend date is greater than converted date number, use former number as time
+            if dteosnum > dtnum:
+                return dteosnum
+            # If not greater, if self._tzinput is True, directly convert dt to time, if not True, use original dtnum
+            # Avoid reconversion if already converted dtin == dt
+            return date2num(dt) if self._tzinput else dtnum
+        # If trading cycle is less than day, convert time directly
+        return date2num(dt)
+
+    def _loadcolumns(self, columns):
+        # Subclasses parsing lines their own way are loaded line by line
+        if type(self)._loadline is not GenericCSVData._loadline:
+            return None
+
+        p = self.p
+        count = len(columns[0])
+        dtfields = columns[p.datetime]
+        parts = None
+        if self._dtstr:
+            specs = [(dtfields, p.dtformat)]
+            if p.time >= 0:
+                specs.append((columns[p.time], p.tmformat))
+            parts = _strptime_parts(specs)
+        elif isinstance(p.dtformat, integer_types) and int(p.dtformat) == 1:
+            parts = _timestamp_parts(dtfields)
+
+        if parts is not None:
+            ordinals, usecs = parts
+            dts = ordinal2num(ordinals, usecs)
+            if p.timeframe >= TimeFrame.Days:
+                days, inverse = np.unique(ordinals, return_inverse=True)
+                eos = [
+                    self.date2num(datetime.combine(date.fromordinal(day), p.sessionend))
+                    for day in days.tolist()
+                ]
+                eos = np.array(eos, dtype=np.float64)[inverse.ravel()]
+                dts = np.where(eos > dts, eos, dts)
+        else:
+            # Other formats: convert each distinct field as _loadline does
+            if self._dtstr:
+                dtformat = p.dtformat
+                if p.time >= 0:
+                    dtfields = [d + "T" + t for d, t in zip(dtfields, columns[p.time])]
+                    dtformat += "T" + p.tmformat
+                convert = lambda field: datetime.strptime(field, dtformat)  # noqa: E731
+            else:
+                convert = self._dtconvert
+            nums = {field: self._dt2num(convert(field)) for field in set(dtfields)}
+            dts = np.array([nums[field] for field in dtfields], dtype=np.float64)
+
+        values = {"datetime": dts}
+        nullvalue = p.nullvalue
+        for linefield in self.getlinealiases():
+            if linefield == "datetime":
+                continue
+            csvidx = getattr(p, linefield)
+            if csvidx is None or csvidx < 0:
+                values[linefield] = np.full(count, float(nullvalue))
+                continue
+            fields = columns[csvidx]
+            if "" in fields:
+                fields = [nullvalue if field == "" else field for field in fields]
+            values[linefield] = np.fromiter(map(float, fields), dtype=np.float64, count=count)
+        return values
+
 
 class GenericCSV(feed.CSVFeedBase):
     """Generic CSV feed class.
@@ -23,6 +23,7 @@ class MixedChannel(StreamingEventQueue):
         max_memory_mb=200,
         adaptive=True,
         batch_size=10000,
+        batch_merge=False,
     ):
         merged_channels: list = []
         for group in (
@@ -40,6 +41,7 @@ class MixedChannel(StreamingEventQueue):
             max_memory_mb=max_memory_mb,
             adaptive=adaptive,
             batch_size=batch_size,
+            batch_merge=batch_merge,
         )
 
 
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+"""NumPy Data Feed Module - Column arrays integration.
+
+This module provides a data feed for market data already held in memory as
+one array per column, like the columns of a NumPy structured array or of an
+``np.load`` archive.
+
+Classes:
+    NumpyData: Uses column arrays as data source.
+
+Example:
+    >>> columns = {'datetime': stamps, 'open': o, 'high': h, 'low': l,
+    ...            'close': c, 'volume': v}
+    >>> data = bt.feeds.NumpyData(dataname=columns)
+    >>> cerebro.adddata(data)
+"""
+
+import numpy as np
+
+from ..feed import DataBase
+from ..utils.dateintern import date2num_array
+
+__all__ = ["NumpyData"]
+
+
+def _nsaxis(values):
+    """int64 epoch nanoseconds of the ``datetime64`` values, if all fit."""
+    nsvalues = values.astype("datetime64[ns]")
+    if not (nsvalues.astype(values.dtype) == values).all():
+        return None  # out of the int64 nanosecond range or finer
+    return nsvalues.view(np.int64).ravel()
+
+
+class NumpyData(DataBase):
+    """
+    Uses column arrays as the feed source: a mapping of names to arrays (a
+    ``dict``, an ``NpzFile``) or a NumPy structured array
+
+    Params:
+
+      - ``bulkload`` (default: *True*): with no filters attached, ``preload``
+        fills each line with its whole column in a single step
+
+      - ``timens`` (default: *False*): with ``bulkload``, also keep the exact
+        ``datetime64`` values as int64 epoch nanoseconds in the ``nsaxis``
+        of the datetime line (see ``LineBuffer.epochns``)
+
+    Note:
+
+      - The lines parameters (datetime, open, high ...) are the names of the
+        columns. ``None`` or a name missing from ``dataname`` indicates that
+        the field is not present
+
+      - The ``datetime`` column holds ``datetime64`` values (naive, UTC) or
+        the float days of ``date2num``
+
+      - All the columns must have the same length
+    """
+
+    _cacheable = True
+
+    params = (
+        ("bulkload", True),
+        ("timens", False),
+        ("datetime", "datetime"),
+        ("open", "open"),
+        ("high", "high"),
+        ("low", "low"),
+        ("close", "close"),
+        ("volume", "volume"),
+        ("openinterest", "openinterest"),
+    )
+
+    datafields = ["datetime", "open", "high", "low", "close", "volume", "openinterest"]
+
+    def __init__(self):
+        """Initialize the NumPy data feed."""
+        super().__init__()
+        self._row = -1
+        self._size = 0
+        self._columns = {}
+        self._nsaxis = None
+
+    def _getcolumn(self, name):
+        dataname = self.p.dataname
+        names = getattr(getattr(dataname, "dtype", None), "names", None)
+        if names is not None:
+            return dataname[name] if name in names else None
+        return dataname[name] if name in dataname else None
+
+    def start(self):
+        """Start the NumPy data feed.
+
+        Converts the columns to float arrays, the datetime one to float days.
+        """
+        super().start()
+        self._row = -1
+
+        columns = {}
+        self._nsaxis = None
+        for alias in self.getlinealiases():
+            name = getattr(self.params, alias, None)
+            column = None if name is None else self._getcolumn(name)
+            if column is None:
+                continue
+            column = np.asarray(column)
+            if alias == "datetime" and column.dtype.kind == "M":
+                if np.isnat(column).any():
+                    raise ValueError("datetime column with NaT values")
+                if self.p.timens:
+                    self._nsaxis = _nsaxis(column)
+                column = date2num_array(column)
+            columns[alias] = np.asarray(column, dtype=np.float64).ravel()
+
+        sizes = {len(column) for column in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError(f"columns of different lengths: {sorted(sizes)}")
+        self._size = sizes.pop() if sizes else 0
+        self._columns = columns
+
+    def preload(self):
+        """Preload all the rows, filling whole lines when possible."""
+        if self._fastpreload():
+            return
+
+        if not (self.p.bulkload and self._canbulkfill() and type(self)._load is NumpyData._load):
+            super().preload()
+            return
+
+        self._bulkfill(self._columns, self._size, self._nsaxis)
+        self._row = self._size
+        self._last()
+        self.home()
+
+    def _endsource(self):
+        self._row = self._size
+
+    def _load(self):
+        self._row += 1
+        if self._row >= self._size:
+            return False
+
+        row = self._row
+        for alias, column in self._columns.items():
+            getattr(self.lines, alias)[0] = column[row]
+        return True
@@ -8,6 +8,8 @@ Classes:
     PandasDirectData: Uses DataFrame tuples as data source.
     PandasData: Uses DataFrame columns as data source.
 
+See ``numpyfeed.NumpyData`` for plain column arrays.
+
 Example:
     >>> import pandas as pd
     >>> df = pd.read_csv('data.csv')
@@ -15,10 +17,13 @@ Example:
     >>> cerebro.adddata(data)
 """
 
+import numpy as np
+
 from ..feed import DataBase
-from ..utils import date2num
+from ..utils import date2num, date2num_array
 from ..utils.log_message import get_logger
 from ..utils.py3 import filter, integer_types, string_types
+from .numpyfeed import _nsaxis
 
 logger = get_logger(__name__)
 
@@ -40,6 +45,8 @@ class PandasDirectData(DataBase):
         it is
     """
 
+    _cacheable = True
+
     # Parameters
     params = (
         ("datetime", 0),
@@ -71,6 +78,9 @@ class PandasDirectData(DataBase):
         # reset the iterator on each start
         self._rows = self.p.dataname.itertuples()
 
+    def _endsource(self):
+        self._rows = iter(())
+
     def _load(self):
         # Try to get next row, return False if error
         try:
@@ -127,6 +137,13 @@ class PandasData(DataBase):
 
       - ``nocase`` (default *True*) case-insensitive match of column names
 
+      - ``bulkload`` (default *True*) with no filters attached, ``preload``
+        fills each line with its whole column in a single step
+
+      - ``timens`` (default *False*) with ``bulkload``, also keep the exact
+        datetimes as int64 epoch nanoseconds in the ``nsaxis`` of the
+        datetime line (see ``LineBuffer.epochns``)
+
     Note:
 
       - The ``dataname`` parameter is a Pandas DataFrame
@@ -144,9 +161,13 @@ class PandasData(DataBase):
         - >= 0 or string: specific colum identifier
     """
 
+    _cacheable = True
+
     # Parameters and their meanings
     params = (
         ("nocase", True),
+        ("bulkload", True),
+        ("timens", False),
         # Possible values for datetime (must always be present)
         #  None: datetime is the "index" in the Pandas Dataframe
         #  -1: autodetect position or case-wise equal name
@@ -182,6 +203,7 @@ class PandasData(DataBase):
         self._loaditems = None
         self._df_values = None
         self._dt_dtnum = None
+        self._nsaxis = None
         self._coldtime = None
         colnames = list(self.p.dataname.columns.values)
         # If datetime is in index
@@ -307,20 +329,23 @@ class PandasData(DataBase):
             self._df_values = None
 
         self._dt_dtnum = None
+        self._nsaxis = None
         try:
             coldtime = self._coldtime
             ts = df.index if coldtime is None else df.iloc[:, coldtime]
+            values = self._datetime64(ts)
+            if values is not None and not np.isnat(values).any():
+                self._dt_dtnum = date2num_array(values).tolist()
+                if self.p.timens:
+                    self._nsaxis = _nsaxis(values)
+                return
             try:
-                import numpy as np
-
                 py_dts = np.array(ts.to_pydatetime())
             except Exception as e1:
                 logger.debug("ts.to_pydatetime() failed, trying .dt accessor: %s", e1)
                 try:
                     import warnings
 
-                    import numpy as np
-
                     with warnings.catch_warnings():
                         warnings.simplefilter("ignore", FutureWarning)
                         py_dts = np.array(ts.dt.to_pydatetime())
@@ -334,6 +359,63 @@ class PandasData(DataBase):
             logger.debug("Failed to pre-compute datetime numbers: %s", e)
             self._dt_dtnum = None
 
+    @staticmethod
+    def _datetime64(ts):
+        """Naive (UTC) datetime64 values of a datetime index or column.
+
+        Returns ``None`` if ``ts`` does not hold datetime64 values.
+        """
+        tz = getattr(getattr(ts, "dtype", None), "tz", None)
+        if tz is not None:
+            # date2num works with the UTC time of aware datetimes
+            ts = ts.tz_convert("UTC") if hasattr(ts, "tz_convert") else ts.dt.tz_convert("UTC")
+            ts = ts.tz_localize(None) if hasattr(ts, "tz_localize") else ts.dt.tz_localize(None)
+        values = np.asarray(ts)
+        return values if values.dtype.kind == "M" else None
+
+    def _bulkcolumns(self):
+        """``{line alias: float values}`` of all the rows, if ready for ``_bulkfill``."""
+        if self._dt_dtnum is None or self._df_values is None:
+            return None
+
+        df = self.p.dataname
+        columns = {"datetime": self._dt_dtnum}
+        for datafield in self.getlinealiases():
+            colindex = self._colmapping.get(datafield)
+            if datafield == "datetime" or colindex is None:
+                continue
+            column = df.iloc[:, colindex]
+            dtype = column.dtype
+            # Other dtypes (float32, nullable, object) go through __setitem__
+            if not isinstance(dtype, np.dtype) or not (dtype.kind in "iub" or dtype == np.float64):
+                return None
+            columns[datafield] = column.to_numpy(dtype=np.float64)
+        return columns
+
+    def preload(self):
+        """Preload all the rows.
+
+        With ``bulkload`` set and no filters attached, each line is filled
+        with its whole column in a single step.
+        """
+        if self._fastpreload():
+            return
+
+        columns = None
+        if self.p.bulkload and self._canbulkfill() and type(self)._load is PandasData._load:
+            columns = self._bulkcolumns()
+        if columns is None:
+            super().preload()
+            return
+
+        self._bulkfill(columns, self._df_len, self._nsaxis)
+        self._idx = self._df_len
+        self._last()
+        self.home()
+
+    def _endsource(self):
+        self._idx = self._df_len
+
     def _load(self):
         # Load one row at a time, _idx increments by 1 each time
         self._idx += 1
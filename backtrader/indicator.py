@@ -9,9 +9,14 @@ The Indicator class serves as the foundation for all technical indicators
 in backtrader, managing line data, minimum periods, and calculation logic.
 """
 
+import array
+
+from .dataseries import DataSeries
+from .linebuffer import LineActions, LineBuffer
 from .lineiterator import IndicatorBase, LineIterator
 from .lineseries import Lines
 from .metabase import AutoInfoClass, OwnerContext
+from .utils import vectorops
 from .utils.py3 import range
 
 
@@ -26,6 +31,10 @@ class IndicatorRegistry:
     _icache: dict = {}
     _icacheuse = False
 
+    # runonce results of indicators, shared between runs (see useresultcache)
+    _rcache: dict = {}
+    _rcacheuse = False
+
     @classmethod
     def register(cls, name, indicator_cls):
         """Register an indicator class in the registry.
@@ -39,8 +48,9 @@ class IndicatorRegistry:
 
     @classmethod
     def cleancache(cls):
-        """Clear the indicator cache."""
+        """Clear the indicator cache and the cache of runonce results."""
         cls._icache = {}
+        cls._rcache = {}
 
     @classmethod
     def usecache(cls, onoff):
@@ -51,6 +61,15 @@ class IndicatorRegistry:
         """
         cls._icacheuse = onoff
 
+    @classmethod
+    def useresultcache(cls, onoff):
+        """Enable or disable sharing runonce results between runs.
+
+        Args:
+            onoff: If True, enable the result cache; if False, disable it
+        """
+        cls._rcacheuse = onoff
+
     @classmethod
     def get_cached_or_create(cls, indicator_cls, *args, **kwargs):
         """Get cached indicator instance or create new one.
@@ -97,6 +116,13 @@ class Indicator(IndicatorBase):
     _ltype = LineIterator.IndType
     csv = False
 
+    # Compute once() with the NumPy kernels (see Indicator.usevectorize)
+    _vectorize = False
+
+    # Compute next() with rolling window state (see Indicator.useincremental)
+    _incremental = False
+    _rolling = None
+
     def __getitem__(self, ago):
         """CRITICAL FIX: Forward item access to the first line (e.g., sma line)
 
@@ -145,9 +171,9 @@ class Indicator(IndicatorBase):
                     if old_owner is not parent_owner:
                         try:
                             old_lists = getattr(old_owner, "_lineiterators", {})
+                            # Identity: == on lines objects builds an operation
                             for indicators in old_lists.values():
-                                while self in indicators:
-                                    indicators.remove(self)
+                                indicators[:] = [x for x in indicators if x is not self]
                         except Exception:  # nosec B110
                             # Best-effort detach from a previous owner; ignore failures.
                             pass
@@ -243,6 +269,153 @@ class Indicator(IndicatorBase):
         """Enable or disable caching"""
         IndicatorRegistry.usecache(onoff)
 
+    @classmethod
+    def usevectorize(cls, onoff):
+        """Enable or disable the vectorized once() backend.
+
+        When active, indicators which provide NumPy kernels (moving averages,
+        Highest/Lowest/SumN, StdDev, Bollinger Bands, RSI, ATR, MACD) compute
+        their runonce values as whole-array operations. Indicators without
+        kernels, or inputs a kernel cannot handle, use the regular ``once``.
+        """
+        Indicator._vectorize = bool(onoff)
+
+    @classmethod
+    def useincremental(cls, onoff):
+        """Enable or disable the incremental next() backend.
+
+        When active, window indicators (``SMA``, ``Average``, ``SumN``,
+        ``Highest``/``Lowest``, ``StdDev`` with a simple moving average and
+        Bollinger Bands) keep rolling state between bars and update it with
+        the newest value in O(1) instead of recalculating the whole window.
+        Called on an indicator class it only affects that class and its
+        subclasses (e.g. ``bt.ind.Highest.useincremental(True)``).
+        """
+        cls._incremental = bool(onoff)
+
+    def _rollingwindow(self, factory, period, data=None):
+        """Return the rolling window state of ``data`` for the current bar.
+
+        The state is created with ``factory(period, values)`` (see
+        ``utils.rolling``) from the last ``period`` values of ``data`` on the
+        first call and whenever the indicator did not move exactly one bar
+        since the previous call. A new bar pushes the current value and a
+        call for the same bar (replay, live bar updates) replaces it.
+        """
+        data = self.data if data is None else data
+        rolling = self._rolling
+        length = len(self)
+        if rolling is not None and length == self._rollinglen + 1:
+            rolling.push(float(data[0]))
+        elif rolling is not None and length == self._rollinglen:
+            rolling.replace(float(data[0]))
+        else:
+            size = min(period, len(data))
+            self._rolling = rolling = factory(period, [float(data[i]) for i in range(1 - size, 1)])
+        self._rollinglen = length
+        return rolling
+
+    @classmethod
+    def useresultcache(cls, onoff):
+        """Enable or disable sharing runonce results between runs.
+
+        When active, the lines computed by ``_once`` are stored under a key
+        made of the indicator class, its parameters and the identity of its
+        inputs (data feeds or other cacheable indicators). An indicator with
+        the same key in a later run (for example another combination of an
+        optimization running in the same process) gets its values, and those
+        of its sub-indicators, copied from the cache instead of computing
+        them. Indicators fed by line operations are not cached.
+        """
+        IndicatorRegistry.useresultcache(bool(onoff))
+
+    def _once(self, start=None, end=None):
+        """Run the runonce calculation, reusing cached results if possible."""
+        if not IndicatorRegistry._rcacheuse:
+            return super()._once(start, end)
+
+        refs = []
+        key = self._resultkey(refs)
+        if key is None:
+            return super()._once(start, end)
+
+        key = (key, self._minperiod, self._clock.buflen())
+        cached = IndicatorRegistry._rcache.get(key)
+        if cached is not None and self._restoreresults(cached[1]):
+            return None
+
+        super()._once(start, end)
+        snapshot = self._snapshotresults()
+        if snapshot is not None:
+            # refs keep the inputs alive: their ids cannot be reused
+            IndicatorRegistry._rcache[key] = (refs, snapshot)
+        return None
+
+    def _resultkey(self, refs):
+        """Return the key of the results of the indicator.
+
+        Args:
+            refs: List collecting the data feeds and lines used in the key
+
+        Returns:
+            A hashable key or None if the results cannot be cached
+        """
+        inputs = tuple(_inputkey(data, refs) for data in self.datas)
+        if not inputs or None in inputs:
+            return None
+
+        key = (type(self), tuple(self.p._getkwargs().items()), inputs)
+        try:
+            hash(key)
+        except TypeError:  # a parameter is not hashable
+            return None
+        return key
+
+    def _resultlines(self):
+        """Return the lines of the indicator and of all its sub-indicators."""
+        lines = list(self.lines)
+        for ind in self._lineiterators[LineIterator.IndType]:
+            if isinstance(ind, Indicator):
+                lines.extend(ind._resultlines())
+            else:
+                lines.append(ind)
+        return lines
+
+    def _snapshotresults(self):
+        """Return a copy of the state of the result lines (None if not possible)."""
+        snapshot = []
+        for line in self._resultlines():
+            if not isinstance(line, LineBuffer) or line.mode != LineBuffer.UnBounded:
+                return None
+            values = vectorops.as_ndarray(line.array).copy()
+            snapshot.append((values, line.idx, line.lencount))
+        return snapshot
+
+    def _restoreresults(self, snapshot):
+        """Set the result lines from ``snapshot``. Return False if it does not fit."""
+        lines = self._resultlines()
+        if len(lines) != len(snapshot) or any(
+            not isinstance(line, LineBuffer) or line.mode != LineBuffer.UnBounded for line in lines
+        ):
+            return False
+
+        for line, (values, idx, lencount) in zip(lines, snapshot):
+            storage = LineBuffer._newarray()
+            if isinstance(storage, array.array):
+                storage.frombytes(values.tobytes())
+            else:
+                storage.extend(values)
+            line.array = storage
+            line.idx = idx
+            line.lencount = lencount
+            if isinstance(line, LineActions):
+                line._once_called = True
+
+        for line in lines:
+            if line.bindings:
+                line.oncebinding()
+        return True
+
     def _finalize_minperiod(self):
         """CRITICAL FIX: Finalize minimum period calculation after indicator __init__ completes.
 
@@ -397,6 +570,29 @@ class Indicator(IndicatorBase):
             self.next()
 
 
+def _inputkey(src, refs):
+    """Return the cache key of the input ``src`` of an indicator (or None).
+
+    Data feeds and their lines are identified by the object itself, lines
+    of an indicator by the key of the indicator and the index of the line.
+    """
+    if isinstance(src, Indicator):
+        return src._resultkey(refs)
+
+    if isinstance(src, DataSeries) or getattr(src, "_is_data_feed_line", False):
+        refs.append(src)
+        return id(src)
+
+    owner = getattr(getattr(src, "_owner", None), "_owner", None)  # Lines -> indicator
+    if isinstance(owner, Indicator):
+        for i, line in enumerate(owner.lines):
+            if line is src:
+                key = owner._resultkey(refs)
+                return None if key is None else (key, i)
+
+    return None
+
+
 class LinePlotterIndicatorBase(Indicator.__class__):
     """Base class for indicators that plot multiple lines.
 
@@ -99,7 +99,12 @@ from .vortex import *
 
 # Add some custom indicators
 from .myind import *
-from .contrib import *
+from ..utils.lazyimport import lazyexports as _lazyexports
+from . import contrib as contrib
+
+# The contributed indicators are only imported when first used
+__all__ = [name for name in globals() if not name.startswith("_")] + contrib.__all__
+__getattr__, __dir__ = _lazyexports(__name__, {"contrib": contrib.__all__})
 
 # # At the end of the file, after all imports
 # from .mabase import _register_common_moving_averages
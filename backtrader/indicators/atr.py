@@ -22,8 +22,14 @@ Example:
 
 import math
 
+import numpy as np
+
+from ..utils import vectorops as _vectorops
+from ..utils.log_message import get_logger
 from . import Indicator, MovAv
 
+logger = get_logger(__name__)
+
 
 class TrueHigh(Indicator):
     """
@@ -270,6 +276,9 @@ class AverageTrueRange(Indicator):
         while len(larray) < end:
             larray.append(float("nan"))
 
+        if self._vectorize and self._once_vectorized(start, end):
+            return
+
         # Pre-fill warmup with NaN (indices 0 to period-1)
         for i in range(min(period, len(high_array))):
             if i < len(larray):
@@ -310,6 +319,48 @@ class AverageTrueRange(Indicator):
             if i < len(larray):
                 larray[i] = prev_atr
 
+    def _once_vectorized(self, start, end):
+        """Compute the true range as array operations and smooth it with the
+        recurrence kernel. Inputs holding NaN values use the regular once().
+
+        Returns:
+            bool: False if the regular once() has to be used.
+        """
+        try:
+            high_array = self.data.high.array
+            low_array = self.data.low.array
+            close_array = self.data.close.array
+            larray = self.lines.atr.array
+            period = self.p.period
+            limit = min(end, len(high_array), len(low_array), len(close_array))
+
+            high = _vectorops.as_ndarray(high_array, limit)
+            low = _vectorops.as_ndarray(low_array, limit)
+            close = _vectorops.as_ndarray(close_array, limit)
+            if np.isnan(high).any() or np.isnan(low).any() or np.isnan(close).any():
+                return False
+
+            _vectorops.assign(larray, 0, np.full(min(period, len(high_array)), float("nan")))
+            if period >= limit:
+                return True
+
+            # tr[k] is the true range of bar k + 1
+            prev_close = close[:-1]
+            tr = np.maximum(high[1:], prev_close) - np.minimum(low[1:], prev_close)
+
+            prev_atr = 0.0
+            for value in tr[:period].tolist():
+                prev_atr += value
+            prev_atr /= period
+            larray[period] = prev_atr
+
+            values = _vectorops.linear_recurrence(tr[period:], self.alpha, self.alpha1, prev_atr)
+            _vectorops.assign(larray, period + 1, values)
+        except Exception:
+            logger.debug("ATR vectorized once() failed", exc_info=True)
+            return False
+        return True
+
 
 TR = TrueRange
 ATR = AverageTrueRange
@@ -51,6 +51,10 @@ import functools
 import math
 import operator
 
+import numpy as np
+
+from ..utils import rolling as _rolling
+from ..utils import vectorops as _vectorops
 from ..utils.log_message import get_logger
 from ..utils.py3 import map, range
 from . import Indicator
@@ -97,6 +101,9 @@ class OperationN(PeriodN):
 
         Applies func to the last 'period' data values.
         """
+        if self._incremental and self._next_rolling():
+            return
+
         # CRITICAL FIX: Use proper line assignment instead of direct array manipulation
         # The line[0] assignment will handle the buffer correctly
         window = self.data.get(size=self.p.period)
@@ -113,8 +120,40 @@ class OperationN(PeriodN):
         value = self.func(window)
         self.lines[0][0] = value
 
+    # Window functions with rolling state for the incremental next() backend
+    _rolling_factories = {
+        max: functools.partial(_rolling.RollingExtreme, func=max),
+        min: functools.partial(_rolling.RollingExtreme, func=min),
+        math.fsum: _rolling.RollingSum,
+    }
+
+    def _next_rolling(self):
+        """Calculate next() from rolling state. Returns False if not possible."""
+        try:
+            factory = self._rolling_factories.get(self.func)
+        except TypeError:  # unhashable func
+            factory = None
+        if factory is None:
+            return False
+
+        rolling = self._rollingwindow(factory, self.p.period)
+        if rolling.nonfinite:
+            return False  # func decides how NaN/inf are handled
+        self.lines[0][0] = rolling.value
+        return True
+
+    # Window functions with a NumPy kernel for the vectorized once() backend
+    _vector_kernels = {
+        max: _vectorops.rolling_max,
+        min: _vectorops.rolling_min,
+        math.fsum: _vectorops.rolling_sum,
+    }
+
     def once(self, start, end):
         """Optimized batch calculation for runonce mode - same approach as SMA"""
+        if self._vectorize and self._once_vectorized(start, end):
+            return
+
         try:
             # Get arrays for efficient calculation - use same approach as SMA
             dst = self.lines[0].array
@@ -164,6 +203,55 @@ class OperationN(PeriodN):
             # Fallback to once_via_next if once() fails
             super().once_via_next(start, end)
 
+    def _once_vectorized(self, start, end):
+        """Compute once() with a rolling-window kernel.
+
+        Only ``func`` values with a known kernel are handled. Windows holding
+        NaN values are recalculated with ``func`` to keep its exact semantics.
+
+        Returns:
+            bool: False if the regular once() has to be used.
+        """
+        try:
+            kernel = self._vector_kernels.get(self.func)
+        except TypeError:  # unhashable func
+            kernel = None
+        if kernel is None:
+            return False
+
+        try:
+            dst = self.lines[0].array
+            src = self.data.array
+            period = self.p.period
+            func = self.func
+
+            while len(dst) < end:
+                dst.append(float("nan"))
+            if start >= end:
+                return True
+
+            _vectorops.assign(dst, start, np.full(end - start, float("nan")))
+
+            actual_end = min(end, len(src))
+            calc_start = max(start, period - 1)
+            if calc_start >= actual_end:
+                return True
+
+            x = _vectorops.as_ndarray(src, actual_end)
+            values = kernel(x, period)[calc_start - period + 1 :]
+            nancounts = _vectorops.rolling_nancount(x, period)[calc_start - period + 1 :]
+            nanrows = np.flatnonzero(nancounts)
+            if len(nanrows):
+                values = values.copy()
+                for row in nanrows.tolist():
+                    i = calc_start + row
+                    values[row] = func(src[i - period + 1 : i + 1])
+            _vectorops.assign(dst, calc_start, values)
+        except Exception:
+            logger.debug("OperationN vectorized once() failed", exc_info=True)
+            return False
+        return True
+
 
 # Set callable function when calculating indicators
 class BaseApplyN(OperationN):
@@ -532,6 +620,12 @@ class Average(PeriodN):
 
         av = sum(data, period) / period
         """
+        if self._incremental:
+            rolling = self._rollingwindow(_rolling.RollingSum, self.p.period)
+            if not rolling.nonfinite:
+                self.lines[0][0] = rolling.sum / self.p.period
+                return
+
         data_values = self.data.get(size=self.p.period)
         avg_value = math.fsum(data_values) / self.p.period
         self.lines[0][0] = avg_value
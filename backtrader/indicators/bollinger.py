@@ -22,8 +22,15 @@ Example:
 
 import math
 
+import numpy as np
+
+from ..utils import rolling as _rolling
+from ..utils import vectorops as _vectorops
+from ..utils.log_message import get_logger
 from . import Indicator, MovAv
 
+logger = get_logger(__name__)
+
 
 class BollingerBands(Indicator):
     """
@@ -81,6 +88,16 @@ class BollingerBands(Indicator):
         period = self.p.period
         devfactor = self.p.devfactor
 
+        if self._incremental:
+            rolling = self._rollingwindow(_rolling.RollingMoments, period)
+            if not rolling.nonfinite:
+                mid = rolling.mean
+                stddev = math.sqrt(rolling.variance())
+                self.lines.mid[0] = mid
+                self.lines.top[0] = mid + devfactor * stddev
+                self.lines.bot[0] = mid - devfactor * stddev
+                return
+
         # Calculate SMA (mid)
         data_sum = 0.0
         data_sq_sum = 0.0
@@ -118,6 +135,9 @@ class BollingerBands(Indicator):
             while len(arr) < end:
                 arr.append(float("nan"))
 
+        if self._vectorize and self._once_vectorized(start, end):
+            return
+
         # PERFORMANCE: Cache constants and functions
         nan_val = float("nan")
         sqrt = math.sqrt
@@ -161,6 +181,34 @@ class BollingerBands(Indicator):
             top_array[i] = mid + devfactor * stddev
             bot_array[i] = mid - devfactor * stddev
 
+    def _once_vectorized(self, start, end):
+        """Compute the bands with rolling loop sums. Returns False on failure."""
+        try:
+            darray = self.data.array
+            period = self.p.period
+            devfactor = self.p.devfactor
+            actual_end = min(end, len(darray))
+
+            warmup = np.full(min(period - 1, len(darray)), float("nan"))
+            for line in (self.lines.mid, self.lines.top, self.lines.bot):
+                _vectorops.assign(line.array, 0, warmup)
+            if actual_end < period:
+                return True
+
+            x = _vectorops.as_ndarray(darray, actual_end)
+            # next()/once() add up each window newest value first
+            mid = _vectorops.rolling_loopsum(x, period) / period
+            meansq = _vectorops.rolling_loopsum(x * x, period) / period
+            stddev = np.sqrt(np.maximum(0.0, np.abs(meansq - mid * mid)))
+
+            _vectorops.assign(self.lines.mid.array, period - 1, mid)
+            _vectorops.assign(self.lines.top.array, period - 1, mid + devfactor * stddev)
+            _vectorops.assign(self.lines.bot.array, period - 1, mid - devfactor * stddev)
+        except Exception:
+            logger.debug("BollingerBands vectorized once() failed", exc_info=True)
+            return False
+        return True
+
 
 # Bollinger Bands Percentage indicator
 class BollingerBandsPct(BollingerBands):
@@ -203,6 +251,9 @@ class BollingerBandsPct(BollingerBands):
         while len(pctb_array) < end:
             pctb_array.append(float("nan"))
 
+        if self._vectorize and self._pctb_vectorized(start, end):
+            return
+
         for i in range(start, min(end, len(darray), len(top_array), len(bot_array))):
             top = top_array[i] if i < len(top_array) else 0.0
             bot = bot_array[i] if i < len(bot_array) else 0.0
@@ -221,3 +272,24 @@ class BollingerBandsPct(BollingerBands):
                     pctb_array[i] = (data_val - bot) / diff
                 else:
                     pctb_array[i] = 0.0
+
+    def _pctb_vectorized(self, start, end):
+        """Compute the %B line as array operations. Returns False on failure."""
+        try:
+            limit = min(end, len(self.data.array), len(self.lines.top.array))
+            limit = min(limit, len(self.lines.bot.array))
+            if start >= limit:
+                return True
+
+            price = _vectorops.as_ndarray(self.data.array)[start:limit]
+            top = _vectorops.as_ndarray(self.lines.top.array)[start:limit]
+            bot = _vectorops.as_ndarray(self.lines.bot.array)[start:limit]
+            diff = top - bot
+            with np.errstate(divide="ignore", invalid="ignore"):
+                pctb = np.where(diff != 0, (price - bot) / diff, 0.0)
+            pctb[np.isnan(top) | np.isnan(bot)] = float("nan")
+            _vectorops.assign(self.lines.pctb.array, start, pctb)
+        except Exception:
+            logger.debug("BollingerBandsPct vectorized once() failed", exc_info=True)
+            return False
+        return True
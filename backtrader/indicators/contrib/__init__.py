@@ -4,225 +4,258 @@
 These indicators are lower-commonality or strategy-specific indicators. They are
 re-exported from ``backtrader.indicators`` so users can access them as
 ``bt.indicators.Xxx``.
-"""
 
-from importlib import import_module as _import_module
+The modules are imported on first use of one of their indicators: ``_EXPORTS``
+lists the names exported by each of them.
+"""
 
-_MODULES = (
-    "absolutely_no_lag_lwma",
-    "absolutely_no_lag_lwma_color",
-    "accumulation_distribution_line",
-    "adx_cross_hull_style_indicator",
-    "adxdmi",
-    "ai_acceleration_deceleration_oscillator",
-    "altr_trend_signal_v22",
-    "anchored_momentum_line",
-    "any_range_cld_tail_indicator",
-    "aroon_horn_sign_indicator",
-    "aroon_oscillator_sign_alert",
-    "arrows_curves_indicator",
-    "as_ctrend_indicator",
-    "asimmetric_stoch_nr_indicator",
-    "atr_normalize_histogram",
-    "average_change_candle",
-    "bb_squeeze_indicator",
-    "bezier_st_dev_indicator",
-    "binary_wave_indicator",
-    "blau_c_momentum_indicator",
-    "blau_cmi_indicator",
-    "blau_csi",
-    "blau_ergodic",
-    "blau_t_stoch_i",
-    "blau_ts_stochastic",
-    "blau_tvi",
-    "brain_trend2_indicator",
-    "brain_trend_signal_proxy",
-    "brake_parb_indicator",
-    "breakout_bars_trend_v2",
-    "bsi_indicator",
-    "bulls_bears_eyes",
-    "bulls_power",
-    "bw_wise_man1_signal",
-    "bykov_trend_indicator",
-    "candle_stop_color",
-    "candles_x_smoothed_indicator",
-    "candlesticks_bw",
-    "caudate_x_period_candle_color",
-    "cci_histogram_indicator",
-    "cci_woodies_indicator",
-    "center_of_gravity_candle_indicator",
-    "center_of_gravity_indicator",
-    "cg_oscillator",
-    "close_line_cci",
-    "close_price_fractals",
-    "color3rd_gen_xma_indicator",
-    "color_bb_candles_indicator",
-    "color_coppock_indicator",
-    "color_hma",
-    "color_j_variation_indicator",
-    "color_metro_de_marker_indicator",
-    "color_metro_stochastic_indicator",
-    "color_metro_wpr_indicator",
-    "color_schaff_de_marker_trend_cycle",
-    "color_schaff_trend_cycle_indicator",
-    "color_step_xccx_indicator",
-    "color_x2_ma",
-    "color_x_derivative",
-    "color_zerolag_de_marker",
-    "corrected_average_indicator",
-    "darvas_boxes_system",
-    "dema_range_channel_color",
-    "derivative_indicator",
-    "digital_ft01_indicator",
-    "digital_macd",
-    "donchian_channels_system",
-    "dots_indicator",
-    "ef_distance_indicator",
-    "ema_rsi_va",
-    "envelopes_jp_alonso",
-    "f2a_ao_indicator",
-    "fatl_filter",
-    "fibo_candles_indicator",
-    "fine_tuning_ma",
-    "fisher_org_v1",
-    "fisher_org_v1_sign",
-    "force_index_ema",
-    "force_index_ema_2",
-    "forecast_oscilator",
-    "fractal_amambk",
-    "frama_series",
-    "frasm_av2_indicator",
-    "go_indicator",
-    "hlr_indicator",
-    "hma",
-    "i4_drfv2",
-    "i4_drfv3",
-    "i_anch_mom_indicator",
-    "i_de_marker_sign_indicator",
-    "i_gap_indicator",
-    "i_stoch_komposter_indicator",
-    "i_trend_indicator",
-    "iamma_indicator",
-    "indexed_moving_average",
-    "instantaneous_trend_filter_indicator",
-    "inverse_reaction_indicator",
-    "irsi_sign_indicator",
-    "iwpr_sign_indicator",
-    "j_brain_trend1_sig_indicator",
-    "j_tpo_proxy",
-    "jma_slope_indicator",
-    "kalman_filter_indicator",
-    "kalman_filter_line",
-    "kama_indicator",
-    "karacatica_indicator",
-    "kdj_indicator",
-    "kwan_ccc_indicator",
-    "kwan_nrp_indicator",
-    "kwan_rdp_indicator",
-    "laguerre_adx_indicator",
-    "laguerre_filter_indicator",
-    "laguerre_plus_di_proxy",
-    "laguerre_roc_indicator",
-    "le_man_signal_indicator",
-    "linear_reg_slope_v2_indicator",
-    "loco_indicator",
-    "lrma_indicator",
-    "lsma_angle_indicator",
-    "ma_rounding_channel_indicator",
-    "macd2_indicator",
-    "macd_candle_indicator",
-    "malr_indicator",
-    "momentum_candle_sign_indicator",
-    "moving_average_fn_indicator",
-    "mt5_stochastic_close_close",
-    "muv_nor_diff_cloud_indicator",
-    "non_lag_dot_indicator",
-    "nrtr_extr_indicator",
-    "nrtr_indicator",
-    "p_channel_system",
-    "percent_envelope",
-    "percentage_crossover_channel",
-    "pivot_zig_zag_proxy",
-    "price_channel_stop_indicator",
-    "price_extreme_channel",
-    "qqe_cloud_indicator",
-    "ravi_indicator",
-    "raw_close_close_stochastic",
-    "rd_trend_trigger_indicator",
-    "renko_level",
-    "renko_line_break",
-    "rftl_indicator",
-    "rkd_indicator",
-    "roc2_vg_indicator",
-    "rsi_histogram_indicator",
-    "rsi_slowdown",
-    "rsioma_v2",
-    "rvi_histogram_indicator",
-    "safe_adx",
-    "shared_strategy_indicators",
-    "sidus_indicator",
-    "silver_trend_indicator",
-    "sliding_range_color",
-    "slow_stoch",
-    "smoothed_adx_indicator",
-    "smoothed_rsi",
-    "spearman_rank_correlation_histogram",
-    "stalin_indicator",
-    "starter_laguerre_filter",
-    "step_manrtr_indicator",
-    "stochastic_histogram_indicator",
-    "t3_alarm_indicator",
-    "t3_average",
-    "t3_indicator",
-    "the20s_v020_signal",
-    "three_candles_indicator",
-    "three_line_break_indicator",
-    "time_line",
-    "trading_channel_index_proxy",
-    "trend_arrows_indicator",
-    "trend_continuation_indicator",
-    "trend_intensity_index_proxy",
-    "trend_manager_indicator",
-    "tri_x_candle_indicator",
-    "trigger_line",
-    "triple_ema_rate",
-    "trvi_indicator",
-    "two_pb_ideal_xosma_indicator",
-    "ultra_absolutely_no_lag_lwma_color",
-    "ultra_wpr_indicator",
-    "up_down_candle_strength",
-    "vinin_i_trend_indicator",
-    "volume_weighted_ma_indicator",
-    "volume_weighted_ma_st_dev_indicator",
-    "vwap_close_indicator",
-    "vwma_candle",
-    "vwma_digit_system",
-    "wami",
-    "wprsi_signal_indicator",
-    "x_de_marker_histogram_vol_direct_indicator",
-    "x_fisher_indicator",
-    "xcci_histogram_vol_direct_indicator",
-    "xcci_histogram_vol_indicator",
-    "xma_ichimoku",
-    "xma_ishimoku_channel_indicator",
-    "xma_ishimoku_line",
-    "xma_range_bands_indicator",
-    "xmacd_indicator",
-    "xrsi_de_marker_histogram",
-    "xrsi_histogram_vol_direct_indicator",
-    "xrsi_histogram_vol_indicator",
-    "xrvi_indicator",
-    "zero_lag_macd",
-    "zig_zag_recent_pivot_signal",
-    "zpf_indicator",
-)
+from ...utils.lazyimport import lazyexports as _lazyexports
 
-__all__ = []
+_EXPORTS = {
+    "absolutely_no_lag_lwma": ("AbsolutelyNoLagLwma",),
+    "absolutely_no_lag_lwma_color": ("AbsolutelyNoLagLwmaColor",),
+    "accumulation_distribution_line": (
+        "AccumulationDistributionLine",
+        "ChaikinOscillator",
+        "LineCCI",
+        "CCIDualOnMA",
+    ),
+    "adx_cross_hull_style_indicator": ("ADXCrossHullStyleIndicator", "UltraXMAIndicator"),
+    "adxdmi": ("ADXDMI",),
+    "ai_acceleration_deceleration_oscillator": ("AIAccelerationDecelerationOscillator",),
+    "altr_trend_signal_v22": ("AltrTrendSignalV22",),
+    "anchored_momentum_line": ("AnchoredMomentumLine", "AnchoredMomentumCandleIndicator"),
+    "any_range_cld_tail_indicator": ("AnyRangeCldTailIndicator",),
+    "aroon_horn_sign_indicator": ("AroonHornSignIndicator",),
+    "aroon_oscillator_sign_alert": ("AroonOscillatorSignAlert",),
+    "arrows_curves_indicator": ("ArrowsCurvesIndicator",),
+    "as_ctrend_indicator": ("ASCtrendIndicator",),
+    "asimmetric_stoch_nr_indicator": ("AsimmetricStochNRIndicator",),
+    "atr_normalize_histogram": ("AtrNormalizeHistogram",),
+    "average_change_candle": ("AverageChangeCandle",),
+    "bb_squeeze_indicator": ("BBSqueezeIndicator",),
+    "bezier_st_dev_indicator": ("BezierStDevIndicator",),
+    "binary_wave_indicator": ("BinaryWaveIndicator",),
+    "blau_c_momentum_indicator": ("BlauCMomentumIndicator",),
+    "blau_cmi_indicator": ("BlauCMIIndicator",),
+    "blau_csi": ("BlauCSI",),
+    "blau_ergodic": ("BlauErgodic",),
+    "blau_t_stoch_i": ("BlauTStochI",),
+    "blau_ts_stochastic": ("BlauTSStochastic",),
+    "blau_tvi": ("BlauTVI",),
+    "brain_trend2_indicator": ("BrainTrend2Indicator", "AbsolutelyNoLagLwmaIndicator"),
+    "brain_trend_signal_proxy": ("BrainTrendSignalProxy",),
+    "brake_parb_indicator": ("BrakeParbIndicator",),
+    "breakout_bars_trend_v2": ("BreakoutBarsTrendV2",),
+    "bsi_indicator": ("BSIIndicator",),
+    "bulls_bears_eyes": ("BullsBearsEyes",),
+    "bulls_power": ("BullsPower", "BearsPower"),
+    "bw_wise_man1_signal": ("BWWiseMan1Signal",),
+    "bykov_trend_indicator": ("BykovTrendIndicator",),
+    "candle_stop_color": ("CandleStopColor",),
+    "candles_x_smoothed_indicator": ("CandlesXSmoothedIndicator",),
+    "candlesticks_bw": ("CandlesticksBW",),
+    "caudate_x_period_candle_color": ("CaudateXPeriodCandleColor",),
+    "cci_histogram_indicator": ("CCIHistogramIndicator",),
+    "cci_woodies_indicator": ("CCIWoodiesIndicator",),
+    "center_of_gravity_candle_indicator": ("CenterOfGravityCandleIndicator",),
+    "center_of_gravity_indicator": ("CenterOfGravityIndicator",),
+    "cg_oscillator": ("CGOscillator",),
+    "close_line_cci": ("CloseLineCCI",),
+    "close_price_fractals": ("ClosePriceFractals",),
+    "color3rd_gen_xma_indicator": ("Color3rdGenXMAIndicator",),
+    "color_bb_candles_indicator": ("ColorBBCandlesIndicator",),
+    "color_coppock_indicator": ("ColorCoppockIndicator",),
+    "color_hma": ("ColorHMA",),
+    "color_j_variation_indicator": ("ColorJVariationIndicator",),
+    "color_metro_de_marker_indicator": ("ColorMetroDeMarkerIndicator",),
+    "color_metro_stochastic_indicator": ("ColorMetroStochasticIndicator",),
+    "color_metro_wpr_indicator": ("ColorMetroWprIndicator",),
+    "color_schaff_de_marker_trend_cycle": ("ColorSchaffDeMarkerTrendCycle",),
+    "color_schaff_trend_cycle_indicator": ("ColorSchaffTrendCycleIndicator",),
+    "color_step_xccx_indicator": ("ColorStepXCCXIndicator",),
+    "color_x2_ma": ("ColorX2MA",),
+    "color_x_derivative": ("ColorXDerivative",),
+    "color_zerolag_de_marker": ("ColorZerolagDeMarker",),
+    "corrected_average_indicator": ("CorrectedAverageIndicator",),
+    "darvas_boxes_system": ("DarvasBoxesSystem",),
+    "dema_range_channel_color": ("DemaRangeChannelColor",),
+    "derivative_indicator": ("DerivativeIndicator",),
+    "digital_ft01_indicator": ("DigitalFT01Indicator",),
+    "digital_macd": ("DigitalMacd",),
+    "donchian_channels_system": ("DonchianChannelsSystem",),
+    "dots_indicator": ("DotsIndicator",),
+    "ef_distance_indicator": ("EFDistanceIndicator",),
+    "ema_rsi_va": ("EmaRsiVa",),
+    "envelopes_jp_alonso": ("EnvelopesJpAlonso",),
+    "f2a_ao_indicator": ("F2aAOIndicator",),
+    "fatl_filter": ("FatlFilter", "JFatlApprox", "JFatlCandleApprox"),
+    "fibo_candles_indicator": ("FiboCandlesIndicator",),
+    "fine_tuning_ma": ("FineTuningMA",),
+    "fisher_org_v1": ("FisherOrgV1",),
+    "fisher_org_v1_sign": ("FisherOrgV1Sign",),
+    "force_index_ema": ("ForceIndexEMA", "ForceDiverSign"),
+    "force_index_ema_2": ("ForceIndexEma",),
+    "forecast_oscilator": ("ForecastOscilator",),
+    "fractal_amambk": ("FractalAMAMBK",),
+    "frama_series": ("FramaSeries", "FramaLinesIndicator"),
+    "frasm_av2_indicator": ("FRASMAv2Indicator",),
+    "go_indicator": ("GOIndicator",),
+    "hlr_indicator": ("HLRIndicator", "ZeroLagHLRIndicator"),
+    "hma": ("HMA", "OsHMAIndicator"),
+    "i4_drfv2": ("I4DRFV2",),
+    "i4_drfv3": ("I4DRFV3",),
+    "i_anch_mom_indicator": ("IAnchMomIndicator",),
+    "i_de_marker_sign_indicator": ("IDeMarkerSignIndicator",),
+    "i_gap_indicator": ("IGapIndicator",),
+    "i_stoch_komposter_indicator": ("IStochKomposterIndicator",),
+    "i_trend_indicator": ("ITrendIndicator",),
+    "iamma_indicator": ("IAMMAIndicator",),
+    "indexed_moving_average": ("IndexedMovingAverage",),
+    "instantaneous_trend_filter_indicator": ("InstantaneousTrendFilterIndicator",),
+    "inverse_reaction_indicator": ("InverseReactionIndicator",),
+    "irsi_sign_indicator": ("IRSISignIndicator",),
+    "iwpr_sign_indicator": ("IWPRSignIndicator",),
+    "j_brain_trend1_sig_indicator": ("JBrainTrend1SigIndicator", "UltraRSIIndicator"),
+    "j_tpo_proxy": ("JTpoProxy",),
+    "jma_slope_indicator": ("JMASlopeIndicator",),
+    "kalman_filter_indicator": ("KalmanFilterIndicator",),
+    "kalman_filter_line": ("KalmanFilterLine", "KalmanFilterCandleIndicator"),
+    "kama_indicator": ("KAMAIndicator", "ColorMomentumAMAIndicator"),
+    "karacatica_indicator": ("KaracaticaIndicator",),
+    "kdj_indicator": ("KDJIndicator",),
+    "kwan_ccc_indicator": ("KwanCccIndicator",),
+    "kwan_nrp_indicator": ("KwanNrpIndicator",),
+    "kwan_rdp_indicator": ("KwanRdpIndicator",),
+    "laguerre_adx_indicator": ("LaguerreAdxIndicator",),
+    "laguerre_filter_indicator": ("LaguerreFilterIndicator",),
+    "laguerre_plus_di_proxy": ("LaguerrePlusDiProxy",),
+    "laguerre_roc_indicator": ("LaguerreRocIndicator",),
+    "le_man_signal_indicator": ("LeManSignalIndicator",),
+    "linear_reg_slope_v2_indicator": ("LinearRegSlopeV2Indicator",),
+    "loco_indicator": ("LocoIndicator",),
+    "lrma_indicator": ("LRMAIndicator", "ChangeOfVolatilityIndicator", "VininITrendLRMAIndicator"),
+    "lsma_angle_indicator": ("LsmaAngleIndicator",),
+    "ma_rounding_channel_indicator": ("MARoundingChannelIndicator",),
+    "macd2_indicator": ("Macd2Indicator",),
+    "macd_candle_indicator": ("MacdCandleIndicator",),
+    "malr_indicator": ("MalrIndicator",),
+    "momentum_candle_sign_indicator": ("MomentumCandleSignIndicator",),
+    "moving_average_fn_indicator": ("MovingAverageFNIndicator",),
+    "mt5_stochastic_close_close": ("Mt5StochasticCloseClose",),
+    "muv_nor_diff_cloud_indicator": ("MUVNorDiffCloudIndicator",),
+    "non_lag_dot_indicator": ("NonLagDotIndicator",),
+    "nrtr_extr_indicator": ("NRTRExtrIndicator",),
+    "nrtr_indicator": ("NRTRIndicator",),
+    "p_channel_system": ("PChannelSystem",),
+    "percent_envelope": ("PercentEnvelope",),
+    "percentage_crossover_channel": ("PercentageCrossoverChannel",),
+    "pivot_zig_zag_proxy": ("PivotZigZagProxy",),
+    "price_channel_stop_indicator": ("PriceChannelStopIndicator",),
+    "price_extreme_channel": ("PriceExtremeChannel",),
+    "qqe_cloud_indicator": ("QQECloudIndicator",),
+    "ravi_indicator": ("RaviIndicator",),
+    "raw_close_close_stochastic": ("RawCloseCloseStochastic", "CloseCloseEmaStochastic"),
+    "rd_trend_trigger_indicator": ("RDTrendTriggerIndicator",),
+    "renko_level": ("RenkoLevel",),
+    "renko_line_break": ("RenkoLineBreak",),
+    "rftl_indicator": ("RFTLIndicator",),
+    "rkd_indicator": ("RKDIndicator",),
+    "roc2_vg_indicator": ("ROC2VGIndicator",),
+    "rsi_histogram_indicator": ("RSIHistogramIndicator",),
+    "rsi_slowdown": ("RSISlowdown",),
+    "rsioma_v2": ("RsiomaV2",),
+    "rvi_histogram_indicator": ("RVIHistogramIndicator",),
+    "safe_adx": ("SafeADX", "SafeAMA"),
+    "shared_strategy_indicators": (
+        "SkyscraperFixIndicator",
+        "SkyscraperFixDuplexIndicator",
+        "SkyscraperFixColorAMLIndicator",
+        "AppliedPriceCCI",
+        "ColorAMLIndicator",
+        "ColorAMLMeanReversionIndicator",
+        "X2MACandleApprox",
+        "XPeriodCandleColor",
+        "XPeriodCandleSystemColor",
+        "AcceleratorOscillator",
+        "AIAcceleratorOscillator",
+        "AdaptiveMarketLevel",
+        "AmlIndicator",
+        "FunctionalAwesomeOscillator",
+        "AIAwesomeOscillator",
+        "BlauErgodicMDI",
+        "BlauErgodicMDIClassic",
+        "BrakeExpIndicator",
+        "FlatTrendIndicator",
+        "FlatTrendDistanceIndicator",
+        "IinMASignalIndicator",
+        "KDJ",
+        "LaguerreIndicator",
+        "LaguerreColorIndicator",
+        "RelativeVigorIndex",
+        "SmoothedRelativeVigorIndex",
+        "SafeCCI",
+        "SafeCCIWithFactor",
+        "SilverTrendSignalProxy",
+        "SilverTrendDirectionSignalProxy",
+    ),
+    "sidus_indicator": ("SidusIndicator",),
+    "silver_trend_indicator": ("SilverTrendIndicator",),
+    "sliding_range_color": ("SlidingRangeColor",),
+    "slow_stoch": ("SlowStoch",),
+    "smoothed_adx_indicator": ("SmoothedADXIndicator",),
+    "smoothed_rsi": ("SmoothedRsi",),
+    "spearman_rank_correlation_histogram": ("SpearmanRankCorrelationHistogram",),
+    "stalin_indicator": ("StalinIndicator",),
+    "starter_laguerre_filter": ("StarterLaguerreFilter",),
+    "step_manrtr_indicator": ("StepMANRTRIndicator",),
+    "stochastic_histogram_indicator": ("StochasticHistogramIndicator",),
+    "t3_alarm_indicator": ("T3AlarmIndicator",),
+    "t3_average": ("T3Average", "T3Trix"),
+    "t3_indicator": ("T3Indicator",),
+    "the20s_v020_signal": ("The20sV020Signal",),
+    "three_candles_indicator": ("ThreeCandlesIndicator",),
+    "three_line_break_indicator": ("ThreeLineBreakIndicator",),
+    "time_line": ("TimeLine",),
+    "trading_channel_index_proxy": ("TradingChannelIndexProxy",),
+    "trend_arrows_indicator": ("TrendArrowsIndicator",),
+    "trend_continuation_indicator": ("TrendContinuationIndicator",),
+    "trend_intensity_index_proxy": ("TrendIntensityIndexProxy",),
+    "trend_manager_indicator": ("TrendManagerIndicator",),
+    "tri_x_candle_indicator": ("TriXCandleIndicator",),
+    "trigger_line": ("TriggerLine",),
+    "triple_ema_rate": ("TripleEmaRate",),
+    "trvi_indicator": ("TRVIIndicator", "ColorRMACDIndicator"),
+    "two_pb_ideal_xosma_indicator": ("TwoPbIdealXOSMAIndicator",),
+    "ultra_absolutely_no_lag_lwma_color": ("UltraAbsolutelyNoLagLwmaColor",),
+    "ultra_wpr_indicator": ("UltraWPRIndicator",),
+    "up_down_candle_strength": ("UpDownCandleStrength",),
+    "vinin_i_trend_indicator": ("VininITrendIndicator",),
+    "volume_weighted_ma_indicator": ("VolumeWeightedMAIndicator",),
+    "volume_weighted_ma_st_dev_indicator": ("VolumeWeightedMAStDevIndicator",),
+    "vwap_close_indicator": ("VWAPCloseIndicator",),
+    "vwma_candle": ("VWMACandle",),
+    "vwma_digit_system": ("VWMADigitSystem",),
+    "wami": ("Wami",),
+    "wprsi_signal_indicator": ("WPRSISignalIndicator",),
+    "x_de_marker_histogram_vol_direct_indicator": ("XDeMarkerHistogramVolDirectIndicator",),
+    "x_fisher_indicator": ("XFisherIndicator",),
+    "xcci_histogram_vol_direct_indicator": ("XCCIHistogramVolDirectIndicator",),
+    "xcci_histogram_vol_indicator": ("XCCIHistogramVolIndicator",),
+    "xma_ichimoku": ("XmaIchimoku", "TwoXmaIchimokuOscillator"),
+    "xma_ishimoku_channel_indicator": ("XMAIshimokuChannelIndicator",),
+    "xma_ishimoku_line": ("XMAIshimokuLine",),
+    "xma_range_bands_indicator": ("XMARangeBandsIndicator",),
+    "xmacd_indicator": ("XMACDIndicator",),
+    "xrsi_de_marker_histogram": ("XrsiDeMarkerHistogram",),
+    "xrsi_histogram_vol_direct_indicator": ("XRSIHistogramVolDirectIndicator",),
+    "xrsi_histogram_vol_indicator": ("XRSIHistogramVolIndicator",),
+    "xrvi_indicator": ("XRVIIndicator",),
+    "zero_lag_macd": ("ZeroLagMacd",),
+    "zig_zag_recent_pivot_signal": ("ZigZagRecentPivotSignal",),
+    "zpf_indicator": ("ZPFIndicator",),
+}
 
-for _module_name in _MODULES:
-    _module = _import_module(f"{__name__}.{_module_name}")
-    for _name in getattr(_module, "__all__", ()):  # pragma: no branch
-        globals()[_name] = getattr(_module, _name)
-        __all__.append(_name)
+__all__ = [name for names in _EXPORTS.values() for name in names]
 
-del _import_module, _module_name, _module, _name
+__getattr__, __dir__ = _lazyexports(__name__, _EXPORTS)
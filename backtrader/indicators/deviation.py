@@ -24,8 +24,15 @@ Example:
 
 import math
 
+import numpy as np
+
+from ..utils import rolling as _rolling
+from ..utils import vectorops as _vectorops
+from ..utils.log_message import get_logger
 from . import Indicator, MovAv
 
+logger = get_logger(__name__)
+
 
 class StandardDeviation(Indicator):
     """
@@ -114,6 +121,16 @@ class StandardDeviation(Indicator):
             return
 
         kind = self._movav_kind()
+        if self._incremental and kind == "simple":
+            rolling = self._rollingwindow(_rolling.RollingMoments, period)
+            if not rolling.nonfinite:
+                if self._use_external_mean:
+                    stddev = self._finish(rolling.meansq(), float(self.data1[0]))
+                else:
+                    stddev = math.sqrt(rolling.variance())
+                self.lines.stddev[0] = stddev
+                return
+
         values = [float(self.data[i]) for i in range(1 - period, 1)]
         if any(value != value for value in values):
             self.lines.stddev[0] = float("nan")
@@ -176,6 +193,10 @@ class StandardDeviation(Indicator):
         else:
             alpha = None
 
+        if alpha is None and self._vectorize:
+            if self._once_vectorized(period, actual_end, mean_array):
+                return
+
         if alpha is None:
             for i in range(period - 1, actual_end):
                 start_idx = i - period + 1
@@ -230,6 +251,35 @@ class StandardDeviation(Indicator):
 
             larray[i] = self._finish(prev_meansq, mean)
 
+    def _once_vectorized(self, period, actual_end, mean_array):
+        """Compute the simple-mean deviation with rolling sums.
+
+        Returns:
+            bool: False if the regular once() has to be used.
+        """
+        try:
+            if actual_end < period:
+                return True
+            x = _vectorops.as_ndarray(self.data.array, actual_end)
+            meansq = _vectorops.rolling_sum(x * x, period) / period
+            if mean_array is not None:
+                if len(mean_array) < actual_end:
+                    return False
+                mean = _vectorops.as_ndarray(mean_array, actual_end)[period - 1 :]
+            else:
+                mean = _vectorops.rolling_sum(x, period) / period
+
+            diff = meansq - mean * mean
+            if self.p.safepow:
+                diff = np.abs(diff)
+            # np.maximum propagates NaN windows/means as NaN results
+            values = np.sqrt(np.maximum(0.0, diff))
+            _vectorops.assign(self.lines.stddev.array, period - 1, values)
+        except Exception:
+            logger.debug("StdDev vectorized once() failed", exc_info=True)
+            return False
+        return True
+
 
 # Average deviation
 class MeanDeviation(Indicator):
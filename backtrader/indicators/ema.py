@@ -19,6 +19,9 @@ Example:
 
 import math
 
+import numpy as np
+
+from ..utils import vectorops as _vectorops
 from ..utils.log_message import get_logger
 from . import MovingAverageBase
 
@@ -95,6 +98,9 @@ class ExponentialMovingAverage(MovingAverageBase):
             except Exception as e:
                 logger.debug("data.once() failed in EMA: %s", e)
 
+        if self._vectorize and self._once_vectorized(start, end):
+            return
+
         darray = self.data.array
         data_len = len(darray)
         if data_len == 0:
@@ -141,5 +147,51 @@ class ExponentialMovingAverage(MovingAverageBase):
             prev = prev * alpha1 + float(current_val) * alpha
             larray[i] = prev
 
+    def _once_vectorized(self, start, end):
+        """Compute once() with the recurrence kernel. Returns False on failure.
+
+        Inputs with NaN values after the seed are left to the regular once(),
+        which skips them without breaking the smoothing chain.
+        """
+        try:
+            larray = self.lines[0].array
+            darray = self.data.array
+            period = self.p.period
+            data_len = len(darray)
+            if data_len == 0:
+                return True
+
+            x = _vectorops.as_ndarray(darray)
+            nans = np.isnan(x)
+            first_valid = int(np.argmin(nans)) if not nans.all() else 0
+            seed_idx = first_valid + period - 1
+            limit = min(end, data_len)
+            if seed_idx + 1 < limit and nans[seed_idx + 1 : limit].any():
+                return False
+
+            _vectorops.assign(larray, 0, np.full(min(seed_idx, data_len), float("nan")))
+            if seed_idx >= data_len:
+                return True
+
+            seed = x[first_valid : seed_idx + 1]
+            seed = seed[~nans[first_valid : seed_idx + 1]].tolist()
+            if not seed:
+                return True
+            prev = 0.0
+            for value in seed:
+                prev += value
+            prev /= len(seed)
+            larray[seed_idx] = prev
+
+            if seed_idx + 1 < limit:
+                values = _vectorops.linear_recurrence(
+                    x[seed_idx + 1 : limit], self.alpha, self.alpha1, prev
+                )
+                _vectorops.assign(larray, seed_idx + 1, values)
+        except Exception:
+            logger.debug("EMA vectorized once() failed", exc_info=True)
+            return False
+        return True
+
 
 EMA = ExponentialMovingAverage
@@ -89,7 +89,7 @@ class HurstExponent(PeriodN):
     def next(self):
         """Calculate Hurst Exponent for the current bar."""
         # Fetch the data
-        ts = asarray(self.data.get(size=self.p.period))
+        ts = self.data.getview(size=self.p.period)
 
         # Calculate the array of the variances of the lagged differences
         tau = [sqrt(std(subtract(ts[lag:], ts[:-lag]))) for lag in self.lags]
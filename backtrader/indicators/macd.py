@@ -24,8 +24,14 @@ Example:
 
 import math
 
+import numpy as np
+
+from ..utils import vectorops as _vectorops
+from ..utils.log_message import get_logger
 from . import Indicator, MovAv
 
+logger = get_logger(__name__)
+
 
 def _finite(value):
     return value is not None and not (isinstance(value, float) and not math.isfinite(value))
@@ -196,6 +202,9 @@ class MACD(Indicator):
         while len(signal_array) < end:
             signal_array.append(float("nan"))
 
+        if self._vectorize and self._once_vectorized(start, end):
+            return
+
         # Pre-fill warmup period with NaN
         for i in range(min(macd_minperiod - 1, len(me1_array))):
             macd_array[i] = float("nan")
@@ -248,6 +257,58 @@ class MACD(Indicator):
             prev_signal = prev_signal * signal_alpha1 + macd_val * signal_alpha
             signal_array[i] = prev_signal
 
+    def _once_vectorized(self, start, end):
+        """Compute the MACD line as an array difference and the signal line
+        with the recurrence kernel. A NaN in the signal input range leaves the
+        calculation to the regular once().
+
+        Returns:
+            bool: False if the regular once() has to be used.
+        """
+        try:
+            me1_array = self.me1.lines[0].array
+            me2_array = self.me2.lines[0].array
+            macd_array = self.lines.macd.array
+            signal_array = self.lines.signal.array
+            macd_minperiod = self.macd_minperiod
+            signal_start = macd_minperiod + self.p.period_signal - 2
+
+            limit = min(end, len(me1_array), len(me2_array))
+            if limit != min(end, len(macd_array)):
+                return False
+
+            first = macd_minperiod - 1
+            macd = np.full(limit, float("nan"))
+            if first < limit:
+                macd[first:] = (
+                    _vectorops.as_ndarray(me1_array)[first:limit]
+                    - _vectorops.as_ndarray(me2_array)[first:limit]
+                )
+            if signal_start + 1 < limit and np.isnan(macd[signal_start + 1 :]).any():
+                return False
+
+            _vectorops.assign(macd_array, 0, macd)
+            _vectorops.assign(signal_array, 0, np.full(min(signal_start, limit), float("nan")))
+            if not 0 <= signal_start < limit:
+                return True
+
+            seed = macd[first : signal_start + 1]
+            seed = seed[~np.isnan(seed)].tolist()
+            prev_signal = 0.0
+            for value in seed:
+                prev_signal += value
+            prev_signal = prev_signal / len(seed) if seed else 0.0
+            signal_array[signal_start] = prev_signal
+
+            values = _vectorops.linear_recurrence(
+                macd[signal_start + 1 :], self.signal_alpha, self.signal_alpha1, prev_signal
+            )
+            _vectorops.assign(signal_array, signal_start + 1, values)
+        except Exception:
+            logger.debug("MACD vectorized once() failed", exc_info=True)
+            return False
+        return True
+
 
 class MACDHisto(MACD):
     """
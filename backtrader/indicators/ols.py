@@ -31,13 +31,18 @@ Example:
                 self.sell(data=self.data1)
 """
 
-import pandas as pd
-
 from . import PeriodN
 
-# Lazy import statsmodels to avoid slow import at module load time
+# Lazy import pandas and statsmodels to avoid slow import at module load time
 # statsmodels is a heavy library that adds 20+ seconds to import time
-# It will be imported when the indicators are actually used
+# They will be imported when the indicators are actually used
+
+
+def _get_pandas():
+    """Lazy import pandas."""
+    import pandas as pd
+
+    return pd
 
 
 def _get_statsmodels():
@@ -67,10 +72,6 @@ class OLS_Slope_InterceptN(PeriodN):
 
     _mindatas = 2  # ensure at least 2 data feeds are passed
 
-    packages = (
-        ("pandas", "pd"),
-        ("statsmodels.api", "sm"),
-    )
     lines = (
         "slope",
         "intercept",
@@ -82,9 +83,9 @@ class OLS_Slope_InterceptN(PeriodN):
 
         Uses statsmodels OLS to perform linear regression.
         """
-        sm = _get_statsmodels()
-        p0 = pd.Series(self.data0.get(size=self.p.period))
-        p1 = pd.Series(self.data1.get(size=self.p.period))
+        pd, sm = _get_pandas(), _get_statsmodels()
+        p0 = pd.Series(self.data0.getview(size=self.p.period))
+        p1 = pd.Series(self.data1.getview(size=self.p.period))
         p1 = sm.add_constant(p1)
         intercept, slope = sm.OLS(p0, p1).fit().params
 
@@ -216,8 +217,6 @@ class OLS_BetaN(PeriodN):
 
     _mindatas = 2  # ensure at least 2 data feeds are passed
 
-    packages = (("pandas", "pd"),)
-
     lines = ("beta",)
     params = (("period", 10),)
 
@@ -226,7 +225,8 @@ class OLS_BetaN(PeriodN):
 
         Uses pandas OLS to calculate regression beta.
         """
-        y, x = (pd.Series(d.get(size=self.p.period)) for d in self.datas)
+        pd = _get_pandas()
+        y, x = (pd.Series(d.getview(size=self.p.period)) for d in self.datas)
         r_beta = pd.ols(y=y, x=x, window_type="full_sample")
         self.lines.beta[0] = r_beta.beta["x"]
 
@@ -241,9 +241,6 @@ class CointN(PeriodN):
 
     _mindatas = 2  # ensure at least 2 data feeds are passed
 
-    packages = (("pandas", "pd"),)  # import pandas as pd
-    frompackages = (("statsmodels.tsa.stattools", "coint"),)  # from st... import coint
-
     lines = (
         "score",
         "pvalue",
@@ -258,8 +255,8 @@ class CointN(PeriodN):
 
         Uses statsmodels coint function to test for cointegration.
         """
-        coint = _get_coint()
-        x, y = (pd.Series(d.get(size=self.p.period)) for d in self.datas)
+        pd, coint = _get_pandas(), _get_coint()
+        x, y = (pd.Series(d.getview(size=self.p.period)) for d in self.datas)
         score, pvalue, _ = coint(x, y, trend=self.p.trend)
         self.lines.score[0] = score
         self.lines.pvalue[0] = pvalue
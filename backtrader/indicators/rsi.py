@@ -24,8 +24,35 @@ Example:
 
 import math
 
+import numpy as np
+
+from ..utils import vectorops as _vectorops
+from ..utils.log_message import get_logger
 from . import Indicator, MovAv
 
+logger = get_logger(__name__)
+
+
+def _updown_vectorized(indicator, larray, end, up):
+    """Vectorized UpDay/DownDay body: ``max(+-(x[i] - x[i - period]), 0)``.
+
+    Returns:
+        bool: False if the regular once() has to be used.
+    """
+    try:
+        darray = indicator.data.array
+        period = indicator.p.period
+        limit = min(end, len(darray))
+        if limit <= period:
+            return True
+        x = _vectorops.as_ndarray(darray, limit)
+        diff = x[period:] - x[:-period] if up else x[:-period] - x[period:]
+        _vectorops.assign(larray, period, np.maximum(diff, 0.0))
+    except Exception:
+        logger.debug("UpDay/DownDay vectorized once() failed", exc_info=True)
+        return False
+    return True
+
 
 # Calculate RSI indicator
 class UpDay(Indicator):
@@ -77,6 +104,9 @@ class UpDay(Indicator):
         for i in range(min(period, end, len(larray))):
             larray[i] = 0.0
 
+        if self._vectorize and _updown_vectorized(self, larray, end, up=True):
+            return
+
         for i in range(period, min(end, len(darray))):
             diff = darray[i] - darray[i - period]
             larray[i] = max(diff, 0.0)
@@ -131,6 +161,9 @@ class DownDay(Indicator):
         for i in range(min(period, end, len(larray))):
             larray[i] = 0.0
 
+        if self._vectorize and _updown_vectorized(self, larray, end, up=False):
+            return
+
         for i in range(period, min(end, len(darray))):
             diff = darray[i - period] - darray[i]
             larray[i] = max(diff, 0.0)
@@ -374,6 +407,9 @@ class RelativeStrengthIndex(Indicator):
         while len(larray) < end:
             larray.append(float("nan"))
 
+        if self._vectorize and self._once_vectorized(start, end):
+            return
+
         for i in range(start, min(end, len(maup_array), len(madown_array))):
             maup_val = maup_array[i] if i < len(maup_array) else 0.0
             madown_val = madown_array[i] if i < len(madown_array) else 0.0
@@ -400,6 +436,35 @@ class RelativeStrengthIndex(Indicator):
                     rs = maup_val / madown_val
                     larray[i] = 100.0 - 100.0 / (1.0 + rs)
 
+    def _once_vectorized(self, start, end):
+        """Compute RSI from the averages as array operations.
+
+        Returns:
+            bool: False if the regular once() has to be used.
+        """
+        try:
+            maup_array = self.maup.lines[0].array
+            madown_array = self.madown.lines[0].array
+            limit = min(end, len(maup_array), len(madown_array))
+            if start >= limit:
+                return True
+
+            maup = _vectorops.as_ndarray(maup_array)[start:limit]
+            madown = _vectorops.as_ndarray(madown_array)[start:limit]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rsi = 100.0 - 100.0 / (1.0 + maup / madown)
+            zerodown = madown == 0.0
+            if self.p.safediv:
+                rsi[zerodown] = np.where(maup[zerodown] == 0.0, self.p.safelow, self.p.safehigh)
+            else:
+                rsi[zerodown] = 100.0
+            rsi[np.isnan(maup) | np.isnan(madown)] = float("nan")
+            _vectorops.assign(self.lines.rsi.array, start, rsi)
+        except Exception:
+            logger.debug("RSI vectorized once() failed", exc_info=True)
+            return False
+        return True
+
 
 RSI = RelativeStrengthIndex
 
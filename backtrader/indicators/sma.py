@@ -21,6 +21,10 @@ Example:
 
 import math
 
+import numpy as np
+
+from ..utils import rolling as _rolling
+from ..utils import vectorops as _vectorops
 from ..utils.log_message import get_logger
 from .mabase import MovingAverageBase
 
@@ -60,8 +64,15 @@ class MovingAverageSimple(MovingAverageBase):
         """Calculate SMA for the current bar.
 
         Recalculates from scratch each bar using sum of the last 'period'
-        values to avoid floating-point drift from incremental updates.
+        values to avoid floating-point drift from incremental updates, unless
+        the incremental backend is active (see ``Indicator.useincremental``).
         """
+        if self._incremental:
+            rolling = self._rollingwindow(_rolling.RollingSum, self.p.period)
+            if not rolling.nonfinite:
+                self.lines.sma[0] = rolling.sum / self.p.period
+                return
+
         try:
             period = self.p.period
             prices = [float(self.data[i]) for i in range(1 - period, 1)]
@@ -80,6 +91,9 @@ class MovingAverageSimple(MovingAverageBase):
                 except Exception as e:
                     logger.debug("data.once() failed in SMA: %s", e)
 
+            if self._vectorize and self._once_vectorized(start, end):
+                return
+
             dst = self.lines[0].array
             src = self.data.array
             period = self.p.period
@@ -118,5 +132,28 @@ class MovingAverageSimple(MovingAverageBase):
             logger.debug("SMA once() failed, falling back to once_via_next", exc_info=True)
             super().once_via_next(start, end)
 
+    def _once_vectorized(self, start, end):
+        """Compute once() with a rolling-sum kernel. Returns False on failure."""
+        try:
+            dst = self.lines[0].array
+            src = self.data.array
+            period = self.p.period
+            actual_end = min(end, len(src))
+
+            while len(dst) < end:
+                dst.append(float("nan"))
+
+            warmup = min(period - 1, len(src))
+            _vectorops.assign(dst, 0, np.full(warmup, float("nan")))
+
+            calc_start = max(period - 1, start)
+            if calc_start < actual_end:
+                sums = _vectorops.rolling_sum(_vectorops.as_ndarray(src, actual_end), period)
+                _vectorops.assign(dst, calc_start, sums[calc_start - period + 1 :] / period)
+        except Exception:
+            logger.debug("SMA vectorized once() failed", exc_info=True)
+            return False
+        return True
+
 
 SMA = MovingAverageSimple
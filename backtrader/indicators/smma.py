@@ -18,8 +18,14 @@ Example:
                 self.buy()
 """
 
+import numpy as np
+
+from ..utils import vectorops as _vectorops
+from ..utils.log_message import get_logger
 from . import MovingAverageBase
 
+logger = get_logger(__name__)
+
 
 class SmoothedMovingAverage(MovingAverageBase):
     """
@@ -94,6 +100,9 @@ class SmoothedMovingAverage(MovingAverageBase):
         while len(larray) < end:
             larray.append(float("nan"))
 
+        if self._vectorize and self._once_vectorized(start, end):
+            return
+
         limit = min(end, len(darray))
         for i in range(limit):
             larray[i] = float("nan")
@@ -114,3 +123,28 @@ class SmoothedMovingAverage(MovingAverageBase):
             current_val = float(darray[i])
             prev = prev * alpha1 + current_val * alpha
             larray[i] = prev
+
+    def _once_vectorized(self, start, end):
+        """Compute once() with the recurrence kernel. Returns False on failure."""
+        try:
+            darray = self.data.array
+            larray = self.lines[0].array
+            period = self.p.period
+            limit = min(end, len(darray))
+
+            _vectorops.assign(larray, 0, np.full(limit, float("nan")))
+
+            seed_idx = self._minperiod - 1
+            if seed_idx >= limit or seed_idx < period - 1:
+                return True
+
+            x = _vectorops.as_ndarray(darray, limit)
+            prev = sum(x[seed_idx - period + 1 : seed_idx + 1].tolist()) / period
+            larray[seed_idx] = prev
+
+            values = _vectorops.linear_recurrence(x[seed_idx + 1 :], self.alpha, self.alpha1, prev)
+            _vectorops.assign(larray, seed_idx + 1, values)
+        except Exception:
+            logger.debug("SMMA vectorized once() failed", exc_info=True)
+            return False
+        return True
@@ -23,9 +23,15 @@ Example:
 
 import math
 
+import numpy as np
+
+from ..utils import vectorops as _vectorops
+from ..utils.log_message import get_logger
 from ..utils.py3 import range
 from . import MovingAverageBase
 
+logger = get_logger(__name__)
+
 
 class WeightedMovingAverage(MovingAverageBase):
     """
@@ -88,6 +94,9 @@ class WeightedMovingAverage(MovingAverageBase):
         while len(larray) < end:
             larray.append(float("nan"))
 
+        if self._vectorize and self._once_vectorized(start, end):
+            return
+
         # Pre-fill warmup with NaN
         for i in range(min(period - 1, len(darray))):
             if i < len(larray):
@@ -99,5 +108,24 @@ class WeightedMovingAverage(MovingAverageBase):
             # window is oldest-first; weights[0]=1.0 weights the oldest value.
             larray[i] = coef * math.fsum(weights[j] * window[j] for j in range(period))
 
+    def _once_vectorized(self, start, end):
+        """Compute once() as a windowed dot product. Returns False on failure."""
+        try:
+            darray = self.data.array
+            larray = self.lines.wma.array
+            period = self.p.period
+            limit = min(end, len(darray))
+
+            _vectorops.assign(larray, 0, np.full(min(period - 1, len(darray)), float("nan")))
+            if limit < period:
+                return True
+
+            values = _vectorops.rolling_dot(_vectorops.as_ndarray(darray, limit), self.weights)
+            _vectorops.assign(larray, period - 1, self.coef * values)
+        except Exception:
+            logger.debug("WMA vectorized once() failed", exc_info=True)
+            return False
+        return True
+
 
 WMA = WeightedMovingAverage
@@ -39,11 +39,14 @@ import itertools
 import math
 from itertools import islice, repeat
 
+import numpy as np
+
 from . import metabase
 from .lineroot import LineRoot, LineRootMixin, LineSingle
 from .utils import num2date
 from .utils.log_message import get_logger
 from .utils.py3 import range, string_types
+from .utils.vectorops import GrowableArray
 
 logger = get_logger(__name__)
 
@@ -52,6 +55,45 @@ NAN = float("NaN")
 # PERFORMANCE OPTIMIZATION: Pre-create default datetime for error recovery
 # Avoids repeated datetime object creation in hot path
 _DEFAULT_DATETIME = datetime.datetime(2000, 1, 1, 0, 0, 0)
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def _finite_or_zero(values):
+    """Replace the infinite values of a float64 ndarray with 0.0 in place."""
+    inf = np.isinf(values)
+    if inf.any():
+        values[inf] = 0.0
+    return values
+
+
+def _finite_view(values):
+    """Read-only ``values`` with the infinities replaced by 0.0.
+
+    ``values`` (an ndarray view of the storage) is returned without a copy
+    unless it holds infinities: the sum of finite values is finite (short of
+    an overflow), so the common case costs a single reduction.
+    """
+    if not math.isfinite(np.add.reduce(values)):  # NaN, inf or overflow
+        if np.isinf(values).any():
+            return _finite_or_zero(values.copy())
+    values = values.view()
+    values.flags.writeable = False
+    return values
+
+
+def _ndarray2array(values):
+    """Copy a float64 ndarray into an ``array.array('d')`` in a single step.
+
+    Infinite values are replaced by 0.0 in the copy, never in ``values``.
+    """
+    out = array.array("d")
+    out.frombytes(np.ascontiguousarray(values).view(np.uint8))
+    if len(out) and not math.isfinite(np.add.reduce(values)):
+        view = np.frombuffer(out, dtype=np.float64)
+        _finite_or_zero(view)
+        del view  # release the buffer export: the array must stay resizable
+    return out
 
 
 # PERFORMANCE OPTIMIZATION: Helper function to check for NaN/None values
@@ -90,6 +132,29 @@ class LineBuffer(LineSingle, LineRootMixin):
     # Define LineBuffer mode attributes: UnBounded (0) and QBuffer (1)
     UnBounded, QBuffer = (0, 1)
 
+    # Storage of UnBounded buffers: array.array (False) or GrowableArray (True)
+    _usenumpy = False
+
+    # Datetime lines: exact int64 epoch nanoseconds, when loaded by the feed
+    _nsaxis = None
+
+    @classmethod
+    def usenumpy(cls, onoff):
+        """Select the storage of unbounded buffers created from now on.
+
+        When active, values are kept in a contiguous ``GrowableArray``
+        (float64 ndarray with amortized O(1) appends) instead of an
+        ``array.array``, so whole-line reads (``get``, ``getzero``,
+        ``plotrange``) and the vectorized kernels need no per-value Python
+        work. QBuffer (``exactbars``) buffers keep using a ``deque``.
+        """
+        LineBuffer._usenumpy = bool(onoff)
+
+    @classmethod
+    def _newarray(cls):
+        """Return empty storage for an unbounded buffer."""
+        return GrowableArray() if LineBuffer._usenumpy else array.array("d")
+
     # Initialization
     def __init__(self):
         """Initialize the LineBuffer instance.
@@ -113,7 +178,7 @@ class LineBuffer(LineSingle, LineRootMixin):
         self.lenmark = 0  # Length mark
 
         # Array - initialize as empty array (will be reset based on mode in reset())
-        self.array = array.array("d")
+        self.array = self._newarray()
 
         # Lines-related - ensure lines exists
         if not hasattr(self, "lines"):
@@ -297,9 +362,10 @@ class LineBuffer(LineSingle, LineRootMixin):
                 self.array = collections.deque(maxlen=deque_maxlen)
                 self.useislice = True
             else:
-                # Non-cache mode, use array.array
-                self.array = array.array("d")
+                # Non-cache mode, use array.array (or GrowableArray if enabled)
+                self.array = self._newarray()
                 self.useislice = False
+                self._nsaxis = None
 
                 # CRITICAL FIX: Do NOT pre-fill array - this causes buflen() to be incorrect
                 # buflen() = len(array) - extension, so pre-filling increases buflen incorrectly
@@ -444,6 +510,8 @@ class LineBuffer(LineSingle, LineRootMixin):
             start = self._idx + ago - size + 1
             end = self._idx + ago + 1
             values = list(islice(self.array, start, end))
+        elif isinstance(self.array, GrowableArray):
+            return _ndarray2array(self.array.view[self._idx + ago - size + 1 : self._idx + ago + 1])
         else:
             # If not using islice, directly slice the array
             values = list(self.array[self._idx + ago - size + 1 : self._idx + ago + 1])
@@ -460,6 +528,43 @@ class LineBuffer(LineSingle, LineRootMixin):
             ),
         )
 
+    def getview(self, ago=0, size=1):
+        """Returns the values of ``get`` as a float64 ndarray
+
+        With NumPy storage (``usenumpy``) the result is a read-only view of
+        the buffer, no copy is made unless the values hold infinities. It
+        must not be kept across ``forward``/``extend``, which may move the
+        storage. Other storages return a copy.
+
+        Keyword Args:
+            ago (int): Point of the array to which size will be added
+            size (int): size of the slice to return
+
+        Returns:
+            numpy.ndarray: The values, infinities replaced by 0.0
+        """
+        if isinstance(self.array, GrowableArray) and not self.useislice:
+            start = self._idx + ago - size + 1
+            return _finite_view(self.array.view[start : self._idx + ago + 1])
+        return np.array(self.get(ago, size), dtype=np.float64)
+
+    def getzeroview(self, idx=0, size=1):
+        """Returns the values of ``getzero`` as a float64 ndarray
+
+        Like ``getview``: a read-only view of the buffer with NumPy storage,
+        a copy otherwise.
+
+        Keyword Args:
+            idx (int): Where to start relative to the real start of the buffer
+            size (int): size of the slice to return
+
+        Returns:
+            numpy.ndarray: The values, infinities replaced by 0.0
+        """
+        if isinstance(self.array, GrowableArray) and not self.useislice:
+            return _finite_view(self.array.view[idx : idx + size])
+        return np.array(self.getzero(idx, size), dtype=np.float64)
+
     # Return the value at the actual index 0 of the array
     def getzeroval(self, idx=0):
         """Returns a single value of the array relative to the real zero
@@ -490,6 +595,8 @@ class LineBuffer(LineSingle, LineRootMixin):
         """
         if self.useislice:
             values = list(islice(self.array, idx, idx + size))
+        elif isinstance(self.array, GrowableArray):
+            return _ndarray2array(self.array.view[idx : idx + size])
         else:
             values = list(self.array[idx : idx + size])
 
@@ -696,6 +803,54 @@ class LineBuffer(LineSingle, LineRootMixin):
             # Batch extend for multiple positions
             self.array.extend([append_val] * size)
 
+    def asstored(self, values):
+        """Returns the float64 array of ``values`` as setting them would store them
+
+        NaN and infinite values are handled as in ``__setitem__``, including
+        the clamping of datetime values.
+        """
+        values = np.array(values, dtype=np.float64).ravel()
+        if self._is_datetime_line:
+            values[np.isinf(values) | ~(values >= 1.0)] = 1.0
+        else:
+            values[np.isinf(values)] = self._default_value
+        return values
+
+    def forwardvalues(self, values, stored=False):
+        """Moves the logical index forward over new positions holding ``values``
+
+        The result is that of a ``forward`` followed by setting ``[0]`` for
+        each value, but the values are added to the buffer in a single step.
+        Bindings are not updated.
+
+        Keyword Args:
+            values (sequence): float values of the new positions
+            stored (bool): ``values`` is a float64 array of values already
+              as stored (see ``asstored``) which the buffer may keep as its
+              storage instead of copying it
+        """
+        if stored:
+            values = np.asarray(values, dtype=np.float64)
+        else:
+            values = self.asstored(values)
+        size = len(values)
+        arr = self.array
+        if isinstance(arr, array.array):
+            arr.frombytes(values.tobytes())
+        elif isinstance(arr, GrowableArray):
+            if len(arr):
+                arr.extend(values)
+            else:
+                arr.adopt(values)  # a private copy, or given away if stored
+        else:
+            arr.extend(values.tolist())
+
+        if self.mode == self.QBuffer:
+            self.idx = self._idx + size
+        else:
+            self._idx += size
+        self.lencount += size
+
     # Move backward one step
     def backwards(self, size=1, force=False):
         """Moves the logical index backwards and reduces the buffer as much as needed
@@ -813,8 +968,11 @@ class LineBuffer(LineSingle, LineRootMixin):
         be plotted)
 
         Returns:
-            A slice of the underlying buffer
+            A slice of the underlying buffer (a read-only ndarray view with
+            NumPy storage)
         """
+        if isinstance(self.array, GrowableArray):
+            return self.getzeroview(idx, size or len(self))
         return self.getzero(idx, size or len(self))
 
     # Get partial data from array
@@ -826,10 +984,13 @@ class LineBuffer(LineSingle, LineRootMixin):
             end: End index of the slice.
 
         Returns:
-            list or array: Slice of data from start to end.
+            list or ndarray: Slice of data from start to end (a read-only
+            ndarray view with NumPy storage).
         """
         if self.useislice:
             values = list(islice(self.array, start, end))
+        elif isinstance(self.array, GrowableArray):
+            return _finite_view(self.array.view[start:end])
         else:
             values = list(self.array[start:end])
 
@@ -850,8 +1011,18 @@ class LineBuffer(LineSingle, LineRootMixin):
         larray = self.array
         blen = self.buflen()
 
+        if isinstance(larray, GrowableArray):
+            values = larray.view[0:blen]  # no copy
+        else:
+            values = larray[0:blen]
         for binding in self.bindings:
-            binding.array[0:blen] = larray[0:blen]
+            barray = binding.array
+            if isinstance(barray, GrowableArray) and len(barray) >= blen:
+                barray.view[0:blen] = values
+            elif isinstance(barray, array.array) and isinstance(values, np.ndarray):
+                barray[0:blen] = array.array("d", np.ascontiguousarray(values).tobytes())
+            else:
+                barray[0:blen] = values
 
     # Convert binding to line
     def bind2lines(self, binding=0):
@@ -1019,6 +1190,30 @@ class LineBuffer(LineSingle, LineRootMixin):
         """Alias to avoid the extra chars in "datetime" for this field"""
         return self.datetime(ago)
 
+    @property
+    def nsaxis(self):
+        """int64 epoch nanoseconds of the stored datetimes, or ``None``.
+
+        Loaded along the float days by feeds with the ``timens`` param, it
+        is aligned with ``array`` and keeps the sub-microsecond precision
+        the float days lose.
+        """
+        return self._nsaxis
+
+    def epochns(self, ago=0):
+        """Get the datetime value at the specified offset as UTC epoch nanoseconds.
+
+        Args:
+            ago: Number of periods to look back (0=current, -1=previous).
+
+        Returns:
+            int: Exact if the feed loaded ``nsaxis``, else derived from the
+            float days (microsecond resolution).
+        """
+        if self._nsaxis is not None:
+            return int(self._nsaxis[self._idx + ago])
+        return (num2date(self[ago]) - _EPOCH) // _MICROSECOND * 1000
+
     def tm_raw(self, ago=0):
         """
         Returns a localtime/gmtime like time.struct_time object which is
@@ -1348,9 +1543,7 @@ class LineActions(LineBuffer, LineActionsMixin, metabase.ParamsMixin):
 
                     # Ensure the line has its own array
                     if not hasattr(line_obj, "array") or not line_obj.array:
-                        import array
-
-                        line_obj.array = array.array("d")
+                        line_obj.array = LineBuffer._newarray()
                         line_obj._idx = -1
                         line_obj.lencount = 0
 
@@ -2176,6 +2369,23 @@ class LinesOperation(LineActions):
         >>> # result[0] = indicator1[0] - indicator2[0]
     """
 
+    # Compile operation trees held by strategies into fused evaluators
+    _fuse = False
+
+    # FusedOperation (see linefusion) evaluating the tree rooted here, if any
+    _fused = None
+
+    @classmethod
+    def usefusion(cls, onoff):
+        """Enable or disable fused evaluation of strategy operation trees.
+
+        When active, each tree of ``LinesOperation``/``LineOwnOperation``
+        objects held by a strategy is compiled into a single evaluator (see
+        ``linefusion``) which computes the root from the source lines
+        without evaluating and storing the intermediate nodes.
+        """
+        LinesOperation._fuse = bool(onoff)
+
     def __init__(self, a, b, operation, r=False, parent_a=None, parent_b=None):
         """Initialize a binary operation between two line objects.
 
@@ -2380,6 +2590,17 @@ class LinesOperation(LineActions):
                 # Clock without a comparable length; proceed to advance operands.
                 pass
 
+        fused = self._fused
+        if fused is not None:
+            # Values already stored by the fused once() or computed here in
+            # a single call: the intermediate nodes are not evaluated
+            self.advance()
+            if not fused.precomputed:
+                self[0] = fused.next()
+            for binding in self.bindings:
+                binding[0] = self[0]
+            return
+
         for operand in self._next_operands:
             self._next_operand_if_due(operand)
 
@@ -2450,6 +2671,11 @@ class LinesOperation(LineActions):
             start: Starting index.
             end: Ending index.
         """
+        if self._fused is not None and self._fused.precomputed:
+            # All values already stored by the fused evaluator of the tree
+            self.oncebinding()
+            return
+
         # CRITICAL FIX: Always use start=0 for nested operations
         # This ensures historical values are available for indicators like SMA
         nested_start = 0
@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+"""Line Fusion Module - Fused evaluation of line operation trees.
+
+Expressions like ``(self.data.close - sma) / atr > 1.5`` written in a
+strategy's ``__init__`` build a tree of ``LinesOperation`` and
+``LineOwnOperation`` objects. Each node is a full line: it is advanced,
+evaluated and stored on every bar, and reads its operands through their
+own ``__getitem__``.
+
+This module compiles such a tree into a single ``FusedOperation`` which
+evaluates the whole expression from the source lines (data feed and
+indicator lines) and the constants:
+
+    - In ``runonce`` mode all the values are computed at once with NumPy,
+      without intermediate line buffers.
+    - In ``next`` mode a Python function is generated for the tree and
+      evaluates the whole expression with a single call per bar.
+
+Both evaluators reproduce the per-node semantics of ``LinesOperation``
+and ``LineOwnOperation`` in the matching mode: NaN operands produce NaN,
+infinite values are read as 0.0, divisions by zero and overflows produce
+NaN, and unary nodes read non-finite values as 0.0 in ``runonce`` mode
+(where the parent node reads their stored values).
+
+Classes:
+    FusedOperation: Compiled evaluator for a tree of line operations.
+
+Functions:
+    fuse: Compile the tree rooted at a ``LinesOperation``.
+"""
+
+import itertools
+import math
+import operator
+
+import numpy as np
+
+from .linebuffer import LineActions, LineBuffer, LineOwnOperation, LinesOperation
+from .utils import vectorops
+from .utils.log_message import get_logger
+
+__all__ = ["FusedOperation", "fuse"]
+
+logger = get_logger(__name__)
+
+NAN = float("NaN")
+
+# operation: (ufunc, python expression template)
+_BINARY = {
+    operator.__add__: (np.add, "{0} + {1}"),
+    operator.__sub__: (np.subtract, "{0} - {1}"),
+    operator.__mul__: (np.multiply, "{0} * {1}"),
+    operator.__truediv__: (np.true_divide, "{0} / {1}"),
+    operator.__floordiv__: (np.floor_divide, "{0} // {1}"),
+    operator.__pow__: (np.power, "{0} ** {1}"),
+    operator.__lt__: (np.less, "{0} < {1}"),
+    operator.__le__: (np.less_equal, "{0} <= {1}"),
+    operator.__gt__: (np.greater, "{0} > {1}"),
+    operator.__ge__: (np.greater_equal, "{0} >= {1}"),
+    operator.__eq__: (np.equal, "{0} == {1}"),
+    operator.__ne__: (np.not_equal, "{0} != {1}"),
+}
+
+_UNARY = {
+    operator.__abs__: (np.abs, "abs({0})"),
+    operator.__neg__: (np.negative, "-{0}"),
+}
+
+# Operations raising ZeroDivisionError for a zero divisor (NaN in the nodes)
+_ZERODIV = (operator.__truediv__, operator.__floordiv__)
+
+
+class _NotFusible(Exception):
+    """Raised when a tree holds something the fused evaluators cannot handle."""
+
+
+class FusedOperation:
+    """Compiled evaluator for a tree of line operations.
+
+    Instances are created with ``fuse``. The tree is kept as a small list of
+    instructions (``leaf``, ``const``, ``binary``, ``unary``) in evaluation
+    order, the last instruction being the root of the expression.
+
+    Attributes:
+        root: The ``LinesOperation`` at the root of the tree.
+        nodes: The operation nodes absorbed by the evaluator (root included).
+        leaves: Source lines read by the evaluator.
+        precomputed: True once ``once`` has stored all the root values.
+    """
+
+    def __init__(self, root, program, nodes, leaves):
+        self.root = root
+        self.nodes = nodes
+        self.leaves = leaves
+        self.precomputed = False
+        self._program = program
+        self._next = self._compile_next()
+
+    def once(self, size):
+        """Store the values of the root for the first ``size`` bars.
+
+        Returns:
+            bool: False if the root uses bounded (``exactbars``) storage or
+            the source lines hold less than ``size`` values (the regular
+            per-node evaluation must then be used).
+        """
+        if self.root.mode != LineBuffer.UnBounded:
+            return False
+        if any(len(leaf.array) < size for leaf, _ in self.leaves):
+            return False
+
+        values = self.evaluate(size)
+        dst = self.root.array
+        if len(dst) < size:
+            dst.extend(itertools.repeat(NAN, size - len(dst)))
+        vectorops.assign(dst, 0, values)
+        self.precomputed = True
+        return True
+
+    def evaluate(self, size):
+        """Return the values of the expression for the first ``size`` bars."""
+        regs = []
+        with np.errstate(all="ignore"):
+            for instr in self._program:
+                kind = instr[0]
+                if kind == "leaf":
+                    # _once_op reads the stored values without warmup guard
+                    line = self.leaves[instr[1]][0]
+                    values = vectorops.as_ndarray(line.array, size)
+                    regs.append(np.where(np.isinf(values), 0.0, values))
+                elif kind == "const":
+                    regs.append(instr[1])
+                elif kind == "unary":
+                    # LineOwnOperation.once stores op(0.0) for non-finite inputs
+                    _, op, src = instr
+                    values = regs[src]
+                    values = np.where(np.isfinite(values), values, 0.0)
+                    regs.append(np.asarray(_UNARY[op][0](values), dtype=np.float64))
+                else:
+                    _, op, left, right = instr
+                    regs.append(_binary(op, regs[left], regs[right]))
+
+        result = regs[-1]
+        if np.ndim(result) == 0:
+            result = np.full(size, result, dtype=np.float64)
+        return np.asarray(result, dtype=np.float64)
+
+    def next(self):
+        """Return the value of the expression for the current bar."""
+        try:
+            return self._next(*[leaf for leaf, _ in self.leaves])
+        except Exception:
+            # A failing node yields NaN and NaN propagates up to the root
+            return NAN
+
+    def _compile_next(self):
+        """Generate the per-bar evaluator of the tree."""
+        args = [f"l{i}" for i in range(len(self.leaves))]
+        body = []
+        consts = {}
+        for reg, instr in enumerate(self._program):
+            kind = instr[0]
+            dst = f"r{reg}"
+            if kind == "leaf":
+                idx = instr[1]
+                minperiod = self.leaves[idx][1]
+                body.append(f"{dst} = l{idx}[0]")
+                body.append(f"if {dst} in INFS: {dst} = 0.0")
+                if minperiod > 1:
+                    body.append(f"if len(l{idx}) < {minperiod}: {dst} = NAN")
+            elif kind == "const":
+                consts[f"c{reg}"] = instr[1]
+                body.append(f"{dst} = c{reg}")
+            elif kind == "unary":
+                _, op, src = instr
+                expr = _UNARY[op][1].format(f"r{src}")
+                body.append(f"{dst} = NAN if r{src} != r{src} else {expr}")
+            else:
+                _, op, left, right = instr
+                a, b = f"r{left}", f"r{right}"
+                expr = _BINARY[op][1].format(a, b)
+                body.append(f"if {a} != {a} or {b} != {b}: {dst} = NAN")
+                body.append("else:")
+                if op in _ZERODIV:
+                    body.append(f"    {dst} = NAN if {b} == 0 else {expr}")
+                else:
+                    body.append(f"    {dst} = {expr}")
+                if op is operator.__pow__:
+                    body.append(f"    if isinstance({dst}, complex): {dst} = NAN")
+                body.append(f"    if {dst} in INFS: {dst} = 0.0")
+
+        body.append(f"return r{len(self._program) - 1}")
+        src = f"def fused({', '.join(args)}):\n" + "\n".join(f"    {line}" for line in body)
+
+        namespace = {"NAN": NAN, "INFS": (math.inf, -math.inf), **consts}
+        exec(compile(src, "<fused-lines>", "exec"), namespace)  # nosec B102
+        return namespace["fused"]
+
+
+def _binary(op, a, b):
+    """Vectorized ``LinesOperation`` node (operands already normalized)."""
+    ufunc = _BINARY[op][0]
+    out = np.asarray(ufunc(a, b), dtype=np.float64)
+    nans = np.isnan(a) | np.isnan(b)
+    if op in _ZERODIV:
+        nans = nans | (np.asarray(b) == 0)
+    if op is operator.__pow__:
+        nans = nans | ~np.isfinite(out)  # OverflowError/complex results
+    else:
+        out[np.isinf(out)] = 0.0
+    if np.any(nans):
+        out = np.where(nans, NAN, out)
+    return out
+
+
+class _Compiler:
+    """Translate a tree of line operations into a ``FusedOperation`` program."""
+
+    def __init__(self, clock_lines):
+        self.clock_lines = clock_lines
+        self.program = []
+        self.nodes = []
+        self.leaves = []
+        self._regs = {}  # node/leaf key -> register, shares repeated subexpressions
+
+    def _emit(self, key, instr):
+        self.program.append(instr)
+        reg = len(self.program) - 1
+        if key is not None:
+            self._regs[key] = reg
+        return reg
+
+    def node(self, node):
+        """Compile an operation node, returning its register."""
+        key = (id(node), "node")
+        if key in self._regs:
+            return self._regs[key]
+
+        if type(node) is LinesOperation:
+            if node.operation not in _BINARY:
+                raise _NotFusible(f"operation {node.operation!r}")
+            a = self.operand(node.a, node._a_guard_minperiod, node._a_minperiod)
+            b = self.operand(node.b, node._b_guard_minperiod, node._b_minperiod)
+            left, right = (b, a) if node.r else (a, b)
+            instr = ("binary", node.operation, left, right)
+        elif type(node) is LineOwnOperation:
+            if node.operation not in _UNARY:
+                raise _NotFusible(f"operation {node.operation!r}")
+            instr = ("unary", node.operation, self.operand(node.a, False, 1))
+        else:
+            raise _NotFusible(type(node).__name__)
+
+        self.nodes.append(node)
+        return self._emit(key, instr)
+
+    def operand(self, operand, guard, minperiod):
+        """Compile an operand: a nested node, a constant or a source line."""
+        if type(operand) in (LinesOperation, LineOwnOperation):
+            return self.node(operand)
+
+        if LinesOperation._is_constant_operand(operand):
+            value = operand[0]
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise _NotFusible(f"constant {value!r}")
+            if isinstance(value, float) and math.isinf(value):
+                value = 0.0
+            return self._emit(None, ("const", value))
+
+        if isinstance(operand, LineActions) or not isinstance(operand, LineBuffer):
+            raise _NotFusible(type(operand).__name__)
+        if operand.bindings or id(operand) not in self.clock_lines:
+            raise _NotFusible("line not driven by the clock")
+
+        minperiod = minperiod if guard else 1
+        key = (id(operand), minperiod)
+        if key in self._regs:
+            return self._regs[key]
+        self.leaves.append((operand, minperiod))
+        return self._emit(key, ("leaf", len(self.leaves) - 1))
+
+
+def fuse(root, clock_lines):
+    """Compile the tree of line operations rooted at ``root``.
+
+    Args:
+        root: A ``LinesOperation``.
+        clock_lines: ids of the lines advancing with the clock of ``root``
+            (lines of the clock data feed and of the indicators it drives).
+
+    Returns:
+        FusedOperation or None: None if the tree holds unsupported
+        operations or operands (other ``LineActions``, lines following
+        another clock), in which case the tree keeps its regular evaluation.
+    """
+    compiler = _Compiler(clock_lines)
+    try:
+        compiler.node(root)
+    except _NotFusible as e:
+        logger.debug("Cannot fuse %s: %s", type(root).__name__, e)
+        return None
+
+    return FusedOperation(root, compiler.program, compiler.nodes, compiler.leaves)
@@ -808,7 +808,7 @@ class LineIteratorMixin:
         if owner is not None:
             try:
                 ind_list = owner._lineiterators.get(LineIterator.IndType, [])
-                if _obj not in ind_list:
+                if not any(x is _obj for x in ind_list):
                     owner.addindicator(_obj)
             except (AttributeError, Exception):
                 logger.debug("Failed to register indicator with owner", exc_info=True)
@@ -1610,8 +1610,10 @@ class LineIterator(LineIteratorMixin, LineSeries):
         """
         # Add indicator to the appropriate lineiterator queue
         # CRITICAL FIX: Check for duplicates before adding
-        if indicator not in self._lineiterators[indicator._ltype]:
-            self._lineiterators[indicator._ltype].append(indicator)
+        # Identity check: == on lines objects builds an operation
+        lineiterators = self._lineiterators[indicator._ltype]
+        if not any(x is indicator for x in lineiterators):
+            lineiterators.append(indicator)
 
         # Set up the indicator's owner and clock if not already set
         if not hasattr(indicator, "_owner") or indicator._owner is None:
@@ -915,6 +915,20 @@ class Lines:
         """
         return self.lines[line].get(ago, size)
 
+    def getview(self, ago=0, size=1, line=0):
+        """Get the values of ``get`` as a float64 ndarray.
+
+        Args:
+            ago: Number of periods to look back (0=current).
+            size: Number of values to return.
+            line: Line index to get values from.
+
+        Returns:
+            numpy.ndarray: Read-only view of the line with NumPy storage,
+            a copy otherwise (see ``LineBuffer.getview``).
+        """
+        return self.lines[line].getview(ago, size)
+
     def __setitem__(self, line, value):
         """Set a line by index with proper binding support.
 
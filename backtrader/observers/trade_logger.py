@@ -29,6 +29,7 @@ Example:
 """
 
 import collections
+import importlib.util
 import json
 import logging
 import os
@@ -45,21 +46,9 @@ logger = get_logger(__name__)
 # Shanghai timezone (UTC+8) used for all log timestamps
 _SHANGHAI_TZ = timezone(timedelta(hours=8))
 
-# Optional MySQL support
-try:
-    import pymysql
-
-    MYSQL_AVAILABLE = True
-except ImportError:
-    MYSQL_AVAILABLE = False
-
-# Optional YAML support
-try:
-    import yaml
-
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
+# Optional MySQL and YAML support, imported when first used
+MYSQL_AVAILABLE = importlib.util.find_spec("pymysql") is not None
+YAML_AVAILABLE = importlib.util.find_spec("yaml") is not None
 
 
 class TradeLogger(Observer):
@@ -523,6 +512,8 @@ class TradeLogger(Observer):
                 print("[TradeLogger] Warning: pymysql not installed, MySQL logging disabled")
             return
 
+        import pymysql
+
         try:
             self._mysql_conn = pymysql.connect(
                 host=self.p.mysql_host,
@@ -1312,6 +1303,8 @@ class TradeLogger(Observer):
                     "current_price": current_price,
                 }
 
+        import yaml
+
         snapshot_path = os.path.join(self.p.log_dir, self.p.snapshot_file)
         try:
             with open(snapshot_path, "w", encoding="utf-8") as f:
@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+"""Optimization Scheduler Module - Batched execution of parameter sweeps.
+
+``Cerebro`` optimizations run every parameter combination of a sweep in a
+pool of worker processes. This module provides:
+
+    - ``OptScheduler``: sends batches of combinations to workers which keep
+      the ``Cerebro`` (with its preloaded feeds and imported modules) from
+      one batch to the next. The batch size adapts to the measured cost of
+      a combination so that each task carries about ``target`` seconds of
+      work, and results are handed over as soon as each batch finishes.
+    - ``OptResultsFile``: an append-only file with the results of a sweep,
+      written as they arrive, which lets an interrupted sweep be resumed.
+
+Classes:
+    OptScheduler: Adaptive batch scheduler over a process pool.
+    OptResultsFile: Streamed, resumable storage of optimization results.
+
+Functions:
+    sweep_fingerprint: Identify the combinations and the setup of a sweep.
+"""
+
+import itertools
+import math
+import multiprocessing
+import os
+import pickle
+import queue
+import time
+
+from .errors import ConfigError
+from .utils.fingerprint import Undescribable, describe, describefeed, digest, dumps
+from .utils.log_message import get_logger
+
+__all__ = ["OptScheduler", "OptResultsFile", "sweep_fingerprint"]
+
+logger = get_logger(__name__)
+
+# Cerebro of a worker process, set once by the pool initializer
+_worker_cerebro = None
+
+
+def _worker_init(cerebro):
+    global _worker_cerebro
+    _worker_cerebro = cerebro
+
+
+def _worker_run(batch):
+    """Run a batch of ``(index, combination)`` in a worker process."""
+    start = time.perf_counter()
+    results = [(idx, _worker_cerebro(iterstrat)) for idx, iterstrat in batch]
+    return time.perf_counter() - start, results
+
+
+# Cerebro parameters which do not change the results of a sweep
+_SKIPPARAMS = ("maxcpus", "optchunksize", "optdatas", "optresults", "optsharedmem", "feedcache")
+
+
+def _classname(cls):
+    # Locally defined classes are fine: the name is the same in a later run
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _describeadded(entries):
+    """Description of ``(class, args, kwargs)`` as added to ``Cerebro``."""
+    return [[_classname(cls), describe(args), describe(kwargs)] for cls, args, kwargs in entries]
+
+
+def _describecerebro(cerebro):
+    """Description of what, besides the combinations, decides the results."""
+    params = dict(cerebro.p._getkwargs())
+    broker = cerebro.getbroker()
+    sizers = sorted(cerebro.sizers.items(), key=lambda item: (item[0] is not None, item[0] or 0))
+    signalstrat = cerebro._signal_strat
+    return {
+        "params": describe({k: v for k, v in params.items() if k not in _SKIPPARAMS}),
+        "datas": [describefeed(data) for data in cerebro.datas],
+        "broker": describe(broker),
+        "comminfo": describe(dict(broker.comminfo)),
+        "analyzers": _describeadded(cerebro.analyzers),
+        "observers": [[multi] + _describeadded([entry])[0] for multi, *entry in cerebro.observers],
+        "indicators": _describeadded(cerebro.indicators),
+        "sizers": [[idx] + _describeadded([entry])[0] for idx, entry in sizers],
+        "signals": [[sigtype] + _describeadded([entry])[0] for sigtype, *entry in cerebro.signals],
+        "signalstrat": [
+            _describeadded([signalstrat])[0] if signalstrat[0] is not None else None,
+            cerebro._signal_concurrent,
+            cerebro._signal_accumulate,
+        ],
+        "calendar": describe(cerebro._tradingcal),
+    }
+
+
+def sweep_fingerprint(combos, cerebro=None):
+    """Return a digest identifying a sweep.
+
+    The digest covers the combinations, in order, and with ``cerebro`` its
+    setup: the datas (path, size and modification time of the files, or
+    the contents of in-memory sources), the broker with its cash and
+    commission schemes, the analyzers, observers, sizers and signals, and
+    the parameters of ``Cerebro`` which change the results.
+
+    Args:
+        combos: Sequence of combinations, each one an iterable of
+            ``(strategy class, args, kwargs)``.
+        cerebro: Optional ``Cerebro`` running the sweep.
+
+    Raises:
+        ConfigError: A value has no description which a later run would
+            reproduce, like an object whose ``repr`` is its address.
+    """
+    try:
+        description = {
+            "combos": [_describeadded(iterstrat) for iterstrat in combos],
+            "setup": _describecerebro(cerebro) if cerebro is not None else None,
+        }
+    except Undescribable as e:
+        raise ConfigError(
+            f"Optimization results cannot be stored for resuming: {e} has no stable description"
+        ) from e
+    return digest(dumps(description).encode())
+
+
+class OptScheduler:
+    """Run the combinations of a sweep in batches over warm worker processes.
+
+    The ``Cerebro`` is handed to each worker once, when the pool starts, and
+    every task carries a batch of ``(index, combination)`` pairs. With
+    ``chunksize=0`` the first tasks carry a single combination; the batch
+    size then follows the measured cost of a combination, aiming at
+    ``target`` seconds per task and never taking more than a fair share of
+    the remaining combinations, so that all workers finish together.
+
+    Args:
+        cerebro: The ``Cerebro`` running the sweep.
+        processes: Number of worker processes (``None``: one per CPU).
+        chunksize: Fixed number of combinations per task (0: adaptive).
+    """
+
+    # Seconds of work aimed at per task when the batch size is adaptive
+    target = 1.0
+
+    # Tasks kept queued per worker, so that no worker waits for the next one
+    inflight = 2
+
+    def __init__(self, cerebro, processes=None, chunksize=0):
+        self.cerebro = cerebro
+        self.processes = processes or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self._cost = None  # smoothed seconds per combination
+
+    def run(self, combos, onresult):
+        """Run ``combos`` calling ``onresult(index, result)`` as results arrive.
+
+        Args:
+            combos: List of ``(index, combination)`` pairs.
+            onresult: Callable receiving each result, in completion order.
+        """
+        pool = multiprocessing.Pool(
+            self.processes, initializer=_worker_init, initargs=(self.cerebro,)
+        )
+        try:
+            self._dispatch(pool, combos, onresult)
+        except BaseException:
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
+
+    def _batchsize(self, remaining):
+        if self.chunksize:
+            return self.chunksize
+        if self._cost is None:
+            return 1
+        size = int(self.target / self._cost) if self._cost > 0 else remaining
+        return max(1, min(size, math.ceil(remaining / self.processes)))
+
+    def _dispatch(self, pool, combos, onresult):
+        todo = iter(combos)
+        remaining = len(combos)
+        done = queue.SimpleQueue()
+        pending = 0
+
+        while True:
+            while remaining and pending < self.processes * self.inflight:
+                batch = list(itertools.islice(todo, self._batchsize(remaining)))
+                remaining -= len(batch)
+                pool.apply_async(_worker_run, (batch,), callback=done.put, error_callback=done.put)
+                pending += 1
+
+            if not pending:
+                break
+
+            item = done.get()
+            pending -= 1
+            if isinstance(item, BaseException):
+                raise item
+
+            elapsed, results = item
+            cost = elapsed / len(results)
+            self._cost = cost if self._cost is None else 0.7 * self._cost + 0.3 * cost
+            for idx, result in results:
+                onresult(idx, result)
+
+
+class OptResultsFile:
+    """Append-only file holding the results of a sweep as they complete.
+
+    The file is a stream of pickles: a header identifying the sweep
+    followed by one ``(index, result)`` record per finished combination.
+    Opening an existing file of the same sweep returns the results already
+    stored, so that only the missing combinations need to run. A record
+    left incomplete by an interrupted process is discarded.
+
+    Args:
+        path: Location of the file.
+        fingerprint: ``sweep_fingerprint`` of the combinations of the sweep.
+        total: Number of combinations of the sweep.
+    """
+
+    FORMAT = 1
+
+    def __init__(self, path, fingerprint, total):
+        self.path = path
+        self.header = {"format": self.FORMAT, "fingerprint": fingerprint, "total": total}
+        self._fp = None
+
+    def open(self):
+        """Open the file for appending and return the stored results.
+
+        Returns:
+            dict: ``index -> result`` for the combinations already finished.
+
+        Raises:
+            ConfigError: The file holds the results of a different sweep.
+        """
+        results = {}
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            self._fp = fp = open(self.path, "r+b")
+            header = pickle.load(fp)
+            if header != self.header:
+                fp.close()
+                raise ConfigError(
+                    f"Optimization results file {self.path!r} belongs to another sweep"
+                )
+            good = fp.tell()
+            while True:
+                try:
+                    idx, result = pickle.load(fp)
+                except EOFError:
+                    break
+                except (pickle.UnpicklingError, ValueError, TypeError):
+                    logger.warning("Discarding incomplete record in %s", self.path)
+                    break
+                results[idx] = result
+                good = fp.tell()
+            fp.seek(good)
+            fp.truncate()
+        else:
+            self._fp = open(self.path, "wb")
+            pickle.dump(self.header, self._fp)
+            self._fp.flush()
+
+        return results
+
+    def append(self, idx, result):
+        """Store the ``result`` of combination ``idx``."""
+        pickle.dump((idx, result), self._fp)
+        self._fp.flush()
+
+    def close(self):
+        """Close the file."""
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
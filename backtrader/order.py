@@ -470,6 +470,15 @@ class OrderBase:
     # Add a number for each order
     refbasis = itertools.count(1)  # for a unique identifier per order
 
+    # Queue and fill state of the tick broker's exchange models: defaults
+    # until set on the order, without going through __getattr__
+    _queue_ahead = 0.0
+    _queue_initial_ahead = 0.0
+    _queue_trade_qty = 0.0
+    _queue_fillable = 0.0
+    _fill_role = None
+    _stop_triggered = False
+
     # Set/get plimit property
     def _getplimit(self):
         return self._plimit
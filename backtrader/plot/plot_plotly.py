@@ -16,7 +16,7 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 from ..parameters import ParameterDescriptor, ParameterizedBase
-from ..utils.date import num2date
+from ..utils.date import num2date, num2date_array
 from ..utils.log_message import get_logger
 from ..utils.py3 import range
 from .scheme import PlotScheme
@@ -546,7 +546,7 @@ class PlotlyPlot(ParameterizedBase):
         )
 
         # Convert datetime
-        xdata = [self._num2date(x) for x in st_dtime[pstart:pend]]
+        xdata = num2date_array(st_dtime[pstart:pend]).tolist()
         current_row = 1
 
         # Plot each data feed
@@ -566,7 +566,7 @@ class PlotlyPlot(ParameterizedBase):
             dts = data.datetime.plot()
             if len(dts) < len(st_dtime):
                 # This data has fewer bars, need to align
-                data_xdata = [self._num2date(x) for x in data.datetime.plotrange(pstart, pend)]
+                data_xdata = num2date_array(data.datetime.plotrange(pstart, pend)).tolist()
 
             # Skip indicators above data (disabled for cleaner chart)
             # for ind in self.dplotsup.get(data, []):
@@ -20,9 +20,11 @@ Example:
 
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
+
 from .dataseries import TimeFrame, _Bar
 from .parameters import ParameterizedBase
-from .utils.date import date2num, num2date
+from .utils.date import date2num, date2num_array, num2date, num2date_array
 
 # Python 3.11+ has datetime.UTC, earlier versions use timezone.utc
 UTC = timezone.utc
@@ -181,6 +183,100 @@ class DTFaker:
         return self.data._getnexteos()
 
 
+# Order of the values of a _Bar, which is that of the lines of a DataBase
+_BARFIELDS = ("close", "low", "high", "open", "volume", "openinterest", "datetime")
+
+
+def _splitdays(dts):
+    """Days (``datetime64[D]``) and microseconds into the day of ``num2date(dts)``"""
+    stamps = num2date_array(dts)
+    days = stamps.astype("datetime64[D]")
+    return days, (stamps - days).astype(np.int64)
+
+
+def _nexteos(dts, sessionend):
+    """Vectorized ``_getnexteos`` of a feed without calendar and timezone
+
+    Returns the ``datetime64[us]`` end of session of each of ``dts``
+    """
+    stamps = num2date_array(dts)
+    eosus = (sessionend.hour * 60 + sessionend.minute) * 60 + sessionend.second
+    eosus = eosus * 1000000 + sessionend.microsecond
+    eos = stamps.astype("datetime64[D]") + np.timedelta64(eosus, "us")
+    eos = num2date_array(date2num_array(eos))  # same round trip as the feed
+    over = stamps > eos
+    while over.any():
+        eos[over] += np.timedelta64(1, "D")
+        over = stamps > eos
+    return eos
+
+
+def _eosevents(dts, eos, onedge):
+    """Replays the end of session checks of ``_eoscheck`` over the bars
+
+    The end of session is taken from the bar which finds none pending and
+    only checked again when a bar goes beyond it. Exact hits put the bar on
+    the edge (``onedge`` is updated in place). Else the bar closes the open
+    bar, but if the resampled bar has just been delivered on an edge (or the
+    bar is on one) the check never succeeds again
+
+    Args:
+      dts: strictly increasing float datetimes of the bars
+      eos: float end of session of each bar
+      onedge: bool array of the bars on a boundary
+
+    Returns:
+      ``(overs, lasteos, pending)``: the bars going beyond the end of session
+      with the open bar, that end of session and the index of the bar whose
+      end of session is still pending after the last bar (``None`` if none)
+    """
+    size = len(dts)
+    overs = np.zeros(size, dtype=bool)
+    lasteos = np.zeros(size)
+    pos = 0
+    pending = None
+    while pos < size:
+        pending = pos
+        nexteos = eos[pos]
+        k = int(np.searchsorted(dts, nexteos))
+        if k == size:
+            break
+        if dts[k] == nexteos:
+            onedge[k] = True
+        elif onedge[k - 1] or onedge[k]:
+            break  # left behind: no bar will ever be equal or over it
+        else:
+            overs[k] = True
+            lasteos[k] = nexteos
+        pending = None
+        pos = k + 1
+
+    return overs, lasteos, pending
+
+
+def _aggregate(values, ends):
+    """Values, in ``_Bar`` order, of the bars made of the bars up to ``ends``"""
+    starts = np.r_[0, ends[:-1] + 1]
+    sizes = ends - starts + 1
+    # Summed one by one in order, as bupdate does, to get the same floats
+    volumes = np.zeros(len(ends))
+    order = np.argsort(-sizes, kind="stable")
+    negsizes = -sizes[order]
+    source = values["volume"]
+    for k in range(-int(negsizes[0])):
+        rows = order[: np.searchsorted(negsizes, -k)]
+        volumes[rows] += source[starts[rows] + k]
+
+    return [
+        values["close"][ends],
+        np.minimum.reduceat(values["low"], starts),
+        np.maximum.reduceat(values["high"], starts),
+        values["open"][starts],
+        volumes,
+        values["openinterest"][ends],
+    ]
+
+
 # Base class for resampler
 class _BaseResampler(ParameterizedBase):
     # Parameters
@@ -637,6 +733,12 @@ class Resampler(_BaseResampler):
         boundary)
         # Whether to use the right time boundary, for example if time boundary is hh:mm:00:hh:mm:05, if set to True, will use hh:mm:05
         # Set to False, will use hh:mm:00
+
+      - Bulk (default: True)
+
+        When the data feed is preloaded (and is not live, has no timezone
+        and no trading calendar) resample all the source bars at once with
+        ``bulk`` instead of one by one. The delivered bars are the same
     """
 
     # Parameters
@@ -644,6 +746,7 @@ class Resampler(_BaseResampler):
         ("bar2edge", True),
         ("adjbartime", True),
         ("rightedge", True),
+        ("bulk", True),
     )
 
     replaying = False
@@ -666,6 +769,129 @@ class Resampler(_BaseResampler):
 
         return False
 
+    def bulk(self, data, values):
+        """Resamples at once all the source bars of a preloaded data feed
+
+        The bars are those ``__call__`` and ``last`` would deliver for the
+        same source bars (the feed has no timezone and no trading calendar)
+
+        Args:
+          data: the data feed being resampled
+          values: ``{line alias: float64 array}`` with the source bars
+
+        Returns:
+          list: one array per value of a ``_Bar`` (in its order) or ``None``
+          if the source bars have to be resampled one by one: settings not
+          covered or bars which are late, repeated or have missing prices
+        """
+        tframe = self.p.timeframe
+        if not (
+            (self.subdays and self.p.bar2edge and TimeFrame.Seconds <= tframe)
+            or TimeFrame.Days <= tframe <= TimeFrame.Years
+        ):
+            return None
+        boundoff = self.p.boundoff
+        if isinstance(boundoff, bool) or not isinstance(boundoff, int) or boundoff < 0:
+            return None
+
+        if any(alias not in values for alias in _BARFIELDS):
+            return None
+        dts = values["datetime"]
+        size = len(dts)
+        if not (dts[1:] > dts[:-1]).all():
+            return None
+        for alias in ("open", "high", "low"):
+            prices = values[alias]
+            # bupdate keeps NaN and zero signs as max/min meet them
+            if (np.isnan(prices) | ((prices == 0.0) & np.signbit(prices))).any():
+                return None
+        if not size:
+            return [dts] * len(_BARFIELDS)
+
+        source = data
+        while source._clone:
+            source = source.data  # clones use the session end of their source
+        sessionend = source.p.sessionend
+
+        comp = self.p.compression
+        at = None  # source bars handled when the bars are delivered
+        adjusting = None  # bars which take the adjusted time
+        if self.componly:
+            at = ends = np.arange(comp - 1, size, comp)
+            if size % comp:
+                ends = np.r_[ends, size - 1]  # delivered by last
+            if self.doadjusttime:
+                adjusting = np.ones(len(ends), dtype=bool)
+                adjusted = date2num_array(_nexteos(dts[ends], sessionend))
+
+        elif self.subdays or tframe == TimeFrame.Days:
+            days, points = _splitdays(dts)
+            eosstamps = _nexteos(dts, sessionend)
+            if self.subdays:
+                unit = 60000000 if tframe == TimeFrame.Minutes else 1000000
+                points, rest = np.divmod(points, unit)
+                points += boundoff
+                onedge = (rest == 0) & (points % comp == 0)
+            else:
+                onedge = np.zeros(size, dtype=bool)
+
+            eosovers, lasteos, pending = _eosevents(dts, date2num_array(eosstamps), onedge)
+            if self.subdays:
+                comps = points // comp
+                overs = eosovers | np.r_[False, comps[1:] > comps[:-1]]
+            else:
+                overs = eosovers & (np.cumsum(eosovers) % comp == 0)
+            # Only checked with the bar open: the previous one was not on the edge
+            overs &= np.r_[False, ~onedge[:-1]] & ~onedge
+
+            at = np.flatnonzero(onedge | overs)
+            ends = np.where(onedge[at], at, at - 1)
+            adjusting = overs[at]
+            if not onedge[-1]:
+                ends = np.r_[ends, size - 1]  # delivered by last
+                adjusting = np.r_[adjusting, True]
+
+            if self.doadjusttime:
+                if self.subdays:
+                    point = (points[ends] // comp + int(self.p.rightedge)) * comp
+                    adjusted = days[ends] + (point * unit).astype("timedelta64[us]")
+                else:
+                    eostimes = eosstamps - eosstamps.astype("datetime64[D]")
+                    adjusted = days[ends] + eostimes[pending if pending is not None else 0]
+                adjusted = date2num_array(adjusted)
+                # Going over the end of session makes it the time of the bar
+                fromeos = np.r_[eosovers[at], pending is None][: len(ends)]
+                adjusted[fromeos] = np.r_[lasteos[at], lasteos[-1]][: len(ends)][fromeos]
+
+        else:
+            days = num2date_array(dts).astype("datetime64[D]")
+            if tframe == TimeFrame.Weeks:
+                # The mondays sort the weeks as the iso years and weeks do
+                keys = days - ((days.astype(np.int64) + 3) % 7).astype("timedelta64[D]")
+            elif tframe == TimeFrame.Months:
+                keys = days.astype("datetime64[M]")
+            else:
+                keys = days.astype("datetime64[Y]")
+            changes = np.r_[False, keys[1:] > keys[:-1]]
+            overs = changes & (np.cumsum(changes) % comp == 0)
+            ends = np.r_[np.flatnonzero(overs) - 1, size - 1]
+
+        bardts = dts[ends]
+        if adjusting is not None and self.doadjusttime:
+            # Delivered bars only take a later time, the last one any time
+            later = np.arange(len(ends)) >= len(at)
+            later |= adjusted > bardts
+            bardts = np.where(adjusting & later, adjusted, bardts)
+
+        if self.subdays:
+            # Source bars not later than the last delivered bar are late
+            delivered = np.searchsorted(at, np.arange(size)) - 1
+            checked = delivered >= 0
+            if not (dts[checked] > bardts[delivered[checked]]).all():
+                return None
+
+        return _aggregate(values, ends) + [bardts]
+
     # Used when calling resampler
     def __call__(self, data, fromcheck=False, forcedata=None):
         """Called for each set of values produced by the data source"""
@@ -0,0 +1,351 @@
+#!/usr/bin/env python
+"""Signal Batch Module - Evaluate a grid of signal parameters in one run.
+
+``Cerebro.optsignal`` adds a signal whose parameters are iterables, like
+``optstrategy`` does for strategies. Instead of running one ``Cerebro``
+per combination, a single ``SignalBatchStrategy`` instantiates every
+distinct signal of the grid, lets the regular (runonce) machinery compute
+them over the data and then simulates the ``SignalStrategy`` order logic
+for all the combinations at once: the values of the signals are stacked
+into 2-D arrays (bars x signals) and a simplified vectorized broker walks
+the bars updating the positions, the value and the trade statistics of
+every combination (a column) with NumPy operations.
+
+The simplified broker executes the market orders of a bar at the open of
+the next bar, as the default broker does, and uses the commission scheme
+and multiplier of the broker for the target data. Cash and margin checks,
+slippage, sizers other than a fixed stake and concurrent order handling
+are not modeled: the results are meant to screen a large grid and pick
+the candidates which will run through the regular event-driven backtest.
+
+Classes:
+    SignalBatchStrategy: Strategy computing the signals of the grid.
+    SignalBatchResults: Per-combination results of the simulation.
+"""
+
+import itertools
+
+import numpy as np
+
+from .errors import ConfigError
+from .signal import (
+    SIGNAL_LONG,
+    SIGNAL_LONG_ANY,
+    SIGNAL_LONG_INV,
+    SIGNAL_LONGEXIT,
+    SIGNAL_LONGEXIT_ANY,
+    SIGNAL_LONGEXIT_INV,
+    SIGNAL_LONGSHORT,
+    SIGNAL_SHORT,
+    SIGNAL_SHORT_ANY,
+    SIGNAL_SHORT_INV,
+    SIGNAL_SHORTEXIT,
+    SIGNAL_SHORTEXIT_ANY,
+    SIGNAL_SHORTEXIT_INV,
+)
+from .strategy import SignalStrategy
+from .utils import vectorops
+
+__all__ = ["SignalBatchStrategy", "SignalBatchResults"]
+
+
+class SignalBatchResults:
+    """Results of the combinations of a signal batch.
+
+    Each metric is an ndarray with one value per combination (column),
+    in the order of ``itertools.product`` over the ``optsignal`` grids.
+
+    Attributes:
+        params: Per combination, a tuple with the ``(args, kwargs)`` of each
+            optimized signal.
+        value: Final value of the broker.
+        pnl: Final value minus the starting cash.
+        rtot: Total compound return (``log(value / cash)``).
+        trades: Number of closed trades.
+        won: Closed trades with a non-negative net profit.
+        lost: Closed trades with a negative net profit.
+        maxdrawdown: Maximum drawdown of the value, in percent.
+    """
+
+    # Metrics which are better when lower
+    _lowerbetter = ("maxdrawdown", "lost")
+
+    def __init__(self, params, **metrics):
+        self.params = params
+        self.metrics = list(metrics)
+        for name, values in metrics.items():
+            setattr(self, name, values)
+
+    def __len__(self):
+        return len(self.params)
+
+    def ranking(self, by="value", n=None):
+        """Return the indices of the ``n`` best combinations by metric ``by``."""
+        values = getattr(self, by)
+        order = np.argsort(values if by in self._lowerbetter else -values, kind="stable")
+        return order[:n].tolist()
+
+    def get(self, idx):
+        """Return a dict with the parameters and the metrics of combination ``idx``."""
+        result = {name: getattr(self, name)[idx].item() for name in self.metrics}
+        result["params"] = self.params[idx]
+        return result
+
+
+class SignalBatchStrategy(SignalStrategy):
+    """Compute the signals of a parameter grid and simulate all combinations.
+
+    The strategy places no orders. The signals added with ``add_signal``
+    are part of every combination and each signal added with
+    ``Cerebro.optsignal`` contributes one of its parameter sets. When the
+    run ends, the results of the simulation are available in ``batch``
+    (a ``SignalBatchResults``).
+
+    Params:
+
+      - ``optsignals`` (default: ``[]``): list of ``(sigtype, sigcls,
+        [(args, kwargs), ...])`` as collected by ``Cerebro.optsignal``
+    """
+
+    params = (("optsignals", []),)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batch = None
+
+        registered = {id(ind) for ind in self._lineiterators[self.IndType]}
+        self._optsignals = []
+        for sigtype, sigcls, combos in self.p.optsignals:
+            signals = []
+            for sigargs, sigkwargs in combos:
+                signal = sigcls(self._dtarget, *sigargs, **sigkwargs)
+                if id(signal) not in registered:
+                    registered.add(id(signal))
+                    self._lineiterators[signal._ltype].append(signal)
+                    signal._owner = self
+                signals.append(signal)
+            self._optsignals.append((sigtype, signals, combos))
+
+    def _once(self, start=None, end=None):
+        super()._once(start, end)
+        # The grid holds complete values: nothing reads them bar by bar
+        grid = {id(s) for _, signals, _ in self._optsignals for s in signals}
+        indicators = self._lineiterators[self.IndType]
+        indicators[:] = [ind for ind in indicators if id(ind) not in grid]
+
+    def _next_signal(self):
+        pass  # the combinations are simulated in stop()
+
+    def stop(self):
+        """Simulate the combinations and store the results in ``batch``."""
+        self.batch = self._simulate()
+
+    def _values(self, signal, size):
+        array = signal.lines[0].array
+        if len(array) < size:
+            raise ConfigError(
+                "Signal batches need the full history of the signals (exactbars must be 0)"
+            )
+        return vectorops.as_ndarray(array, end=size)
+
+    def _columns(self, size):
+        """Return the signal values (bars x columns) per signal type, the
+        params and the minimum period of each column."""
+        shape = tuple(len(signals) for _, signals, _ in self._optsignals)
+        ncols = int(np.prod(shape))
+        colidx = np.unravel_index(np.arange(ncols), shape)
+
+        fixed = [s for sigs in self._signals.values() for s in sigs]
+        minperiod = np.full(ncols, max([self._dtarget._minperiod] + [s._minperiod for s in fixed]))
+
+        values = {}
+        for sigtype, sigs in self._signals.items():
+            for signal in sigs:
+                column = self._values(signal, size)[:, None]
+                values.setdefault(sigtype, []).append((column, None))
+
+        for (sigtype, signals, _), idx in zip(self._optsignals, colidx):
+            matrix = np.column_stack([self._values(s, size) for s in signals])
+            values.setdefault(sigtype, []).append((matrix, idx))
+            periods = np.array([s._minperiod for s in signals])
+            np.maximum(minperiod, periods[idx], out=minperiod)
+
+        params = list(itertools.product(*(combos for _, _, combos in self._optsignals)))
+        return values, params, minperiod
+
+    @staticmethod
+    def _flags(values, t, ncols):
+        """Vectorized ``SignalStrategy._evaluate_signals`` for bar ``t``."""
+        cache = {}
+
+        def reduce(sigtype, test):
+            key = (sigtype, test)
+            if key not in cache:
+                if sigtype not in values:  # no signal: [[0.0]] never passes
+                    cache[key] = np.zeros(ncols, dtype=bool)
+                else:
+                    result = np.ones(ncols, dtype=bool)
+                    for matrix, idx in values[sigtype]:
+                        row = matrix[t] if idx is None else matrix[t][idx]
+                        if test > 0:
+                            result &= row > 0.0
+                        elif test < 0:
+                            result &= row < 0.0
+                        else:
+                            result &= row != 0.0  # NaN counts as set, like bool()
+                    cache[key] = result
+            return cache[key]
+
+        pos, neg, anyv = 1, -1, 0
+        ls_long = reduce(SIGNAL_LONGSHORT, pos)
+        ls_short = reduce(SIGNAL_LONGSHORT, neg)
+        l_enter = (
+            reduce(SIGNAL_LONG, pos) | reduce(SIGNAL_LONG_INV, neg) | reduce(SIGNAL_LONG_ANY, anyv)
+        )
+        s_enter = (
+            reduce(SIGNAL_SHORT, neg)
+            | reduce(SIGNAL_SHORT_INV, pos)
+            | reduce(SIGNAL_SHORT_ANY, anyv)
+        )
+        l_exit = (
+            reduce(SIGNAL_LONGEXIT, neg)
+            | reduce(SIGNAL_LONGEXIT_INV, pos)
+            | reduce(SIGNAL_LONGEXIT_ANY, anyv)
+        )
+        s_exit = (
+            reduce(SIGNAL_SHORTEXIT, pos)
+            | reduce(SIGNAL_SHORTEXIT_INV, neg)
+            | reduce(SIGNAL_SHORTEXIT_ANY, anyv)
+        )
+        longexit = any(
+            k in values for k in (SIGNAL_LONGEXIT, SIGNAL_LONGEXIT_INV, SIGNAL_LONGEXIT_ANY)
+        )
+        shortexit = any(
+            k in values for k in (SIGNAL_SHORTEXIT, SIGNAL_SHORTEXIT_INV, SIGNAL_SHORTEXIT_ANY)
+        )
+        none = np.zeros(ncols, dtype=bool)
+        l_rev = none if longexit else s_enter
+        s_rev = none if shortexit else l_enter
+        l_leave = (
+            none
+            if longexit
+            else (
+                reduce(SIGNAL_LONG, neg)
+                | reduce(SIGNAL_LONG_INV, pos)
+                | reduce(SIGNAL_LONG_ANY, anyv)
+            )
+        )
+        s_leave = (
+            none
+            if shortexit
+            else (
+                reduce(SIGNAL_SHORT, pos)
+                | reduce(SIGNAL_SHORT_INV, neg)
+                | reduce(SIGNAL_SHORT_ANY, anyv)
+            )
+        )
+        return ls_long, ls_short, l_enter, s_enter, l_exit, s_exit, l_rev, s_rev, l_leave, s_leave
+
+    def _decide(self, flags, units):
+        """Return the orders of a bar for positions of ``units`` stakes.
+
+        Returns:
+            tuple: ``(close, target)`` with the columns closing their position
+            and the position (in stakes) once all the orders are executed.
+        """
+        ls_long, ls_short, l_enter, s_enter, l_exit, s_exit, l_rev, s_rev, l_leave, s_leave = flags
+        accumulate = self.p._accumulate
+        flat, islong, isshort = units == 0, units > 0, units < 0
+
+        target = units.copy()
+        buy = flat & (ls_long | l_enter)
+        target[buy] = 1
+        target[flat & ~buy & (ls_short | s_enter)] = -1
+
+        # Long: close, then reverse and/or accumulate
+        closelong = islong & (ls_short | l_exit | l_rev | l_leave)
+        target[closelong] = 0
+        target[islong & (ls_short | l_rev)] -= 1
+        if accumulate:
+            target[islong & (ls_long | l_enter)] += 1
+
+        closeshort = isshort & (ls_long | s_exit | s_rev | s_leave)
+        target[closeshort] = 0
+        target[isshort & (ls_long | s_rev)] += 1
+        if accumulate:
+            target[isshort & (ls_short | s_enter)] -= 1
+
+        return closelong | closeshort, target
+
+    def _simulate(self):
+        data = self._dtarget
+        size = data.buflen()
+        opens = vectorops.as_ndarray(data.open.array, end=size)
+        closes = vectorops.as_ndarray(data.close.array, end=size)
+
+        values, params, minperiod = self._columns(size)
+        ncols = len(params)
+
+        comminfo = self.broker.getcommissioninfo(data)
+        mult = comminfo.p.mult
+        stake = getattr(self.getsizer().p, "stake", 1)
+        cash = self.broker.startingcash
+
+        units = np.zeros(ncols)  # position in stakes
+        orders = None  # (close, target) decided on the previous bar
+        value = np.full(ncols, float(cash))
+        peak = value.copy()
+        maxdd = np.zeros(ncols)
+        entry = np.zeros(ncols)  # average price of the open trade
+        tradecomm = np.zeros(ncols)  # commission paid by the open trade
+        trades = np.zeros(ncols, dtype=int)
+        won = np.zeros(ncols, dtype=int)
+
+        for t in range(size):
+            if t:
+                value += units * stake * (opens[t] - closes[t - 1]) * mult
+
+            if orders is not None:
+                close, target = orders
+                price = opens[t]
+                # A closed position is reopened from 0 (a new trade)
+                held = np.where(close, 0.0, units)
+                opened = target - held
+
+                closecomm = comminfo.getcommission(np.where(close, units, 0.0) * stake, price)
+                opencomm = comminfo.getcommission(opened * stake, price)
+                value -= closecomm + opencomm
+
+                pnlcomm = units * stake * (price - entry) * mult - tradecomm - closecomm
+                trades += close
+                won += close & (pnlcomm >= 0.0)
+
+                # Adding to a trade averages its price, reducing keeps it
+                adding = (opened != 0) & (np.sign(opened) == np.sign(target))
+                total = np.where(adding, target, 1.0)
+                entry = np.where(adding, (held * entry + opened * price) / total, entry)
+                tradecomm = np.where(close, 0.0, tradecomm) + opencomm
+                tradecomm[target == 0] = 0.0
+                units = target
+                orders = None
+
+            value += units * stake * (closes[t] - opens[t]) * mult
+            np.maximum(peak, value, out=peak)
+            np.maximum(maxdd, (peak - value) / peak * 100.0, out=maxdd)
+
+            if t + 1 < size:  # orders of the last bar are never executed
+                active = minperiod <= t + 1
+                if active.any():
+                    close, target = self._decide(self._flags(values, t, ncols), units)
+                    orders = (close & active, np.where(active, target, units))
+
+        return SignalBatchResults(
+            params,
+            value=value,
+            pnl=value - cash,
+            rtot=np.log(value / cash),
+            trades=trades,
+            won=won,
+            lost=trades - won,
+            maxdrawdown=maxdd,
+        )
@@ -17,7 +17,14 @@ Example:
 # The modules below should/must define __all__ with the objects wishes
 # or prepend an "_" (underscore) to private classes/variables
 
-from .btapistore import BtApiMissingDependencyError as BtApiMissingDependencyError
-from .btapistore import BtApiProviderNotImplementedError as BtApiProviderNotImplementedError
-from .btapistore import BtApiStore as BtApiStore
-from .vchartfile import VChartFile as VChartFile
+from ..utils.lazyimport import lazyexports as _lazyexports
+
+# The names exported by each module, imported on first use of one of them
+_EXPORTS = {
+    "btapistore": ("BtApiMissingDependencyError", "BtApiProviderNotImplementedError", "BtApiStore"),
+    "vchartfile": ("VChartFile",),
+}
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
+
+__getattr__, __dir__ = _lazyexports(__name__, _EXPORTS)
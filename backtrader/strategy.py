@@ -921,6 +921,87 @@ class Strategy(StrategyBase):
                     # Attribute access/typecheck failed; skip this attribute.
                     pass
 
+        from .linebuffer import LinesOperation
+
+        if LinesOperation._fuse:
+            self._fuse_lineactions(all_indicators, _feed_of)
+
+    def _fuse_lineactions(self, indicators, feed_of):
+        """Compile the operation trees held by the strategy (see ``linefusion``).
+
+        Every ``LinesOperation`` stored as a strategy attribute is the root of
+        a tree which is replaced by a single fused evaluator. Intermediate
+        nodes which are not strategy attributes themselves are no longer
+        advanced by the strategy. Trees reading lines which do not advance
+        with the feed of the root keep their regular evaluation.
+
+        Args:
+            indicators: All the indicators of the strategy (nested included).
+            feed_of: Callable resolving a line object to the feed it follows.
+        """
+        from .linebuffer import LinesOperation
+        from .linefusion import fuse
+
+        roots = []
+        for attr_name, value in object.__getattribute__(self, "__dict__").items():
+            if attr_name.startswith("_"):
+                continue
+            if isinstance(value, dict):
+                values = value.values()
+            elif isinstance(value, (list, tuple)):
+                values = value
+            else:
+                values = (value,)
+            roots.extend(v for v in values if type(v) is LinesOperation)
+
+        if not roots:
+            return
+
+        # Lines advancing in step with each feed: its own and its indicators'
+        clock_lines = collections.defaultdict(set)
+        for data in self.datas:
+            clock_lines[id(data)].update(id(line) for line in data.lines)
+        for ind in indicators:
+            idatas = getattr(ind, "datas", None)
+            feed = feed_of(idatas[0]) if idatas else None
+            if feed is None:
+                continue
+            clock_lines[id(feed)].update(id(line) for line in ind.lines)
+
+        absorbed = set()
+        fused_roots = set()
+        for root in roots:
+            if id(root) in fused_roots:
+                continue
+            feed = feed_of(root)
+            if feed is None:
+                continue
+            fused = fuse(root, clock_lines[id(feed)])
+            if fused is None:
+                continue
+            root._fused = fused
+            fused_roots.add(id(root))
+            absorbed.update(id(node) for node in fused.nodes)
+
+        absorbed -= fused_roots
+        if absorbed:
+            cache = tuple(
+                (lineaction, clock)
+                for lineaction, clock in self._get_strategy_next_lineactions()
+                if id(lineaction) not in absorbed
+            )
+            object.__setattr__(self, "_strategy_next_lineactions_cache", cache)
+
+    def _once(self, start=None, end=None):
+        """Run the runonce calculations, then the fused strategy operations."""
+        super()._once(start, end)
+
+        size = self._clock.buflen()
+        for lineaction in self._get_strategy_lineactions():
+            fused = getattr(lineaction, "_fused", None)
+            if fused is not None and not fused.once(size):
+                logger.debug("Fused once unavailable for %s", type(lineaction).__name__)
+
     def _addwriter(self, writer):
         """Add a writer to the strategy.
 
@@ -8,6 +8,7 @@ Exports:
     AutoDict, AutoDictList, AutoOrderedDict, DotDict: Dictionary utilities.
     OrderedDict: Ordered dictionary from collections.
     num2date, date2num, num2dt, num2time, time2num: Date/time conversions.
+    num2date_array, date2num_array: Vectorized date/time conversions.
     tzparse, Localizer, TIME_MAX: Timezone utilities.
 
 Example:
@@ -27,7 +28,9 @@ from .dateintern import UTC as UTC
 from .dateintern import Localizer as Localizer
 from .dateintern import TZLocal as TZLocal
 from .dateintern import date2num as date2num
+from .dateintern import date2num_array as date2num_array
 from .dateintern import num2date as num2date
+from .dateintern import num2date_array as num2date_array
 from .dateintern import num2dt as num2dt
 from .dateintern import num2time as num2time
 from .dateintern import time2num as time2num
@@ -48,7 +51,9 @@ __all__ = [
     "Localizer",
     "TZLocal",
     "date2num",
+    "date2num_array",
     "num2date",
+    "num2date_array",
     "num2dt",
     "num2time",
     "time2num",
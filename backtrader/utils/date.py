@@ -8,6 +8,7 @@ provides timezone handling utilities.
 Exports:
     date2num: Convert datetime to internal float representation.
     num2date: Convert internal float to datetime.
+    date2num_array/num2date_array: Vectorized date2num/num2date.
     num2dt: Alias for num2date.
     time2num: Convert time to internal float representation.
     num2time: Convert internal float to time.
@@ -39,10 +40,12 @@ from .dateintern import (
     Localizer,
     TZLocal,
     date2num,
+    date2num_array,
     datetime2str,
     datetime2timestamp,
     get_last_timeframe_timestamp,
     num2date,
+    num2date_array,
     num2dt,
     num2time,
     str2datetime,
@@ -55,6 +58,8 @@ __all__ = (
     "num2date",
     "num2dt",
     "date2num",
+    "num2date_array",
+    "date2num_array",
     "time2num",
     "num2time",
     "get_last_timeframe_timestamp",
@@ -16,6 +16,9 @@ Functions:
     num2dt: Convert numeric date to date.
     num2time: Convert numeric date to time.
     date2num: Convert datetime to numeric format.
+    ordinal2num: Convert arrays of day ordinals and times to numeric format.
+    date2num_array: Convert datetime64 arrays to numeric format.
+    num2date_array: Convert numeric date arrays to datetime64.
     time2num: Convert time to numeric format.
 
 Constants:
@@ -30,6 +33,7 @@ import math
 import time as _time
 from functools import lru_cache
 
+import numpy as np
 import pytz
 
 from .py3 import string_types
@@ -491,6 +495,119 @@ def date2num(dt, tz=None):
     return base
 
 
+def ordinal2num(ordinals, microseconds):
+    """Vectorized ``date2num`` of naive datetimes given by their parts.
+
+    Args:
+        ordinals: Proleptic Gregorian ordinals of the dates (``toordinal``).
+        microseconds: Microseconds elapsed since midnight on each date.
+
+    Returns:
+        numpy.ndarray: float64 values, bit-identical to those of ``date2num``.
+    """
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    microseconds = np.asarray(microseconds, dtype=np.int64)
+    times, inverse = np.unique(microseconds, return_inverse=True)
+
+    def terms(usecs):
+        seconds, usec = divmod(int(usecs), 1000000)
+        minutes, second = divmod(seconds, 60)
+        hour, minute = divmod(minutes, 60)
+        return (
+            hour / HOURS_PER_DAY,
+            minute / MINUTES_PER_DAY,
+            second / SECONDS_PER_DAY,
+            usec / MUSECONDS_PER_DAY,
+        )
+
+    fractions = np.array([math.fsum(terms(usecs)) for usecs in times.tolist()], dtype=np.float64)
+    fraction = fractions[inverse.ravel()]
+    base = ordinals.astype(np.float64)
+    result = base + fraction
+
+    # date2num rounds the exact sum of the terms once (fsum). Adding the
+    # already rounded fraction rounds twice, which only matters when the
+    # error of the addition is (nearly) half an ulp: redo those with fsum
+    back = result - base
+    error = (base - (result - back)) + (fraction - back)
+    risky = np.abs(error) >= np.spacing(result) / 2.0 - 2.0**-52
+    risky |= np.frexp(result)[0] == 0.5
+    for idx in np.flatnonzero(risky).tolist():
+        result[idx] = math.fsum((float(ordinals[idx]),) + terms(microseconds[idx]))
+    return result
+
+
+# datetime64 counts from the epoch, date2num from 0001-01-01 (ordinal 1)
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+MAX_ORDINAL = datetime.date.max.toordinal()
+MUSECONDS_PER_DAY_INT = 86400 * 1000000
+
+
+def date2num_array(values):
+    """Vectorized ``date2num`` of naive (or UTC) datetimes.
+
+    Args:
+        values: ``datetime64`` array of any unit, or anything numpy converts
+            to one (e.g. a sequence of naive ``datetime`` objects).
+
+    Returns:
+        numpy.ndarray: float64 values, bit-identical to those of ``date2num``
+        with anything below the microsecond dropped. ``NaT`` gives ``NaN``.
+
+    Raises:
+        ValueError: if a date is out of the range of ``datetime``.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind != "M":
+        values = values.astype("datetime64[us]")
+    nat = np.isnat(values)
+    usecs = values.astype("datetime64[us]").astype(np.int64)
+    usecs[nat] = 0
+    ordinals, usecs = np.divmod(usecs, MUSECONDS_PER_DAY_INT)
+    ordinals += EPOCH_ORDINAL
+    if ordinals.size and not (ordinals.min() >= 1 and ordinals.max() <= MAX_ORDINAL):
+        raise ValueError("datetime64 values out of the range of datetime")
+
+    result = ordinal2num(ordinals, usecs).reshape(values.shape)
+    result[nat] = np.nan
+    return result
+
+
+def num2date_array(values):
+    """Vectorized ``num2date`` (naive, no timezone).
+
+    Args:
+        values: float days as returned by ``date2num``.
+
+    Returns:
+        numpy.ndarray: ``datetime64[us]`` values equal to those of
+        ``num2date``. ``tolist()`` gives the ``datetime`` objects.
+    """
+    values = np.array(values, dtype=np.float64)
+    shape = values.shape
+    values = values.ravel()
+    # num2date maps invalid values to the epoch and raises out of range
+    invalid = ~(values > 0.0)
+    values[invalid] = EPOCH_ORDINAL
+    outside = (values < 1.0) | (values >= MAX_ORDINAL + 1)
+    for value in values[outside].tolist():
+        num2date(value)
+
+    ordinals = values.astype(np.int64)
+    remainder = values - ordinals
+    hour, remainder = np.divmod(HOURS_PER_DAY * remainder, 1.0)
+    minute, remainder = np.divmod(MINUTES_PER_HOUR * remainder, 1.0)
+    second, remainder = np.divmod(SECONDS_PER_MINUTE * remainder, 1.0)
+    usecs = (MUSECONDS_PER_SECOND * remainder).astype(np.int64)
+    usecs[usecs < 10] = 0
+    # Close to the next second: rounded up to it
+    usecs[usecs > 999990] = 1000000
+
+    seconds = (hour.astype(np.int64) * 60 + minute.astype(np.int64)) * 60 + second.astype(np.int64)
+    usecs += (ordinals - EPOCH_ORDINAL) * MUSECONDS_PER_DAY_INT + seconds * 1000000
+    return usecs.view("datetime64[us]").reshape(shape)
+
+
 # Convert time to number
 
 
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+"""Feed Cache Module - Preloaded data feed lines kept on disk.
+
+Parsing a large CSV file (or resampling its bars) takes the same time on
+every run although the result does not change until the source does. A
+``FeedCache`` keeps the lines of a preloaded data feed in a directory: one
+``.npy`` file per line and a ``meta.json`` file describing the feed. The
+next ``preload`` of the same feed memory-maps the files instead of loading
+the bars again.
+
+Entries are named after a SHA-256 digest of the description of the feed
+(see ``backtrader.utils.fingerprint``): its class, its parameters, its filters (for example a resampler) and its
+source, which is the path, size and modification time of a file (or its
+contents, see ``hashfiles``), the contents of a DataFrame or of NumPy
+column arrays, or the description of the data feed a clone copies. Any
+change gives a new entry: stale entries are never used (but are kept
+until ``clear`` removes them).
+
+Classes:
+    FeedCache: Directory of cached data feed lines.
+
+Note:
+    Feeds whose description cannot be reproduced by a later run, like a
+    lambda used as a filter or an open file as ``dataname``, are not
+    cached.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from ..version import __version__
+from . import fingerprint
+from .log_message import get_logger
+
+__all__ = ["FeedCache"]
+
+logger = get_logger(__name__)
+
+# Layout of the entries, part of the description of every feed
+FORMAT = 1
+
+
+class FeedCache:
+    """Directory of cached data feed lines.
+
+    A data feed uses it during ``preload`` when given as its ``cache``
+    parameter (or the ``feedcache`` parameter of ``Cerebro``), either as a
+    ``FeedCache`` or as the path of the directory.
+
+    Args:
+        path: Directory of the entries, created when first needed.
+        hashfiles: Identify files by the digest of their contents instead
+          of their size and modification time: slower, but the entries
+          survive a new checkout or copy of unchanged files.
+    """
+
+    def __init__(self, path, hashfiles=False):
+        self.path = os.fspath(path)
+        self.hashfiles = hashfiles
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.path!r}, hashfiles={self.hashfiles!r})"
+
+    def key(self, data):
+        """Returns the key of the entry of the started feed ``data``.
+
+        Returns:
+            tuple: ``(digest, description)`` or ``None`` if ``data`` cannot
+            be cached.
+        """
+        try:
+            description = fingerprint.describefeed(data, self.hashfiles)
+        except fingerprint.Undescribable as e:
+            logger.debug("Data feed %s not cached: %s", data._name, e)
+            return None
+
+        description = {"format": FORMAT, "version": __version__, "feed": description}
+        return fingerprint.digest(fingerprint.dumps(description).encode()), description
+
+    def load(self, data, key):
+        """Fills the empty lines of ``data`` from the entry ``key``.
+
+        The values are memory-mapped copy-on-write: the files are never
+        modified by changes to the lines.
+
+        Returns:
+            bool: ``False`` if there is no (valid) entry for ``key``.
+        """
+        digest, description = key
+        folder = os.path.join(self.path, digest)
+        if not os.path.isdir(folder):
+            return False
+        try:
+            with open(os.path.join(folder, "meta.json")) as f:
+                meta = json.load(f)
+            if fingerprint.dumps(meta.get("key")) != fingerprint.dumps(description):
+                return False
+
+            size = meta["size"]
+            mmap_mode = "c" if size else None  # empty files cannot be mapped
+            names = [f"{i}.npy" for i in range(len(data.lines))]
+            if meta["nsaxis"]:
+                names.append("nsaxis.npy")
+            arrays = [np.load(os.path.join(folder, name), mmap_mode=mmap_mode) for name in names]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Unusable feed cache entry %s: %s", folder, e)
+            return False
+
+        if any(len(values) != size for values in arrays):
+            logger.warning("Unusable feed cache entry %s: wrong sizes", folder)
+            return False
+
+        for line, values in zip(data.lines, arrays):
+            line.forwardvalues(values, stored=True)
+        if meta["nsaxis"]:
+            data.lines.datetime._nsaxis = arrays[-1]
+        return True
+
+    def save(self, data, key):
+        """Stores the lines of the preloaded ``data`` as the entry ``key``.
+
+        Errors are logged and the feed is simply left out of the cache.
+
+        Returns:
+            bool: ``True`` if the entry was written.
+        """
+        digest, description = key
+        folder = os.path.join(self.path, digest)
+        size = data.buflen()
+        arrays = [np.asarray(line.array, dtype=np.float64) for line in data.lines]
+        if any(len(values) != size for values in arrays):
+            return False
+        nsaxis = data.lines.datetime._nsaxis
+        meta = {"key": description, "size": size, "nsaxis": nsaxis is not None}
+
+        tmpdir = None
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            # Written aside and renamed: an entry is complete or not there
+            tmpdir = tempfile.mkdtemp(prefix=f".{digest}.", dir=self.path)
+            for i, values in enumerate(arrays):
+                np.save(os.path.join(tmpdir, f"{i}.npy"), values)
+            if nsaxis is not None:
+                np.save(os.path.join(tmpdir, "nsaxis.npy"), np.asarray(nsaxis, dtype=np.int64))
+            with open(os.path.join(tmpdir, "meta.json"), "w") as f:
+                json.dump(meta, f)
+            os.rename(tmpdir, folder)
+        except OSError as e:
+            if not os.path.isdir(folder):  # else saved by someone else
+                logger.warning("Data feed %s not cached in %s: %s", data._name, self.path, e)
+            if tmpdir is not None:
+                shutil.rmtree(tmpdir, ignore_errors=True)
+            return False
+        return True
+
+    def clear(self):
+        """Removes all the entries (and those left unfinished)."""
+        if not os.path.isdir(self.path):
+            return
+        for name in os.listdir(self.path):
+            digest = name.lstrip(".")[:64]
+            if len(digest) == 64 and all(c in "0123456789abcdef" for c in digest):
+                shutil.rmtree(os.path.join(self.path, name), ignore_errors=True)
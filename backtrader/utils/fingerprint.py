@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+"""Fingerprint Module - Reproducible descriptions of run inputs.
+
+Results kept across runs (a resumable optimization sweep, the lines of a
+preloaded data feed) are only valid for the inputs which produced them.
+The functions of this module turn those inputs into JSON values which a
+later run reproduces exactly if (and only if) the inputs are the same, and
+hash them into a short digest.
+
+Values are described by contents: numbers and strings as they are,
+containers element by element, classes and functions by qualified name,
+objects with params (commission schemes, brokers, ...) by class and params,
+files by path, size and modification time (or contents), arrays and
+DataFrames by a SHA-256 digest of their contents.
+
+Classes:
+    Undescribable: A value has no description a later run would reproduce.
+
+Functions:
+    describe: JSON description of a value.
+    describefeed: JSON description of the lines a data feed loads.
+    dumps: Canonical JSON text of a description.
+    digest: SHA-256 hex digest of some buffers.
+
+Note:
+    Lambdas, locally defined classes and objects whose repr holds their
+    address (or open files as ``dataname``) raise ``Undescribable``.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+
+import numpy as np
+
+__all__ = [
+    "Undescribable",
+    "qualname",
+    "describe",
+    "describearray",
+    "describeframe",
+    "describefile",
+    "describesource",
+    "describefilter",
+    "describefeed",
+    "dumps",
+    "digest",
+]
+
+# Feed parameters which do not change the values of the lines
+FEEDSKIPPARAMS = ("dataname", "name", "cache")
+
+
+class Undescribable(Exception):
+    """The description of a value would not be the same in a later run."""
+
+
+def qualname(obj):
+    """Importable name of the class or function ``obj``."""
+    name = getattr(obj, "__qualname__", None)
+    if name is None or "<" in name:  # lambdas, locally defined
+        raise Undescribable(repr(obj))
+    return f"{obj.__module__}.{name}"
+
+
+def describe(value):
+    """JSON value standing for ``value``."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [describe(x) for x in value]
+    if isinstance(value, dict):
+        items = ([describe(k), describe(v)] for k, v in value.items())
+        return {"dict": sorted(items, key=dumps)}
+    if isinstance(value, type) or (callable(value) and hasattr(value, "__qualname__")):
+        return {"object": qualname(value)}
+    if isinstance(value, (datetime.date, datetime.time, datetime.timedelta)):
+        return {"repr": repr(value)}
+    params = getattr(value, "p", None)
+    if hasattr(params, "_getkwargs"):  # commission schemes, brokers, ...
+        return {"object": qualname(type(value)), "params": describe(dict(params._getkwargs()))}
+
+    text = repr(value)
+    if " at 0x" in text:  # identity, not contents
+        raise Undescribable(text)
+    return {"type": qualname(type(value)), "repr": text}
+
+
+def dumps(description):
+    """Canonical JSON text of ``description``."""
+    return json.dumps(description, sort_keys=True)
+
+
+def digest(*buffers):
+    """SHA-256 hex digest of ``buffers`` (bytes-like objects)."""
+    sha = hashlib.sha256()
+    for buffer in buffers:
+        sha.update(buffer)
+    return sha.hexdigest()
+
+
+def describearray(values):
+    """Description of a NumPy array by dtype, shape and contents."""
+    values = np.ascontiguousarray(values)
+    if values.dtype.hasobject:
+        raise Undescribable("object array")
+    return {"dtype": str(values.dtype.descr), "shape": values.shape, "sha256": digest(values)}
+
+
+def describeframe(frame):
+    """Description of a pandas DataFrame by columns, dtypes and contents."""
+    import pandas as pd
+
+    try:
+        hashes = pd.util.hash_pandas_object(frame, index=True).to_numpy()
+    except TypeError as e:  # unhashable cells
+        raise Undescribable(str(e)) from e
+    return {
+        "columns": describe([str(column) for column in frame.columns]),
+        "dtypes": [str(dtype) for dtype in frame.dtypes],
+        "index": [str(frame.index.dtype), str(frame.index.name)],
+        "sha256": digest(hashes),
+    }
+
+
+def describefile(path, hashfiles=False):
+    """Description of a file by path, size and mtime (or its contents)."""
+    path = os.path.abspath(os.fspath(path))
+    try:
+        if not hashfiles:
+            stat = os.stat(path)
+            return {"path": path, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha.update(chunk)
+    except OSError as e:
+        raise Undescribable(str(e)) from e
+    return {"path": path, "sha256": sha.hexdigest()}
+
+
+def describesource(dataname, hashfiles=False):
+    """Description of the ``dataname`` of a data feed."""
+    if isinstance(dataname, (str, os.PathLike)):
+        return {"file": describefile(dataname, hashfiles)}
+    if isinstance(dataname, np.ndarray):
+        return {"array": describearray(dataname)}
+    if type(dataname).__module__.startswith("pandas") and hasattr(dataname, "columns"):
+        return {"frame": describeframe(dataname)}
+    if hasattr(dataname, "keys") and not hasattr(dataname, "readline"):
+        # Mapping of column arrays: dict, NpzFile
+        columns = {str(name): describearray(dataname[name]) for name in dataname.keys()}
+        return {"columns": sorted(columns.items())}
+    raise Undescribable(repr(dataname))
+
+
+def describefilter(ffilter, args, kwargs):
+    """Description of a filter added with ``addfilter``."""
+    if hasattr(ffilter, "ffilter"):  # SimpleFilterWrapper: what it wraps
+        description = {"filter": {"object": qualname(type(ffilter))}}
+        description["wrapped"] = describefilter(ffilter.ffilter, (), {})
+    elif isinstance(ffilter, type) or not hasattr(ffilter, "p"):
+        description = {"filter": describe(ffilter)}
+    else:  # instance: its class and parameters
+        description = {"filter": {"object": qualname(type(ffilter))}}
+        description["params"] = describe(dict(ffilter.p._getkwargs()))
+    description["args"] = describe(args)
+    description["kwargs"] = describe(kwargs)
+    return description
+
+
+def describefeed(data, hashfiles=False):
+    """JSON description of the lines ``data`` loads.
+
+    Covers the class of the feed, its params, filters and calendar and its
+    source (or, for a clone, the description of the feed it copies).
+    """
+    params = dict(data.p._getkwargs())
+    description = {
+        "feed": qualname(type(data)),
+        "lines": list(data.getlinealiases()),
+        "params": describe({k: v for k, v in params.items() if k not in FEEDSKIPPARAMS}),
+        "filters": [describefilter(*f) for f in data._filters],
+        # Not started yet: the parameter (the environment calendar is not known)
+        "calendar": describe(getattr(data, "_calendar", data.p.calendar)),
+    }
+    if data._clone:
+        description["clone"] = describefeed(data.data, hashfiles)
+    else:
+        description["source"] = describesource(params["dataname"], hashfiles)
+    return description
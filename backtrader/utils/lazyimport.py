@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""Lazy Import Module - Package exports imported on first use.
+
+Packages like the indicator catalog or the data feeds export many classes
+from many submodules, most of which a given program never uses. Importing
+all of them makes every ``import backtrader`` (and every worker process)
+pay for the whole catalog.
+
+``lazyexports`` builds the module level ``__getattr__`` and ``__dir__``
+(PEP 562) of such a package from a table of the names each submodule
+exports: a submodule is imported the first time one of its names is looked
+up, and the name is then kept in the package namespace like an eager
+import would have done.
+
+Functions:
+    lazyexports: ``__getattr__`` and ``__dir__`` of a lazily importing package.
+
+Example:
+    >>> _EXPORTS = {"sma": ("MovingAverageSimple", "SMA")}
+    >>> __getattr__, __dir__ = lazyexports(__name__, _EXPORTS)
+"""
+
+import sys
+import warnings
+from importlib import import_module
+
+__all__ = ["lazyexports"]
+
+
+def lazyexports(package, exports, deprecated=None):
+    """Returns the module ``__getattr__`` and ``__dir__`` of ``package``.
+
+    Args:
+        package: Name of the package (its ``__name__``).
+        exports: ``{submodule: names}`` with the names the package exports
+          from each of its submodules. The submodules themselves can also
+          be looked up as attributes of the package.
+        deprecated: Optional ``{submodule: names}`` with names the package
+          used to export (by accident, through star imports) which are
+          still found in the submodules. Each lookup issues a
+          ``DeprecationWarning`` and they are not listed by ``__dir__``.
+
+    Returns:
+        tuple: ``(__getattr__, __dir__)`` to be set in the package.
+    """
+    owners = {name: module for module, names in exports.items() for name in names}
+    legacy = {name: module for module, names in (deprecated or {}).items() for name in names}
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name):
+        module = owners.get(name)
+        if module is not None:
+            value = getattr(import_module(f"{package}.{module}"), name)
+        elif name in legacy:
+            module = f"{package}.{legacy[name]}"
+            warnings.warn(
+                f"{package}.{name} is deprecated, import it from where it is defined"
+                f" (found through {module})",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            return getattr(import_module(module), name)  # not kept: warn every time
+        elif name in exports:
+            value = import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        namespace[name] = value  # later lookups do not get here
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(owners))
+
+    return __getattr__, __dir__
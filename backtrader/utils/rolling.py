@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+"""Rolling Module - Window statistics updated one value at a time.
+
+The ``next()`` implementations of window indicators recalculate the whole
+window on every bar: O(period) work per update. The classes of this module
+keep the last ``period`` values of a line together with running statistics,
+so that each new value costs O(1) (amortized). They are used by indicators
+when the incremental ``next()`` backend is active
+(``Cerebro(incremental=True)``).
+
+Classes:
+    RollingWindow: Base class holding the last ``period`` values.
+    RollingSum: Running sum.
+    RollingMoments: Running mean and variance (Welford).
+    RollingExtreme: Running maximum or minimum (monotonic deque).
+
+Note:
+    Values which are not finite (NaN, inf) are kept in the window but left
+    out of the running statistics: while ``nonfinite`` is not 0 the owner
+    has to calculate its result from ``window`` as the regular ``next()``
+    does.
+"""
+
+import collections
+import itertools
+import math
+
+__all__ = ["RollingWindow", "RollingSum", "RollingMoments", "RollingExtreme"]
+
+
+class RollingWindow:
+    """Last ``period`` values of a line and running statistics over them.
+
+    Subclasses implement ``resync`` (recalculate the statistics from the
+    window), ``_add`` (a value enters the window), ``_drop`` (the oldest
+    value leaves the window) and ``_undo`` (the newest value is removed).
+
+    Args:
+        period: Size of the window.
+        values: Initial values (only the last ``period`` are kept).
+    """
+
+    # Running statistics accumulate rounding errors: recalculate them from
+    # the window every ``period`` updates (amortized O(1))
+    drifts = True
+
+    def __init__(self, period, values=()):
+        self.period = period
+        self.window = collections.deque(values, maxlen=period)
+        self.pushed = len(self.window)  # number of values seen
+        self.nonfinite = 0
+        self._updates = 0
+        self.resync()
+
+    def push(self, value):
+        """Add ``value`` as the newest value, dropping the oldest one."""
+        window = self.window
+        if len(window) == self.period:
+            old = window[0]
+            if math.isfinite(old):
+                self._drop(old)
+            else:
+                self.nonfinite -= 1
+
+        self.pushed += 1
+        window.append(value)
+        if math.isfinite(value):
+            self._add(value)
+        else:
+            self.nonfinite += 1
+
+        self._tick()
+
+    def replace(self, value):
+        """Replace the newest value (a bar updated in place)."""
+        old = self.window.pop()
+        if math.isfinite(old):
+            self._undo(old)
+        else:
+            self.nonfinite -= 1
+
+        self.window.append(value)
+        if math.isfinite(value):
+            self._add(value)
+        else:
+            self.nonfinite += 1
+
+        self._tick()
+
+    def _tick(self):
+        if self.drifts:
+            self._updates += 1
+            if self._updates >= self.period:
+                self._updates = 0
+                self.resync()
+
+    def _finite(self):
+        finite = [value for value in self.window if math.isfinite(value)]
+        self.nonfinite = len(self.window) - len(finite)
+        return finite
+
+    def resync(self):
+        raise NotImplementedError
+
+    def _add(self, value):
+        raise NotImplementedError
+
+    def _drop(self, value):
+        raise NotImplementedError
+
+    def _undo(self, value):
+        self._drop(value)
+
+
+class RollingSum(RollingWindow):
+    """Running sum of the finite values of the window (``sum``)."""
+
+    @property
+    def value(self):
+        return self.sum
+
+    def resync(self):
+        self.sum = math.fsum(self._finite())
+
+    def _add(self, value):
+        self.sum += value
+
+    def _drop(self, value):
+        self.sum -= value
+
+
+class RollingMoments(RollingWindow):
+    """Running ``mean`` and ``variance`` of the finite values of the window.
+
+    Uses Welford's updates, which do not suffer from the cancellation of
+    ``mean(x * x) - mean(x) ** 2`` when the values are far from 0.
+    """
+
+    def resync(self):
+        finite = self._finite()
+        self.count = count = len(finite)
+        self.mean = mean = math.fsum(finite) / count if count else 0.0
+        self.m2 = math.fsum((value - mean) * (value - mean) for value in finite)
+
+    def _add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def _drop(self, value):
+        self.count -= 1
+        if not self.count:
+            self.mean = self.m2 = 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 -= delta * (value - self.mean)
+
+    def variance(self):
+        """Population variance (0.0 for an empty window)."""
+        return max(0.0, self.m2 / self.count) if self.count else 0.0
+
+    def meansq(self):
+        """Mean of the squared values."""
+        return self.variance() + self.mean * self.mean
+
+
+class RollingExtreme(RollingWindow):
+    """Running maximum (``func=max``) or minimum (``func=min``) (``value``).
+
+    A deque holds the window values which can still become the extreme,
+    so each value is added and removed once. Ties keep the oldest value, as
+    ``max``/``min`` return the first extreme of an iterable.
+
+    ``replace`` is O(1) (amortized) when the new value is at least as
+    extreme as the one it replaces, as the high (low) of a bar updated in
+    place only rises (falls). Otherwise the values which the replaced one
+    had removed from the deque are inserted again.
+    """
+
+    drifts = False  # comparisons only: nothing to recalculate
+
+    def __init__(self, period, values=(), func=max):
+        self.ismax = func is max
+        super().__init__(period, values)
+
+    @property
+    def value(self):
+        return self._queue[0][1] if self._queue else float("nan")
+
+    def resync(self):
+        self._queue = collections.deque()
+        first = self.pushed - len(self.window)
+        self.nonfinite = 0
+        for seq, value in enumerate(self.window, first):
+            if math.isfinite(value):
+                self._insert(seq, value)
+            else:
+                self.nonfinite += 1
+
+    def _insert(self, seq, value):
+        queue = self._queue
+        if self.ismax:
+            while queue and queue[-1][1] < value:
+                queue.pop()
+        else:
+            while queue and queue[-1][1] > value:
+                queue.pop()
+        queue.append((seq, value))
+
+    def _add(self, value):
+        self._insert(self.pushed - 1, value)
+
+    def _drop(self, value):
+        # Called before ``pushed`` counts the new value: the oldest value of
+        # the full window has sequence number pushed - period
+        queue = self._queue
+        if queue and queue[0][0] <= self.pushed - self.period:
+            queue.popleft()
+
+    def replace(self, value):
+        window = self.window
+        newest = self.pushed - 1
+        old, window[-1] = window[-1], value
+        queue = self._queue
+        if not math.isfinite(old):
+            self.nonfinite -= 1
+        else:
+            queue.pop()  # the newest value is always the last one of the deque
+            if not (value >= old if self.ismax else value <= old):  # NaN too
+                # Bring back the values after the last candidate, which the
+                # old value had removed and the new one may not
+                first = queue[-1][0] + 1 if queue else self.pushed - len(window)
+                evicted = list(itertools.islice(reversed(window), 1, 1 + newest - first))
+                for seq, evictee in enumerate(reversed(evicted), first):
+                    if math.isfinite(evictee):
+                        self._insert(seq, evictee)
+
+        if math.isfinite(value):
+            self._insert(newest, value)
+        else:
+            self.nonfinite += 1
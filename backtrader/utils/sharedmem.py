@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+"""Shared Memory Module - Preloaded line data shared across processes.
+
+During optimization ``Cerebro`` pickles itself to every worker process,
+including the values of every preloaded data feed. This module moves those
+values to a single ``multiprocessing.shared_memory`` block created by the
+main process: the lines then hold a ``SharedArray`` which pickles as the
+name of the block and the location of the values, and the workers attach
+to the block instead of receiving (and keeping) their own copy.
+
+Classes:
+    SharedArray: ``GrowableArray`` storage backed by a shared memory block.
+    SharedLinesStore: Owner of the block holding the values of data feeds.
+
+Note:
+    ``SharedArray`` is copy-on-write: the shared values are read-only and
+    the first modification of a line copies its values to private storage.
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .log_message import get_logger
+from .vectorops import GrowableArray
+
+__all__ = ["SharedArray", "SharedLinesStore"]
+
+logger = get_logger(__name__)
+
+# Blocks attached by this process (name -> SharedMemory), reused by the
+# SharedArray objects of every unpickled task
+_attached = {}
+
+
+def _attach(name):
+    """Return the ``SharedMemory`` block ``name``, attaching it once per process.
+
+    Pool workers share the resource tracker of the process which created
+    the block, so attaching does not change which process destroys it.
+    """
+    shm = _attached.get(name)
+    if shm is None:
+        shm = _attached[name] = shared_memory.SharedMemory(name=name)
+    return shm
+
+
+def _rebuild(name, offset, size):
+    return SharedArray(_attach(name), offset, size)
+
+
+class SharedArray(GrowableArray):
+    """``GrowableArray`` whose values live in a shared memory block.
+
+    The values are exposed through a read-only ndarray over the block, so
+    ``view``, indexing and the vectorized kernels work without copies.
+    Appending, assigning or deleting values first copies them to private
+    storage, leaving the block untouched.
+
+    Args:
+        shm: The ``SharedMemory`` block.
+        offset: Position (in values) of the first value in the block.
+        size: Number of values.
+    """
+
+    __slots__ = ("_shm", "_offset")
+
+    def __init__(self, shm, offset, size):
+        data = np.ndarray((size,), dtype=np.float64, buffer=shm.buf, offset=offset * 8)
+        data.flags.writeable = False
+        self._shm = shm
+        self._offset = offset
+        self._size = size
+        self._data = data
+
+    @property
+    def shared(self):
+        """True while the values are still read from the shared block."""
+        return self._shm is not None
+
+    def detach(self):
+        """Copy the values to private storage (no-op once detached)."""
+        if self._shm is not None:
+            self._data = np.array(self._data[: self._size], copy=True)
+            self._shm = None
+
+    def __reduce__(self):
+        if self._shm is not None:
+            return _rebuild, (self._shm.name, self._offset, self._size)
+        return GrowableArray, (self._data[: self._size].copy(),)
+
+    def _reserve(self, size):
+        if self._shm is not None:
+            data = np.empty(max(size, self._size * 2, self._MINCAPACITY))
+            data[: self._size] = self._data[: self._size]
+            self._data = data
+            self._shm = None
+        else:
+            super()._reserve(size)
+
+    def __setitem__(self, index, value):
+        self.detach()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self.detach()
+        super().__delitem__(index)
+
+    def pop(self, index=-1):
+        """Remove and return the value at ``index`` (default: the last one)."""
+        self.detach()
+        return super().pop(index)
+
+
+class SharedLinesStore:
+    """Shared memory block holding the values of preloaded data feeds.
+
+    ``share`` copies the values of every line of the feeds into a new block
+    and replaces the storage of the lines with ``SharedArray`` objects.
+    ``release`` gives the lines private storage again and destroys the block.
+    Only the process which created the store may release it.
+    """
+
+    def __init__(self):
+        self._shm = None
+        self._lines = []
+
+    def share(self, datas):
+        """Move the values of the lines of ``datas`` to a shared memory block.
+
+        Returns:
+            int: The number of bytes placed in shared memory (0 if nothing
+            was shared).
+        """
+        lines = [
+            line
+            for data in datas
+            for line in data.lines
+            if not getattr(line, "useislice", False) and len(line.array)
+        ]
+        size = sum(len(line.array) for line in lines)
+        if not size:
+            return 0
+
+        self._shm = shm = shared_memory.SharedMemory(create=True, size=size * 8)
+        values = np.ndarray((size,), dtype=np.float64, buffer=shm.buf)
+        offset = 0
+        for line in lines:
+            n = len(line.array)
+            values[offset : offset + n] = np.asarray(line.array, dtype=np.float64)
+            line.array = SharedArray(shm, offset, n)
+            offset += n
+        del values  # no exported buffer may outlive the block
+
+        self._lines = lines
+        logger.debug("Shared %d lines (%d bytes) in %s", len(lines), size * 8, shm.name)
+        return size * 8
+
+    def release(self):
+        """Give the shared lines private storage and destroy the block."""
+        if self._shm is None:
+            return
+
+        for line in self._lines:
+            if isinstance(line.array, SharedArray):
+                line.array.detach()
+        self._lines = []
+
+        shm, self._shm = self._shm, None
+        try:
+            shm.close()
+        except BufferError:
+            # A view is still alive somewhere: the mapping goes with the process
+            logger.debug("Shared block %s still in use", shm.name, exc_info=True)
+        shm.unlink()
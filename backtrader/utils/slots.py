@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""Slots Module - ``__slots__`` for dataclasses on every supported Python.
+
+``dataclass(slots=True)`` requires Python 3.10. The :func:`slotted`
+decorator does the same for the records created by the million (events,
+fills): the class is rebuilt with a ``__slots__`` holding its fields, so
+that instances have no per-instance ``__dict__``.
+
+Example:
+    Declaring a slotted record::
+
+        @slotted()
+        @dataclass
+        class Fill:
+            price: float
+            size: float = 0.0
+
+        assert not hasattr(Fill(1.0), "__dict__")
+"""
+
+import dataclasses
+
+__all__ = ["slotted"]
+
+
+def _slot_names(cls):
+    names = set()
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        names.update((slots,) if isinstance(slots, str) else slots)
+    return names
+
+
+def _rebind_class_cell(value, old, new):
+    # Methods calling super() without arguments close over ``__class__``
+    if isinstance(value, (classmethod, staticmethod)):
+        value = value.__func__
+    elif isinstance(value, property):
+        for func in (value.fget, value.fset, value.fdel):
+            _rebind_class_cell(func, old, new)
+        return
+
+    for cell in getattr(value, "__closure__", None) or ():
+        try:
+            if cell.cell_contents is old:
+                cell.cell_contents = new
+        except ValueError:  # empty cell
+            pass
+
+
+def slotted(*extra, dynamic=False):
+    """Rebuild a dataclass with ``__slots__`` for its fields.
+
+    Fields inherited from a slotted base class are not declared again, so
+    that a hierarchy of slotted dataclasses stores each field once.
+
+    Args:
+        *extra: Names of additional slots which are not dataclass fields
+            (attributes set after creation, unset until then).
+        dynamic: Whether to keep a ``__dict__`` slot for other attributes.
+            The dictionary is only allocated when such an attribute is set.
+    """
+
+    def wrap(cls):
+        if "__slots__" in cls.__dict__:
+            raise TypeError(f"{cls.__name__} already specifies __slots__")
+
+        inherited = _slot_names(cls)
+        names = []
+        for name in [field.name for field in dataclasses.fields(cls)] + list(extra):
+            if name not in inherited and name not in names:
+                names.append(name)
+        if dynamic and "__dict__" not in inherited:
+            names.append("__dict__")
+
+        cls_dict = dict(cls.__dict__)
+        cls_dict["__slots__"] = tuple(names)
+        for name in names:
+            cls_dict.pop(name, None)  # field defaults live in __init__
+        cls_dict.pop("__dict__", None)
+        cls_dict.pop("__weakref__", None)
+
+        new = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        new.__qualname__ = cls.__qualname__
+        for value in cls_dict.values():
+            _rebind_class_cell(value, cls, new)
+        return new
+
+    return wrap
@@ -0,0 +1,493 @@
+#!/usr/bin/env python
+"""Vector Operations Module - NumPy kernels and storage for line data.
+
+This module provides whole-array kernels used by indicators when the
+vectorized ``once()`` backend is active (``Cerebro(vectorize=True)``). The
+kernels operate on ``numpy.ndarray`` objects and are free of per-bar Python
+work. Window sums are bit-for-bit those of ``math.fsum`` and cost
+O(n log period) C-level operations, extremes cost O(n) and weighted windows
+(``rolling_dot``) or loop sums (``rolling_loopsum``) O(n * period), which is
+still far below O(n * period) interpreter steps.
+
+It also provides ``GrowableArray``, the contiguous storage used by
+``LineBuffer`` when ``Cerebro(numpystorage=True)`` is active.
+
+Classes:
+    GrowableArray: Preallocated, geometrically growing float64 storage.
+
+Functions:
+    as_ndarray: Zero-copy float64 view over a line's storage.
+    assign: Copy an ndarray into a line's storage in a single step.
+    rolling_sum: Sum of each trailing window, as ``math.fsum`` gives it.
+    rolling_loopsum: Sum of each trailing window, as a plain loop gives it.
+    rolling_max: Maximum of each trailing window.
+    rolling_min: Minimum of each trailing window.
+    rolling_dot: Weighted sum of each trailing window.
+    rolling_nancount: Number of NaN values in each trailing window.
+    linear_recurrence: ``y[i] = y[i - 1] * alpha1 + x[i] * alpha``.
+    merge_timelines: Union of several datetime arrays and who ticks when.
+
+Note:
+    Window kernels return ``len(x) - period + 1`` values: element ``k``
+    belongs to the window ending at index ``k + period - 1``.
+
+    ``rolling_sum`` and ``rolling_dot`` carry double-double (about 106
+    bits) partial sums and round them once. The rare windows whose exact sum
+    may round either way are summed again with ``math.fsum``, as
+    ``dateintern.ordinal2num`` does for its risky values.
+"""
+
+import array
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+__all__ = [
+    "GrowableArray",
+    "as_ndarray",
+    "assign",
+    "rolling_sum",
+    "rolling_loopsum",
+    "rolling_max",
+    "rolling_min",
+    "rolling_dot",
+    "rolling_nancount",
+    "linear_recurrence",
+    "merge_timelines",
+]
+
+# scipy.signal is imported on first use only: it is an expensive import and
+# the recurrence kernel has a pure Python fallback.
+_lfilter = None
+
+
+class GrowableArray:
+    """Contiguous float64 storage with the ``array.array`` interface.
+
+    Values live in a preallocated ``numpy.ndarray`` whose capacity doubles
+    when full, so appending is amortized O(1) and all the stored values are
+    always available as a zero-copy ndarray through ``view``. Integer
+    indexing returns Python floats and, as with ``array.array``, slicing
+    returns a copy (an ndarray).
+
+    Args:
+        values: Optional initial values.
+        capacity: Optional initial capacity.
+    """
+
+    __slots__ = ("_data", "_size")
+
+    _MINCAPACITY = 64
+
+    def __init__(self, values=(), capacity=0):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        self._size = len(values)
+        self._data = np.empty(max(capacity, self._size, self._MINCAPACITY))
+        self._data[: self._size] = values
+
+    @property
+    def view(self):
+        """ndarray view over the stored values (no copy)."""
+        return self._data[: self._size]
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None or np.dtype(dtype) == self._data.dtype:
+            return self._data[: self._size]
+        return self._data[: self._size].astype(dtype)
+
+    def __getstate__(self):
+        return self._data[: self._size].copy()
+
+    def __setstate__(self, state):
+        self._size = len(state)
+        self._data = np.empty(max(self._size, self._MINCAPACITY))
+        self._data[: self._size] = state
+
+    def _reserve(self, size):
+        capacity = len(self._data)
+        if size > capacity:
+            data = np.empty(max(size, capacity * 2))
+            data[: self._size] = self._data[: self._size]
+            self._data = data
+
+    def adopt(self, values):
+        """Use the float64 ndarray ``values`` as the storage (no copy).
+
+        The previous values are discarded and ``values`` must not be used
+        elsewhere, since later writes go to it.
+        """
+        self._data = values
+        self._size = len(values)
+
+    def append(self, value):
+        """Add ``value`` at the end of the storage."""
+        size = self._size
+        if size == len(self._data):
+            self._reserve(size + 1)
+        self._data[size] = value
+        self._size = size + 1
+
+    def extend(self, values):
+        """Add all ``values`` at the end of the storage."""
+        if not hasattr(values, "__len__"):
+            values = list(values)
+        values = np.asarray(values, dtype=np.float64).ravel()
+        size = self._size
+        self._reserve(size + len(values))
+        self._data[size : size + len(values)] = values
+        self._size = size + len(values)
+
+    def pop(self, index=-1):
+        """Remove and return the value at ``index`` (default: the last one)."""
+        if index not in (-1, self._size - 1):
+            value = self[index]
+            del self[index]
+            return value
+        if not self._size:
+            raise IndexError("pop from empty array")
+        self._size -= 1
+        return float(self._data[self._size])
+
+    def tolist(self):
+        """Return the stored values as a list of Python floats."""
+        return self._data[: self._size].tolist()
+
+    def _index(self, index):
+        size = self._size
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("array index out of range")
+        return index
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return iter(self._data[: self._size].tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._data[: self._size][index].copy()
+        return float(self._data[self._index(index)])
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step == 1 and len(value) != max(0, stop - start):
+                # Resizing slice assignment, as supported by array.array
+                tail = self._data[stop : self._size].copy()
+                self._size = start
+                self.extend(value)
+                self.extend(tail)
+                return
+            self._data[: self._size][index] = value
+        else:
+            self._data[self._index(index)] = value
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step == 1 and stop >= self._size:
+                self._size = min(self._size, start)  # tail deletion, no copy
+                return
+        else:
+            index = self._index(index)
+        kept = np.delete(self._data[: self._size], index)
+        self._size = len(kept)
+        self._data[: self._size] = kept
+
+    def __repr__(self):
+        return f"GrowableArray({self.tolist()!r})"
+
+
+def as_ndarray(buf, end=None):
+    """Return a float64 ndarray over ``buf`` without copying when possible.
+
+    ``array.array('d')`` storage (the default ``LineBuffer`` storage) is
+    exposed through the buffer protocol and ``GrowableArray`` storage through
+    its ``view``. Other iterables (deques, lists, ``PseudoArray``) are copied.
+
+    Note:
+        While a view over an ``array.array`` is alive, the array cannot be
+        resized. Callers must not keep views across ``forward``/``extend``.
+
+    Args:
+        buf: Line storage (``line.array``).
+        end: Optional length limit of the returned array.
+
+    Returns:
+        numpy.ndarray: 1-D float64 array.
+    """
+    if isinstance(buf, np.ndarray):
+        arr = buf
+    elif isinstance(buf, GrowableArray):
+        arr = buf.view
+    elif isinstance(buf, array.array) and buf.typecode == "d":
+        arr = np.frombuffer(buf, dtype=np.float64) if len(buf) else np.empty(0)
+    else:
+        arr = np.asarray(list(buf), dtype=np.float64)
+
+    if end is not None:
+        arr = arr[:end]
+    return arr
+
+
+def assign(buf, start, values):
+    """Store ``values`` into ``buf[start:start + len(values)]``.
+
+    Args:
+        buf: Line storage (``line.array``) which must already be long enough.
+        start: First index to be written.
+        values: 1-D ndarray with the values.
+    """
+    n = len(values)
+    if not n:
+        return
+    if isinstance(buf, array.array) and buf.typecode == "d":
+        view = np.frombuffer(buf, dtype=np.float64)
+        view[start : start + n] = values
+        del view  # release the buffer export: the array must stay resizable
+    elif isinstance(buf, GrowableArray):
+        buf.view[start : start + n] = values
+    elif isinstance(buf, np.ndarray):
+        buf[start : start + n] = values
+    else:
+        buf[start : start + n] = values.tolist()
+
+
+def _two_sum(a, b):
+    # Rounded sum and its exact rounding error (Knuth)
+    s = a + b
+    bb = s - a
+    return s, (a - (s - bb)) + (b - bb)
+
+
+def _dd_add(a, b):
+    # Add two (hi, lo, magnitude) double-double partial sums. ``hi + lo``
+    # carries about 106 bits and the magnitude (sum of the absolute values
+    # of the terms) bounds the error of each addition.
+    s, e = _two_sum(a[0], b[0])
+    e += a[1] + b[1]
+    hi = s + e
+    return hi, e - (hi - s), a[2] + b[2]
+
+
+def _round_exact(partial, depth, windows, fsum):
+    """Round the double-double window sums ``partial`` like ``math.fsum``.
+
+    ``hi`` is the correctly rounded sum unless the exact value may lie on
+    the other side of a rounding boundary, given the error bound of
+    ``depth`` double-double additions. Those few windows (and the ones whose
+    ``hi`` is a power of two, where the spacing changes) are summed again
+    with ``fsum(windows[k])``.
+    """
+    hi, lo, mag = partial
+    tol = mag * (depth * 2.0**-100)
+    with np.errstate(invalid="ignore"):
+        risky = np.abs(lo) + tol >= np.abs(np.spacing(hi)) / 2
+        risky |= np.frexp(hi)[0] == 0.5
+        risky &= np.isfinite(hi)  # overflows stay as summed
+    for k in np.flatnonzero(risky).tolist():
+        hi[k] = fsum(windows[k])
+    return hi
+
+
+def _nonfinite_windows(x, period, out, func):
+    # Sum the windows holding NaN/inf directly (``func`` of the windows)
+    finite = np.isfinite(x)
+    if finite.all():
+        return
+    counts = np.concatenate(([0], np.cumsum(~finite)))
+    bad = np.flatnonzero(counts[period:] != counts[:-period])
+    with np.errstate(invalid="ignore", over="ignore"):  # inf - inf
+        out[bad] = func(sliding_window_view(x, period)[bad])
+
+
+def rolling_sum(x, period):
+    """Sum of each trailing window of ``period`` values.
+
+    The results are bit-for-bit those of ``math.fsum`` over each window.
+    Windows holding a NaN (or infinities) produce what ``sum`` gives them;
+    the other windows are not affected by them.
+    """
+    n = len(x)
+    if period < 1 or n < period:
+        return np.empty(0)
+
+    nout = n - period + 1
+    terms = np.where(np.isfinite(x), x, 0.0)
+    # Sums of 1, 2, 4, ... consecutive terms; a window adds up the ones
+    # matching the bits set in ``period``.
+    sums = (terms, np.zeros(n), np.abs(terms))
+    size, offset, depth = 1, 0, 0
+    acc = None
+    while True:
+        if period & size:
+            part = tuple(a[offset : offset + nout] for a in sums)
+            acc = part if acc is None else _dd_add(acc, part)
+            offset += size
+            depth += 1
+        if offset == period:
+            break
+        sums = _dd_add(tuple(a[:-size] for a in sums), tuple(a[size:] for a in sums))
+        size *= 2
+        depth += 1
+
+    windows = sliding_window_view(terms, period)
+    out = _round_exact(acc, depth, windows, lambda w: math.fsum(w.tolist()))
+    _nonfinite_windows(x, period, out, lambda w: w.sum(axis=1))
+    return out
+
+
+def rolling_loopsum(x, period):
+    """Sum of each trailing window added up newest value first.
+
+    The results are bit-for-bit those of a ``total += value`` loop walking
+    the window backwards from its last value, which is how some indicators
+    accumulate. Costs O(n * period) C-level operations.
+    """
+    n = len(x)
+    if period < 1 or n < period:
+        return np.empty(0)
+
+    nout = n - period + 1
+    out = np.zeros(nout)
+    for j in range(period - 1, -1, -1):
+        out += x[j : j + nout]
+    return out
+
+
+def _rolling_extreme(x, period, ufunc):
+    # van Herk/Gil-Werman: a window spans at most two blocks of ``period``
+    # values, the end of the first and the start of the second, so it is
+    # the extreme of a suffix and a prefix accumulation. O(n) and exact.
+    n = len(x)
+    if period < 1 or n < period:
+        return np.empty(0)
+
+    nout = n - period + 1
+    nblocks = -(-n // period)
+    blocks = np.zeros(nblocks * period)  # padding is never in a window
+    blocks[:n] = x
+    blocks = blocks.reshape(nblocks, period)
+    prefix = ufunc.accumulate(blocks, axis=1).ravel()
+    suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    return ufunc(suffix[:nout], prefix[period - 1 : period - 1 + nout])
+
+
+def rolling_max(x, period):
+    """Maximum of each trailing window of ``period`` values."""
+    return _rolling_extreme(x, period, np.maximum)
+
+
+def rolling_min(x, period):
+    """Minimum of each trailing window of ``period`` values."""
+    return _rolling_extreme(x, period, np.minimum)
+
+
+def rolling_dot(x, weights):
+    """Weighted sum of each trailing window (``weights[0]`` is the oldest).
+
+    The results are bit-for-bit those of ``math.fsum`` over the rounded
+    products of each window. Costs O(n * period) C-level operations.
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    period = len(weights)
+    n = len(x)
+    if period < 1 or n < period:
+        return np.empty(0)
+
+    nout = n - period + 1
+    terms = np.where(np.isfinite(x), x, 0.0)
+    zeros = np.zeros(nout)
+    acc = (zeros, zeros, zeros)
+    with np.errstate(over="ignore"):
+        for j, weight in enumerate(weights.tolist()):
+            products = weight * terms[j : j + nout]
+            acc = _dd_add(acc, (products, zeros, np.abs(products)))
+
+    windows = sliding_window_view(terms, period)
+    out = _round_exact(acc, period, windows, lambda w: math.fsum((w * weights).tolist()))
+    _nonfinite_windows(x, period, out, lambda w: w @ weights)
+    return out
+
+
+def rolling_nancount(x, period):
+    """Number of NaN values in each trailing window of ``period`` values."""
+    if period < 1 or len(x) < period:
+        return np.empty(0, dtype=np.int64)
+    nans = np.concatenate(([0], np.cumsum(np.isnan(x), dtype=np.int64)))
+    return nans[period:] - nans[:-period]
+
+
+def linear_recurrence(x, alpha, alpha1, seed):
+    """Exponential smoothing recurrence seeded with ``seed``.
+
+    Computes ``y[i] = y[i - 1] * alpha1 + x[i] * alpha`` with
+    ``y[-1] = seed``. The results are bit-for-bit identical to the scalar
+    loop used by the ``next()`` implementations (NaN propagates forward).
+
+    Args:
+        x: 1-D ndarray with the input values.
+        alpha: Weight of the new value.
+        alpha1: Weight of the previous result.
+        seed: Value preceding ``x[0]``.
+
+    Returns:
+        numpy.ndarray: The smoothed values (same length as ``x``).
+    """
+    global _lfilter
+
+    if not len(x):
+        return np.empty(0)
+
+    if _lfilter is None:
+        try:
+            from scipy.signal import lfilter
+        except ImportError:
+            lfilter = False
+        _lfilter = lfilter
+
+    if _lfilter:
+        out, _ = _lfilter([alpha], [1.0, -alpha1], x, zi=[alpha1 * seed])
+        return out
+
+    out = np.empty(len(x))
+    prev = seed
+    for i, value in enumerate(x.tolist()):
+        prev = prev * alpha1 + value * alpha
+        out[i] = prev
+    return out
+
+
+def merge_timelines(timelines):
+    """Merge the datetime arrays of several feeds into a single timeline.
+
+    Args:
+        timelines: Sequence of 1-D ndarrays, each strictly increasing.
+
+    Returns:
+        tuple: ``(steps, members)`` where ``steps`` is the sorted ndarray of
+        the unique datetimes and ``members[k]`` is the list of the indices of
+        the timelines holding ``steps[k]`` (in input order), or ``None`` if a
+        timeline is not strictly increasing.
+    """
+    for x in timelines:
+        if len(x) > 1 and not (np.diff(x) > 0).all():  # NaN fails too
+            return None
+
+    sizes = [len(x) for x in timelines]
+    if not sum(sizes):
+        return np.empty(0), []
+
+    values = np.concatenate(timelines)
+    owners = np.repeat(np.arange(len(timelines)), sizes)
+    order = np.argsort(values, kind="stable")  # ties keep the input order
+    values, owners = values[order], owners[order]
+
+    bounds = np.flatnonzero(np.diff(values)) + 1
+    steps = values[np.concatenate(([0], bounds))]
+    members = [m.tolist() for m in np.split(owners, bounds)]
+    return steps, members
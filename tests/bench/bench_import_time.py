@@ -0,0 +1,56 @@
+"""Benchmark for the time taken by ``import backtrader``.
+
+The contributed indicators, data feeds, brokers and stores are imported on
+first use, as are the heavy optional dependencies (statsmodels, pandas,
+plotting). This guards against a module of the catalog being imported
+eagerly again.
+
+Marked ``slow`` and kept out of the unit suite: wall-clock times depend on
+the load of the machine.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import backtrader as bt
+
+ROOT = os.path.dirname(os.path.dirname(bt.__file__))
+
+# Times the lazy import, then the import of the whole catalog and of
+# statsmodels (what ``import backtrader`` used to load) in the same process
+CODE = """
+import importlib, time
+start = time.perf_counter()
+import backtrader as bt
+lazy = time.perf_counter() - start
+start = time.perf_counter()
+for package in (bt.indicators.contrib, bt.feeds, bt.brokers, bt.stores):
+    for module in package._EXPORTS:
+        try:
+            importlib.import_module(f"{package.__name__}.{module}")
+        except ImportError:
+            pass
+try:
+    import statsmodels.api
+except ImportError:
+    pass
+print(lazy, time.perf_counter() - start)
+"""
+
+
+@pytest.mark.slow
+def test_import_time_below_the_eager_catalog():
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, os.environ.get("PYTHONPATH", "")]))
+    times = []
+    for _ in range(3):
+        result = subprocess.run(
+            [sys.executable, "-c", CODE], env=env, capture_output=True, text=True, check=True
+        )
+        times.append([float(value) for value in result.stdout.split()])
+    lazy, eager = min(times)
+    # Importing the whole catalog (statsmodels included) took well over 2s
+    assert lazy < 1.5
+    assert lazy < eager
@@ -0,0 +1,96 @@
+"""Tests for the open-position index and cached mark-to-market of BackBroker."""
+
+import datetime
+
+import pytest
+
+import backtrader as bt
+import testcommon
+from backtrader.brokers.bbroker import BackBroker
+
+
+class RotationStrategy(bt.Strategy):
+    """Opens, flips and closes positions on several datas in turn."""
+
+    def __init__(self):
+        self.values = []
+
+    def next(self):
+        broker = self.broker
+        self.values.append(
+            (
+                broker.getvalue(),
+                broker.getcash(),
+                broker.get_leverage(),
+                broker.get_value(mkt=True),
+                broker.get_value(lever=True),
+                broker._unrealized,
+            )
+        )
+        for i, data in enumerate(self.datas):
+            step = (len(self) + 3 * i) % 12
+            if step == 0:
+                self.buy(data=data, size=10 + i)
+            elif step == 4:
+                self.sell(data=data, size=20 + i)
+            elif step == 8:
+                self.close(data=data)
+
+
+def _run(comminfo):
+    cerebro = bt.Cerebro(stdstats=False)
+    for i in range(6):
+        # Feeds starting on different dates: not all of them tick every bar
+        fromdate = datetime.datetime(2006, 1, 1) + datetime.timedelta(days=9 * i)
+        cerebro.adddata(testcommon.getdata(0, fromdate=fromdate))
+    cerebro.broker.setcash(100000.0)
+    cerebro.broker.setcommission(**comminfo)
+    cerebro.addstrategy(RotationStrategy)
+    strat = cerebro.run()[0]
+    return strat.values, cerebro.broker.getvalue(), cerebro.broker.getcash()
+
+
+@pytest.mark.parametrize(
+    "comminfo",
+    [
+        dict(commission=0.001),
+        dict(commission=2.0, margin=1000.0, mult=10.0),
+        dict(commission=0.001, stocklike=True, interest=0.05, interest_long=True, leverage=2.0),
+    ],
+)
+def test_open_positions_match_full_scan(monkeypatch, comminfo):
+    values, value, cash = _run(comminfo)
+    assert len(values) > 200
+
+    # Full scan: every position is visited and nothing is cached
+    monkeypatch.setattr(BackBroker, "_open_positions", lambda self: list(self.positions.items()))
+    get_value_net = BackBroker._get_value_net
+
+    def full_value_net(self, datas, lever, shortcash, positions, getcommissioninfo):
+        return get_value_net(self, datas, lever, shortcash, dict(positions), getcommissioninfo)
+
+    monkeypatch.setattr(BackBroker, "_get_value_net", full_value_net)
+    assert _run(comminfo) == (values, value, cash)
+
+
+class IndexCheckStrategy(RotationStrategy):
+    def __init__(self):
+        super().__init__()
+        self.counts = []
+
+    def next(self):
+        positions = self.broker.positions
+        expected = [(data, pos) for data, pos in positions.items() if pos]
+        assert self.broker._open_positions() == expected
+        self.counts.append(len(expected))
+        super().next()
+
+
+def test_open_positions_index_follows_executions():
+    cerebro = bt.Cerebro(stdstats=False)
+    for _ in range(4):
+        cerebro.adddata(testcommon.getdata(0))
+    cerebro.addstrategy(IndexCheckStrategy)
+    strat = cerebro.run()[0]
+    assert len(cerebro.broker.positions) == 4
+    assert min(strat.counts[20:]) < 4  # flat datas are left out
@@ -0,0 +1,125 @@
+"""Tests for the price-indexed book of resting orders of BackBroker."""
+
+import datetime
+
+import pytest
+
+import backtrader as bt
+import testcommon
+from backtrader.brokers.bbroker import BackBroker
+
+
+class LadderStrategy(bt.Strategy):
+    """Keeps ladders of limit, stop and stop-limit orders on several datas."""
+
+    def __init__(self):
+        self.events = []
+        self.resting = []
+        self.refs = {}  # order refs differ from run to run
+
+    def _ref(self, order):
+        return self.refs.setdefault(order.ref, len(self.refs))
+
+    def notify_order(self, order):
+        self.events.append(
+            (
+                len(self),
+                self._ref(order),
+                order.status,
+                order.executed.size,
+                order.executed.price,
+                order.executed.dt,
+            )
+        )
+
+    def next(self):
+        self.resting.append(len(self.broker._book))
+        self.events.append(("open", [self._ref(o) for o in self.broker.get_orders_open()]))
+        if len(self) % 10 == 0:
+            for order in self.broker.get_orders_open()[::3]:
+                self.cancel(order)
+
+        if len(self) % 5:
+            return
+
+        for i, data in enumerate(self.datas):
+            close = data.close[0]
+            valid = None if i else data.datetime.date(0) + datetime.timedelta(days=8)
+            for k in range(1, 6):
+                step = close * 0.01 * k
+                self.buy(data=data, exectype=bt.Order.Limit, price=close - step, valid=valid)
+                self.sell(data=data, exectype=bt.Order.Limit, price=close + step)
+                self.buy(data=data, exectype=bt.Order.Stop, price=close + step, valid=valid)
+                self.sell(data=data, exectype=bt.Order.Stop, price=close - step)
+                self.buy(
+                    data=data,
+                    exectype=bt.Order.StopLimit,
+                    price=close + step,
+                    plimit=close + step / 2,
+                )
+                self.sell(
+                    data=data,
+                    exectype=bt.Order.StopTrail,
+                    trailpercent=0.01 * k,
+                )
+
+            o1 = self.buy(data=data, exectype=bt.Order.Limit, price=close * 0.98)
+            self.sell(data=data, exectype=bt.Order.Stop, price=close * 0.97, oco=o1)
+            self.buy_bracket(
+                data=data, price=close * 0.99, stopprice=close * 0.96, limitprice=close * 1.03
+            )
+
+
+def _run(**kwargs):
+    cerebro = bt.Cerebro(stdstats=False, **kwargs)
+    for i in range(3):
+        fromdate = datetime.datetime(2006, 1, 1) + datetime.timedelta(days=7 * i)
+        cerebro.adddata(testcommon.getdata(i % 2, fromdate=fromdate))
+    cerebro.broker.setcash(1e7)
+    cerebro.addstrategy(LadderStrategy)
+    strat = cerebro.run()[0]
+    return strat, (strat.events, cerebro.broker.getvalue(), cerebro.broker.getcash())
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"runonce": False}, {"cheat_on_open": True}])
+def test_pending_book_matches_full_scan(monkeypatch, kwargs):
+    strat, result = _run(**kwargs)
+    assert max(strat.resting) > 50
+    assert sum(1 for event in result[0] if event[2:3] == (bt.Order.Completed,)) > 100
+
+    # Every order stays in the pending queue and is evaluated on every bar
+    monkeypatch.setattr(BackBroker, "_restable", classmethod(lambda cls: False))
+    strat, expected = _run(**kwargs)
+    assert max(strat.resting) == 0
+    assert result == expected
+
+
+def test_pending_book_due_orders():
+    book = bt.brokers.pendingbook.PendingBook()
+    data = testcommon.getdata(0)
+    cerebro = bt.Cerebro()
+    cerebro.adddata(data)
+    cerebro.run()
+
+    orders = []
+    for seq, (ordercls, exectype, price) in enumerate(
+        [
+            (bt.BuyOrder, bt.Order.Limit, 9.0),
+            (bt.SellOrder, bt.Order.Stop, 10.0),
+            (bt.SellOrder, bt.Order.Limit, 11.0),
+            (bt.BuyOrder, bt.Order.Stop, 12.0),
+            (bt.BuyOrder, bt.Order.StopTrail, 12.0),
+            (bt.BuyOrder, bt.Order.Market, None),
+        ]
+    ):
+        order = ordercls(data=data, size=1, exectype=exectype, price=price, simulated=True)
+        order.pseq = seq
+        orders.append(order)
+
+    assert [book.add(order) for order in orders] == [True] * 4 + [False] * 2
+    assert len(book) == 4 and book.orders() == orders[:4]
+    assert book.due(lambda data: (10.5, 10.8, 10.2, 10.5)) == []
+    assert book.due(lambda data: (10.5, 11.0, 9.5, 10.5)) == [orders[1], orders[2]]
+    assert book.remove(orders[3]) and not book.remove(orders[3])
+    assert book.due(lambda data: (float("nan"),) * 4) == [orders[0]]
+    assert len(book) == 0
@@ -0,0 +1,102 @@
+"""Tests for depth diffs and level deltas in the tick broker."""
+
+import random
+
+import pytest
+
+from backtrader import DepthBook
+from backtrader.brokers.hft import QueueExchangeModel
+from backtrader.brokers.tickbroker import TickBroker
+from backtrader.events import OrderBookDiff, OrderBookSnapshot, TickEvent
+from backtrader.order import Order
+
+
+class DummyData:
+    def __init__(self, name="BTC/USDT"):
+        self._name = name
+        self.symbol = name
+
+
+def _stream():
+    """Depth diffs of a random book, each followed by a trade or not."""
+    rng = random.Random(11)
+    events = []
+    for i in range(1, 300):
+        bids = [(100.0 - 0.5 * rng.randint(0, 6), float(rng.randint(0, 6))) for _ in range(3)]
+        asks = [(100.5 + 0.5 * rng.randint(0, 6), float(rng.randint(0, 6))) for _ in range(3)]
+        if i == 1:
+            bids.append((100.0, 5.0))
+            asks.append((100.5, 5.0))
+        events.append(OrderBookDiff(timestamp=float(i), symbol="BTC/USDT", bids=bids, asks=asks))
+        if i % 2:
+            price = 100.0 - 0.5 * rng.randint(0, 4)
+            events.append(TickEvent(timestamp=i + 0.5, symbol="BTC/USDT", price=price, volume=2.0))
+    return events
+
+
+def _replay(as_snapshots=False):
+    data = DummyData()
+    broker = TickBroker(cash=1e6, exchange_model=QueueExchangeModel(tick_size=0.5))
+    book = DepthBook(tick_size=0.5)
+    orders = []
+    for i, event in enumerate(_stream()):
+        if isinstance(event, TickEvent):
+            broker.process_tick(event)
+            continue
+        if as_snapshots:
+            book.apply_diff(event.bids, event.asks)
+            event = OrderBookSnapshot(
+                timestamp=event.timestamp, symbol=event.symbol, bids=book.bids, asks=book.asks
+            )
+        if i % 10 == 0:
+            price = 100.0 - 0.5 * (i // 10 % 4)
+            orders.append(
+                broker.buy(owner=None, data=data, size=1, price=price, exectype=Order.Limit)
+            )
+        broker.process_orderbook(event)
+
+    return [
+        (o.status, o.executed.size, o.executed.price, round(getattr(o, "_queue_ahead", 0.0), 9))
+        for o in orders
+    ], broker.getcash()
+
+
+def test_depth_diffs_match_snapshots(monkeypatch):
+    result = _replay()
+    assert sum(status == Order.Completed for status, *_ in result[0]) > 5
+    assert any(queue_ahead for *_, queue_ahead in result[0])
+    assert _replay(as_snapshots=True) == result
+
+    # Diffing whole snapshots instead of using the changes of the depth book
+    def rediff(self, ob_event):
+        return DepthBook.diff(
+            ob_event.previous_bids,
+            ob_event.previous_asks,
+            ob_event.bids,
+            ob_event.asks,
+            self.tick_size,
+        )
+
+    monkeypatch.setattr(QueueExchangeModel, "_depth_changes", rediff)
+    assert _replay(as_snapshots=True) == result
+
+
+def test_orderbook_diff_event_builds_snapshot():
+    broker = TickBroker()
+    broker.process_orderbook(
+        OrderBookSnapshot(
+            timestamp=1.0, symbol="BTC/USDT", bids=[(100.0, 1.0)], asks=[(101.0, 1.0)]
+        )
+    )
+    broker.process_orderbook(
+        OrderBookDiff(timestamp=2.0, symbol="BTC/USDT", bids=[(100.5, 2.0)], asks=[(101.0, 0.0)])
+    )
+    last = broker._last_orderbook["BTC/USDT"]
+    assert isinstance(last, OrderBookSnapshot)
+    assert last.bids == [(100.5, 2.0), (100.0, 1.0)] and last.asks == []
+    assert last.previous_asks == [(101.0, 1.0)]
+    assert last.depth_changes == {
+        (True, 100.5): (0.0, 2.0),
+        (False, 101.0): (1.0, 0.0),
+    }
+    assert last.local_time == pytest.approx(2.0)
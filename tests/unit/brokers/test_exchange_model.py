@@ -86,3 +86,42 @@ def test_queue_exchange_model_fills_maker_after_queue_is_consumed():
 
     assert fills == [(order, 100.0, 1.0, FillRole.MAKER)]
     assert order._queue_ahead == pytest.approx(0.0)
+
+
+def test_queue_exchange_model_updates_levels_with_per_order_models():
+    class PerOrderQueueModel:
+        """Queue model without the level updates."""
+
+        def __init__(self):
+            self.model = ProbQueueModel()
+
+        def update_on_trade(self, order, trade_event):
+            return self.model.update_on_trade(order, trade_event)
+
+        def update_on_depth(self, order, prev_qty, new_qty):
+            self.model.update_on_depth(order, prev_qty, new_qty)
+
+    def maker_orders():
+        orders = []
+        for price, ahead in [(100.0, 1.0), (99.5, 0.5), (100.0, 3.0), (100.0, 0.0)]:
+            order = DummyOrder(size=2.0, price=price, exectype=Order.Limit, buy=True)
+            order._fill_role = FillRole.MAKER
+            order._queue_ahead = ahead
+            orders.append(order)
+        return orders
+
+    trade = TickEvent(timestamp=2.0, symbol="BTC/USDT", price=100.0, volume=2.0)
+    snapshot = OrderBookSnapshot(
+        timestamp=3.0, symbol="BTC/USDT", bids=[(100.0, 1.0), (99.5, 6.0)], asks=[]
+    )
+    snapshot.previous_bids, snapshot.previous_asks = [(100.0, 4.0), (99.5, 2.0)], []
+    results = []
+    for queue_model in (ProbQueueModel(), PerOrderQueueModel()):
+        model = QueueExchangeModel(queue_model=queue_model, tick_size=0.5)
+        orders = maker_orders()
+        fills = [(orders.index(fill[0]),) + fill[1:] for fill in model.on_trade(trade, orders)]
+        model.on_depth_update(snapshot, orders)
+        results.append((fills, [order._queue_ahead for order in orders]))
+
+    assert results[0] == results[1]
+    assert [fill[0] for fill in results[0][0]] == [0, 3]
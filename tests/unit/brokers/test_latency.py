@@ -41,3 +41,35 @@ def test_intp_latency_model_interpolates_between_points():
     assert model.feed_latency(2.0, "BTC/USDT") == pytest.approx(0.2)
     assert model.order_entry_latency(2.0, "BTC/USDT") == pytest.approx(0.4)
     assert model.order_response_latency(2.0, "BTC/USDT") == pytest.approx(0.6)
+
+
+def test_intp_latency_model_cursor_and_batch_match_search():
+    rows = [(1.0, 0.1, 0.2, 0.3), (1.0, 0.2, 0.3, 0.4), (3.0, 0.3, 0.6, 0.9)]
+    rows += [(3.0 + i, 0.01 * i, 0.02 * i, 0.03 * i) for i in range(1, 40)]
+    model = IntpLatencyModel(rows, latency_offset=0.25)
+    stamps = [0.0, 0.75, 1.0, 2.0, 5.5, 40.0, 1.5, 20.3, 20.4, 100.0, 2.75, 6.0]
+
+    def searched(ts, column):
+        points = sorted(rows)
+        lookup = ts + 0.25
+        if lookup <= points[0][0]:
+            return points[0][column]
+        if lookup > points[-1][0]:
+            return points[-1][column]
+        idx = next(i for i, row in enumerate(points) if row[0] >= lookup)
+        left, right = points[idx - 1], points[idx]
+        if left[0] == right[0]:
+            return right[column]
+        ratio = (lookup - left[0]) / (right[0] - left[0])
+        return left[column] + (right[column] - left[column]) * ratio
+
+    assert [model.feed_latency(ts, "BTC/USDT") for ts in stamps] == [
+        searched(ts, 1) for ts in stamps
+    ]
+    assert [model.order_response_latency(ts, "BTC/USDT") for ts in stamps] == [
+        searched(ts, 3) for ts in stamps
+    ]
+    assert model.order_entry_latencies(stamps, "BTC/USDT").tolist() == [
+        searched(ts, 2) for ts in stamps
+    ]
+    assert IntpLatencyModel([]).feed_latencies([1.0, 2.0], "BTC/USDT").tolist() == [0.0, 0.0]
@@ -0,0 +1,136 @@
+"""Tests for the symbol-keyed pending-order registry of the tick broker."""
+
+import random
+
+import pytest
+
+from backtrader.brokers.hft import ConstantLatencyModel, OrderSet, SymbolOrders
+from backtrader.brokers.tickbroker import TickBroker
+from backtrader.events import OrderBookSnapshot, TickEvent
+from backtrader.order import Order
+
+
+class DummyData:
+    def __init__(self, name):
+        self._name = name
+        self.symbol = name
+
+
+def _replay(**kwargs):
+    rng = random.Random(7)
+    datas = [DummyData("BTC/USDT"), DummyData("ETH/USDT")]
+    broker = TickBroker(cash=1e7, **kwargs)
+    prices = {data._name: 100.0 for data in datas}
+    orders = []
+    for i in range(450):
+        data = datas[i % 2]
+        price = prices[data._name] = prices[data._name] + rng.choice((-0.5, 0.0, 0.5))
+        if i % 15 == 0:
+            for k in range(1, 8):
+                for exectype, offset, plimit in (
+                    (Order.Limit, -k, None),
+                    (Order.Stop, k, None),
+                    (Order.StopLimit, k, k / 2.0),
+                ):
+                    for side, sign in ((broker.buy, 1), (broker.sell, -1)):
+                        orders.append(
+                            side(
+                                owner=None,
+                                data=data,
+                                size=1 + k % 3,
+                                price=price + sign * offset,
+                                plimit=None if plimit is None else price + sign * plimit,
+                                exectype=exectype,
+                            )
+                        )
+            orders.append(broker.buy(owner=None, data=data, size=1, exectype=Order.Market))
+        if i % 40 == 0 and broker.pending_orders:
+            broker.cancel(broker.pending_orders[0])
+
+        timestamp = float(i)
+        if i % 3:
+            broker.process_tick(
+                TickEvent(timestamp=timestamp, symbol=data._name, price=price, volume=5.0)
+            )
+        else:
+            broker.process_orderbook(
+                OrderBookSnapshot(
+                    timestamp=timestamp,
+                    symbol=data._name,
+                    bids=[(price - 0.25, 3.0), (price - 0.75, 5.0)],
+                    asks=[(price + 0.25, 3.0), (price + 0.75, 5.0)] if i % 9 else [],
+                )
+            )
+
+    # Order refs differ from run to run: use the index of the order
+    index = {order.ref: i for i, order in enumerate(orders)}
+    history = [dict(entry, order_ref=index[entry["order_ref"]]) for entry in broker.order_history]
+    return [
+        (o.status, o.executed.size, o.executed.price, getattr(o, "_stop_triggered", False))
+        for o in orders
+    ], (broker.getcash(), len(broker.pending_orders), history)
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"latency_model": ConstantLatencyModel(5)}])
+def test_price_indexed_candidates_match_full_scan(monkeypatch, kwargs):
+    calls = []
+    trade_candidates = SymbolOrders.trade_candidates
+
+    def tracking_candidates(self, price):
+        candidates = trade_candidates(self, price)
+        calls.append((len(candidates), len(self)))
+        return candidates
+
+    monkeypatch.setattr(SymbolOrders, "trade_candidates", tracking_candidates)
+    statuses, result = _replay(**kwargs)
+    assert sum(status == Order.Completed for status, *_ in statuses) > 100
+    assert sum(ncandidates for ncandidates, _ in calls) < sum(n for _, n in calls) / 2
+
+    # Every pending order of the symbol is a candidate for every event
+    monkeypatch.setattr(SymbolOrders, "trade_candidates", lambda self, price: list(self))
+    monkeypatch.setattr(SymbolOrders, "depth_candidates", lambda self, bid, ask: list(self))
+    assert _replay(**kwargs) == (statuses, result)
+
+
+def test_symbol_orders_ladders():
+    data = DummyData("BTC/USDT")
+    broker = TickBroker()
+    buylimit = broker.buy(owner=None, data=data, size=1, price=99.0, exectype=Order.Limit)
+    sellstop = broker.sell(owner=None, data=data, size=1, price=98.0, exectype=Order.Stop)
+    selllimit = broker.sell(owner=None, data=data, size=1, price=101.0, exectype=Order.Limit)
+    buystop = broker.buy(owner=None, data=data, size=1, price=102.0, exectype=Order.Stop)
+    stoplimit = broker.buy(
+        owner=None, data=data, size=1, price=103.0, plimit=100.5, exectype=Order.StopLimit
+    )
+    market = broker.buy(owner=None, data=data, size=1, exectype=Order.Market)
+
+    orders = SymbolOrders()
+    for order in (buylimit, sellstop, selllimit, buystop, stoplimit, market):
+        assert orders.add(order)
+    assert not orders.add(market)
+
+    assert orders.trade_candidates(100.0) == [market]
+    assert orders.trade_candidates(98.5) == [buylimit, market]
+    assert orders.trade_candidates(102.0) == [selllimit, buystop, market]
+    assert orders.trade_candidates(float("nan")) == list(orders)
+    assert orders.depth_candidates(98.0, 102.5) == [sellstop, buystop, market]
+    assert orders.depth_candidates(101.0, None) == [selllimit, market]
+
+    stoplimit._stop_triggered = True
+    orders.reindex(stoplimit)
+    assert orders.trade_candidates(100.0) == [stoplimit, market]
+
+    assert orders.discard(buylimit) and not orders.discard(buylimit)
+    assert buylimit not in orders and len(orders) == 5
+    with pytest.raises(ValueError):
+        orders.remove(buylimit)
+
+
+def test_order_set_keeps_insertion_order():
+    items = [object() for _ in range(5)]
+    orders = OrderSet(items)
+    orders.append(items[0])
+    orders.remove(items[2])
+    orders.add(items[2])
+    assert list(orders) == [items[0], items[1], items[3], items[4], items[2]]
+    assert items[3] in orders and len(orders) == 5
@@ -49,3 +49,47 @@ def test_prob_queue_model_estimates_queue_and_waits_until_consumed():
     assert order._queue_ahead == pytest.approx(1.0)
     assert model.update_on_trade(order, second_trade) == pytest.approx(3.0)
     assert order._queue_ahead == pytest.approx(0.0)
+
+
+@pytest.mark.parametrize("model_class", [NoQueueModel, ProbQueueModel])
+def test_level_updates_match_per_order_updates(model_class):
+    model = model_class()
+    aheads = [0.0, 0.5, 2.0, 3.5, 7.0, -1.0]
+    trades = [
+        TickEvent(timestamp=float(i), symbol="BTC/USDT", price=100.0, volume=volume)
+        for i, volume in enumerate([0.0, 1.0, 2.5, 0.5])
+    ]
+    depths = [(8.0, 6.0), (6.0, 9.0), (9.0, 1.0)]
+
+    def orders():
+        result = []
+        for ahead in aheads:
+            order = DummyOrder(size=2.0)
+            order._queue_ahead = ahead
+            order._queue_trade_qty = 0.0
+            result.append(order)
+        return result
+
+    def state(level):
+        return [(o._queue_ahead, o._queue_trade_qty, o._queue_fillable) for o in level]
+
+    single, level = orders(), orders()
+    for trade, (prev_qty, new_qty) in zip(trades, depths + [(1.0, 0.0)]):
+        fillables = [model.update_on_trade(order, trade) for order in single]
+        assert model.update_level_on_trade(level, trade) == fillables
+        for order in single:
+            model.update_on_depth(order, prev_qty, new_qty)
+        model.update_level_on_depth(level, prev_qty, new_qty)
+        assert state(level) == state(single)
+
+
+def test_order_updates_use_overridden_level_updates():
+    class HalfQueueModel(ProbQueueModel):
+        def update_level_on_trade(self, orders, trade_event):
+            return [f / 2 for f in super().update_level_on_trade(orders, trade_event)]
+
+    order = DummyOrder(size=3.0)
+    order._queue_ahead = 1.0
+    trade = TickEvent(timestamp=1.0, symbol="BTC/USDT", price=100.0, volume=3.0)
+
+    assert HalfQueueModel().update_on_trade(order, trade) == 1.0
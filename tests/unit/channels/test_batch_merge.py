@@ -0,0 +1,165 @@
+"""Tests for the batch merge of StreamingEventQueue."""
+
+import random
+
+import numpy as np
+import pytest
+
+from backtrader.channel import DataChannel, EventPriority, StreamingEventQueue
+from backtrader.events import BarEvent, OrderBookSnapshot, TickEvent
+from backtrader.feeds.mixed_channel import MixedChannel
+
+
+class MemoryChannel(DataChannel):
+    def __init__(self, channel_type, symbol, events):
+        super().__init__(symbol=symbol, validate=False, auto_fix=False)
+        self.channel_type = channel_type
+        self._events = list(events)
+
+    def load(self):
+        for event in self._events:
+            yield event
+
+
+def _ticks(symbol, timestamps):
+    return [TickEvent(timestamp=ts, symbol=symbol, price=100.0, volume=1.0) for ts in timestamps]
+
+
+def _sources(seed=3):
+    rng = random.Random(seed)
+
+    def walk(n, step):
+        ts, out = 0.0, []
+        for _ in range(n):
+            ts += rng.choice((0.0, step, 2 * step))
+            out.append(ts)
+        return out
+
+    ticks = [
+        MemoryChannel("tick", "BTC/USDT", _ticks("BTC/USDT", walk(700, 0.5))),
+        MemoryChannel("tick", "ETH/USDT", _ticks("ETH/USDT", walk(400, 1.0))),
+    ]
+    books = [
+        MemoryChannel(
+            "orderbook",
+            "BTC/USDT",
+            [
+                OrderBookSnapshot(
+                    timestamp=ts, symbol="BTC/USDT", bids=[(99.0, 1.0)], asks=[(101.0, 1.0)]
+                )
+                for ts in walk(300, 1.5)
+            ],
+        )
+    ]
+    bars = [
+        [
+            BarEvent(
+                timestamp=ts,
+                symbol="BTC/USDT",
+                open=100.0,
+                high=101.0,
+                low=99.0,
+                close=100.0,
+                volume=1.0,
+            )
+            for ts in walk(60, 5.0)
+        ]
+    ]
+    return ticks, books, bars
+
+
+def _expected(channels, bars):
+    """(timestamp, priority, source, position) order of all the events."""
+    keyed = []
+    for source, channel in enumerate(channels):
+        priority = EventPriority.TICK if channel.channel_type == "tick" else EventPriority.ORDERBOOK
+        for position, event in enumerate(channel.load()):
+            keyed.append((event.timestamp, priority, source, position, event))
+    for i, bar_data in enumerate(bars):
+        for position, event in enumerate(bar_data):
+            keyed.append((event.timestamp, EventPriority.BAR, len(channels) + i, position, event))
+    keyed.sort(key=lambda item: item[:4])
+    return [item[-1] for item in keyed]
+
+
+@pytest.mark.parametrize("batch_size", [1, 7, 10000])
+def test_batch_merge_orders_events(batch_size):
+    ticks, books, bars = _sources()
+    queue = MixedChannel(
+        tick_channels=ticks,
+        orderbook_channels=books,
+        bars=bars,
+        batch_size=batch_size,
+        batch_merge=True,
+    )
+    events = list(queue)
+
+    assert [event.data for event in events] == _expected(ticks + books, bars)
+    assert len({event.sequence for event in events}) == len(events)
+    assert events[0].channel_name in ("BTC/USDT", "ETH/USDT")
+    assert {event.channel_name for event in events if event.channel_type == "bar"} == {"BTC/USDT"}
+    assert queue.empty and queue.pop() is None and queue.peek() is None
+    assert queue.total_events_popped == len(events) and len(queue) == 0
+
+
+def test_batch_merge_matches_heap_merge():
+    ticks, books, bars = _sources(seed=11)
+
+    def merged(batch_merge):
+        queue = MixedChannel(
+            tick_channels=ticks,
+            orderbook_channels=books,
+            bars=bars,
+            adaptive=False,
+            batch_merge=batch_merge,
+        )
+        return [(event.timestamp, event.priority, event.data) for event in queue]
+
+    heap = merged(False)
+    batch = merged(True)
+    # The heap breaks ties of timestamp and priority on load order
+    assert sorted(batch, key=lambda item: item[:2]) == batch
+    assert [item[:2] for item in batch] == [item[:2] for item in heap]
+    assert sorted(map(id, (d for *_, d in batch))) == sorted(map(id, (d for *_, d in heap)))
+
+
+def test_batch_merge_equal_timestamps_and_unsorted_batches():
+    symbol = "BTC/USDT"
+    tick = MemoryChannel("tick", symbol, _ticks(symbol, [2.0, 1.0, 2.0, 3.0]))
+    book = MemoryChannel(
+        "orderbook",
+        symbol,
+        [OrderBookSnapshot(timestamp=2.0, symbol=symbol, bids=[(99.0, 1.0)], asks=[])],
+    )
+    queue = StreamingEventQueue([book, tick], batch_size=2, batch_merge=True)
+
+    assert queue.peek().data is queue.peek().data
+    events = list(queue)
+    # Each batch is sorted on its own
+    assert [(event.timestamp, event.channel_type) for event in events] == [
+        (1.0, "tick"),
+        (2.0, "tick"),
+        (2.0, "tick"),
+        (2.0, "orderbook"),
+        (3.0, "tick"),
+    ]
+    assert queue.current_timestamp == 3.0
+
+
+def test_load_batches_skips_events_without_timestamp():
+    symbol = "BTC/USDT"
+    channel = MemoryChannel(
+        "tick", symbol, _ticks(symbol, [1.0, 2.0]) + [None] + _ticks(symbol, [3.0])
+    )
+    batches = list(channel.load_batches(2))
+
+    assert [len(events) for _, events in batches] == [2, 1]
+    assert all(isinstance(timestamps, np.ndarray) for timestamps, _ in batches)
+    assert np.concatenate([timestamps for timestamps, _ in batches]).tolist() == [1.0, 2.0, 3.0]
+
+
+def test_batch_merge_empty_sources():
+    queue = StreamingEventQueue(
+        [MemoryChannel("tick", "BTC/USDT", [])], bars=[[]], batch_merge=True
+    )
+    assert queue.empty and list(queue) == [] and len(queue) == 0
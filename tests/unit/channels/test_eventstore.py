@@ -0,0 +1,139 @@
+"""Tests for the binary event store and its replay by the channels."""
+
+import csv
+import json
+import random
+
+import numpy as np
+import pytest
+
+from backtrader.brokers.hft.binance_bbo import (
+    BUY_EVENT,
+    DEPTH_BBO_EVENT,
+    EVENT_DTYPE,
+    EXCH_EVENT,
+    LOCAL_EVENT,
+    SELL_EVENT,
+    TRADE_EVENT,
+)
+from backtrader.channels import OrderBookChannel, TickChannel
+from backtrader.channels.eventstore import (
+    convert_hft_events,
+    convert_to_event_store,
+    iter_event_chunks,
+    iter_event_store,
+    load_event_store,
+    write_event_store,
+)
+from backtrader.events import FundingEvent, OrderBookDiff, OrderBookSnapshot, TickEvent
+
+
+@pytest.fixture
+def text_inputs(tmp_path):
+    rng = random.Random(5)
+    ticks = tmp_path / "ticks.csv"
+    with open(ticks, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp", "price", "volume", "direction", "trade_id"])
+        for i in range(300):
+            price = 100 + rng.randint(-20, 20) * 0.1
+            side = rng.choice(["buy", "sell"])
+            writer.writerow([f"{1609459200 + i * 0.013:.6f}", price, 0.5, side, i + 1])
+
+    books = tmp_path / "books.jsonl"
+    bids = {round(100 - 0.1 * k, 1): 1.0 for k in range(1, 12)}
+    asks = {round(100 + 0.1 * k, 1): 1.0 for k in range(12)}
+    with open(books, "w") as f:
+        for i in range(300):
+            if i % 7:  # else unchanged
+                bids[round(100 - 0.1 * rng.randint(1, 11), 1)] = rng.randint(0, 4)
+                asks[round(100 + 0.1 * rng.randint(1, 11), 1)] = rng.randint(0, 4)
+            line = {
+                "timestamp": 1609459200 + i * 0.01,
+                "bids": sorted(((p, q) for p, q in bids.items() if q), reverse=True),
+                "asks": sorted((p, q) for p, q in asks.items() if q),
+            }
+            f.write(json.dumps(line) + "\n")
+
+    return str(ticks), str(books)
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1 << 16])
+def test_store_replays_text_inputs(tmp_path, text_inputs, chunk_size):
+    store = str(tmp_path / "store.npy")
+    rows = convert_to_event_store(text_inputs, store, symbol="BTC/USDT", chunk_size=chunk_size)
+    assert rows == len(load_event_store(store)) < 300 + 300 * 23
+
+    for channel_cls, path, depth in (
+        (TickChannel, text_inputs[0], {}),
+        (OrderBookChannel, text_inputs[1], {"depth": 5}),
+    ):
+        expected = list(channel_cls("BTC/USDT", dataname=path, **depth).load())
+        replayed = list(channel_cls("BTC/USDT", dataname=store, **depth).load())
+        assert replayed == expected
+
+    chunks = list(iter_event_chunks(store, chunk_size=chunk_size))
+    assert sum(len(chunk) for chunk in chunks) == rows
+    for previous, chunk in zip(chunks, chunks[1:]):  # events are not split
+        assert chunk["ival"][0] > previous["ival"][-1]
+    assert list(iter_event_store(store, "BTC/USDT", chunk_size=chunk_size)) == list(
+        iter_event_store(store, "BTC/USDT")
+    )
+
+
+def test_store_encodes_snapshots_as_diffs(tmp_path):
+    events = [
+        OrderBookSnapshot(timestamp=1.0, symbol="X", bids=[(10.0, 1.0)], asks=[(11.0, 2.0)]),
+        OrderBookSnapshot(timestamp=2.0, symbol="X", bids=[(10.0, 1.0)], asks=[(11.0, 2.0)]),
+        OrderBookDiff(timestamp=3.0, symbol="X", bids=[(10.0, 0.0)], asks=[(10.5, 1.0)]),
+        OrderBookSnapshot(timestamp=4.0, symbol="X", bids=[], asks=[]),
+        TickEvent(timestamp=5.0, symbol="X", price=10.5, volume=1.0, direction="sell"),
+        OrderBookSnapshot(timestamp=6.0, symbol="X", bids=[(9.0, 1.0)], asks=[]),
+    ]
+    store = tmp_path / "store.npy"
+    assert write_event_store(events, store) == 2 + 1 + 2 + 1 + 1 + 1
+
+    replayed = list(iter_event_store(store, "X", exchange="binance"))
+    assert [type(event) for event in replayed] == [
+        OrderBookSnapshot,
+        OrderBookDiff,  # unchanged: a level is restated
+        OrderBookDiff,
+        OrderBookSnapshot,  # cleared
+        TickEvent,
+        OrderBookSnapshot,
+    ]
+    assert [event.timestamp for event in replayed] == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert replayed[1].bids == [(10.0, 1.0)] and replayed[1].asks == []
+    assert replayed[2].bids == [(10.0, 0.0)] and replayed[2].asks == [(10.5, 1.0)]
+    assert replayed[3].bids == replayed[3].asks == []
+    assert replayed[4].direction == "sell" and replayed[4].exchange == "binance"
+    assert replayed[5].bids == [(9.0, 1.0)]
+
+    with pytest.raises(ValueError):
+        write_event_store([FundingEvent(timestamp=1.0, symbol="X")], tmp_path / "bad.npy")
+
+
+def test_convert_hft_events_groups_depth_rows(tmp_path):
+    feed = EXCH_EVENT | LOCAL_EVENT
+    data = np.array(
+        [
+            (DEPTH_BBO_EVENT | feed | SELL_EVENT, 1_000, 1_500, 11.0, 2.0, 0, 0, 0.0),
+            (DEPTH_BBO_EVENT | feed | BUY_EVENT, 1_000, 1_500, 10.0, 1.0, 0, 0, 0.0),
+            (TRADE_EVENT | LOCAL_EVENT | BUY_EVENT, 1_200, 1_700, 11.0, 0.5, 0, 0, 0.0),
+            (TRADE_EVENT | EXCH_EVENT | BUY_EVENT, 1_200, 1_700, 11.0, 0.5, 0, 0, 0.0),
+            (TRADE_EVENT | feed | SELL_EVENT, 1_200, 1_700, 10.0, 0.5, 0, 0, 0.0),
+            (DEPTH_BBO_EVENT | feed | BUY_EVENT, 2_000, 2_000, 10.5, 3.0, 0, 0, 0.0),
+        ],
+        dtype=EVENT_DTYPE,
+    )
+    rows = convert_hft_events(data)
+    assert rows["ival"].tolist() == [0, 0, 1, 2, 3]
+
+    np.savez_compressed(tmp_path / "events.npz", data=data)
+    store = tmp_path / "store.npy"
+    assert convert_to_event_store([tmp_path / "events.npz"], store) == 5
+    events = list(iter_event_store(store, "X"))
+    assert [type(event) for event in events] == [OrderBookDiff, TickEvent, TickEvent, OrderBookDiff]
+    assert events[0].bids == [(10.0, 1.0)] and events[0].asks == [(11.0, 2.0)]
+    assert events[0].timestamp == pytest.approx(1e-6) and events[0].local_time == 1.5e-6
+    assert events[3].local_time is None
@@ -0,0 +1,68 @@
+"""Tests for depth-diff streams in OrderBookChannel."""
+
+import json
+
+from backtrader.channels.orderbook import OrderBookChannel
+from backtrader.events import OrderBookDiff, OrderBookSnapshot
+
+
+def _diff(u, bids=(), asks=(), first=None, ts=None):
+    return {
+        "e": "depthUpdate",
+        "E": int((ts or u) * 1000),
+        "s": "BTCUSDT",
+        "U": u if first is None else first,
+        "u": u,
+        "b": [[str(p), str(q)] for p, q in bids],
+        "a": [[str(p), str(q)] for p, q in asks],
+    }
+
+
+def test_jsonl_depth_updates_are_applied_to_last_snapshot(tmp_path, caplog):
+    lines = [
+        {
+            "timestamp": 1.0,
+            "lastUpdateId": 10,
+            "bids": [[100.0, 1.0], [99.0, 2.0], [98.0, 3.0]],
+            "asks": [[101.0, 1.0], [102.0, 2.0]],
+        },
+        _diff(9, bids=[(100.0, 9.0)]),  # already in the snapshot
+        _diff(12, first=10, bids=[(100.0, 0.0)], asks=[(100.5, 4.0)]),
+        _diff(15, first=14, bids=[(97.0, 1.0)]),  # 13 is missing
+    ]
+    path = tmp_path / "book.jsonl"
+    path.write_text("\n".join(json.dumps(line) for line in lines))
+
+    channel = OrderBookChannel("BTC/USDT", dataname=str(path), depth=2)
+    events = list(channel.load())
+
+    assert [event.timestamp for event in events] == [1.0, 12.0, 15.0]
+    assert all(isinstance(event, OrderBookSnapshot) for event in events)
+    assert events[1].bids == [(99.0, 2.0), (98.0, 3.0)]
+    assert events[1].asks == [(100.5, 4.0), (101.0, 1.0)]
+    assert events[2].bids == [(99.0, 2.0), (98.0, 3.0)]
+    assert "Gap in depth updates" in caplog.text
+
+
+def test_push_depth_diff():
+    channel = OrderBookChannel("BTC/USDT", depth=5)
+    assert channel.push(
+        OrderBookSnapshot(
+            timestamp=1.0, symbol="BTC/USDT", bids=[(100.0, 1.0)], asks=[(101.0, 2.0)]
+        )
+    )
+    diff = OrderBookDiff(
+        timestamp=2.0,
+        symbol="BTC/USDT",
+        bids=[(100.5, 3.0)],
+        asks=[(101.0, 0.0), (101.5, 1.0)],
+        first_update_id=1,
+        final_update_id=2,
+    )
+    assert diff.event_type == "orderbook_diff" and diff.validate()
+    assert channel.push(diff)
+    assert channel.latest.bids == [(100.5, 3.0), (100.0, 1.0)]
+    assert channel.latest.asks == [(101.5, 1.0)]
+    assert not channel.push(diff)  # already applied
+
+    assert not OrderBookDiff(timestamp=3.0, symbol="BTC/USDT", bids=[(100.0, -1.0)]).validate()
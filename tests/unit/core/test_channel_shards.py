@@ -0,0 +1,181 @@
+"""Tests for the per-symbol sharded replay of channel runs."""
+
+import random
+
+import pytest
+
+import backtrader as bt
+from backtrader.brokers.tickbroker import TickBroker
+from backtrader.channel import DataChannel, StreamingEventQueue
+from backtrader.channelshards import (
+    QueueSource,
+    ShardedRun,
+    allocate_cash,
+    partition_events,
+    partition_sources,
+)
+from backtrader.errors import ConfigError
+from backtrader.events import TickEvent
+from backtrader.order import Order
+
+SYMBOLS = ("BTC/USDT", "ETH/USDT", "SOL/USDT")
+CASH = 1e6
+
+
+class MemoryChannel(DataChannel):
+    def __init__(self, symbol, events):
+        super().__init__(symbol=symbol, validate=False, auto_fix=False)
+        self.channel_type = "tick"
+        self._events = list(events)
+
+    def load(self):
+        for event in self._events:
+            yield event
+
+
+class _Data:
+    def __init__(self, symbol):
+        self._name = self.symbol = symbol
+
+
+class PerSymbolStrategy(bt.Strategy):
+    """Alternates market buys and sells on each symbol, every few ticks."""
+
+    def __init__(self):
+        self.counts = {}
+
+    def notify_tick(self, tick):
+        count = self.counts[tick.symbol] = self.counts.get(tick.symbol, 0) + 1
+        if count % 4 == 1:
+            order = self.buy if count % 8 == 1 else self.sell
+            order(data=_Data(tick.symbol), size=1 + count % 3, exectype=Order.Market)
+
+
+def _channel(symbols=SYMBOLS):
+    rng = random.Random(5)
+    channels = []
+    for offset, symbol in enumerate(SYMBOLS):
+        price = 100.0 * (offset + 1)
+        events = []
+        for i in range(60):
+            price += rng.choice((-0.5, 0.0, 0.5))
+            # Timestamps of different symbols never coincide
+            timestamp = 1.0 + i + offset / 10.0
+            events.append(TickEvent(timestamp=timestamp, symbol=symbol, price=price, volume=3.0))
+        if symbol in symbols:
+            channels.append(MemoryChannel(symbol, events))
+    return StreamingEventQueue(channels, adaptive=False)
+
+
+def _run(symbols=SYMBOLS, channel=None, **kwargs):
+    cerebro = bt.Cerebro(**kwargs)
+    cerebro.setbroker(TickBroker(cash=CASH))
+    cerebro.addstrategy(PerSymbolStrategy)
+    return cerebro, cerebro.run(channel=channel or _channel(symbols))
+
+
+def _fills(history):
+    return [{k: v for k, v in entry.items() if k != "order_ref"} for entry in history]
+
+
+@pytest.mark.parametrize("maxcpus", [1, 2])
+def test_sharded_run_matches_serial_run(maxcpus):
+    cerebro, _ = _run()
+    broker = cerebro.broker
+    assert len(broker.order_history) > 20
+
+    _, sharded = _run(channelshards=True, maxcpus=maxcpus)
+    assert isinstance(sharded, ShardedRun)
+    assert [shard.symbol for shard in sharded.shards] == list(SYMBOLS)
+    assert len(sharded) == 3 and all(len(strats) == 1 for strats in sharded)
+    assert _fills(sharded.order_history) == _fills(broker.order_history)
+    assert [entry["symbol"] for entry in sharded.records] == [
+        entry["symbol"] for entry in broker.order_history
+    ]
+    # The shards share the cash of the broker
+    assert [shard.startvalue for shard in sharded.shards] == pytest.approx([CASH / 3] * 3)
+    assert sharded.startvalue == pytest.approx(CASH)
+    assert sharded.value == pytest.approx(broker.getvalue())
+    assert sharded.cash == pytest.approx(broker.getcash())
+    assert sum(sharded.pnl.values()) == pytest.approx(broker.getvalue() - CASH)
+
+    for shard in sharded.shards:
+        _, alone = _run(
+            symbols=[shard.symbol], channelshards=True, shardcash={shard.symbol: CASH / 3}
+        )
+        assert _fills(alone.shards[0].order_history) == _fills(shard.order_history)
+        assert alone.shards[0].equity == shard.equity
+        assert all(entry["symbol"] == shard.symbol for entry in shard.order_history)
+
+
+def test_sharded_run_is_deterministic():
+    _, first = _run(channelshards=True, maxcpus=2)
+    _, second = _run(channelshards=True, maxcpus=1)
+    assert _fills(first.order_history) == _fills(second.order_history)
+    assert first.equity == second.equity
+
+
+def test_merged_equity_sums_shard_values():
+    _, sharded = _run(channelshards=True, maxcpus=1)
+    equity = sharded.equity
+    assert [t for t, _ in equity] == sorted({t for s in sharded.shards for t, _ in s.equity})
+    assert equity[-1][1] == pytest.approx(sharded.value)
+
+    def value_at(shard, timestamp):
+        value = shard.startvalue
+        for t, v in shard.equity:
+            if t > timestamp:
+                break
+            value = v
+        return value
+
+    for timestamp, total in equity[::7]:
+        assert total == pytest.approx(sum(value_at(s, timestamp) for s in sharded.shards))
+
+
+def test_shard_cash_allocations():
+    _, sharded = _run(channelshards=True, maxcpus=1, shardcash={"ETH/USDT": CASH / 2})
+    starts = [shard.startvalue for shard in sharded.shards]
+    assert starts == pytest.approx([CASH / 4, CASH / 2, CASH / 4])
+    assert sharded.equity[-1][1] == pytest.approx(sharded.value)
+
+    assert allocate_cash(10.0, ["a", "b"], {"a": 10.0}) == {"a": 10.0, "b": 0.0}
+    for allocations in ({"a": 11.0}, {"c": 1.0}, {"a": -1.0}):
+        with pytest.raises(ConfigError):
+            allocate_cash(10.0, ["a", "b"], allocations)
+    with pytest.raises(ConfigError):
+        allocate_cash(None, ["a"])
+
+
+def test_partition_events_keeps_stream_order():
+    events = list(_channel())
+    shards = partition_events(events)
+    assert list(shards) == list(SYMBOLS)
+    assert sum(len(shard) for shard in shards.values()) == len(events)
+    for symbol, shard in shards.items():
+        assert [event.data.symbol for event in shard] == [symbol] * len(shard)
+        assert [event.timestamp for event in shard] == sorted(event.timestamp for event in shard)
+
+
+def test_queue_is_partitioned_at_the_source():
+    shards = partition_sources(_channel())
+    assert list(shards) == list(SYMBOLS)
+    assert all(isinstance(source, QueueSource) for source in shards.values())
+    assert [len(source.channels) for source in shards.values()] == [1, 1, 1]
+
+    expected = partition_events(_channel())
+    for symbol, source in shards.items():
+        events = list(source)
+        assert [event.data for event in events] == [event.data for event in expected[symbol]]
+        assert [event.channel_name for event in events] == [symbol] * len(events)
+
+
+def test_event_stream_is_partitioned_by_event():
+    events = list(_channel())
+    shards = partition_sources(iter(events))
+    assert all(isinstance(shard, list) for shard in shards.values())
+
+    _, fromqueue = _run(channelshards=True, maxcpus=1)
+    _, fromlist = _run(channel=events, channelshards=True, maxcpus=2)
+    assert _fills(fromlist.order_history) == _fills(fromqueue.order_history)
+    assert fromlist.equity == fromqueue.equity
@@ -0,0 +1,65 @@
+"""Tests for the incremental L2 depth book."""
+
+import random
+
+import pytest
+
+from backtrader import DepthBook
+
+
+def _level_qty(levels, key, book):
+    for price, qty in levels:
+        if book.key(price) == key:
+            return qty
+    return 0.0
+
+
+def test_depth_book_snapshot_and_diff():
+    book = DepthBook(tick_size=0.1)
+    changes = book.apply_snapshot(bids=[(100.0, 2.0), (99.9, 1.0)], asks=[(100.1, 1.0)])
+    assert changes == {(True, 1000): (0.0, 2.0), (True, 999): (0.0, 1.0), (False, 1001): (0.0, 1.0)}
+    assert book.best_bid == 100.0 and book.best_ask == 100.1 and len(book) == 3
+
+    changes = book.apply_diff(bids=[(100.0, 0.0), (99.8, 3.0), (99.9, 1.0)], asks=[(100.2, 4.0)])
+    assert changes == {(True, 1000): (2.0, 0.0), (True, 998): (0.0, 3.0), (False, 1002): (0.0, 4.0)}
+    assert book.bids == [(99.9, 1.0), (99.8, 3.0)]
+    assert book.asks == [(100.1, 1.0), (100.2, 4.0)]
+    assert book.levels(True, 1) == [(99.9, 1.0)] and book.levels(False, 0) == []
+    assert book.qty(True, 99.80000001) == 3.0 and book.qty(False, 99.8) == 0.0
+
+    # A level updated twice within a diff only reports its net change
+    assert book.apply_diff(bids=[(99.9, 5.0), (99.9, 1.0)], asks=[(100.5, 0.0)]) == {}
+
+    changes = book.apply_snapshot(bids=[(99.8, 3.0)], asks=[])
+    assert changes == {
+        (True, 999): (1.0, 0.0),
+        (False, 1001): (1.0, 0.0),
+        (False, 1002): (4.0, 0.0),
+    }
+    assert book.best_ask is None
+
+
+@pytest.mark.parametrize("tick_size", [None, 0.5])
+def test_depth_book_changes_match_level_scan(tick_size):
+    rng = random.Random(3)
+    book = DepthBook(tick_size)
+    prev_bids, prev_asks = [], []
+    for _ in range(200):
+        if rng.random() < 0.2:
+            bids = [(100.0 - 0.5 * i, float(rng.randint(1, 5))) for i in range(rng.randint(0, 8))]
+            asks = [(100.5 + 0.5 * i, float(rng.randint(1, 5))) for i in range(rng.randint(0, 8))]
+            changes = book.apply_snapshot(bids, asks)
+        else:
+            bid_diff = [(100.0 - 0.5 * rng.randint(0, 9), float(rng.randint(0, 3))) for _ in "ab"]
+            ask_diff = [(100.5 + 0.5 * rng.randint(0, 9), float(rng.randint(0, 3))) for _ in "ab"]
+            changes = book.apply_diff(bid_diff, ask_diff)
+            bids, asks = book.bids, book.asks
+
+        assert changes == DepthBook.diff(prev_bids, prev_asks, bids, asks, tick_size)
+        for isbid, prev, new in ((True, prev_bids, bids), (False, prev_asks, asks)):
+            for key in {book.key(p) for p, _ in prev + new}:
+                expected = (_level_qty(prev, key, book), _level_qty(new, key, book))
+                assert changes.get((isbid, key), (expected[1],) * 2) == expected
+        assert book.bids == sorted(book.bids, reverse=True)
+        assert book.asks == sorted(book.asks)
+        prev_bids, prev_asks = book.bids, book.asks
@@ -0,0 +1,90 @@
+"""Tests for the runonce indicator results shared between runs (``indcache``)."""
+
+import numpy as np
+import pytest
+
+import backtrader as bt
+import testcommon
+from backtrader.indicator import Indicator, IndicatorRegistry
+
+
+class CrossStrategy(bt.Strategy):
+    params = (("fast", 5), ("slow", 20))
+
+    def __init__(self):
+        fast = bt.ind.SMA(self.data, period=self.p.fast)
+        slow = bt.ind.EMA(self.data.close, period=self.p.slow)
+        self.cross = bt.ind.CrossOver(fast, slow)
+        self.macd = bt.ind.MACD(self.data)
+        self.signal = bt.ind.EMA(self.macd.signal, period=self.p.fast)
+        self.stoch = bt.ind.Stochastic(self.data)  # holds line operations
+        self.body = bt.ind.SMA(self.data.close - self.data.open, period=3)  # not cached
+        self.values = []
+
+    def next(self):
+        self.values.append(
+            [self.cross[0], self.macd.macd[0], self.signal[0], self.stoch.percD[0], self.body[0]]
+        )
+        if self.cross > 0:
+            self.buy()
+        elif self.cross < 0:
+            self.close()
+
+
+class ValuesAnalyzer(bt.Analyzer):
+    def stop(self):
+        self.rets["values"] = self.strategy.values
+
+
+def _optimize(data=None, **kwargs):
+    cerebro = bt.Cerebro(stdstats=False, **kwargs)
+    cerebro.adddata(data if data is not None else testcommon.getdata(0))
+    cerebro.optstrategy(CrossStrategy, fast=range(5, 8), slow=range(20, 23))
+    cerebro.addanalyzer(ValuesAnalyzer)
+    results = cerebro.run()
+    return [np.array(r[0].analyzers[0].get_analysis()["values"]) for r in results]
+
+
+def test_cached_results_match_computed_results(monkeypatch):
+    expected = _optimize(maxcpus=1)
+
+    restored = []
+    restore = Indicator._restoreresults
+
+    def tracking_restore(self, snapshot):
+        done = restore(self, snapshot)
+        restored.append((type(self), done))
+        return done
+
+    monkeypatch.setattr(Indicator, "_restoreresults", tracking_restore)
+    values = _optimize(maxcpus=1, indcache=True)
+
+    assert len(values) == len(expected)
+    for got, exp in zip(values, expected):
+        np.testing.assert_array_equal(got, exp)
+
+    # MACD/Stochastic run once, SMA/EMA once per period, CrossOver once per pair
+    assert restored and all(done for _, done in restored)
+    hits = [cls for cls, _ in restored]
+    assert hits.count(bt.ind.MACD) == 8
+    assert hits.count(bt.ind.CrossOver) == 0
+
+
+@pytest.mark.parametrize("indcache", [False, True])
+def test_cache_is_emptied_by_each_run(indcache):
+    _optimize(maxcpus=1, indcache=True)
+    assert IndicatorRegistry._rcache
+
+    data = testcommon.getdata(0)
+    _optimize(data, maxcpus=1, indcache=indcache)
+    assert bool(IndicatorRegistry._rcache) is indcache
+    # Entries only refer to the feed of the last run
+    for refs, _ in IndicatorRegistry._rcache.values():
+        assert all(ref is data or any(ref is line for line in data.lines) for ref in refs)
+
+
+def test_pool_results_match_with_cache():
+    expected = _optimize(maxcpus=1)
+    values = _optimize(maxcpus=2, indcache=True)
+    for got, exp in zip(values, expected):
+        np.testing.assert_array_equal(got, exp)
@@ -0,0 +1,126 @@
+"""Tests for the lazy imports of the catalogs and optional subsystems.
+
+``import backtrader`` only imports the modules of the contributed
+indicators, data feeds, brokers and stores whose names are used, and none
+of the heavy optional dependencies. The time it takes is measured by
+``tests/bench/bench_import_time.py``.
+"""
+
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import backtrader as bt
+from backtrader.utils.lazyimport import lazyexports
+
+ROOT = os.path.dirname(os.path.dirname(bt.__file__))
+
+# Only imported when the features using them are
+HEAVY = ("pandas", "scipy", "statsmodels", "matplotlib", "yaml", "backtrader.plot")
+
+
+def _python(code):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, os.environ.get("PYTHONPATH", "")]))
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout.splitlines()[-1]
+
+
+def test_import_loads_no_catalog_module():
+    modules = json.loads(
+        _python("import sys, json, backtrader; print(json.dumps(list(sys.modules)))")
+    )
+    assert not [name for name in HEAVY if name in modules]
+    assert not [name for name in modules if name.startswith("backtrader.indicators.contrib.")]
+    assert "backtrader.feeds.yahoo" not in modules
+    assert "backtrader.brokers.tickbroker" not in modules
+
+
+@pytest.mark.parametrize(
+    "package",
+    [bt.indicators.contrib, bt.feeds, bt.brokers, bt.stores],
+    ids=lambda package: package.__name__,
+)
+def test_exports_match_the_modules(package):
+    for module, names in package._EXPORTS.items():
+        module = importlib.import_module(f"{package.__name__}.{module}")
+        assert set(names) <= set(getattr(module, "__all__", names))
+        for name in names:
+            assert getattr(package, name) is getattr(module, name)
+            assert name in dir(package) and name in package.__all__
+
+
+def test_contrib_exports_whole_modules():
+    contrib = bt.indicators.contrib
+    for module, names in contrib._EXPORTS.items():
+        module = importlib.import_module(f"{contrib.__name__}.{module}")
+        assert list(names) == module.__all__
+
+
+def test_indicators_namespace():
+    # Core indicators and their aliases are registered on import
+    assert bt.ind.SMA is bt.indicators.MovingAverageSimple is bt.ind.MovAv.SMA
+    assert bt.indicators.ZeroLagMacd is bt.indicators.contrib.ZeroLagMacd
+    assert "ZeroLagMacd" in dir(bt.indicators)
+
+    namespace = {}
+    exec("from backtrader.indicators import *", namespace)
+    assert namespace["ZPFIndicator"] is bt.indicators.contrib.ZPFIndicator
+    assert namespace["RSI"] is bt.indicators.RSI
+
+    with pytest.raises(AttributeError):
+        bt.indicators.NotAnIndicator
+
+
+def test_lazyexports_submodules():
+    getattr_, dir_ = lazyexports("backtrader.feeds", {"numpyfeed": ("NumpyData",)})
+    assert getattr_("numpyfeed") is sys.modules["backtrader.feeds.numpyfeed"]
+    assert getattr_("NumpyData") is bt.feeds.NumpyData
+    assert "NumpyData" in dir_()
+    with pytest.raises(AttributeError):
+        getattr_("pandafeed_")
+    assert bt.reports.ReportGenerator.__module__ == "backtrader.reports.reporter"
+
+
+def test_feeds_keep_leaked_names_deprecated():
+    import datetime
+
+    from backtrader import feed
+
+    leaked = {
+        "feed": feed,
+        "TimeFrame": bt.TimeFrame,
+        "date2num": bt.utils.date2num,
+        "datetime": datetime.datetime,
+        "UTC": datetime.timezone.utc,
+    }
+    for name, value in leaked.items():
+        with pytest.warns(DeprecationWarning, match=f"backtrader.feeds.{name} is deprecated"):
+            assert getattr(bt.feeds, name) is value
+        assert name not in dir(bt.feeds)
+    for names in bt.feeds._DEPRECATED.values():
+        for name in names:
+            with pytest.warns(DeprecationWarning):
+                getattr(bt.feeds, name)
+
+
+def test_lazy_names_in_a_run():
+    start = time.perf_counter()
+    cerebro = bt.Cerebro(stdstats=False)
+    path = os.path.join(os.path.dirname(__file__), "../../datas/2006-day-001.txt")
+    cerebro.adddata(bt.feeds.BacktraderCSVData(dataname=path))
+
+    class St(bt.Strategy):
+        def __init__(self):
+            self.ind = bt.ind.AbsolutelyNoLagLwma(self.data)
+
+    cerebro.addstrategy(St)
+    (strategy,) = cerebro.run()
+    assert len(strategy.ind) == len(strategy.data) > 0
+    assert time.perf_counter() - start < 60
@@ -0,0 +1,85 @@
+"""Tests for the fused evaluation of strategy operation trees (``Cerebro(fuse=True)``)."""
+
+import operator
+
+import numpy as np
+import pytest
+
+import backtrader as bt
+import testcommon
+from backtrader.linebuffer import LineBuffer, LinesOperation
+from backtrader.linefusion import FusedOperation, fuse
+
+
+class ExpressionsStrategy(bt.Strategy):
+    """Strategy recording the values of several operation trees."""
+
+    def __init__(self):
+        d = self.data
+        sma = bt.ind.SMA(d, period=15)
+        atr = bt.ind.ATR(d)
+        self.signal = (d.close - sma) / atr > 1.5
+        self.shifted = -sma + 2.0
+        self.body = abs(d.close - d.open) / (d.high - d.low)
+        self.delayed = d.close - d.close(-1)  # _LineDelay operand: not fusible
+        self.values = []
+
+    def next(self):
+        self.values.append(
+            [self.signal[0], self.shifted[0], self.body[0], self.delayed[0], self.signal[-1]]
+        )
+
+
+def _run(**kwargs):
+    cerebro = bt.Cerebro(stdstats=False, **kwargs)
+    cerebro.adddata(testcommon.getdata(0))
+    cerebro.addstrategy(ExpressionsStrategy)
+    strat = cerebro.run()[0]
+    return strat, np.array(strat.values)
+
+
+@pytest.mark.parametrize("runonce", [True, False])
+def test_fused_trees_match_regular_evaluation(runonce):
+    _, expected = _run(runonce=runonce)
+    strat, values = _run(runonce=runonce, fuse=True)
+    np.testing.assert_array_equal(expected, values)
+
+    for root in (strat.signal, strat.shifted, strat.body):
+        assert isinstance(root._fused, FusedOperation)
+        assert root._fused.precomputed is runonce
+    assert strat.delayed._fused is None
+
+    # Intermediate nodes are no longer advanced by the strategy
+    absorbed = {id(node) for node in strat.signal._fused.nodes if node is not strat.signal}
+    advanced = {id(la) for la, _ in strat._get_strategy_next_lineactions()}
+    assert absorbed and not absorbed & advanced
+
+
+def test_fusion_flag_is_reset_by_regular_run():
+    _run(fuse=True)
+    assert LinesOperation._fuse is True
+    strat, _ = _run()
+    assert LinesOperation._fuse is False
+    assert strat.signal._fused is None
+
+
+def test_fused_nan_and_division_semantics():
+    a, b = LineBuffer(), LineBuffer()
+    for x, y in ((1.0, 0.0), (float("nan"), 1.0), (float("inf"), 2.0), (4.0, 2.0)):
+        a.forward()
+        b.forward()
+        a.array[-1], b.array[-1] = x, y  # raw storage: forward() sanitizes values
+    op = LinesOperation(a, b, operator.__truediv__)
+    fused = fuse(op, {id(a), id(b)})
+    values = fused.evaluate(4)
+    assert np.isnan(values[0]) and np.isnan(values[1])
+    assert values[2] == 0.0 and values[3] == 2.0
+
+    a.home()
+    b.home()
+    scalar = []
+    for _ in range(4):
+        a.advance()
+        b.advance()
+        scalar.append(fused.next())
+    np.testing.assert_array_equal(values, np.array(scalar, dtype=float))
@@ -0,0 +1,116 @@
+"""Tests for the contiguous NumPy line storage (``Cerebro(numpystorage=True)``)."""
+
+import array
+import pickle
+
+import numpy as np
+import pytest
+
+import backtrader as bt
+import testcommon
+from backtrader.linebuffer import LineBuffer
+from backtrader.utils.vectorops import GrowableArray
+
+
+class LinesStrategy(bt.Strategy):
+    """Strategy recording indicator values and whole-line reads."""
+
+    def __init__(self):
+        self.sma = bt.ind.SMA(self.data, period=15)
+        self.cross = bt.ind.CrossOver(self.data.close, self.sma)
+        self.values = []
+
+    def next(self):
+        self.values.append(
+            [
+                self.sma[0],
+                self.cross[0],
+                *self.data.close.get(size=5),
+                *self.sma.get(ago=-1, size=2),
+            ]
+        )
+
+
+def _run(**kwargs):
+    cerebro = bt.Cerebro(stdstats=False, **kwargs)
+    cerebro.adddata(testcommon.getdata(0))
+    cerebro.addstrategy(LinesStrategy)
+    strat = cerebro.run()[0]
+    return strat, strat.values
+
+
+@pytest.mark.parametrize("runonce", [True, False])
+def test_numpystorage_matches_array_storage(runonce):
+    _, expected = _run(runonce=runonce)
+    strat, values = _run(runonce=runonce, numpystorage=True)
+    assert isinstance(strat.data.close.array, GrowableArray)
+    assert isinstance(strat.data.close.get(size=3), array.array)
+    np.testing.assert_array_equal(np.array(expected), np.array(values))
+
+
+def test_numpystorage_flag_is_reset_by_regular_run():
+    _run(numpystorage=True)
+    assert LineBuffer._usenumpy is True
+    strat, _ = _run()
+    assert LineBuffer._usenumpy is False
+    assert isinstance(strat.data.close.array, array.array)
+
+
+def test_getzero_sanitizes_infinite_values():
+    LineBuffer.usenumpy(True)
+    try:
+        line = LineBuffer()
+    finally:
+        LineBuffer.usenumpy(False)
+    line.array.extend([1.0, float("inf"), float("nan")])
+    values = line.getzero(0, 3)
+    assert values[0] == 1.0 and values[1] == 0.0 and np.isnan(values[2])
+    assert line.array[1] == float("inf")  # storage is left untouched
+
+
+def test_views_share_the_numpy_storage():
+    LineBuffer.usenumpy(True)
+    try:
+        line = LineBuffer()
+    finally:
+        LineBuffer.usenumpy(False)
+    for value in (1.0, 2.0, 3.0, 4.0):
+        line.forward(value)
+    for view in (line.getview(size=3), line.getzeroview(1, 3), line.plotrange(1, 4), line.plot()):
+        assert np.shares_memory(view, line.array.view) and not view.flags.writeable
+    np.testing.assert_array_equal(line.getview(ago=-1, size=2), [2.0, 3.0])
+    assert list(line.get(size=2)) == list(line.getview(size=2))
+
+    line.array[2] = float("-inf")  # sanitized in a copy, like get()
+    view = line.plotrange(0, 4)
+    assert not np.shares_memory(view, line.array.view)
+    assert view.tolist() == [1.0, 2.0, 0.0, 4.0] and line.array[2] == float("-inf")
+
+    plain = LineBuffer()
+    plain.forward(1.0)
+    plain.forward(float("inf"))
+    assert plain.getview(size=2).tolist() == [1.0, 0.0]
+
+
+def test_growable_array_interface():
+    buf = GrowableArray()
+    for i in range(100):
+        buf.append(float(i))
+    assert len(buf) == 100 and buf[-1] == 99.0 and type(buf[0]) is float
+    buf.extend(iter([100.0, 101.0]))
+    buf[0] = -1.0
+    assert buf.tolist()[:2] == [-1.0, 1.0] and buf[101] == 101.0
+    del buf[50:]
+    assert len(buf) == 50 and buf.pop() == 49.0
+    del buf[0]
+    assert buf[0] == 1.0 and len(buf) == 48
+    buf[0:2] = [5.0, 6.0, 7.0]  # resizing slice assignment
+    assert buf.tolist()[:4] == [5.0, 6.0, 7.0, 3.0] and len(buf) == 49
+    with pytest.raises(IndexError):
+        buf[49]
+    copy = buf[0:3]
+    copy[0] = 0.0
+    assert buf[0] == 5.0  # slices are copies
+    restored = pickle.loads(pickle.dumps(buf))
+    assert restored.tolist() == buf.tolist()
+    np.testing.assert_array_equal(np.asarray(buf), buf.view)
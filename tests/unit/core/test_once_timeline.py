@@ -0,0 +1,71 @@
+"""Tests for the precomputed multi-data timeline of the runonce loop."""
+
+import datetime
+
+import numpy as np
+import pytest
+
+import backtrader as bt
+import testcommon
+from backtrader.utils import vectorops
+
+
+class RecordStrategy(bt.Strategy):
+    def __init__(self):
+        self.sma = bt.ind.SMA(self.data0, period=10)
+        self.steps = []
+
+    def next(self):
+        self.steps.append(
+            (self.datetime[0], len(self.sma), self.sma[0])
+            + tuple((len(d), d.datetime[0], d.close[0]) for d in self.datas)
+        )
+        if len(self) % 20 == 0:
+            self.buy(data=self.datas[-1])
+
+
+def _run(cheat_on_open=False):
+    cerebro = bt.Cerebro(stdstats=False, cheat_on_open=cheat_on_open)
+    cerebro.adddata(testcommon.getdata(0))
+    cerebro.adddata(
+        testcommon.getdata(
+            1, fromdate=datetime.datetime(2006, 3, 1), todate=datetime.datetime(2006, 10, 31)
+        )
+    )
+    cerebro.adddata(testcommon.getdata(0, fromdate=datetime.datetime(2006, 6, 15)))
+    cerebro.addstrategy(RecordStrategy)
+    strat = cerebro.run()[0]
+    return strat.steps, cerebro.broker.getvalue()
+
+
+@pytest.mark.parametrize("cheat_on_open", [False, True])
+def test_timeline_matches_peeking_loop(monkeypatch, cheat_on_open):
+    timelines = []
+    oncetimeline = bt.Cerebro._oncetimeline
+
+    def tracking_timeline(self, datas):
+        timeline = oncetimeline(self, datas)
+        timelines.append(timeline)
+        return timeline
+
+    monkeypatch.setattr(bt.Cerebro, "_oncetimeline", tracking_timeline)
+    steps, value = _run(cheat_on_open)
+    assert len(timelines) == 1 and timelines[0] is not None
+    assert len(steps) > 100
+
+    monkeypatch.setattr(bt.Cerebro, "_oncetimeline", lambda self, datas: None)
+    assert _run(cheat_on_open) == (steps, value)
+
+
+def test_merge_timelines():
+    steps, members = vectorops.merge_timelines(
+        [np.array([1.0, 3.0, 5.0]), np.array([]), np.array([2.0, 3.0, 6.0])]
+    )
+    np.testing.assert_array_equal(steps, [1.0, 2.0, 3.0, 5.0, 6.0])
+    assert members == [[0], [2], [0, 2], [0], [2]]
+
+    steps, members = vectorops.merge_timelines([np.array([])])
+    assert len(steps) == 0 and members == []
+
+    assert vectorops.merge_timelines([np.array([1.0, 1.0])]) is None
+    assert vectorops.merge_timelines([np.array([1.0, np.nan])]) is None
@@ -0,0 +1,127 @@
+"""Tests for the batched optimization scheduler and the resumable results file."""
+
+import datetime
+import itertools
+import os
+import shutil
+
+import pytest
+
+import backtrader as bt
+import testcommon
+from backtrader.errors import ConfigError
+from backtrader.optscheduler import OptResultsFile, sweep_fingerprint
+
+
+class CrossStrategy(bt.Strategy):
+    params = (("period", 10),)
+
+    def __init__(self):
+        sma = bt.ind.SMA(self.data, period=self.p.period)
+        self.cross = bt.ind.CrossOver(self.data.close, sma)
+
+    def next(self):
+        if self.cross > 0:
+            self.buy()
+        elif self.cross < 0:
+            self.close()
+
+
+def _optimize(periods=range(8, 16), callback=None, **kwargs):
+    cerebro = bt.Cerebro(stdstats=False, **kwargs)
+    cerebro.adddata(testcommon.getdata(0))
+    cerebro.optstrategy(CrossStrategy, period=periods)
+    cerebro.addanalyzer(bt.analyzers.TradeAnalyzer)
+    if callback is not None:
+        cerebro.optcallback(callback)
+    results = cerebro.run()
+    return [(r[0].params.period, r[0].analyzers[0].get_analysis().total.total) for r in results]
+
+
+@pytest.mark.parametrize("chunksize", [0, 3])
+def test_pool_batches_match_single_process(chunksize):
+    expected = _optimize(maxcpus=1)
+    assert _optimize(maxcpus=2, optchunksize=chunksize) == expected
+
+
+@pytest.mark.parametrize("maxcpus", [1, 2])
+def test_interrupted_sweep_resumes_from_results_file(tmp_path, maxcpus):
+    path = str(tmp_path / "sweep.pkl")
+    expected = _optimize(maxcpus=1)
+
+    seen = []
+
+    def interrupt(result):
+        seen.append(result)
+        if len(seen) == 3:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        _optimize(maxcpus=maxcpus, optresults=path, optchunksize=1, callback=interrupt)
+
+    rerun = []
+    assert _optimize(maxcpus=maxcpus, optresults=path, callback=rerun.append) == expected
+    assert len(rerun) == len(expected) - 3
+
+    # Everything is stored now: nothing runs
+    rerun.clear()
+    assert _optimize(maxcpus=maxcpus, optresults=path, callback=rerun.append) == expected
+    assert not rerun
+
+
+def test_results_file_rejects_other_sweeps_and_partial_records(tmp_path):
+    path = str(tmp_path / "sweep.pkl")
+    resfile = OptResultsFile(path, "abc", 2)
+    assert resfile.open() == {}
+    resfile.append(0, ["first"])
+    resfile.append(1, ["second"])
+    resfile.close()
+
+    with open(path, "r+b") as fp:  # simulate a record cut by a killed process
+        fp.truncate(fp.seek(0, 2) - 3)
+
+    resfile = OptResultsFile(path, "abc", 2)
+    assert resfile.open() == {0: ["first"]}
+    resfile.close()
+
+    with pytest.raises(ConfigError):
+        OptResultsFile(path, "other", 2).open()
+
+
+DATAPATH = os.path.join(testcommon.modpath, testcommon.dataspath, testcommon.datafiles[0])
+
+
+def _sweep(path, periods=range(8, 10), analyzer=bt.analyzers.TradeAnalyzer, **kwargs):
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.adddata(bt.feeds.BacktraderCSVData(dataname=path, fromdate=kwargs.get("fromdate")))
+    cerebro.optstrategy(CrossStrategy, period=periods)
+    cerebro.addanalyzer(analyzer)
+    cerebro.broker.setcash(kwargs.get("cash", 10000.0))
+    cerebro.broker.setcommission(commission=kwargs.get("commission", 0.0))
+    return sweep_fingerprint(list(itertools.product(*cerebro.strats)), cerebro)
+
+
+def test_fingerprint_covers_the_setup_of_the_sweep(tmp_path):
+    path = str(tmp_path / "data.txt")
+    shutil.copy(DATAPATH, path)
+    fingerprint = _sweep(path)
+    assert _sweep(path) == fingerprint  # stable from run to run
+
+    changes = [
+        {"periods": range(8, 11)},
+        {"cash": 20000.0},
+        {"commission": 0.001},
+        {"analyzer": bt.analyzers.SharpeRatio},
+        {"fromdate": datetime.datetime(2006, 3, 1)},
+    ]
+    fingerprints = {_sweep(path, **change) for change in changes}
+    assert len(fingerprints) == len(changes) and fingerprint not in fingerprints
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert _sweep(path) != fingerprint
+
+
+def test_fingerprint_rejects_unstable_values():
+    with pytest.raises(ConfigError, match="no stable description"):
+        _sweep(DATAPATH, periods=[object()])
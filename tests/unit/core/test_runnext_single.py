@@ -0,0 +1,80 @@
+"""Tests for the ``_runnext`` loop specialized for a single historical feed."""
+
+import pytest
+
+import backtrader as bt
+import testcommon
+
+
+class TradingStrategy(bt.Strategy):
+    def __init__(self):
+        self.sma = bt.ind.SMA(self.data0, period=15)
+        self.cross = bt.ind.CrossOver(self.data0.close, self.sma)
+        self.values = []
+        self.events = []
+        self.add_timer(when=bt.timer.SESSION_START, cheat=True)
+        self.add_timer(when=bt.timer.SESSION_END)
+
+    def notify_timer(self, timer, when, *args, **kwargs):
+        self.events.append(("timer", len(self), when))
+
+    def notify_order(self, order):
+        if order.status == order.Completed:
+            self.events.append(("order", len(self), order.executed.price))
+
+    def next_open(self):
+        self.events.append(("open", len(self), self.data0.open[0]))
+
+    def next(self):
+        self.values.append((self.data0.datetime[0], self.data0.close[0], self.sma[0]))
+        if self.cross > 0:
+            self.buy(coc=False)
+        elif self.cross < 0:
+            self.close()
+
+
+def _run(datas, **kwargs):
+    cerebro = bt.Cerebro(stdstats=False, runonce=False, **kwargs)
+    for data in datas:
+        cerebro.adddata(data)
+    cerebro.addstrategy(TradingStrategy)
+    strat = cerebro.run()[0]
+    return strat.values, strat.events, cerebro.broker.getvalue()
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"preload": False}, {"cheat_on_open": True}])
+def test_single_feed_loop_matches_general_loop(monkeypatch, kwargs):
+    calls = []
+    single = bt.Cerebro._runnext_single
+
+    def tracking_single(self, runstrats, data):
+        calls.append(data)
+        return single(self, runstrats, data)
+
+    monkeypatch.setattr(bt.Cerebro, "_runnext_single", tracking_single)
+
+    data = testcommon.getdata(0)
+    values, events, value = _run([data], **kwargs)
+    assert calls == [data]
+    assert values
+
+    # A second, identical feed goes through the general loop
+    values2, events2, value2 = _run([testcommon.getdata(0), testcommon.getdata(0)], **kwargs)
+    assert len(calls) == 1
+    assert values2 == values
+    assert events2 == events
+    assert value2 == value
+
+
+def test_single_feed_loop_with_resampling():
+    data = testcommon.getdata(0)
+    cerebro = bt.Cerebro(stdstats=False, runonce=False)
+    cerebro.resampledata(data, timeframe=bt.TimeFrame.Weeks)
+    cerebro.addstrategy(TradingStrategy)
+    strat = cerebro.run()[0]
+
+    expected = bt.Cerebro(stdstats=False, runonce=False)
+    expected.resampledata(testcommon.getdata(0), timeframe=bt.TimeFrame.Weeks)
+    expected.resampledata(testcommon.getdata(0), timeframe=bt.TimeFrame.Weeks)
+    expected.addstrategy(TradingStrategy)
+    assert strat.values == expected.run()[0].values
@@ -0,0 +1,83 @@
+"""Tests for the shared memory preloaded data of optimizations (``optsharedmem``)."""
+
+import pickle
+
+import numpy as np
+
+import backtrader as bt
+import testcommon
+from backtrader.utils.sharedmem import SharedArray, SharedLinesStore
+
+
+class CrossStrategy(bt.Strategy):
+    params = (("period", 10),)
+
+    def __init__(self):
+        sma = bt.ind.SMA(self.data, period=self.p.period)
+        self.cross = bt.ind.CrossOver(self.data.close, sma)
+
+    def next(self):
+        if self.cross > 0:
+            self.buy()
+        elif self.cross < 0:
+            self.close()
+
+
+class StorageAnalyzer(bt.Analyzer):
+    """Record how the worker stores the values of the data feed."""
+
+    def start(self):
+        array = self.data.close.array
+        self.rets["shared"] = isinstance(array, SharedArray) and array.shared
+
+    def stop(self):
+        self.rets["trades"] = len(self.strategy._trades[self.data][0])
+
+
+def _optimize(**kwargs):
+    cerebro = bt.Cerebro(stdstats=False, **kwargs)
+    cerebro.adddata(testcommon.getdata(0))
+    cerebro.optstrategy(CrossStrategy, period=range(8, 12))
+    cerebro.addanalyzer(StorageAnalyzer)
+    results = cerebro.run()
+    return cerebro, [r[0].analyzers[0].get_analysis() for r in results]
+
+
+def test_workers_attach_shared_data():
+    _, expected = _optimize(maxcpus=1)
+    cerebro, results = _optimize(maxcpus=2, optsharedmem=True)
+
+    assert [r["trades"] for r in results] == [r["trades"] for r in expected]
+    assert all(r["shared"] for r in results)
+    assert not any(r["shared"] for r in expected)
+    # The block is gone: the main process lines hold private values again
+    assert not cerebro.datas[0].close.array.shared
+
+
+def test_shared_array_is_copy_on_write():
+    data = testcommon.getdata(0)
+    data._start()
+    data.preload()
+    values = data.close.array.tolist()
+
+    store = SharedLinesStore()
+    assert store.share([data]) > 0
+    try:
+        shared = data.close.array
+        assert isinstance(shared, SharedArray) and shared.shared
+        assert shared.tolist() == values
+
+        clone = pickle.loads(pickle.dumps(shared))
+        assert clone.shared and clone.tolist() == values
+
+        clone[0] = -1.0  # detaches the clone, the block is untouched
+        assert not clone.shared and clone[0] == -1.0
+        assert shared[0] == values[0]
+
+        shared.append(1.0)
+        assert not shared.shared and len(shared) == len(values) + 1
+        np.testing.assert_array_equal(shared.view[:-1], values)
+    finally:
+        store.release()
+
+    assert data.open.array.tolist() == pickle.loads(pickle.dumps(data.open.array)).tolist()
@@ -0,0 +1,105 @@
+"""Tests for the vectorized evaluation of signal grids (``Cerebro.optsignal``)."""
+
+import itertools
+
+import pytest
+
+import backtrader as bt
+import testcommon
+
+
+class SmaCross(bt.Indicator):
+    lines = ("signal",)
+    params = (("fast", 5), ("slow", 20))
+
+    def __init__(self):
+        fast = bt.ind.SMA(self.data, period=self.p.fast)
+        slow = bt.ind.SMA(self.data, period=self.p.slow)
+        self.lines.signal = bt.ind.CrossOver(fast, slow)
+
+
+class CloseOverSma(bt.Indicator):
+    lines = ("signal",)
+    params = (("period", 15),)
+
+    def __init__(self):
+        self.lines.signal = self.data.close - bt.ind.SMA(self.data, period=self.p.period)
+
+
+CROSS_GRID = dict(fast=(5, 10, 15), slow=(20, 30))
+LEVEL_GRID = dict(period=(10, 20, 30))
+CASH = 1000000.0
+
+
+def _setup(cerebro, commission, accumulate):
+    cerebro.adddata(testcommon.getdata(0))
+    cerebro.broker.setcash(CASH)  # accumulating must not run out of cash
+    cerebro.broker.setcommission(commission=commission)
+    cerebro.signal_accumulate(accumulate)
+
+
+def _single(sigtype, sigcls, kwargs, exitsignal, commission, accumulate):
+    cerebro = bt.Cerebro(stdstats=False)
+    _setup(cerebro, commission, accumulate)
+    cerebro.add_signal(sigtype, sigcls, **kwargs)
+    if exitsignal:
+        cerebro.add_signal(bt.SIGNAL_LONGEXIT, CloseOverSma)
+    cerebro.addanalyzer(bt.analyzers.TradeAnalyzer)
+    cerebro.addanalyzer(bt.analyzers.DrawDown)
+    strat = cerebro.run()[0]
+    trades = strat.analyzers[0].get_analysis()
+    closed = trades.total.closed if "closed" in trades.get("total", {}) else 0
+    won = trades.won.total if "won" in trades else 0
+    drawdown = strat.analyzers[1].get_analysis().max.drawdown
+    return cerebro.broker.getvalue(), closed, won, drawdown
+
+
+def _batch(sigtype, sigcls, grid, exitsignal, commission, accumulate, runonce=True):
+    cerebro = bt.Cerebro(stdstats=False, runonce=runonce)
+    _setup(cerebro, commission, accumulate)
+    cerebro.optsignal(sigtype, sigcls, **grid)
+    if exitsignal:
+        cerebro.add_signal(bt.SIGNAL_LONGEXIT, CloseOverSma)
+    strat = cerebro.run()[0]
+    assert isinstance(strat, bt.SignalBatchStrategy)
+    return strat.batch
+
+
+@pytest.mark.parametrize(
+    "sigtype,sigcls,grid,exitsignal,commission,accumulate",
+    [
+        (bt.SIGNAL_LONGSHORT, SmaCross, CROSS_GRID, False, 0.0, False),
+        (bt.SIGNAL_LONG, SmaCross, CROSS_GRID, False, 0.001, False),
+        (bt.SIGNAL_LONG, SmaCross, CROSS_GRID, True, 0.0, False),
+        (bt.SIGNAL_SHORT, SmaCross, CROSS_GRID, False, 0.0, False),
+        (bt.SIGNAL_LONG_ANY, SmaCross, CROSS_GRID, False, 0.002, True),
+        (bt.SIGNAL_LONG, CloseOverSma, LEVEL_GRID, False, 0.002, True),
+    ],
+)
+def test_batch_matches_event_driven_runs(sigtype, sigcls, grid, exitsignal, commission, accumulate):
+    batch = _batch(sigtype, sigcls, grid, exitsignal, commission, accumulate)
+    combos = [dict(zip(grid, values)) for values in itertools.product(*grid.values())]
+    assert len(batch) == len(combos)
+
+    for idx, kwargs in enumerate(combos):
+        value, closed, won, drawdown = _single(
+            sigtype, sigcls, kwargs, exitsignal, commission, accumulate
+        )
+        result = batch.get(idx)
+        assert result["params"] == (((), kwargs),)
+        assert result["value"] == pytest.approx(value)
+        assert result["pnl"] == pytest.approx(value - CASH)
+        assert result["trades"] == closed
+        assert result["won"] == won
+        assert result["maxdrawdown"] == pytest.approx(drawdown)
+
+
+def test_batch_in_next_mode_and_ranking():
+    batch = _batch(bt.SIGNAL_LONGSHORT, SmaCross, CROSS_GRID, False, 0.0, False)
+    nextmode = _batch(bt.SIGNAL_LONGSHORT, SmaCross, CROSS_GRID, False, 0.0, False, runonce=False)
+    assert nextmode.value.tolist() == pytest.approx(batch.value.tolist())
+
+    ranked = batch.ranking(by="value")
+    assert sorted(ranked) == list(range(len(batch)))
+    assert batch.value[ranked[0]] == batch.value.max()
+    assert batch.ranking(by="maxdrawdown", n=1) == [int(batch.maxdrawdown.argmin())]
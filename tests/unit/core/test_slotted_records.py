@@ -0,0 +1,126 @@
+"""Tests for the slotted event and fill records."""
+
+import copy
+import dataclasses
+import pickle
+from typing import List
+
+import pytest
+
+from backtrader.brokers.hft import FillPool, FillReport, MatchingCore, MatchResult, OrderResult
+from backtrader.channel import Event
+from backtrader.events import (
+    BarEvent,
+    EventData,
+    FundingEvent,
+    OrderBookDiff,
+    OrderBookSnapshot,
+    TickEvent,
+)
+from backtrader.utils.slots import slotted
+
+
+@slotted()
+@dataclasses.dataclass
+class _Base:
+    x: int
+    tags: List[str] = dataclasses.field(default_factory=list)
+
+    def describe(self):
+        return f"base {self.x}"
+
+
+@slotted("scratch")
+@dataclasses.dataclass
+class _Child(_Base):
+    y: float = 1.5
+
+    def describe(self):
+        return super().describe() + f" child {self.y}"
+
+
+def test_slotted_dataclass():
+    child = _Child(1, y=2.0)
+    assert _Child.__slots__ == ("y", "scratch")
+    assert not hasattr(child, "__dict__")
+    assert child.describe() == "base 1 child 2.0"
+    assert child == _Child(1, [], 2.0) and child.tags == [] and _Child(2).y == 1.5
+    assert not hasattr(child, "scratch")
+    child.scratch = 3
+    with pytest.raises(AttributeError):
+        child.other = 3
+
+    restored = pickle.loads(pickle.dumps(child))
+    assert restored == child and restored.scratch == 3
+    assert dataclasses.replace(child, y=4.0).describe() == "base 1 child 4.0"
+    with pytest.raises(TypeError):
+        slotted()(_Child)
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        TickEvent(timestamp=1.0, symbol="BTC/USDT", price=100.0, volume=1.0),
+        OrderBookSnapshot(
+            timestamp=1.0, symbol="BTC/USDT", bids=[(99.0, 1.0)], asks=[(101.0, 1.0)]
+        ),
+        OrderBookDiff(timestamp=1.0, symbol="BTC/USDT", asks=[(101.0, 0.0)]),
+        FundingEvent(timestamp=1.0, symbol="BTC/USDT", rate=0.0001, mark_price=100.0),
+        BarEvent(timestamp=1.0, symbol="BTC/USDT", open=100.0, high=101.0, low=99.0, close=100.0),
+    ],
+)
+def test_events_keep_fields_in_slots(record):
+    fields = [field.name for field in dataclasses.fields(record)]
+    slots = set()
+    for klass in type(record).__mro__:
+        slots.update(klass.__dict__.get("__slots__", ()))
+    assert set(fields) <= slots
+    assert record.validate()
+    assert list(record.to_dict()) == fields
+    assert copy.deepcopy(record) == record == pickle.loads(pickle.dumps(record))
+
+    # Live adapters attach extra attributes
+    record.datetime = "2024-01-01"
+    assert record.to_dict()["datetime"] == "2024-01-01"
+
+
+def test_orderbook_depth_state_slots():
+    snapshot = OrderBookSnapshot(timestamp=1.0, symbol="BTC/USDT", asks=[(101.0, 1.0)])
+    assert getattr(snapshot, "depth_changes", None) is None
+    snapshot.previous_asks = []
+    snapshot.depth_changes = {(False, 101.0): (0.0, 1.0)}
+    assert "depth_changes" not in snapshot.__dict__
+    assert "depth_changes" not in snapshot.to_dict()
+    assert snapshot == OrderBookSnapshot(timestamp=1.0, symbol="BTC/USDT", asks=[(101.0, 1.0)])
+
+
+def test_hot_records_have_no_dict():
+    records = [
+        Event(timestamp=1.0),
+        FillReport(order=None, fill_price=1.0, fill_size=2.0),
+        MatchResult(action="PENDING"),
+        OrderResult(action="FILL"),
+    ]
+    for record in records:
+        assert not hasattr(record, "__dict__")
+    assert Event(timestamp=1.0, sequence=2) < Event(timestamp=1.0, sequence=3)
+    assert issubclass(TickEvent, EventData)
+
+
+def test_fill_pool_recycles_fills():
+    pool = FillPool(maxsize=2)
+    fills = [pool.acquire(object(), 100.0 + i, 1.0) for i in range(3)]
+    pool.release(fills)
+    assert len(pool) == 2 and fills[0].order is None
+
+    order = object()
+    fill = pool.acquire(order, 99.0, 2.0, role="maker", timestamp=5.0, source="orderbook_depth")
+    assert fill is fills[1]
+    assert fill == FillReport(order, 99.0, 2.0, "maker", 5.0, "orderbook_depth")
+
+    core = MatchingCore(fill_pool=pool)
+    built = core._build_fill(order, 98.0, 1.0, 6.0)
+    assert built is fills[0] and len(pool) == 0
+    result = MatchResult(action="FILL", fills=[built])
+    core.release(result)
+    assert result.fills == [] and len(pool) == 1
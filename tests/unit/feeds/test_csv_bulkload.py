@@ -0,0 +1,173 @@
+"""Tests for the bulk preload path of the CSV feeds.
+
+The bulk path must fill the lines exactly as the per-line ``_loadline``
+loop does, and fall back to it whenever it cannot.
+"""
+
+import datetime
+import io
+import os
+
+import numpy as np
+import pytest
+
+import backtrader as bt
+from backtrader.linebuffer import LineBuffer
+from backtrader.utils.dateintern import date2num, ordinal2num
+
+DATAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../datas")
+
+
+def _datapath(name):
+    return os.path.join(DATAS, name)
+
+
+def _preload(cls, bulkload, **kwargs):
+    # Inline texts start with their header line
+    if kwargs["dataname"].startswith("h"):
+        kwargs["dataname"] = io.StringIO(kwargs["dataname"])
+    data = cls(bulkload=bulkload, **kwargs)
+    data._start()
+    data.preload()
+    return data
+
+
+def _arrays(data):
+    return [np.asarray(line.array, dtype=float).tobytes() for line in data.lines]
+
+
+def _assert_same(cls, **kwargs):
+    slow = _preload(cls, False, **kwargs)
+    fast = _preload(cls, True, **kwargs)
+    assert _arrays(fast) == _arrays(slow)
+    assert [len(line) for line in fast.lines] == [len(line) for line in slow.lines]
+    return fast
+
+
+@pytest.mark.parametrize(
+    "cls, kwargs",
+    [
+        (bt.feeds.BacktraderCSVData, dict(dataname=_datapath("2006-day-001.txt"))),
+        (
+            bt.feeds.BacktraderCSVData,
+            dict(dataname=_datapath("2006-min-005.txt"), timeframe=bt.TimeFrame.Minutes),
+        ),
+        (
+            bt.feeds.BacktraderCSVData,
+            dict(
+                dataname=_datapath("2006-day-001.txt"),
+                fromdate=datetime.datetime(2006, 3, 1),
+                todate=datetime.datetime(2006, 6, 1),
+            ),
+        ),
+        (
+            bt.feeds.GenericCSVData,
+            dict(
+                dataname=_datapath("2006-min-005.txt"),
+                dtformat="%Y-%m-%d",
+                time=1,
+                tmformat="%H:%M:%S",
+                open=2,
+                high=3,
+                low=4,
+                close=5,
+                volume=6,
+                openinterest=7,
+                timeframe=bt.TimeFrame.Minutes,
+            ),
+        ),
+        (
+            bt.feeds.MT4CSVData,
+            dict(
+                dataname=_datapath("XAUUSD_M30.csv"),
+                separator="\t",
+                tmformat="%H:%M:%S",
+                timeframe=bt.TimeFrame.Minutes,
+            ),
+        ),
+        (
+            bt.feeds.GenericCSVData,
+            dict(
+                dataname=_datapath("2006-day-001.txt"),
+                dtformat=lambda s: datetime.datetime.strptime(s, "%Y-%m-%d"),
+            ),
+        ),
+        (
+            bt.feeds.GenericCSVData,
+            dict(dataname="h\n1136214000,1,2,3,4,5,6\n1136300400,1,2,3,,5,6\n", dtformat=1),
+        ),
+        (
+            bt.feeds.GenericCSVData,
+            dict(
+                dataname="h\r\n2006-01-02 10:00:00,1,2,3,4,5,inf\r\n"
+                "2006-01-02 10:01:00,nan,2,3,4,5,6\r\n"
+            ),
+        ),
+    ],
+)
+def test_bulkload_matches_line_by_line(cls, kwargs):
+    data = _assert_same(cls, **kwargs)
+    assert data.buflen() > 0
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "h\n2006-01-02 10:00:00,1,2,3,4,5,6\n2006-02-30 10:01:00,1,2,3,4,5,6\n",
+        "h\n2006-01-02 10:00:00,1,2,3,4,5,6\n2006-01-03 10:01:00,1,2,3,x,5,6\n",
+    ],
+)
+def test_bulkload_raises_like_line_by_line(text):
+    with pytest.raises(ValueError) as slow:
+        _preload(bt.feeds.GenericCSVData, False, dataname=text)
+    with pytest.raises(ValueError) as fast:
+        _preload(bt.feeds.GenericCSVData, True, dataname=text)
+    assert str(fast.value) == str(slow.value)
+
+
+def test_irregular_rows_fall_back():
+    # Extra fields are ignored by the per-line loop
+    text = "h\n2006-01-02 10:00:00,1,2,3,4,5,6\n2006-01-02 10:01:00,1,2,3,4,5,6,7\n"
+    data = _assert_same(bt.feeds.GenericCSVData, dataname=text)
+    assert data.buflen() == 2
+
+
+def test_loadline_override_falls_back():
+    class Doubled(bt.feeds.BacktraderCSVData):
+        def _loadline(self, linetokens):
+            ret = super()._loadline(linetokens)
+            self.lines.close[0] *= 2.0
+            return ret
+
+    path = _datapath("2006-day-001.txt")
+    plain = _preload(bt.feeds.BacktraderCSVData, True, dataname=path)
+    doubled = _preload(Doubled, True, dataname=path)
+    assert np.array_equal(
+        np.asarray(doubled.lines.close.array), 2.0 * np.asarray(plain.lines.close.array)
+    )
+
+
+def test_ordinal2num_matches_date2num():
+    dts = [
+        datetime.datetime(2006, 1, 2, 10, 0, 0),
+        datetime.datetime(1999, 12, 31, 23, 59, 59, 999999),
+        datetime.datetime(2024, 2, 29, 16, 0, 0, 1),
+        datetime.datetime(1, 1, 1, 0, 0, 0),
+    ]
+    ordinals = [dt.toordinal() for dt in dts]
+    usecs = [((dt.hour * 60 + dt.minute) * 60 + dt.second) * 1000000 + dt.microsecond for dt in dts]
+    assert ordinal2num(ordinals, usecs).tolist() == [date2num(dt) for dt in dts]
+
+
+def test_forwardvalues_sanitizes_like_setitem():
+    values = [1.5, float("inf"), float("nan"), -2.0]
+    expected = LineBuffer()
+    for value in values:
+        expected.forward()
+        expected[0] = value
+
+    buffer = LineBuffer()
+    buffer.forwardvalues(np.array(values))
+    assert len(buffer) == len(expected) == 4
+    assert buffer[0] == -2.0
+    assert np.asarray(buffer.array).tobytes() == np.asarray(expected.array).tobytes()
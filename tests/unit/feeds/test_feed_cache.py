@@ -0,0 +1,218 @@
+"""Tests for the on-disk cache of preloaded data feeds."""
+
+import io
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import backtrader as bt
+from backtrader.feed import CSVDataBase
+from backtrader.utils.feedcache import FeedCache
+
+DATAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../datas")
+TF = bt.TimeFrame
+
+
+@pytest.fixture
+def csvpath(tmp_path):
+    path = tmp_path / "2006-min-005.txt"
+    shutil.copy(os.path.join(DATAS, "2006-min-005.txt"), path)
+    return str(path)
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Number of feeds which parsed their CSV file."""
+    calls = []
+    bulkload = CSVDataBase._bulkload
+
+    def spy(self):
+        calls.append(self)
+        return bulkload(self)
+
+    monkeypatch.setattr(CSVDataBase, "_bulkload", spy)
+    return calls
+
+
+def _preload(data):
+    data._start()
+    data.preload()
+    return data
+
+
+def _csv(path, **kwargs):
+    return bt.feeds.BacktraderCSVData(dataname=path, timeframe=TF.Minutes, compression=5, **kwargs)
+
+
+def _arrays(data):
+    return [np.asarray(line.array, dtype=float).tobytes() for line in data.lines]
+
+
+def _entries(cachedir):
+    return len(os.listdir(cachedir)) if os.path.isdir(cachedir) else 0
+
+
+def test_csv_cache_hit(tmp_path, csvpath, loads):
+    cachedir = str(tmp_path / "cache")
+    plain = _preload(_csv(csvpath))
+    missed = _preload(_csv(csvpath, cache=cachedir))
+    assert _entries(cachedir) == 1
+    del loads[:]
+
+    cached = _preload(_csv(csvpath, cache=cachedir))
+    assert not loads
+    assert _arrays(cached) == _arrays(missed) == _arrays(plain)
+    assert cached.buflen() == plain.buflen() > 0
+    # Nothing is left to load from the source
+    assert cached.f is None and not cached.load()
+
+
+def test_csv_cache_invalidation(tmp_path, csvpath, loads):
+    cachedir = str(tmp_path / "cache")
+    _preload(_csv(csvpath, cache=cachedir))
+    _preload(_csv(csvpath, cache=cachedir, fromdate=bt.utils.date.num2date(732315.0)))
+    assert _entries(cachedir) == 2
+
+    with open(csvpath) as f:
+        text = f.read().splitlines(keepends=True)
+    with open(csvpath, "w") as f:
+        f.writelines(text[:-10])
+    del loads[:]
+    data = _preload(_csv(csvpath, cache=cachedir))
+    assert len(loads) == 1 and _entries(cachedir) == 3
+    assert data.buflen() == len(text) - 11
+
+    FeedCache(cachedir).clear()
+    assert _entries(cachedir) == 0
+
+
+def test_hashfiles_ignores_the_modification_time(tmp_path, csvpath, loads):
+    cache = FeedCache(tmp_path / "cache", hashfiles=True)
+    _preload(_csv(csvpath, cache=cache))
+    stat = os.stat(csvpath)
+    os.utime(csvpath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    _preload(_csv(csvpath, cache=cache))
+    assert len(loads) == 1
+
+    _preload(_csv(csvpath, cache=str(tmp_path / "cache")))
+    assert len(loads) == 2
+
+
+def test_resampled_feed_is_cached(tmp_path, csvpath, loads):
+    cachedir = str(tmp_path / "cache")
+
+    def make(**kwargs):
+        data = _csv(csvpath, **kwargs)
+        data.resample(timeframe=TF.Minutes, compression=60)
+        return _preload(data)
+
+    plain = make()
+    make(cache=cachedir)
+    del loads[:]
+    cached = make(cache=cachedir)
+    assert not loads
+    assert _arrays(cached) == _arrays(plain)
+
+    data = _csv(csvpath, cache=cachedir)
+    data.resample(timeframe=TF.Minutes, compression=30)
+    _preload(data)
+    assert len(loads) == 1 and _entries(cachedir) == 2
+
+
+def test_uncacheable_feeds(tmp_path, csvpath):
+    cachedir = str(tmp_path / "cache")
+    data = _csv(csvpath, cache=cachedir)
+    data.addfilter_simple(lambda d: False)
+    _preload(data)
+
+    with open(csvpath) as f:
+        source = io.StringIO(f.read())
+    data = _preload(_csv(source, cache=cachedir))
+    assert data.buflen() > 0
+    assert _entries(cachedir) == 0
+
+
+def test_feeds_take_part_only_if_cacheable(tmp_path, csvpath):
+    class Uncached(bt.feeds.BacktraderCSVData):
+        _cacheable = False
+
+    cachedir = str(tmp_path / "cache")
+    data = _preload(Uncached(dataname=csvpath, cache=cachedir))
+    assert data.buflen() > 0 and _entries(cachedir) == 0
+    assert bt.feeds.DataBase._cacheable is False
+
+
+def test_unusable_entry_is_loaded_again(tmp_path, csvpath, loads):
+    cachedir = str(tmp_path / "cache")
+    plain = _preload(_csv(csvpath, cache=cachedir))
+    (entry,) = os.listdir(cachedir)
+    os.remove(os.path.join(cachedir, entry, "0.npy"))
+    data = _preload(_csv(csvpath, cache=cachedir))
+    assert len(loads) == 2
+    assert _arrays(data) == _arrays(plain)
+
+
+def _frame():
+    rng = np.random.default_rng(5)
+    index = pd.date_range("2021-03-01 09:30", periods=300, freq="min")
+    columns = {
+        name: rng.random(300) for name in ("open", "high", "low", "close", "volume", "openinterest")
+    }
+    return pd.DataFrame(columns, index=index)
+
+
+def test_pandas_and_numpy_feeds(tmp_path):
+    cachedir = str(tmp_path / "cache")
+    frame = _frame()
+    columns = {"datetime": frame.index.values}
+    columns.update((name, frame[name].to_numpy()) for name in frame.columns)
+    makers = [
+        lambda **kw: bt.feeds.PandasData(dataname=frame, timens=True, **kw),
+        lambda **kw: bt.feeds.PandasDirectData(dataname=frame, **kw),
+        lambda **kw: bt.feeds.NumpyData(dataname=columns, **kw),
+    ]
+    for make in makers:
+        plain = _preload(make())
+        _preload(make(cache=cachedir))
+        cached = _preload(make(cache=cachedir))
+        assert _arrays(cached) == _arrays(plain)
+        assert cached.lines.datetime._nsaxis is not None or plain.lines.datetime._nsaxis is None
+        assert not cached.load()
+    assert _entries(cachedir) == 3
+
+    frame.iloc[7, 0] += 1.0
+    _preload(bt.feeds.PandasData(dataname=frame, timens=True, cache=cachedir))
+    assert _entries(cachedir) == 4
+
+
+def test_cerebro_feedcache(tmp_path, csvpath, loads):
+    cachedir = str(tmp_path / "cache")
+
+    def run(**kwargs):
+        seen = []
+
+        class Recorder(bt.Strategy):
+            def __init__(self):
+                self.sma = bt.ind.SMA(self.data1, period=3)
+
+            def next(self):
+                seen.append((len(self.data0), len(self.data1), self.data1.close[0], self.sma[0]))
+
+        cerebro = bt.Cerebro(stdstats=False, preloadresample=True, **kwargs)
+        data = cerebro.adddata(_csv(csvpath))
+        cerebro.resampledata(data, timeframe=TF.Minutes, compression=60)
+        cerebro.addstrategy(Recorder)
+        cerebro.run()
+        return seen
+
+    plain = run()
+    assert run(feedcache=cachedir, numpystorage=True) == plain
+    del loads[:]
+    assert run(feedcache=cachedir, numpystorage=True) == plain
+    assert run(feedcache=cachedir) == plain
+    assert not loads
+    # The source and its resampled clone
+    assert _entries(cachedir) == 2
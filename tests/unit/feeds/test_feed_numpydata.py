@@ -0,0 +1,151 @@
+"""Tests for NumpyData and the bulk preload of the columnar feeds."""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import backtrader as bt
+from backtrader.utils import date2num
+
+ROWS = 500
+
+
+def _frame(index=None):
+    rng = np.random.default_rng(7)
+    if index is None:
+        index = pd.date_range("2021-03-01 09:30", periods=ROWS, freq="min")
+    frame = pd.DataFrame(
+        {
+            "open": rng.random(ROWS),
+            "high": rng.random(ROWS),
+            "low": rng.random(ROWS),
+            "close": rng.random(ROWS),
+            "volume": rng.integers(0, 1000, ROWS),
+            "openinterest": 0,
+        },
+        index=index,
+    )
+    frame.iloc[3, 0] = np.inf
+    frame.iloc[4, 1] = np.nan
+    return frame
+
+
+def _preload(cls, bulkload, **kwargs):
+    data = cls(bulkload=bulkload, **kwargs)
+    data._start()
+    data.preload()
+    return data
+
+
+def _arrays(data):
+    return [np.asarray(line.array, dtype=float).tobytes() for line in data.lines]
+
+
+def _assert_same(cls, **kwargs):
+    slow = _preload(cls, False, **kwargs)
+    fast = _preload(cls, True, **kwargs)
+    assert _arrays(fast) == _arrays(slow)
+    assert fast.buflen() == slow.buflen()
+    return fast
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        None,
+        pd.date_range("2021-03-01", periods=ROWS, freq="D", unit="ns")
+        + pd.Timedelta(nanoseconds=1500),
+        pd.date_range("2021-03-01", periods=ROWS, freq="h", tz="UTC").tz_convert("US/Eastern"),
+    ],
+)
+def test_pandas_bulkload_matches_line_by_line(index):
+    data = _assert_same(bt.feeds.PandasData, dataname=_frame(index))
+    assert data.buflen() == ROWS
+
+
+def test_pandas_bulkload_applies_dates():
+    data = _assert_same(
+        bt.feeds.PandasData,
+        dataname=_frame(),
+        fromdate=datetime.datetime(2021, 3, 1, 10),
+        todate=datetime.datetime(2021, 3, 1, 11),
+    )
+    assert data.buflen() == 61
+
+
+def test_pandas_unusual_dtypes_fall_back():
+    frame = _frame().astype({"close": "float32"})
+    frame["symbol"] = "X"
+    _assert_same(bt.feeds.PandasData, dataname=frame)
+
+
+def test_numpy_data_matches_pandas_data():
+    frame = _frame()
+    columns = {"datetime": frame.index.values}
+    columns.update((name, frame[name].to_numpy()) for name in frame.columns)
+    numpy = _assert_same(bt.feeds.NumpyData, dataname=columns)
+    pandas = _preload(bt.feeds.PandasData, False, dataname=frame)
+    assert _arrays(numpy) == _arrays(pandas)
+    assert numpy.lines.datetime.array[0] == date2num(datetime.datetime(2021, 3, 1, 9, 30))
+
+
+def test_numpy_data_structured_array_and_float_days():
+    records = np.zeros(3, dtype=[("dt", "f8"), ("close", "f8")])
+    records["dt"] = [738000.5, 738001.5, 738002.5]
+    records["close"] = [1.0, 2.0, 3.0]
+    data = _assert_same(bt.feeds.NumpyData, dataname=records, datetime="dt")
+    assert list(data.lines.close.array) == [1.0, 2.0, 3.0]
+    assert list(data.lines.open.array) == [0.0, 0.0, 0.0]
+    assert list(data.lines.datetime.array) == [738000.5, 738001.5, 738002.5]
+
+
+def test_numpy_data_rejects_ragged_columns():
+    data = bt.feeds.NumpyData(dataname={"datetime": np.arange(1.0, 4.0), "close": np.ones(2)})
+    with pytest.raises(ValueError):
+        data._start()
+
+
+def test_numpy_data_in_cerebro():
+    frame = _frame().fillna(1.0).replace(np.inf, 1.0)
+    columns = {"datetime": frame.index.values}
+    columns.update((name, frame[name].to_numpy()) for name in frame.columns)
+    closes = []
+
+    class Recorder(bt.Strategy):
+        def next(self):
+            closes.append(self.data.close[0])
+
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.adddata(bt.feeds.NumpyData(dataname=columns))
+    cerebro.addstrategy(Recorder)
+    cerebro.run()
+    assert closes == frame["close"].tolist()
+
+
+def test_timens_keeps_nanoseconds():
+    stamps = np.datetime64("2024-01-02T09:30", "ns") + np.arange(4) * np.timedelta64(1500, "ns")
+    columns = {"datetime": stamps, "close": np.arange(4.0)}
+    seen = []
+
+    class Recorder(bt.Strategy):
+        def next(self):
+            seen.append(self.data.datetime.epochns())
+
+    for timens in (True, False):
+        seen.clear()
+        cerebro = bt.Cerebro(stdstats=False)
+        cerebro.adddata(bt.feeds.NumpyData(dataname=columns, timens=timens))
+        cerebro.addstrategy(Recorder)
+        cerebro.run()
+        if timens:
+            assert seen == stamps.view(np.int64).tolist()
+        else:
+            # Float days only keep (about) tens of microseconds
+            assert seen == [int(stamps[0].view(np.int64))] * 4
+
+    frame = pd.DataFrame({"close": np.arange(4.0)}, index=pd.DatetimeIndex(stamps))
+    data = _preload(bt.feeds.PandasData, True, dataname=frame, timens=True)
+    assert data.lines.datetime.nsaxis.tolist() == stamps.view(np.int64).tolist()
+    assert _preload(bt.feeds.PandasData, True, dataname=frame).lines.datetime.nsaxis is None
@@ -0,0 +1,190 @@
+"""Tests for the bulk resampling of preloaded data feeds.
+
+``Resampler.bulk`` must deliver the very same bars as resampling the source
+bars one by one, and hand them back to the one by one path when it cannot.
+"""
+
+import datetime
+import os
+
+import numpy as np
+import pytest
+
+import backtrader as bt
+from backtrader.resamplerfilter import Resampler
+
+DATAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../datas")
+TF = bt.TimeFrame
+
+
+@pytest.fixture
+def bulkcalls(monkeypatch):
+    """Results of the calls to ``Resampler.bulk``: ``True`` if it resampled."""
+    calls = []
+    bulk = Resampler.bulk
+
+    def spy(self, data, values):
+        bars = bulk(self, data, values)
+        calls.append(bars is not None)
+        return bars
+
+    monkeypatch.setattr(Resampler, "bulk", spy)
+    return calls
+
+
+def _minutes(**kwargs):
+    path = os.path.join(DATAS, "2006-min-005.txt")
+    return bt.feeds.BacktraderCSVData(dataname=path, timeframe=TF.Minutes, compression=5, **kwargs)
+
+
+def _days(**kwargs):
+    return bt.feeds.BacktraderCSVData(dataname=os.path.join(DATAS, "2006-day-001.txt"), **kwargs)
+
+
+def _resample(data, bulk, **kwargs):
+    data.resample(bulk=bulk, **kwargs)
+    data._start()
+    data.preload()
+    return data
+
+
+def _arrays(data):
+    return [np.asarray(line.array, dtype=float).tobytes() for line in data.lines]
+
+
+def _assert_same(make, **kwargs):
+    slow = _resample(make(), False, **kwargs)
+    fast = _resample(make(), True, **kwargs)
+    assert _arrays(fast) == _arrays(slow)
+    assert fast.buflen() == slow.buflen() > 0
+    return fast
+
+
+@pytest.mark.parametrize(
+    "timeframe, compression",
+    [
+        (TF.Minutes, 15),
+        (TF.Minutes, 60),
+        (TF.Minutes, 7),
+        (TF.Seconds, 600),
+        (TF.Days, 1),
+        (TF.Days, 2),
+        (TF.Weeks, 1),
+        (TF.Months, 1),
+    ],
+)
+@pytest.mark.parametrize(
+    "options",
+    [{}, dict(rightedge=False), dict(adjbartime=False), dict(boundoff=2)],
+)
+def test_bulk_matches_streaming(bulkcalls, timeframe, compression, options):
+    _assert_same(_minutes, timeframe=timeframe, compression=compression, **options)
+    assert bulkcalls == [True]
+
+
+@pytest.mark.parametrize(
+    "sessionend",
+    # 16:00 is the last bar of each day: the end of session is left behind
+    [datetime.time(16, 0), datetime.time(17, 20), datetime.time(12, 0)],
+)
+@pytest.mark.parametrize("timeframe, compression", [(TF.Minutes, 60), (TF.Days, 1)])
+def test_bulk_session_ends(bulkcalls, sessionend, timeframe, compression):
+    def make():
+        return _minutes(sessionend=sessionend)
+
+    _assert_same(make, timeframe=timeframe, compression=compression)
+    assert bulkcalls == [True]
+
+
+@pytest.mark.parametrize(
+    "timeframe, compression",
+    [(TF.Days, 3), (TF.Weeks, 1), (TF.Weeks, 2), (TF.Months, 1), (TF.Years, 1)],
+)
+def test_bulk_from_days(bulkcalls, timeframe, compression):
+    def make():
+        return _days(fromdate=datetime.datetime(2006, 2, 1))
+
+    _assert_same(make, timeframe=timeframe, compression=compression)
+    assert bulkcalls == [True]
+
+
+def test_bulk_irregular_bars():
+    rng = np.random.default_rng(3)
+    for _ in range(40):
+        size = int(rng.integers(1, 300))
+        steps = rng.choice([1, 15, 60, 61, 300, 3600, 86400, 200000], size=size)
+        stamps = np.datetime64("2021-03-05T09:30") + np.cumsum(steps).astype("timedelta64[s]")
+        columns = dict(
+            datetime=stamps,
+            open=rng.random(size),
+            high=rng.random(size) + 1.0,
+            low=rng.random(size),
+            close=rng.random(size),
+            volume=rng.random(size) * 1000.0,
+        )
+        sessionend = datetime.time(int(rng.integers(0, 24)), int(rng.integers(0, 60)))
+        timeframe = [TF.Seconds, TF.Minutes, TF.Days, TF.Weeks][int(rng.integers(0, 4))]
+        compression = int(rng.choice([1, 2, 5, 30]))
+
+        def make():
+            return bt.feeds.NumpyData(dataname=columns, timeframe=TF.Seconds, sessionend=sessionend)
+
+        _assert_same(
+            make,
+            timeframe=timeframe,
+            compression=compression,
+            rightedge=bool(rng.integers(0, 2)),
+        )
+
+
+def test_unsupported_bars_go_through_the_resampler(bulkcalls):
+    # Repeated timestamps would be late data
+    stamps = np.datetime64("2021-03-05T09:30") + np.array([0, 1, 1, 2, 7], dtype="timedelta64[m]")
+    columns = dict(datetime=stamps, open=np.arange(5.0), high=np.arange(5.0), low=np.zeros(5))
+
+    def make():
+        return bt.feeds.NumpyData(dataname=columns, timeframe=TF.Minutes)
+
+    _assert_same(make, timeframe=TF.Minutes, compression=5)
+    _assert_same(_minutes, timeframe=TF.Minutes, compression=15, bar2edge=False)
+    assert bulkcalls == [False, False]
+
+
+def test_bulk_clone(bulkcalls):
+    def make():
+        data = _minutes()
+        data._start()
+        data.preload()
+        return data.clone()
+
+    _assert_same(make, timeframe=TF.Minutes, compression=30)
+    assert bulkcalls == [True]
+
+
+def test_cerebro_preloadresample(bulkcalls):
+    def run(**kwargs):
+        seen = []
+
+        class Recorder(bt.Strategy):
+            def __init__(self):
+                self.sma = bt.ind.SMA(self.data1, period=3)
+
+            def next(self):
+                seen.append((len(self.data1), self.data1.datetime[0], self.data1.close[0]))
+                seen.append(self.sma[0])
+
+        cerebro = bt.Cerebro(stdstats=False, preloadresample=True)
+        data = cerebro.adddata(_minutes())
+        cerebro.resampledata(data, timeframe=TF.Minutes, compression=60, **kwargs)
+        cerebro.addstrategy(Recorder)
+        cerebro.run()
+        assert cerebro._dopreload
+        return seen
+
+    assert run() == run(bulk=False)
+    assert bulkcalls == [True]
+
+    cerebro = bt.Cerebro()
+    cerebro.resampledata(_minutes(), timeframe=TF.Minutes, compression=60)
+    cerebro.run()
+    assert not cerebro._dopreload
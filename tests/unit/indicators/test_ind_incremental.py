@@ -0,0 +1,134 @@
+"""Tests for the incremental (rolling state) next() backend of window indicators.
+
+Runs the same strategy in ``next`` mode with ``Cerebro(incremental=False)``
+and ``Cerebro(incremental=True)`` and checks that every indicator line
+produces the same values, within the rounding of the running sums.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+import backtrader as bt
+import testcommon
+from backtrader.utils.rolling import RollingExtreme, RollingMoments, RollingSum
+
+
+class NanEvery(bt.Indicator):
+    """Close with NaN values every 37 bars."""
+
+    lines = ("value",)
+
+    def next(self):
+        self.lines.value[0] = float("nan") if len(self) % 37 == 0 else self.data.close[0]
+
+
+class IndicatorsStrategy(bt.Strategy):
+    """Strategy recording the value of every line of every indicator."""
+
+    def __init__(self):
+        d = self.data
+        nans = NanEvery(d)
+        self.inds = [
+            bt.ind.SMA(d, period=30),
+            bt.ind.Average(d, period=12),
+            bt.ind.SumN(d, period=7),
+            bt.ind.Highest(d.high, period=10),
+            bt.ind.Lowest(d.low, period=10),
+            bt.ind.StdDev(d, period=20),
+            bt.ind.StdDev(d, bt.ind.SMA(d, period=20), period=20),
+            bt.ind.StdDev(d, period=20, movav=bt.ind.EMA),
+            bt.ind.BollingerBands(d),
+            bt.ind.SMA(nans, period=5),
+            bt.ind.Highest(nans, period=5),
+            bt.ind.StdDev(nans, period=5),
+        ]
+        self.vals = []
+
+    def next(self):
+        self.vals.append([line[0] for ind in self.inds for line in ind.lines])
+
+
+def _run(incremental, replay=False):
+    cerebro = bt.Cerebro(runonce=False, incremental=incremental, stdstats=False)
+    if replay:
+        cerebro.replaydata(testcommon.getdata(0), timeframe=bt.TimeFrame.Weeks)
+    else:
+        cerebro.adddata(testcommon.getdata(0))
+    cerebro.addstrategy(IndicatorsStrategy)
+    strat = cerebro.run()[0]
+    return strat, np.array(strat.vals)
+
+
+@pytest.mark.parametrize("replay", [False, True])
+def test_incremental_matches_regular_next(replay):
+    _, expected = _run(incremental=False, replay=replay)
+    strat, values = _run(incremental=True, replay=replay)
+    assert len(expected) == len(values) > 0
+    np.testing.assert_allclose(values, expected, rtol=1e-12, atol=1e-9)
+    assert all(ind._rolling is not None for ind in strat.inds[:7])
+    assert strat.inds[7]._rolling is None  # exponential StdDev is already O(1)
+
+
+def test_incremental_per_indicator_class():
+    _, expected = _run(incremental=False)
+    bt.ind.Highest.useincremental(True)
+    try:
+        strat, values = _run(incremental=False)
+    finally:
+        del bt.ind.Highest._incremental
+    np.testing.assert_allclose(values, expected, rtol=1e-12, atol=1e-9)
+    assert strat.inds[3]._rolling is not None
+    assert strat.inds[0]._rolling is None
+
+
+def test_rolling_window_states():
+    values = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0, 5.0, 3.0, 5.0]
+    period = 4
+    rsum, rmom = RollingSum(period, values[:1]), RollingMoments(period, values[:1])
+    rmax, rmin = RollingExtreme(period, values[:1]), RollingExtreme(period, values[:1], min)
+    for i, value in enumerate(values[1:], 2):
+        window = values[max(0, i - period) : i]
+        for rolling in (rsum, rmom, rmax, rmin):
+            rolling.push(value)
+            assert list(rolling.window) == window
+        mean = math.fsum(window) / len(window)
+        assert rsum.sum == pytest.approx(math.fsum(window))
+        assert rmom.mean == pytest.approx(mean)
+        assert rmom.variance() == pytest.approx(np.var(window))
+        assert rmax.value == max(window) and rmin.value == min(window)
+
+    for rolling in (rsum, rmom, rmax, rmin):
+        rolling.replace(0.5)
+        rolling.push(float("nan"))
+    assert rsum.nonfinite == rmom.nonfinite == rmax.nonfinite == rmin.nonfinite == 1
+    assert rsum.sum == pytest.approx(8.5) and rmom.mean == pytest.approx(8.5 / 3)
+    assert rmax.value == 5.0 and rmin.value == 0.5
+
+
+def test_rolling_extreme_replace(monkeypatch):
+    rng = np.random.default_rng(7)
+    rmax, rmin = RollingExtreme(5), RollingExtreme(5, func=min)
+    window = []
+    for value in rng.integers(0, 10, 500).astype(float):
+        if not math.isfinite(rmax.value) or rng.random() < 0.5:
+            window = (window + [value])[-5:]
+            rmax.push(value), rmin.push(value)
+        else:
+            value = float("nan") if rng.random() < 0.1 else value
+            window[-1] = value
+            rmax.replace(value), rmin.replace(value)
+        finite = [x for x in window if math.isfinite(x)]
+        if finite:
+            assert rmax.value == max(finite) and rmin.value == min(finite)
+
+    # A bar whose high rises (low falls) updates the deque without a rescan
+    monkeypatch.setattr(RollingExtreme, "resync", None)
+    for value in (10.0, 11.0, 12.0):
+        rmax.replace(value), rmin.replace(-value)
+    assert rmax.value == 12.0 and rmin.value == -12.0
+
+
+def test_rolling_helpers_are_not_exported():
+    assert not [name for name in dir(bt.indicators) if name.startswith("Rolling")]
@@ -0,0 +1,155 @@
+"""Tests for the vectorized (NumPy) runonce backend of the core indicators.
+
+Runs the same strategy with ``Cerebro(vectorize=False)`` and
+``Cerebro(vectorize=True)`` and checks that every indicator line produces the
+same values. Every line must match bit-for-bit: the window sums reproduce
+``math.fsum`` (or the plain loops of Bollinger Bands) exactly.
+"""
+
+import math
+import os
+
+import numpy as np
+import pytest
+
+import backtrader as bt
+import testcommon
+from backtrader.utils import vectorops
+
+
+class IndicatorsStrategy(bt.Strategy):
+    """Strategy recording the value of every line of every indicator."""
+
+    def __init__(self):
+        d = self.data
+        self.inds = [
+            bt.ind.EMA(d, period=20),
+            bt.ind.SMMA(d, period=14),
+            bt.ind.ATR(d),
+            bt.ind.MACD(d),
+            bt.ind.Highest(d.high, period=10),
+            bt.ind.Lowest(d.low, period=10),
+            bt.ind.SMA(d, period=30),
+            bt.ind.WMA(d, period=15),
+            bt.ind.SumN(d, period=7),
+            bt.ind.StdDev(d, period=20),
+            bt.ind.StdDev(d, bt.ind.SMA(d, period=20), period=20),
+            bt.ind.BollingerBandsPct(d),
+            bt.ind.RSI(d),
+            bt.ind.RSI_Safe(d),
+            bt.ind.MACDHisto(d),
+            bt.ind.Stochastic(d),
+            bt.ind.SMA(bt.ind.SMA(d, period=5), period=10),
+        ]
+        self.vals = []
+
+    def next(self):
+        self.vals.append([line[0] for ind in self.inds for line in ind.lines])
+
+
+def _getorcl():
+    datapath = os.path.join(testcommon.modpath, testcommon.dataspath, "orcl-1995-2014.txt")
+    return bt.feeds.BacktraderCSVData(dataname=datapath)
+
+
+def _run(vectorize, getdata=lambda: testcommon.getdata(0)):
+    cerebro = bt.Cerebro(vectorize=vectorize, stdstats=False)
+    cerebro.adddata(getdata())
+    cerebro.addstrategy(IndicatorsStrategy)
+    strat = cerebro.run()[0]
+    return np.array(strat.vals)
+
+
+@pytest.mark.parametrize("getdata", [lambda: testcommon.getdata(0), _getorcl])
+def test_vectorized_matches_regular_once(getdata):
+    vals = _run(vectorize=False, getdata=getdata)
+    vvals = _run(vectorize=True, getdata=getdata)
+    assert len(vals) == len(vvals) > 0
+    np.testing.assert_array_equal(vals, vvals)
+
+
+def test_vectorize_flag_is_reset_by_regular_run():
+    _run(vectorize=True)
+    assert bt.Indicator._vectorize is True
+    _run(vectorize=False)
+    assert bt.Indicator._vectorize is False
+
+
+def test_rolling_kernels():
+    x = np.array([1.0, 5.0, 2.0, float("nan"), 4.0, 3.0])
+    np.testing.assert_array_equal(vectorops.rolling_sum(x[:3], 2), [6.0, 7.0])
+    np.testing.assert_array_equal(vectorops.rolling_max(x[:3], 2), [5.0, 5.0])
+    np.testing.assert_array_equal(vectorops.rolling_min(x[:3], 2), [1.0, 2.0])
+    np.testing.assert_array_equal(vectorops.rolling_dot(x[:3], [1.0, 2.0]), [11.0, 9.0])
+    np.testing.assert_array_equal(vectorops.rolling_nancount(x, 2), [0, 0, 1, 1, 0])
+    assert len(vectorops.rolling_sum(x, 10)) == 0
+
+
+def test_rolling_kernels_match_each_window():
+    rng = np.random.default_rng(3)
+    x = rng.random(3001) * 100.0 + 4000.0
+    x[[10, 700, 2000]] = [float("nan"), float("inf"), -float("inf")]
+    finite = np.isfinite(x)
+    for period in (1, 2, 29, 256, 257, 1000):
+        windows = np.lib.stride_tricks.sliding_window_view(x, period)
+        with np.errstate(invalid="ignore"):
+            sums = windows.sum(axis=1)
+        fsums = [math.fsum(w) for w in windows.tolist()]
+        exact = np.lib.stride_tricks.sliding_window_view(finite, period).all(axis=1)
+        sums[exact] = np.array(fsums)[exact]
+        np.testing.assert_array_equal(vectorops.rolling_sum(x, period), sums)
+        np.testing.assert_array_equal(vectorops.rolling_max(x, period), windows.max(axis=1))
+        np.testing.assert_array_equal(vectorops.rolling_min(x, period), windows.min(axis=1))
+
+
+def test_window_sums_are_rounded_like_fsum():
+    # Cancellation and near-ties which any single-double summation misses
+    x = np.tile([1e16, 1.0, -1e16, 3.0, 0.5, 0.1, 2.0**-60], 50)
+    for period in (2, 3, 5, 7, 11):
+        windows = np.lib.stride_tricks.sliding_window_view(x, period).tolist()
+        weights = np.arange(1.0, period + 1)
+        np.testing.assert_array_equal(
+            vectorops.rolling_sum(x, period), [math.fsum(w) for w in windows]
+        )
+        np.testing.assert_array_equal(
+            vectorops.rolling_dot(x, weights),
+            [math.fsum((weights * w).tolist()) for w in np.asarray(windows)],
+        )
+
+
+def test_rolling_loopsum_matches_scalar_loop():
+    x = np.random.default_rng(5).random(400) * 100.0
+    expected = []
+    for k in range(len(x) - 20 + 1):
+        total = 0.0
+        for value in x[k : k + 20][::-1].tolist():
+            total += value
+        expected.append(total)
+    np.testing.assert_array_equal(vectorops.rolling_loopsum(x, 20), expected)
+
+
+def test_linear_recurrence_matches_scalar_loop():
+    x = np.random.default_rng(1).random(500) * 100.0
+    alpha = 2.0 / 21.0
+    alpha1 = 1.0 - alpha
+    prev = 50.0
+    expected = []
+    for value in x.tolist():
+        prev = prev * alpha1 + value * alpha
+        expected.append(prev)
+    np.testing.assert_array_equal(vectorops.linear_recurrence(x, alpha, alpha1, 50.0), expected)
+
+
+def test_assign_writes_into_array_storage():
+    import array
+
+    buf = array.array("d", [0.0] * 5)
+    vectorops.assign(buf, 2, np.array([1.0, 2.0]))
+    assert list(buf) == [0.0, 0.0, 1.0, 2.0, 0.0]
+    buf.append(3.0)  # no buffer export may outlive assign()
+    view = vectorops.as_ndarray(buf)
+    assert view.base is not None and view[3] == 2.0
+
+
+def test_kernel_module_is_not_exported():
+    assert "vectorops" not in dir(bt.indicators)
@@ -0,0 +1,54 @@
+"""Tests for the vectorized date2num/num2date conversions."""
+
+import datetime
+
+import numpy as np
+import pytest
+
+from backtrader.utils import date2num, date2num_array, num2date, num2date_array
+
+
+def test_date2num_array_matches_date2num():
+    rng = np.random.default_rng(11)
+    usecs = rng.integers(-60 * 365 * 86400, 80 * 365 * 86400, 20000) * 1000000
+    usecs += rng.integers(0, 1000000, len(usecs))
+    values = usecs.view("datetime64[us]")
+    expected = [date2num(dt) for dt in values.tolist()]
+    assert date2num_array(values).tolist() == expected
+    # Units other than microseconds, sub-microsecond parts dropped
+    nanos = values.astype("datetime64[ns]") + np.timedelta64(999, "ns")
+    assert date2num_array(nanos).tolist() == expected
+
+
+def test_date2num_array_nat_and_range():
+    values = np.array(["2020-01-01T10:00", "NaT"], dtype="datetime64[s]")
+    result = date2num_array(values)
+    assert result[0] == date2num(datetime.datetime(2020, 1, 1, 10))
+    assert np.isnan(result[1])
+    assert date2num_array([datetime.datetime(2001, 2, 3)]).tolist() == [730519.0]
+    with pytest.raises(ValueError):
+        date2num_array(np.array(["10000-01-01"], dtype="datetime64[D]"))
+
+
+def test_num2date_array_matches_num2date():
+    rng = np.random.default_rng(12)
+    values = np.concatenate(
+        [
+            rng.uniform(1.0, 3652059.0, 20000),
+            738000 + rng.integers(0, 86400 * 1000, 20000) / 86400000.0,
+            [float("nan"), 0.0, -3.0, 738000.9999999999, 738000.99999999],
+        ]
+    )
+    expected = [num2date(value) for value in values.tolist()]
+    result = num2date_array(values)
+    assert result.dtype == np.dtype("datetime64[us]")
+    assert result.tolist() == expected
+    assert num2date_array(values.reshape(5, -1)).shape == (5, len(values) // 5)
+
+
+def test_num2date_array_raises_like_num2date():
+    for value in (0.5, 3652060.5):
+        with pytest.raises((ValueError, OverflowError)):
+            num2date(value)
+        with pytest.raises((ValueError, OverflowError)):
+            num2date_array([738000.0, value])
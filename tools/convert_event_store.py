@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+
+from backtrader.brokers.hft import convert_binance_bbo_zip_pair
+from backtrader.channels.eventstore import convert_to_event_store
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Convert tick/orderbook replay inputs of one instrument into a binary event store (.npy)"
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="Tick CSV, orderbook CSV/JSONL (plain or .gz) or hftbacktest .npz/.npy files",
+    )
+    parser.add_argument("--output", required=True, help="Path of the event store to write (.npy)")
+    parser.add_argument(
+        "--symbol", default="", help="Symbol given to the channels reading text inputs"
+    )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=None,
+        help="Optional orderbook depth to keep; all levels by default",
+    )
+    parser.add_argument(
+        "--book-ticker-zip",
+        default=None,
+        help="Binance bookTicker zip file, converted together with --trades-zip",
+    )
+    parser.add_argument(
+        "--trades-zip",
+        default=None,
+        help="Binance trades zip file, converted together with --book-ticker-zip",
+    )
+    parser.add_argument(
+        "--tick-size",
+        type=float,
+        default=0.01,
+        help="Tick size used to fuse Binance bookTicker depth",
+    )
+    parser.add_argument(
+        "--lot-size",
+        type=float,
+        default=0.001,
+        help="Lot size used to fuse Binance bookTicker depth",
+    )
+    return parser
+
+
+def main() -> int:
+    parser = _build_parser()
+    args = parser.parse_args()
+    if bool(args.book_ticker_zip) != bool(args.trades_zip):
+        parser.error("--book-ticker-zip and --trades-zip go together")
+    if not args.inputs and not args.book_ticker_zip:
+        parser.error("no input given")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        inputs = list(args.inputs)
+        if args.book_ticker_zip:
+            result = convert_binance_bbo_zip_pair(
+                book_ticker_zip_path=args.book_ticker_zip,
+                trades_zip_path=args.trades_zip,
+                output_directory=tmpdir,
+                tick_size=args.tick_size,
+                lot_size=args.lot_size,
+            )
+            inputs.append(str(result.hft_npz_path))
+        rows = convert_to_event_store(inputs, args.output, symbol=args.symbol, depth=args.depth)
+
+    print(f"Wrote {rows} rows to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())